@@ -158,6 +158,13 @@ and valid markers are:
 
 Please see matplotlib docs online for more details.
 
+Line traces longer than DECIMATE_ABOVE points (scope captures, for instance)
+are decimated when the Page is rendered: for every DECIMATION_DPI column
+across the plot width only the first, last, smallest and largest points are
+drawn, so peaks and glitches stay exactly where they were. Pass
+decimate=False to add_trace() to draw every point, for publication plots.
+create_csv() always writes the full data.
+
 Trace colors currently supported are:
   - LT_RED_1
   - LT_BLUE_1
@@ -310,6 +317,14 @@ kit_datasheet() performs the following sequence for you:
   5. Repeats for each plot on your Page. The disposable Page evaporates.
   6. Creates a PDF of your entire page for reference and dumps it in the zip file.
 
+Replotting unchanged data can skip matplotlib entirely: set
+LTC_plot.RENDER_CACHE_DIR to a directory and every Page.create_svg() and
+Page.create_pdf() first looks there for a file rendered from an identical
+page. Pages are identified by a hash of everything given to Page and
+add_plot(), trace data included. Edits made directly on Page.Figure are not
+part of that hash, so leave the cache off for such pages. The least recently
+used files are removed when the directory grows past RENDER_CACHE_MAX_BYTES.
+
 If you end up needing more than one page of plots you can add your pages to
 a Multipage_pdf:
 
@@ -345,6 +360,7 @@ import os
 import shutil
 import io
 import csv
+import hashlib
 
 
 class PyICe_data_base():
@@ -447,7 +463,8 @@ class plot(object):
         self.current_style_index = 0
 
     def add_trace(self, axis, data, color, marker=None, markersize=0, linestyle="-",
-                  linewidth=None, legend="", stepped_style=False, vxline=False, hxline=False):
+                  linewidth=None, legend="", stepped_style=False, vxline=False, hxline=False,
+                  decimate=True):
         """Add a trace.
         Adds a new trace to the object's internal collection.
 
@@ -470,6 +487,8 @@ class plot(object):
             markersize: Markersize to use.
             stepped_style: Stepped style to use.
             vxline: Vxline to use.
+            decimate: False to draw every point even when the trace is
+                longer than DECIMATE_ABOVE.
         """
         data = data if not isinstance(data, zip) else list(data)
         legend = legend.replace("-", "−") if legend is not None else legend
@@ -487,7 +506,8 @@ class plot(object):
                       "legend": legend,
                       "stepped_style": stepped_style,
                       "vxline": vxline,
-                      "hxline": hxline
+                      "hxline": hxline,
+                      "decimate": decimate
                       }
         if axis == 1:
             self.y1_axis_params["trace_data"].append(trace_data)
@@ -1023,7 +1043,7 @@ class scope_plot(plot):
         self.current_style_index = 0
 
     def add_trace(self, data, color, marker=None, markersize=0,
-                  linestyle="-", linewidth=None, legend=""):
+                  linestyle="-", linewidth=None, legend="", decimate=True):
         """Add a trace.
 
         Appends a new trace entry to the object's internal collection.
@@ -1041,6 +1061,8 @@ class scope_plot(plot):
             linewidth: Plot line width in points.
             marker: Plot marker style string.
             markersize: Markersize to use.
+            decimate: False to draw every point even when the trace is
+                longer than DECIMATE_ABOVE.
         """
         plot.add_trace(
             self,
@@ -1051,7 +1073,8 @@ class scope_plot(plot):
             markersize=markersize,
             linestyle=linestyle,
             linewidth=linewidth,
-            legend=legend)
+            legend=legend,
+            decimate=decimate)
 
     def add_legend(self, axis=1, location=(
             0, 0), justification='lower left', use_axes_scale=False, fontsize=7):
@@ -1311,6 +1334,11 @@ class Page():
             raise Exception(
                 'Specify exactly one of rows_x_cols or plot_count arguments. rows_x_cols should be a two-element list or tuple.')
         self.page_size = page_size
+        self._render_digest = None
+        if RENDER_CACHE_DIR is not None:
+            self._render_digest = hashlib.sha256()
+            _update_render_digest(self._render_digest, (
+                _RENDER_CACHE_VERSION, matplotlib.__version__, self.rows_x_cols, page_size))
         self.plot_list = []
         self.page_type = None
         self.next_position = 0
@@ -1409,6 +1437,12 @@ class Page():
             self.page_type = plot.plot_type
         elif self.page_type != plot.plot_type:
             raise Exception("\n\n\n**************************************************\nPlots of different types not allowed on same page.\nPlease combine only common plot types per page.\n**************************************************\n\n\n")
+        if self._render_digest is not None and not _update_render_digest(self._render_digest, (
+                type(plot).__name__, vars(plot), position, plot_sizex, plot_sizey,
+                left_border, right_border, top_border, bottom_border, x_gap, y_gap,
+                trace_width, DECIMATE_ABOVE, DECIMATION_DPI)):
+            # something in the plot has no stable value to hash
+            self._render_digest = None
         if position is None:
             self.next_position += 1
         else:
@@ -1760,6 +1794,14 @@ class Page():
                             y = unzip[1]
                         else:
                             x, y = zip(*trace["data"])
+                        if trace.get("decimate", True) and not trace["stepped_style"] \
+                           and trace["marker"] in (None, "", "None") \
+                           and DECIMATE_ABOVE is not None and len(x) > DECIMATE_ABOVE:
+                            (x, y) = _decimate_minmax(
+                                x, y,
+                                columns=int(plot_sizex * DECIMATION_DPI),
+                                xlims=plot.xlims if plot.xlims not in [None, "auto"] else None,
+                                logx=plot.logx)
                         if trace["stepped_style"]:
                             y_axis_params["axis"].step(x,
                                                        y,
@@ -2029,6 +2071,9 @@ class Page():
 
         Transmits data to the remote endpoint.
 
+        With RENDER_CACHE_DIR set, a page identical to one rendered before
+        is served from the cache instead of being drawn again.
+
 
         >>> from PyICe.LTC_plot import Page
         >>> hasattr(Page, 'create_svg')
@@ -2041,14 +2086,11 @@ class Page():
         Returns:
             The SVG markup string.
         """
-        FigureCanvasSVG(self.Figure)
-        figdata = io.StringIO()
-        self.Figure.savefig(figdata, format="svg")
-        output = figdata.getvalue().replace("Linear Helv Cond",
-                                            "LinearHelvCond").replace("font-size:9.5px;font-style:normal",
-                                                                      "font-size:9.5px;font-weight:bold").replace("font-size:8.14285714286px;font-style:bold",
-                                                                                                                  "font-size:8.14285714286px;font-weight:bold").replace("font-size:9.5px;font-style:bold",
-                                                                                                                                                                        "font-size:9.5px;font-weight:bold").encode("utf-8")
+        cache_file = self._render_cache_file("svg")
+        output = _render_cache_read(cache_file)
+        if output is None:
+            output = self._render_svg()
+            _render_cache_write(cache_file, output)
         if self._svg_comments:
             comment_block = b"\n".join(
                 b"<!-- " + c.encode("utf-8") + b" -->" for c in self._svg_comments)
@@ -2074,6 +2116,9 @@ class Page():
 
         Supports the ``Page`` workflow by performing the described operation.
 
+        With RENDER_CACHE_DIR set, a page identical to one rendered before
+        is copied from the cache instead of being drawn again.
+
 
         >>> from PyICe.LTC_plot import Page
         >>> hasattr(Page, 'create_pdf')
@@ -2092,8 +2137,33 @@ class Page():
         file_basename = os.path.join(
             filepath, "{}.pdf".format(file_basename).replace(
                 " ", "_"))
-        FigureCanvasPdf(self.Figure)
-        self.Figure.savefig(file_basename, format="pdf")
+        cache_file = self._render_cache_file("pdf")
+        output = _render_cache_read(cache_file)
+        if output is None:
+            FigureCanvasPdf(self.Figure)
+            figdata = io.BytesIO()
+            self.Figure.savefig(figdata, format="pdf")
+            output = figdata.getvalue()
+            _render_cache_write(cache_file, output)
+        with open(file_basename, 'wb') as output_file:
+            output_file.write(output)
+
+    def _render_cache_file(self, extension):
+        if RENDER_CACHE_DIR is None or self._render_digest is None:
+            return None
+        return os.path.join(RENDER_CACHE_DIR, "{}.{}".format(
+            self._render_digest.hexdigest(), extension))
+
+    def _render_svg(self):
+        FigureCanvasSVG(self.Figure)
+        figdata = io.StringIO()
+        self.Figure.savefig(figdata, format="svg")
+        output = figdata.getvalue().replace("Linear Helv Cond",
+                                            "LinearHelvCond").replace("font-size:9.5px;font-style:normal",
+                                                                      "font-size:9.5px;font-weight:bold").replace("font-size:8.14285714286px;font-style:bold",
+                                                                                                                  "font-size:8.14285714286px;font-weight:bold").replace("font-size:9.5px;font-style:bold",
+                                                                                                                                                                        "font-size:9.5px;font-weight:bold").encode("utf-8")
+        return output
 
     def kit_datasheet(self, file_basename="datasheet_kit"):
         """Perform kit datasheet operation.
@@ -2581,6 +2651,182 @@ def fracRGB_to_webRGB(fracRGB):
     return RGB_to_webRGB(fracRGB_to_RGB(fracRGB))
 
 
+def _decimate_minmax(x, y, columns, xlims=None, logx=False):
+    """Keep the first, last, smallest and largest point of each plot column.
+
+    Drawn at *columns* columns across the plot, the decimated trace covers
+    exactly the same pixels as the full one.  Traces that cannot be
+    decimated faithfully (x not ascending, non-numeric or NaN data, x <= 0
+    on a log axis) are returned unchanged.
+
+    >>> x = np.arange(1000.0)
+    >>> y = np.zeros(1000); y[123] = 5.0; y[876] = -3.0
+    >>> dx, dy = _decimate_minmax(x, y, columns=10)
+    >>> len(dx) <= 40, float(dy.max()), float(dy.min()), float(dx[0]), float(dx[-1])
+    (True, 5.0, -3.0, 0.0, 999.0)
+
+    Args:
+        x: Ascending x data.
+        y: Y data, same length as *x*.
+        columns: Number of columns across the plot width.
+        xlims: Plot x limits, or None to use the data range.
+        logx: True if the x axis is logarithmic.
+
+    Returns:
+        tuple: (x, y) arrays of the points to draw.
+    """
+    try:
+        x_arr = np.asarray(x, dtype=float)
+        y_arr = np.asarray(y, dtype=float)
+    except (TypeError, ValueError):
+        return (x, y)
+    if x_arr.ndim != 1 or x_arr.shape != y_arr.shape or len(x_arr) <= 4 * columns:
+        return (x, y)
+    if np.isnan(y_arr).any() or np.isnan(x_arr).any() or (np.diff(x_arr) < 0).any():
+        return (x, y)
+    if logx:
+        if x_arr[0] <= 0:
+            return (x, y)
+        position = np.log10(x_arr)
+    else:
+        position = x_arr
+    (x_min, x_max) = (position[0], position[-1]) if xlims is None else (
+        (np.log10(xlims[0]), np.log10(xlims[1])) if logx else (xlims[0], xlims[1]))
+    if not x_max > x_min:
+        return (x, y)
+    # Points left or right of the limits share one column each, which keeps
+    # the direction of lines leaving the plot.
+    column = np.clip(np.floor((position - x_min) / (x_max - x_min) * columns), -1, columns).astype(np.int64)
+    starts = np.flatnonzero(np.concatenate(([True], column[1:] != column[:-1])))
+    lengths = np.diff(np.append(starts, len(column)))
+    bucket = np.repeat(np.arange(len(starts)), lengths)
+    keep = np.zeros(len(column), dtype=bool)
+    keep[starts] = True
+    keep[starts + lengths - 1] = True
+    for extreme in (np.minimum, np.maximum):
+        is_extreme = y_arr == np.repeat(extreme.reduceat(y_arr, starts), lengths)
+        candidates = np.flatnonzero(is_extreme)
+        # first extreme point of every column
+        keep[candidates[np.unique(bucket[candidates], return_index=True)[1]]] = True
+    return (x_arr[keep], y_arr[keep])
+
+
+def _update_render_digest(digest, spec):
+    """Feed a plot specification into a hashlib *digest*.
+
+    Every value is tagged with its type, so that for instance [1, 2] and
+    (1, 2) hash differently.  Numeric sequences, trace data in particular,
+    are hashed as one numpy buffer rather than value by value.
+
+    >>> a, b = hashlib.sha256(), hashlib.sha256()
+    >>> _update_render_digest(a, {"data": [(0, 1.5), (1, 2.5)], "color": "red"})
+    True
+    >>> _update_render_digest(b, {"color": "red", "data": np.array([[0, 1.5], [1, 2.5]])})
+    True
+    >>> a.hexdigest() == b.hexdigest()
+    False
+    >>> _update_render_digest(hashlib.sha256(), [object()])
+    False
+
+    Args:
+        digest: hashlib object to update.
+        spec: Nested dicts, lists, tuples, numpy arrays and scalars.
+
+    Returns:
+        bool: False if *spec* holds an object with no stable value to hash.
+    """
+    if spec is None or isinstance(spec, (bool, int, float, complex, str, bytes, np.generic)):
+        digest.update("{}:{!r};".format(type(spec).__name__, spec).encode("utf-8"))
+        return True
+    if isinstance(spec, dict):
+        digest.update("dict{};".format(len(spec)).encode("utf-8"))
+        return all(_update_render_digest(digest, key) and _update_render_digest(digest, value)
+                   for (key, value) in sorted(spec.items(), key=lambda item: repr(item[0])))
+    if isinstance(spec, (list, tuple, np.ndarray)):
+        try:
+            array = np.asarray(spec)
+        except (TypeError, ValueError):
+            array = None
+        if array is not None and array.dtype.kind in "biufc":
+            array = np.ascontiguousarray(array)
+            digest.update("{}{}{};".format(type(spec).__name__, array.dtype.str, array.shape).encode("utf-8"))
+            digest.update(array.data)
+            return True
+        items = spec.tolist() if isinstance(spec, np.ndarray) else spec
+        digest.update("{}{};".format(type(spec).__name__, len(items)).encode("utf-8"))
+        return all(_update_render_digest(digest, item) for item in items)
+    return False
+
+
+def _render_cache_read(cache_file):
+    """Return the contents of *cache_file* and mark it most recently used.
+
+    >>> _render_cache_read(None) is None
+    True
+
+    Args:
+        cache_file: Path in RENDER_CACHE_DIR, or None.
+
+    Returns:
+        bytes, or None on a cache miss.
+    """
+    if cache_file is None:
+        return None
+    try:
+        with open(cache_file, 'rb') as f:
+            data = f.read()
+    except OSError:
+        return None
+    try:
+        os.utime(cache_file)
+    except OSError:
+        pass
+    return data
+
+
+def _render_cache_write(cache_file, data):
+    """Store *data* as *cache_file*, then evict least recently used files.
+
+    The cache is best effort: failing to write it never fails the plot.
+
+    >>> _render_cache_write(None, b"")
+
+    Args:
+        cache_file: Path in RENDER_CACHE_DIR, or None.
+        data: Rendered file contents.
+    """
+    if cache_file is None:
+        return
+    directory = os.path.dirname(cache_file)
+    try:
+        os.makedirs(directory, exist_ok=True)
+        # Written aside and renamed so that other processes plotting into the
+        # same cache never read a partial file.
+        temp_file = "{}.{}.tmp".format(cache_file, os.getpid())
+        with open(temp_file, 'wb') as f:
+            f.write(data)
+        os.replace(temp_file, cache_file)
+    except OSError:
+        return
+    entries = []
+    for entry in os.scandir(directory):
+        if entry.name.endswith((".svg", ".pdf")):
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+    total = sum(size for (_, size, _) in entries)
+    for (_, size, path) in sorted(entries):
+        if total <= RENDER_CACHE_MAX_BYTES:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
+
+
 def _escape_attrib_reversal(s):
     # Don't know why SVG backend does this, need to reverse it to include html entities.
     # 12/26/2016 Bill had complained that he couldn't use & character which as true because the I had the next line uncommented.
@@ -2644,6 +2890,19 @@ LT_SCOPE_GRID = CMYK_to_fracRGB([0, 0, 0, 0.2])       #
 # This makes the most sense - Black
 LT_TEXT = webRGB_to_fracRGB("000000")
 
+# Line traces longer than this are decimated to DECIMATION_DPI columns per
+# inch of plot width when a Page is rendered.  None turns decimation off.
+DECIMATE_ABOVE = 20000
+DECIMATION_DPI = 600
+
+# Rendered Pages are cached in RENDER_CACHE_DIR, keyed on a hash of the page
+# contents, and the least recently used files are removed once the directory
+# holds more than RENDER_CACHE_MAX_BYTES.  None turns the cache off.
+RENDER_CACHE_DIR = None
+RENDER_CACHE_MAX_BYTES = 256 * 2**20
+# Bump to invalidate cached files when rendering changes.
+_RENDER_CACHE_VERSION = 1
+
 #
 # These are special characters that can be used in labels, notes and arrows.
 # Bob Reay's version outputs web values which seems to import into Illustrator
@@ -3,9 +3,33 @@
 >>> from PyICe.data_utils.LTspice_waveform_reader import LTspice_wavereader
 
 """
-from scipy.interpolate import interp1d
 from PyICe.lab_utils.eng_string import eng_string
+import collections.abc
+import itertools
 import numpy
+import os
+
+
+class _lazy_columns(collections.abc.Mapping):
+    # Read-only mapping of trace name to numpy column that parses each
+    # column from the export file the first time it is accessed.
+    def __init__(self, reader, keys, chunk_rows):
+        self._reader = reader
+        self._keys = keys
+        self._chunk_rows = chunk_rows
+        self._columns = {}
+
+    def __getitem__(self, key):
+        if key not in self._columns:
+            column = self._keys.index(key)
+            self._columns[key] = self._reader._load_array(usecols=[column], chunk_rows=self._chunk_rows)[:, 0]
+        return self._columns[key]
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self):
+        return len(self._keys)
 
 
 class LTspice_wavereader():
@@ -28,7 +52,7 @@ class LTspice_wavereader():
 
            This script endevors to parse the file and return a Python record of the individual columns.
 
-           The resultant data structure is a dictionary with the header row values as the keys and a list of values found for each column as the values for each key.
+           The resultant data structure is a dictionary with the header row values as the keys and a numpy array of the values found for each column as the values for each key.
            It is incumbent upon the user to massage the record further, for example zipping times and voltages if need be for the data analysis.
 
 
@@ -41,10 +65,13 @@ class LTspice_wavereader():
         """
         self.file_name = file_name
 
-    def read_file(self, floats=True):
+    def read_file(self, floats=True, cache=False, lazy=False, chunk_rows=100000):
         """As returned from the file, each data value would be a string.
 
            The argument 'floats' (default True) converts all the values to floats presuming that was the intent of the LTCspice excercise.
+           Float data is parsed by numpy in chunks of rows straight into a preallocated 2-D array, and each dictionary value is a column of that array.
+           With cache=True the array is also saved next to the export as a .npy sidecar and reloaded from there while it is newer than the export.
+           With lazy=True columns are only parsed (or, from the cache, only paged in) when they are first accessed, so unused traces cost nothing.
 
 
         >>> from PyICe.data_utils.LTspice_waveform_reader import LTspice_wavereader
@@ -53,32 +80,68 @@ class LTspice_wavereader():
 
         Args:
             floats: Floats to use.
+            cache: If True, use and refresh the .npy sidecar cache.
+            lazy: If True, load each column on first access.
+            chunk_rows: Number of rows parsed per chunk.
         """
-        rows = []
-        file = open(self.file_name, "r")
-        firstline = True
-        self.data = {}
-        keys = []
-        for line in file:
-            if firstline:
-                keys = line.strip().split("\t")
-                firstline = False
-            else:
-                rows.append(line.strip().split("\t"))
-        file.close()
-        column = 0              # Dictionaries are ordered since Python 3.6
-        for key in keys:
-            self.data[key] = []
-            for row in rows:
-                self.data[key].append(
-                    float(row[column]) if floats else row[column])
-            column += 1
+        if not floats:
+            rows = []
+            with open(self.file_name, "r") as file:
+                keys = file.readline().strip().split("\t")
+                for line in file:
+                    if line.strip():  # skip the trailing line feed
+                        rows.append(line.strip().split("\t"))
+            # Dictionaries are ordered since Python 3.6
+            self.data = {key: [row[column] for row in rows] for column, key in enumerate(keys)}
+            return
+        with open(self.file_name, "r") as file:
+            keys = file.readline().strip().split("\t")
+        cache_file = f'{self.file_name}.npy'
+        array = None
+        if cache and os.path.exists(cache_file) and os.path.getmtime(cache_file) >= os.path.getmtime(self.file_name):
+            array = numpy.load(cache_file, mmap_mode='r' if lazy else None)
+            if array.ndim != 2 or array.shape[1] != len(keys):
+                array = None
+        if array is None:
+            if lazy and not cache:
+                self.data = _lazy_columns(self, keys, chunk_rows)
+                return
+            array = self._load_array(usecols=None, chunk_rows=chunk_rows)
+            if cache:
+                # Column major, so that each trace is contiguous when memory mapped.
+                numpy.save(cache_file, numpy.asfortranarray(array))
+                if lazy:
+                    array = numpy.load(cache_file, mmap_mode='r')
+        self.data = {key: array[:, column] for column, key in enumerate(keys)}
+
+    def _load_array(self, usecols, chunk_rows):
+        # Count lines first so that the result is allocated once, column major.
+        with open(self.file_name, "rb") as file:
+            capacity = sum(block.count(b"\n") for block in iter(lambda: file.read(1 << 20), b"")) + 1
+        with open(self.file_name, "r") as file:
+            header = file.readline().strip().split("\t")
+            columns = len(header) if usecols is None else len(usecols)
+            array = numpy.empty((capacity, columns), dtype=numpy.float64, order='F')
+            rows = 0
+            while True:
+                lines = list(itertools.islice(file, chunk_rows))
+                if not lines:
+                    break
+                # A chunk of only trailing blank lines would make loadtxt warn.
+                lines = [line for line in lines if not line.isspace()]
+                if not lines:
+                    continue
+                chunk = numpy.loadtxt(lines, dtype=numpy.float64, delimiter="\t", usecols=usecols, ndmin=2)
+                array[rows:rows + len(chunk)] = chunk
+                rows += len(chunk)
+        return array[:rows]
 
     def resample_timeseries(self, timestep, verbose=False):
         """This utility can be used to resample the data with a known fixed time step so that an FFT may be taken.
 
            LTspice, as with all versions of Spice, generates variable time steps as needed for covergence.
            The first column of data (first dictionary key) is presumed to be the indepdendent variable, or common indepedent variable, across all columns - almost invariably "time".
+           Each column is linearly interpolated onto the new time base with a single numpy.interp call.
            The original series is destroyed and replaced with the resampled version.
 
 
@@ -91,7 +154,7 @@ class LTspice_wavereader():
             verbose: If True, print debug output.
         """
         keys = [key for key in self.data.keys()]
-        native_times = self.data[keys[0]]
+        native_times = numpy.asarray(self.data[keys[0]], dtype=numpy.float64)
         start = native_times[0]
         stop = native_times[-1]
         new_times = numpy.linspace(
@@ -111,16 +174,12 @@ class LTspice_wavereader():
             print(
                 f"New size:      {eng_string(x=len(new_times), fmt=':.2g', si=True, units=' Points')}")
 
-        self.data[keys[0]] = new_times
+        resampled = {keys[0]: new_times}
         for data_series in keys[1:]:
             if verbose:
                 print(f"Processing: {data_series}")
-            interp_function = interp1d(
-                x=native_times,
-                y=self.data[data_series],
-                kind='linear')
-            self.data[data_series] = [
-                interp_function(time) for time in new_times]
+            resampled[data_series] = numpy.interp(new_times, native_times, self.data[data_series])
+        self.data = resampled
         if verbose:
             print("Resampling Complete!")
 
@@ -99,8 +99,7 @@ class oscilloscope_waveform_dump(oscilloscope):
         self.get_interface().write(":WAVeform:POINts MAXimum")
 
     def _get_channel_data(self, channel_num):
-        self.get_interface().write(f":Waveform:Source CHANNel{channel_num}")
-        return self.fetch_waveform_data()
+        return self.fetch_waveform_data(f"CHANnel{channel_num}")
 
     def _get_scope_time_info(self):
         # Requires Waveform Source to be set to an acive channel
@@ -152,7 +151,7 @@ class oscilloscope_waveform_dump(oscilloscope):
             results_dict[f'channel_{num}_active'] = displayed
             if displayed:
                 results_dict[f"channel_{num}"] = self._get_channel_data(num)
-                for key, value in self.get_waveform_scaling().items():
+                for key, value in self.get_waveform_scaling(f"CHANnel{num}").items():
                     results_dict[f"channel_{num}_{key}"] = value
                 results_dict[f'channel_{num}_name'] = self.user_query_waveform_name(
                     num)
@@ -3,16 +3,112 @@
 >>> from PyICe.data_utils.pattern_generators import TWI_Pattern
 
 """
+import bisect
+import math
+import numpy
 from PyICe.lab_utils.eng_string import eng_string
 from PyICe import LTC_plot
 
 
+class _run_length_line():
+    """One output line of a pattern, held as runs of equal samples until it is rendered.
+
+    >>> line = _run_length_line()
+    >>> line.append(1, 3); line.append(1, 2); line.append(0, 4)
+    >>> line.values, line.ends
+    ([1, 0], [5, 9])
+    >>> line.overwrite(2, 6, 0)
+    >>> line.render().tolist()
+    [1, 1, 0, 0, 0, 0, 0, 0, 0]
+    """
+    def __init__(self):
+        """Create an empty line."""
+        self.values = []
+        self.ends = []  # index after the last sample of each run
+        self._rendered = None
+
+    def __len__(self):
+        """Return the number of samples.
+
+        Returns:
+            int: Number of samples.
+        """
+        return self.ends[-1] if self.ends else 0
+
+    def append(self, value, cycles):
+        """Add *cycles* samples of *value* to the end of the line.
+
+        Args:
+            value: Sample value.
+            cycles: Number of samples.
+        """
+        if cycles <= 0:
+            return
+        if self.values and self.values[-1] == value:
+            self.ends[-1] += cycles
+        else:
+            self.ends.append(len(self) + cycles)
+            self.values.append(value)
+        self._rendered = None
+
+    def last(self):
+        """Return the value of the final sample.
+
+        Returns:
+            The value, or None if the line is empty.
+        """
+        return self.values[-1] if self.values else None
+
+    def overwrite(self, start, stop, value):
+        """Set samples *start* up to, not including, *stop* to *value*.
+
+        The runs at both ends are split and the runs in between replaced
+        by one run, so the cost does not depend on the number of samples.
+
+        Args:
+            start: First sample index.
+            stop: Sample index after the last one. Both are clipped to the line.
+            value: Sample value.
+        """
+        start = max(start, 0)
+        stop = min(stop, len(self))
+        if start >= stop:
+            return
+        first = bisect.bisect_right(self.ends, start)
+        last = bisect.bisect_left(self.ends, stop)
+        (values, ends) = ([value], [stop])
+        if start > (self.ends[first - 1] if first else 0):
+            values.insert(0, self.values[first])
+            ends.insert(0, start)
+        if stop < self.ends[last]:
+            values.append(self.values[last])
+            ends.append(self.ends[last])
+        self.values[first:last + 1] = values
+        self.ends[first:last + 1] = ends
+        self._rendered = None
+
+    def render(self):
+        """Expand the runs into one sample per time step.
+
+        Returns:
+            numpy.ndarray: uint8 samples. The array is shared until the line changes.
+        """
+        if self._rendered is None:
+            self._rendered = numpy.repeat(numpy.array(self.values, dtype=numpy.uint8),
+                                          numpy.diff(numpy.array(self.ends, dtype=numpy.int64), prepend=0))
+        return self._rendered
+
+
 class TWI_Pattern():
     """This class can be used to construct a Two Wire Interface Pattern (I²C or SMBus or whatever) time-slice by time-slice.
 
     It's meant to feed into a pattern generator instrument such as the old HP8110A dual pattern generator or its modern equivalent.
     It has two channels, one for the I²C pins SDA and SCL as well as a strobe channel (which the HP811xx family supports) to trigger a scope.
 
+    Each line is kept as runs of equal samples while the pattern is built, so long dwells and spikes cost
+    nothing per time step. The records are only expanded, into uint8 numpy arrays, by get_SCL(), get_SDA(),
+    get_STB() and get_ALL().
+
     >>> from PyICe.data_utils.pattern_generators import TWI_Pattern
     >>> TWI_Pattern is not None
     True
@@ -412,9 +508,9 @@ class TWI_Pattern():
 
         """
         self.items = []
-        self.SDA = []
-        self.SCL = []
-        self.STB = []
+        self._SDA = _run_length_line()
+        self._SCL = _run_length_line()
+        self._STB = _run_length_line()
         self.sda_spikes = []
         self.scl_spikes = []
 
@@ -469,9 +565,9 @@ class TWI_Pattern():
         """
         cycles = round(tdwell / self.tstep)
         assert cycles >= 0, f"TWI Pattern Generator: tdwell of {tdwell} results in the addition of a negative time slice, not acheivable."
-        self.SCL.extend([SCL] * cycles)
-        self.SDA.extend([SDA] * cycles)
-        self.STB.extend([STB] * cycles)
+        self._SCL.append(SCL, cycles)
+        self._SDA.append(SDA, cycles)
+        self._STB.append(STB, cycles)
 
     def pad_out(self):
         """Perform pad out operation.
@@ -483,10 +579,10 @@ class TWI_Pattern():
         True
 
         """
-        cycles = self.max_record_size - len(self.SCL)
-        self.SCL.extend(self.SCL[-1:] * cycles)
-        self.SDA.extend(self.SDA[-1:] * cycles)
-        self.STB.extend(self.STB[-1:] * cycles)
+        cycles = self.max_record_size - len(self._SCL)
+        for line in (self._SCL, self._SDA, self._STB):
+            if len(line):
+                line.append(line.last(), cycles)
 
     def finalize(self):
         """Run the finalize step.
@@ -502,22 +598,12 @@ class TWI_Pattern():
         for item in self.items:
             item.extend(previous)
             previous = item
-        for sda_spike in self.sda_spikes:
-            for index in range(len(self.SDA)):
-                if index > sda_spike.tstart / \
-                        self.tstep and index <= (sda_spike.tstart + sda_spike.twidth) / self.tstep:
-                    if sda_spike.value:
-                        self.SDA[index] |= 1
-                    else:
-                        self.SDA[index] &= 0
-        for scl_spike in self.scl_spikes:
-            for index in range(len(self.SCL)):
-                if index > scl_spike.tstart / \
-                        self.tstep and index <= (scl_spike.tstart + scl_spike.twidth) / self.tstep:
-                    if scl_spike.value:
-                        self.SCL[index] |= 1
-                    else:
-                        self.SCL[index] &= 0
+        for (spikes, line) in ((self.sda_spikes, self._SDA), (self.scl_spikes, self._SCL)):
+            for spike in spikes:
+                # The time slices after tstart, up to and including tstart + twidth.
+                line.overwrite(math.floor(spike.tstart / self.tstep) + 1,
+                               math.floor((spike.tstart + spike.twidth) / self.tstep) + 1,
+                               1 if spike.value else 0)
         self.audit()
 
     def get_SDA(self):
@@ -533,9 +619,18 @@ class TWI_Pattern():
         True
 
         Returns:
-            The current sda.
+            numpy.ndarray: The SDA record, one uint8 per time step.
+        """
+        return self._SDA.render()
+
+    @property
+    def SDA(self):
+        """The SDA record, one uint8 per time step.
+
+        Returns:
+            numpy.ndarray: See get_SDA().
         """
-        return self.SDA
+        return self.get_SDA()
 
     def get_SCL(self):
         """Return the current scl.
@@ -550,9 +645,18 @@ class TWI_Pattern():
         True
 
         Returns:
-            The current scl.
+            numpy.ndarray: The SCL record, one uint8 per time step.
+        """
+        return self._SCL.render()
+
+    @property
+    def SCL(self):
+        """The SCL record, one uint8 per time step.
+
+        Returns:
+            numpy.ndarray: See get_SCL().
         """
-        return self.SCL
+        return self.get_SCL()
 
     def get_STB(self):
         """Return the current stb.
@@ -567,14 +671,25 @@ class TWI_Pattern():
         True
 
         Returns:
-            The current stb.
+            numpy.ndarray: The STB record, one uint8 per time step.
+        """
+        return self._STB.render()
+
+    @property
+    def STB(self):
+        """The STB record, one uint8 per time step.
+
+        Returns:
+            numpy.ndarray: See get_STB().
         """
-        return self.STB
+        return self.get_STB()
 
     def get_ALL(self, SCL_channel, SDA_channel, STB_channel):
         """Build up the compound record of instrument Channels 1, 2 and 3 (Strobe).
 
         On the HP8110a, for example, the two output channels and the Strobe channel are binarily weighted so it takes values of 0-7 for 3 bits.
+        The record is built from the runs of the three lines without expanding them separately, and can be
+        written as is to a pattern channel such as Agilent_8110a.add_channels_pattern().
 
 
         >>> from PyICe.data_utils.pattern_generators import TWI_Pattern
@@ -587,20 +702,16 @@ class TWI_Pattern():
             STB_channel: Stb channel to use.
 
         Returns:
-            The current all.
+            numpy.ndarray: The compound record, one uint8 per time step.
         """
-        values = []
-        for position in range(len(self.SCL)):
-            values.append(self.SCL[position] *
-                          2**(SCL_channel -
-                              1) +
-                          self.SDA[position] *
-                          2**(SDA_channel -
-                              1) +
-                          self.STB[position] *
-                          2**(STB_channel -
-                              1))
-        return values
+        lines = ((self._SCL, SCL_channel), (self._SDA, SDA_channel), (self._STB, STB_channel))
+        # Every run boundary of any line starts a run of the compound record.
+        bounds = numpy.unique(numpy.array(self._SCL.ends + self._SDA.ends + self._STB.ends, dtype=numpy.int64))
+        values = numpy.zeros(len(bounds), dtype=numpy.uint8)
+        for (line, channel) in lines:
+            line_values = numpy.array(line.values, dtype=numpy.uint8)[numpy.searchsorted(line.ends, bounds)]
+            values += line_values * numpy.uint8(2**(channel - 1))
+        return numpy.repeat(values, numpy.diff(bounds, prepend=0))
 
     def audit(self):
         """Run the audit step.
@@ -612,14 +723,9 @@ class TWI_Pattern():
         True
 
         """
-        assert len(
-            self.SDA) == len(
-            self.SCL), "TWI Pattern Generator: SDA and SCL records unequal length!"
-        assert len(
-            self.SCL) == len(
-            self.STB), "TWI Pattern Generator: SCL and STB records unequal length!"
-        assert len(
-            self.SCL) <= self.max_record_size, f"TWI Pattern Generator: Record size of {len(self.SCL)} exceeds max record size of {self.max_record_size}!"
+        assert len(self._SDA) == len(self._SCL), "TWI Pattern Generator: SDA and SCL records unequal length!"
+        assert len(self._SCL) == len(self._STB), "TWI Pattern Generator: SCL and STB records unequal length!"
+        assert len(self._SCL) <= self.max_record_size, f"TWI Pattern Generator: Record size of {len(self._SCL)} exceeds max record size of {self.max_record_size}!"
 
     def visualize(self, title=None, file_basename=None, offset_SCL=5,
                   offset_SDA=3, offset_STB=1, plot_sizex=5, plot_sizey=4):
@@ -641,26 +747,26 @@ class TWI_Pattern():
             plot_sizey: Plot sizey to use.
             title: Title string for display or report heading.
         """
-        times = [index * self.tstep for index in range(len(self.SCL))]
+        times = numpy.arange(len(self._SCL)) * self.tstep
         G0 = LTC_plot.scope_plot(plot_title="TWI Pattern" if title is None else title,
                                  plot_name=None,
                                  xaxis_label=f"{eng_string(x=times[-1] / 10, fmt=':.3g', si=True, units='s')} / DIV",
                                  xlims=(times[0], times[-1]),
                                  ylims=(0, 8))
-        SCL = [value + offset_SCL for value in self.SCL]
-        SDA = [value + offset_SDA for value in self.SDA]
-        STB = [value + offset_STB for value in self.STB]
-        G0.add_trace(data=zip(times, SCL),
+        SCL = self.get_SCL().astype(float) + offset_SCL
+        SDA = self.get_SDA().astype(float) + offset_SDA
+        STB = self.get_STB().astype(float) + offset_STB
+        G0.add_trace(data=numpy.column_stack((times, SCL)),
                      color=LTC_plot.LT_RED_1,
                      marker=None,
                      markersize=0,
                      legend="SCL")
-        G0.add_trace(data=zip(times, SDA),
+        G0.add_trace(data=numpy.column_stack((times, SDA)),
                      color=LTC_plot.LT_BLUE_1,
                      marker=None,
                      markersize=0,
                      legend="SDA")
-        G0.add_trace(data=zip(times, STB),
+        G0.add_trace(data=numpy.column_stack((times, STB)),
                      color=LTC_plot.LT_GREEN_1,
                      marker=None,
                      markersize=0,
@@ -674,7 +780,7 @@ class TWI_Pattern():
             use_axes_scale=False,
             fontsize=10)
         G0.add_note(
-            note=f"Pattern Length = {len(self.SCL)}",
+            note=f"Pattern Length = {len(self._SCL)}",
             location=[
                 0.01,
                 0.99],
@@ -3,10 +3,14 @@
 >>> from PyICe.data_utils.stdf_utils import FileReader
 
 """
-from pystdf.IO import Parser
+from pystdf.IO import Parser, EofException
 import pystdf.V4
+import hashlib
+import numpy
+import struct
 import time
 import math
+import os
 from ..lab_utils.banners import print_banner
 # ENUMS for fields by position within STDF record to make this code more readable.
 # See: http://www.kanwoda.com/wp-content/uploads/2015/05/std-spec.pdf
@@ -73,17 +77,24 @@ class FileReader:
     True
 
     """
-    def __init__(self):
+    def __init__(self, callback=None):
         """Initialize file reader.
 
         Stores configuration in ``data`` for use by other methods.
 
         >>> from PyICe.data_utils.stdf_utils import FileReader
-        >>> FileReader is not None
-        True
+        >>> seen = []
+        >>> FileReader(callback=seen.append).after_send(None, ('record', 'fields'))
+        >>> seen
+        [('record', 'fields')]
 
+        Args:
+            callback: Optional callable receiving each parsed record as it
+                arrives. If given, records are streamed to it instead of
+                being accumulated in ``data``.
         """
         self.data = []
+        self._callback = callback
 
     def after_send(self, dataSource, data):
         """Perform after send operation.
@@ -99,7 +110,10 @@ class FileReader:
             data: Data to write.
             dataSource: Datasource to use.
         """
-        self.data.append(data)
+        if self._callback is not None:
+            self._callback(data)
+        else:
+            self.data.append(data)
 
     def write(self, line):
         """Write a value to the channel.
@@ -132,19 +146,28 @@ class FileReader:
 class stdf_reader():
     """Stdf_reader.
 
+    Parametric results are held in a columnar store rather than per-part
+    record lists: ``results`` is a parts x tests float32 matrix (nan where
+    a part did not run a test), with matching ``test_flags``, ``tested``
+    and ``passed`` matrices. Rows follow ``part_ids`` and columns follow
+    ``testnums``, so fetching every part's result for one test is a single
+    column lookup.
+
     >>> from PyICe.data_utils.stdf_utils import stdf_reader
     >>> stdf_reader is not None
     True
 
     """
-    def __init__(self, filename, exit_if_malformed=True):
+    _CACHE_VERSION = 1
+
+    def __init__(self, filename, exit_if_malformed=True, cache_dir=None):
         """Creates an object that can be interrogated for both stdf metadata like test setup time and device numbers as well as any individual test.
 
         It utilizes the pystdf module which does the really dirty business of parsing the raw .stdf file and all of its 1985 file structure economizations.
-        Upon object creation, the file will be parsed by pystdf and then scanned again record by record to produce a far friendlier collection of interrogation methods.
-        The main attribute self.parts is a dictionary of devices with part numbers as the key.
-        The part number will be a string as that's what pystdf returned.
+        Upon object creation, the file is parsed by pystdf and each record is folded into the columnar store as it arrives, so the record stream is never held in memory.
+        Part numbers are strings as that's what pystdf returned.
         A secondary attribute self.metadata is a dictionary of metadata objects like "SETUPTIME" and "STARTTIME".
+        If cache_dir is given, the columnar store is saved there keyed by a hash of the file contents, and later readers of the same file load it instead of parsing.
 
 
         >>> from PyICe.data_utils.stdf_utils import stdf_reader
@@ -154,14 +177,25 @@ class stdf_reader():
         Args:
             exit_if_malformed: Exit if malformed to use.
             filename: File path.
+            cache_dir: Optional directory for the parsed data cache.
         """
         self.exit_if_malformed = exit_if_malformed
+        cache_file = None
+        if cache_dir is not None:
+            cache_file = os.path.join(cache_dir, f'{_file_digest(filename)}.v{self._CACHE_VERSION}.npz')
+            if os.path.exists(cache_file):
+                self.load_cache(cache_file)
+                return
         self.scan_file(filename)
+        if cache_file is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+            self.save_cache(cache_file)
 
     def scan_file(self, filename):
         """Perform scan file operation.
 
-        Steps through a range of values, collecting data at each point.
+        Streams the file through pystdf, parsing only the record types used
+        here and folding each one into the columnar store as it arrives.
 
 
         >>> from PyICe.data_utils.stdf_utils import stdf_reader
@@ -174,106 +208,239 @@ class stdf_reader():
         Raises:
             Exception: If an unexpected error occurs.
         """
+        self._filename = filename
+        self._state = None
+        self._this_part = {}
+        self._this_header = [None, None]
+        self._columns = {}
+        self._part_rows = {}
+        self.metadata = {}
+        self.part_ids = []
+        self._part_fields = {name: [] for name in ('HEAD', 'SITE', 'XLOC', 'YLOC', 'SOFTBIN', 'HARDBIN', 'PASSING')}
+        self._results = numpy.full((0, 0), numpy.nan, dtype=numpy.float32)
+        self._test_flags = numpy.zeros((0, 0), dtype=numpy.uint8)
+        self._tested = numpy.zeros((0, 0), dtype=bool)
         with open(filename, 'rb') as file:
-            p = Parser(inp=file, reopen_fn=None)
-            reader = FileReader()
-            p.addSink(reader)
+            p = Parser(recTypes=[pystdf.V4.mir, pystdf.V4.pir, pystdf.V4.ptr, pystdf.V4.prr, pystdf.V4.mrr], inp=file, reopen_fn=None)
+            p.recordParsers[(pystdf.V4.ptr.typ, pystdf.V4.ptr.sub)] = _parse_ptr_prefix
+            p.addSink(FileReader(callback=self._scan_record))
             p.parse()
-            self.parts = {}
-            self.metadata = {}
-            state = None
-            this_part: dict = {}
-            for line in reader.data:
-                record_type = type(line[RECORDTYPE])
-                if record_type is pystdf.V4.Sbr:
-                    pass
-                    # self.metadata["BINCOUNT"][line[DATAOBJECT][SBIN_NUM]] =
-                    # line[DATAOBJECT][SBIN_CNT] # Anyone care about this
-                    # record, seems redundant?
-                if record_type is pystdf.V4.Mir:                        # Master information record
-                    if state not in [None]:
-                        print_banner(
-                            f'Corrupted STDF File: {filename}!',
-                            f'Got an MIR but not as the first Field. Last record type is "{state}".',
-                            length=160)
-                        if self.exit_if_malformed:
-                            raise Exception(
-                                "\n\nSet exit_if_malformed to False if you want to push on.")
-                    self.metadata["SETUPTIME"] = {
-                        "UNIX": line[DATAOBJECT][SETUPTIME],
-                        "HUMAN": time.strftime(
-                            '%Y-%m-%d %H:%M:%S',
-                            time.localtime(
-                                line[DATAOBJECT][SETUPTIME]))}
-                    self.metadata["STARTTIME"] = {
-                        "UNIX": line[DATAOBJECT][STARTTIME],
-                        "HUMAN": time.strftime(
-                            '%Y-%m-%d %H:%M:%S',
-                            time.localtime(
-                                line[DATAOBJECT][STARTTIME]))}
-                    state = "MIR"
-                if record_type is pystdf.V4.Pir:                        # Product Information record - New Part Found!
-                    if state not in ["MIR", "PRR"]:
-                        print_banner(
-                            f'Corrupted STDF File: {filename}',
-                            f'Got a PIR but not after an MIR or after a PRR. Last record type is "{state}".',
-                            length=160)
-                        if self.exit_if_malformed:
-                            raise Exception(
-                                "\n\nSet exit_if_malformed to False if you want to push on.")
-                    # Each unit gets a fresh dictionary.
-                    this_part = {}
-                    # Grab the header.
-                    this_part["HEADER"] = line[DATAOBJECT]
-                    # Start a new list of tests.
-                    this_part["TESTS"] = []
-                    state = "PIR"
-                # Parametric Test Record - This is a test within this part.
-                if record_type is pystdf.V4.Ptr:
-                    if state not in ["PIR", "PTR"]:
-                        print_banner(
-                            f'Corrupted STDF File: {filename}',
-                            f'Got a PTR but not at after a PIR or another PTR. Last record type is "{state}".',
-                            length=160)
-                        if self.exit_if_malformed:
-                            raise Exception(
-                                "\n\nSet exit_if_malformed to False if you want to push on.")
-                    # Grab the test data.
-                    this_part["TESTS"].append(line[DATAOBJECT])
-                    state = "PTR"
-                # Product Results record - End of this part.
-                if record_type is pystdf.V4.Prr:
-                    if state not in ["PIR", "PTR"]:
-                        print_banner(
-                            f'Corrupted STDF File: {filename}',
-                            f'Got a PRR but not at after a PIR or a PTR. Last record type is "{state}".',
-                            length=160)
-                        if self.exit_if_malformed:
-                            raise Exception(
-                                "\n\nSet exit_if_malformed to False if you want to push on.")
-                    this_part["XLOC"] = line[DATAOBJECT][XLOC]
-                    this_part["YLOC"] = line[DATAOBJECT][YLOC]
-                    this_part["SOFTBIN"] = line[DATAOBJECT][SOFT_BIN]
-                    this_part["HARDBIN"] = line[DATAOBJECT][HARD_BIN]
-                    flag = line[DATAOBJECT][PART_FLG]
-                    this_part["PASSING"] = (
-                        flag & PRR_PART_FLG_FAILED_BIT != PRR_PART_FLG_FAILED_BIT) and (
-                        flag & PRR_PART_FLG_INVALID_BIT != PRR_PART_FLG_INVALID_BIT) and (
-                        flag & PRR_PART_FLG_INCOMPLETE_BIT != PRR_PART_FLG_INCOMPLETE_BIT)
-                    # Set the key to the device number and attach the data.
-                    self.parts[line[DATAOBJECT][PARTNUM]] = this_part
-                    state = "PRR"
-                if record_type is pystdf.V4.Mrr:                        # Master information record
-                    if state not in ["PRR"]:
-                        print_banner(
-                            f'Corrupted STDF File: {filename}',
-                            f'Got an MRR but not after a PRR. Last record type is "{state}".',
-                            length=160)
-                        if self.exit_if_malformed:
-                            raise Exception(
-                                "\n\nSet exit_if_malformed to False if you want to push on.")
-                    state = "MRR"
-            file.close()
+        rows, columns = len(self.part_ids), len(self._columns)
+        self.results = numpy.ascontiguousarray(self._results[:rows, :columns])
+        self.test_flags = numpy.ascontiguousarray(self._test_flags[:rows, :columns])
+        self.tested = numpy.ascontiguousarray(self._tested[:rows, :columns])
+        del self._results, self._test_flags, self._tested
+        self.testnums = numpy.fromiter(self._columns, dtype=numpy.int64, count=columns)
+        # Fields missing from truncated records are stored as -1.
+        for attribute, name in (('xlocs', 'XLOC'), ('ylocs', 'YLOC'), ('softbins', 'SOFTBIN'), ('hardbins', 'HARDBIN'),
+                                ('_heads', 'HEAD'), ('_sites', 'SITE')):
+            setattr(self, attribute, numpy.array([-1 if value is None else value for value in self._part_fields[name]], dtype=numpy.int32))
+        self.part_passing = numpy.array(self._part_fields['PASSING'], dtype=bool)
+        del self._part_fields, self._this_part
+        self._index()
+
+    def _malformed(self, *lines):
+        print_banner(f'Corrupted STDF File: {self._filename}', *lines, length=160)
+        if self.exit_if_malformed:
+            raise Exception(
+                "\n\nSet exit_if_malformed to False if you want to push on.")
+
+    def _scan_record(self, line):
+        record_type = type(line[RECORDTYPE])
+        if record_type is pystdf.V4.Ptr:                            # Parametric Test Record - This is a test within this part.
+            if self._state not in ["PIR", "PTR"]:
+                self._malformed(f'Got a PTR but not at after a PIR or another PTR. Last record type is "{self._state}".')
+            # First result of each test number in the part wins.
+            self._this_part.setdefault(line[DATAOBJECT][PTR_TEST_NUM], line[DATAOBJECT])
+            self._state = "PTR"
+        elif record_type is pystdf.V4.Pir:                          # Product Information record - New Part Found!
+            if self._state not in ["MIR", "PRR"]:
+                self._malformed(f'Got a PIR but not after an MIR or after a PRR. Last record type is "{self._state}".')
+            # Each unit gets a fresh dictionary of tests, and the header.
+            self._this_part = {}
+            self._this_header = line[DATAOBJECT]
+            self._state = "PIR"
+        elif record_type is pystdf.V4.Prr:                          # Product Results record - End of this part.
+            if self._state not in ["PIR", "PTR"]:
+                self._malformed(f'Got a PRR but not at after a PIR or a PTR. Last record type is "{self._state}".')
+            self._store_part(line[DATAOBJECT])
+            self._this_part = {}
+            self._state = "PRR"
+        elif record_type is pystdf.V4.Mir:                          # Master information record
+            if self._state not in [None]:
+                self._malformed(f'Got an MIR but not as the first Field. Last record type is "{self._state}".')
+            self._set_times(line[DATAOBJECT][SETUPTIME], line[DATAOBJECT][STARTTIME])
+            self._state = "MIR"
+        elif record_type is pystdf.V4.Mrr:                          # Master results record
+            if self._state not in ["PRR"]:
+                self._malformed(f'Got an MRR but not after a PRR. Last record type is "{self._state}".')
+            self._state = "MRR"
+
+    def _set_times(self, setup_time, start_time):
+        self.metadata["SETUPTIME"] = {
+            "UNIX": setup_time,
+            "HUMAN": time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(setup_time))}
+        self.metadata["STARTTIME"] = {
+            "UNIX": start_time,
+            "HUMAN": time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(start_time))}
+
+    def _store_part(self, prr):
+        part_id = prr[PARTNUM]
+        columns = [self._columns.setdefault(testnum, len(self._columns)) for testnum in self._this_part]
+        row = self._part_rows.get(part_id)
+        if row is None:
+            # Set the key to the device number.
+            row = self._part_rows[part_id] = len(self.part_ids)
+            self.part_ids.append(part_id)
+            for values in self._part_fields.values():
+                values.append(None)
+        self._reserve(row + 1, len(self._columns))
+        # A retested part replaces the earlier results for its part number.
+        self._results[row] = numpy.nan
+        self._test_flags[row] = 0
+        self._tested[row] = False
+        if columns:
+            tests = self._this_part.values()
+            self._results[row, columns] = [numpy.nan if test[PTR_RESULT] is None else test[PTR_RESULT] for test in tests]
+            # a truncated record without flags cannot be trusted to have passed
+            self._test_flags[row, columns] = [PTR_TEST_FLG_FLAG_INVALID if test[PTR_TEST_FLG] is None else test[PTR_TEST_FLG] for test in tests]
+            self._tested[row, columns] = True
+        flag = prr[PART_FLG]
+        fields = self._part_fields
+        fields['HEAD'][row], fields['SITE'][row] = self._this_header[HEAD_NUM], self._this_header[SITE_NUM]
+        fields['XLOC'][row] = prr[XLOC]
+        fields['YLOC'][row] = prr[YLOC]
+        fields['SOFTBIN'][row] = prr[SOFT_BIN]
+        fields['HARDBIN'][row] = prr[HARD_BIN]
+        fields['PASSING'][row] = (
+            flag & PRR_PART_FLG_FAILED_BIT != PRR_PART_FLG_FAILED_BIT) and (
+            flag & PRR_PART_FLG_INVALID_BIT != PRR_PART_FLG_INVALID_BIT) and (
+            flag & PRR_PART_FLG_INCOMPLETE_BIT != PRR_PART_FLG_INCOMPLETE_BIT)
+
+    def _reserve(self, rows, columns):
+        # Grow the store geometrically so parsing stays linear in the file size.
+        capacity_rows, capacity_columns = self._results.shape
+        if rows <= capacity_rows and columns <= capacity_columns:
+            return
+        shape = (max(rows, 2 * capacity_rows, 64), max(columns, capacity_columns + capacity_columns // 2, 16))
+        for name, fill in (('_results', numpy.nan), ('_test_flags', 0), ('_tested', False)):
+            old = getattr(self, name)
+            new = numpy.full(shape, fill, dtype=old.dtype)
+            new[:old.shape[0], :old.shape[1]] = old
+            setattr(self, name, new)
+
+    def _index(self):
+        self._part_rows = {part_id: row for row, part_id in enumerate(self.part_ids)}
+        self._columns = {testnum: column for column, testnum in enumerate(self.testnums.tolist())}
+        self.passed = self.tested & (self.test_flags == 0)  # All bits must be 0 to pass
+        self._parts = None
+
+    def save_cache(self, cache_file):
+        """Save the columnar store to an uncompressed .npz file.
+
+        >>> from PyICe.data_utils.stdf_utils import stdf_reader
+        >>> hasattr(stdf_reader, 'save_cache')
+        True
+
+        Args:
+            cache_file: Destination file path.
+        """
+        times = [self.metadata[key]["UNIX"] for key in ("SETUPTIME", "STARTTIME") if key in self.metadata]
+        temp_file = f'{cache_file}.{os.getpid()}.tmp'
+        with open(temp_file, 'wb') as f:
+            numpy.savez(f, part_ids=numpy.array(self.part_ids, dtype=str), testnums=self.testnums,
+                        results=self.results, test_flags=self.test_flags, tested=self.tested,
+                        xlocs=self.xlocs, ylocs=self.ylocs, softbins=self.softbins, hardbins=self.hardbins,
+                        part_passing=self.part_passing, heads=self._heads, sites=self._sites,
+                        times=numpy.array(times, dtype=numpy.int64))
+        os.replace(temp_file, cache_file)
+
+    def load_cache(self, cache_file):
+        """Load a columnar store written by :meth:`save_cache`.
+
+        >>> from PyICe.data_utils.stdf_utils import stdf_reader
+        >>> hasattr(stdf_reader, 'load_cache')
+        True
+
+        Args:
+            cache_file: Source file path.
+        """
+        with numpy.load(cache_file) as cache:
+            self.part_ids = cache['part_ids'].tolist()
+            self.testnums = cache['testnums']
+            self.results = cache['results']
+            self.test_flags = cache['test_flags']
+            self.tested = cache['tested']
+            self.xlocs = cache['xlocs']
+            self.ylocs = cache['ylocs']
+            self.softbins = cache['softbins']
+            self.hardbins = cache['hardbins']
+            self.part_passing = cache['part_passing']
+            self._heads = cache['heads']
+            self._sites = cache['sites']
+            times = cache['times'].tolist()
+        self.metadata = {}
+        if times:
+            self._set_times(*times)
+        self._index()
+
+    @property
+    def parts(self):
+        """Per-part summary dictionary keyed by part number, built on first use.
+
+        Each entry holds "HEADER" ([HEAD_NUM, SITE_NUM]), "XLOC", "YLOC",
+        "SOFTBIN", "HARDBIN" and "PASSING". Test results are in the
+        columnar arrays rather than per-part lists.
+
+        >>> from PyICe.data_utils.stdf_utils import stdf_reader
+        >>> isinstance(stdf_reader.parts, property)
+        True
+
+        Returns:
+            dict: Part number to part summary.
+        """
+        if self._parts is None:
+            self._parts = {part_id: {"HEADER": [head, site], "XLOC": x, "YLOC": y, "SOFTBIN": softbin,
+                                     "HARDBIN": hardbin, "PASSING": passing}
+                           for part_id, head, site, x, y, softbin, hardbin, passing in zip(
+                               self.part_ids, self._heads.tolist(), self._sites.tolist(), self.xlocs.tolist(),
+                               self.ylocs.tolist(), self.softbins.tolist(), self.hardbins.tolist(),
+                               self.part_passing.tolist())}
+        return self._parts
+
+    def get_testnum_column(self, testnum):
+        """Return the column index of a test number in the result matrices.
+
+        >>> from PyICe.data_utils.stdf_utils import stdf_reader
+        >>> hasattr(stdf_reader, 'get_testnum_column')
+        True
+
+        Args:
+            testnum: Testnum to use.
+
+        Returns:
+            int: Column index, or None if no part ran the test.
+        """
+        return self._columns.get(testnum)
+
+    def get_testnum_results(self, testnum):
+        """Return every part's result for one test as a numpy view.
+
+        >>> from PyICe.data_utils.stdf_utils import stdf_reader
+        >>> hasattr(stdf_reader, 'get_testnum_results')
+        True
+
+        Args:
+            testnum: Testnum to use.
+
+        Returns:
+            numpy.ndarray: One float32 result per entry of part_ids, nan
+            for parts that did not run the test.
+
+        Raises:
+            KeyError: If no part ran the test.
+        """
+        return self.results[:, self._columns[testnum]]
 
     def test_passed(self, device, testnum):
         """Return test passed result.
@@ -290,11 +457,12 @@ class stdf_reader():
             testnum: Testnum to use.
 
         Returns:
-            True if the test passed, False otherwise.
+            True if the test passed, False otherwise, None if the part did
+            not run the test.
         """
-        for test in self.parts[str(device)]["TESTS"]:
-            if test[PTR_TEST_NUM] == testnum:
-                return test[PTR_TEST_FLG] == 0  # All bits must be 0 to pass
+        row, column = self._part_rows[str(device)], self._columns.get(testnum)
+        if column is not None and self.tested[row, column]:
+            return bool(self.passed[row, column])
 
     def part_passed(self, device):
         """Takes a part number <int> or <string>.
@@ -313,7 +481,7 @@ class stdf_reader():
         Returns:
             True if the part passed all tests, False otherwise.
         """
-        return self.parts[str(device)]["PASSING"]
+        return bool(self.part_passing[self._part_rows[str(device)]])
 
     def get_all_passing_parts(self):
         """Returns a list of all parts with a Passing flag.
@@ -329,11 +497,7 @@ class stdf_reader():
         Returns:
             The current all passing parts.
         """
-        passing_parts = []
-        for part in self.parts:
-            if self.parts[part]["PASSING"]:
-                passing_parts.append(part)
-        return passing_parts
+        return [self.part_ids[row] for row in numpy.flatnonzero(self.part_passing)]
 
     def get_all_in_bins_list(self, bins_list):
         """Takes a bin number list.
@@ -351,11 +515,7 @@ class stdf_reader():
         Returns:
             The current all in bins list.
         """
-        parts_in_bins = []
-        for part in self.parts:
-            if self.parts[part]["SOFTBIN"] in bins_list:
-                parts_in_bins.append(part)
-        return parts_in_bins
+        return [self.part_ids[row] for row in numpy.flatnonzero(numpy.isin(self.softbins, list(bins_list)))]
 
     def get_bin_numbers(self, device_list):
         """Takes a part number list <int>s or <string>s.
@@ -376,7 +536,7 @@ class stdf_reader():
         results = []
         for part in device_list:
             part = str(part)  # All part numbers are strings
-            results.append({"PART": part, "BIN": self.parts[part]["SOFTBIN"]})
+            results.append({"PART": part, "BIN": int(self.softbins[self._part_rows[part]])})
         return results
 
     def get_bin_number(self, device):
@@ -411,10 +571,7 @@ class stdf_reader():
         Returns:
             The current all part indices.
         """
-        parts_list = []
-        for part in self.parts:
-            parts_list.append(part)
-        return parts_list
+        return list(self.part_ids)
 
     def get_all_of_testnum(self, testnum):
         """The only argument is test number (testnum) which is an integer in the .stdf format which is a list of 10 digits like 104000041 which was stored as the U*4 or unsigned 4 byte format.
@@ -423,6 +580,7 @@ class stdf_reader():
         Usually the left 5 digits of the returned value represent the major test number (lefft padded with 0s) and the right 5 digits represent the subordinate test number (right justified).
         Your mileage may vary. See to_eagle_testnumber and from_eagle_testnumber at the bottom of this file.
         Returns a python dictionary with the device number (a string as returned by pystdf) and the value (usually float?) as the tester reading for that device.
+        Use get_testnum_results to get the same column as a numpy array without building a dictionary.
 
 
         >>> from PyICe.data_utils.stdf_utils import stdf_reader
@@ -435,12 +593,11 @@ class stdf_reader():
         Returns:
             The current all of testnum.
         """
-        results = {}
-        for part in self.parts:
-            for test in self.parts[part]["TESTS"]:
-                if test[PTR_TEST_NUM] == testnum:
-                    results[part] = test[PTR_RESULT]
-        return results
+        column = self._columns.get(testnum)
+        if column is None:
+            return {}
+        rows = numpy.flatnonzero(self.tested[:, column])
+        return dict(zip([self.part_ids[row] for row in rows], self.results[rows, column].tolist()))
 
     def get_value(self, devnum, testnum):
         """Takes arguments devnum and testnum.
@@ -459,11 +616,11 @@ class stdf_reader():
             testnum: Testnum to use.
 
         Returns:
-            The current value.
+            The current value, or None if the part did not run the test.
         """
-        for test in self.parts[str(devnum)]["TESTS"]:
-            if test[PTR_TEST_NUM] == testnum:
-                return test[PTR_RESULT]
+        row, column = self._part_rows[str(devnum)], self._columns.get(testnum)
+        if column is not None and self.tested[row, column]:
+            return float(self.results[row, column])
 
     def get_setup_time(self):
         """Returns the tester's setup time as a dictionary keyed by "UNIX" and "STRING".
@@ -518,7 +675,7 @@ class stdf_reader():
         Returns:
             The current xlocation.
         """
-        return self.parts[str(devnum)]["XLOC"]
+        return int(self.xlocs[self._part_rows[str(devnum)]])
 
     def get_ylocation(self, devnum):
         """Takes the argument devnum and returns the y location on the wafer as an integer.
@@ -537,7 +694,40 @@ class stdf_reader():
         Returns:
             The current ylocation.
         """
-        return self.parts[str(devnum)]["YLOC"]
+        return int(self.ylocs[self._part_rows[str(devnum)]])
+
+
+_PTR_PREFIX_FORMATS = 'IBBBBf'  # TEST_NUM, HEAD_NUM, SITE_NUM, TEST_FLG, PARM_FLG, RESULT
+
+
+def _parse_ptr_prefix(parser, header, fields):
+    # pystdf record parser for PTRs that decodes only the fixed size fields
+    # up to RESULT in one unpack and skips the text, scaling and limit
+    # fields, which are most of the per-field parsing cost of a lot.
+    buf = parser.inp.read(header.len)
+    if len(buf) < header.len:
+        parser.eof = 1
+        raise EofException()
+    header.len = 0
+    try:
+        return list(struct.unpack_from(parser.endian + _PTR_PREFIX_FORMATS, buf))
+    except struct.error:
+        # truncated record; keep whatever leading fields are present
+        offset = 0
+        for fmt in _PTR_PREFIX_FORMATS:
+            if offset + struct.calcsize(fmt) > len(buf):
+                break
+            fields.append(struct.unpack_from(parser.endian + fmt, buf, offset)[0])
+            offset += struct.calcsize(fmt)
+        return fields
+
+
+def _file_digest(filename):
+    digest = hashlib.sha256()
+    with open(filename, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
 
 
 def to_eagle_testnumber(test_number):
@@ -5,92 +5,130 @@
 """
 from PyICe.lab_utils.banners import print_banner
 from statsmodels.tsa.stattools import adfuller
-from operator import itemgetter
 from scipy import stats
 import numpy
 
 warned_1_already = False
-warned_2_already = False
+
+
+def _first_index(mask):
+    """Return the index of the first True element along the last axis, or -1.
+
+    >>> import numpy
+    >>> from PyICe.data_utils.wave_analysis import _first_index
+    >>> _first_index(numpy.array([False, True, True]))
+    1
+    >>> _first_index(numpy.array([[False, False], [False, True]])).tolist()
+    [-1, 1]
+
+    Args:
+        mask: Boolean array, one search per row.
+
+    Returns:
+        int for a 1-D mask, otherwise an integer array with one index per row.
+    """
+    index = numpy.argmax(mask, axis=-1)
+    found = numpy.take_along_axis(mask, numpy.expand_dims(index, -1), axis=-1)[..., 0]
+    index = numpy.where(found, index, -1)
+    return int(index) if index.ndim == 0 else index
+
+
+def _last_index(mask):
+    """Return the index of the last True element along the last axis, or -1.
+
+    >>> import numpy
+    >>> from PyICe.data_utils.wave_analysis import _last_index
+    >>> _last_index(numpy.array([True, True, False]))
+    1
+    >>> _last_index(numpy.array([False, False]))
+    -1
+
+    Args:
+        mask: Boolean array, one search per row.
+
+    Returns:
+        int for a 1-D mask, otherwise an integer array with one index per row.
+    """
+    reverse_index = _first_index(mask[..., ::-1])
+    index = numpy.where(reverse_index == -1, -1, mask.shape[-1] - 1 - reverse_index)
+    return int(index) if index.ndim == 0 else index
+
+
+def _as_columns(data):
+    # assume (x,y) paired unless proven otherwise for legacy compatibility
+    global warned_1_already
+    try:
+        if len(data) == 2 and len(data[0]) > 2:
+            # it's in columns
+            return data[0], data[1]
+    except TypeError:
+        # zip objects (and maybe other generators) have no len
+        data = list(data)
+    # assume it's in pairs
+    # there's one corner case here, if the waveform data is exactly 2x2.
+    if not warned_1_already:
+        print_banner(
+            "WARNING: The waveform class instantiated with (x,y) pair data (legacy format) N x 2.",
+            "This is both expensive to zip together from independent database columns",
+            "and expensive to unzip on the other side of the function call, for no net benefit.",
+            "Consider sending data in instead as (x_data, y_data) 2 x N column tuple.",
+            length=160)
+        warned_1_already = True
+    pairs = numpy.asarray(data, dtype=numpy.float64)
+    if pairs.ndim != 2 or pairs.shape[1] != 2:
+        raise ValueError(f"\nWaveform Analyser: expected (x_data, y_data) columns or N x 2 (x,y) pairs, got shape {pairs.shape}.\n")
+    return pairs[:, 0], pairs[:, 1]
 
 
 class waveform(object):
-    """Waveform (object subclass).
+    """Single captured waveform held as contiguous float64 x and y arrays.
+
+    Edge, trigger and settling searches are numpy mask operations rather
+    than Python loops. To analyze many captures of the same length at once,
+    use :class:`waveform_batch` instead.
 
     >>> from PyICe.data_utils.wave_analysis import waveform
-    >>> waveform is not None
-    True
+    >>> w = waveform(([0, 1, 2, 3], [0.0, 0.0, 1.0, 1.0]), leader_size=0.25)
+    >>> w.ydata.dtype, w.ydata.flags['C_CONTIGUOUS']
+    (dtype('float64'), True)
 
     """
     # @profile
     def __init__(self, data, trigger_sigma=10, trigger_level=None,
                  leader_size=0.099, debug=False, stationarity_check=False):
         """Initialize waveform.
-        Initializes 16 instance attributes that configure the object's
-        behavior.
-
-        Initializes 23 instance attributes that configure the object's behavior.
 
+        *data* is preferably an (x_data, y_data) column pair, for example two
+        numpy arrays straight from a database query. Legacy N x 2 (x,y) pair
+        data is still accepted and unzipped with a single numpy conversion.
+        Columns that are already contiguous float64 arrays (for example from
+        :meth:`from_blobs`) are used without copying.
 
         >>> from PyICe.data_utils.wave_analysis import waveform
         >>> hasattr(waveform, '__init__')
         True
 
         Args:
-            data: Data to write.
+            data: (x_data, y_data) columns, or an iterable of (x, y) pairs.
             debug: If True, enable debug output.
-            leader_size: Leader size to use.
+            leader_size: Fraction of the record at each end used to measure
+                the settled levels before and after the transient.
             stationarity_check: Stationarity check to use.
             trigger_level: Trigger level to use.
             trigger_sigma: Trigger sigma to use.
+
+        Raises:
+            ValueError: If x and y data do not have the same length.
         """
         _MAX_POINTS = 10000  # noqa: F841
         LEADER_SIZE = leader_size
         MAX_NONSTATIONARITY = 1e-4
-        global warned_2_already
-
-        # Figure out transposition/zip status.
-        # assume (x,y) paired unless proven otherwise for legacy compatibility
-        # This is pretty hacky, but promises trememdous speed improvement when
-        # passing data straight from sqlite and numpy to here, compared with
-        # list(zip) operations to meet the legacy calling argument format, but
-        # are then immediately undone.
-        def _zip(data):
-            global warned_1_already
-            # Let the nagging begin
-            if not warned_1_already:
-                print_banner(
-                    "WARNING: The waveform class instantiated with (x,y) pair data (legacy format) N x 2.",
-                    "This is both expensive to zip together from independent database columns",
-                    "and expensive to unzip on the other side of the function call, for no net benefit.",
-                    "Consider sending data in instead as (x_data, y_data) 2 x N column tuple.",
-                    length=160)
-                warned_1_already = True
-            self.data = data
-            # TODO numpy array, not list!
-            self.xdata, self.ydata = list(zip(*data))
-        try:
-            if len(data) == 2 and len(data[0]) > 2:
-                # it's in columns
-                # list? necessary? Trying not to do too much work here.
-                self.data = zip(data)
-                self.xdata = data[0]  # This should be faster!
-                self.ydata = data[1]
-            else:
-                # assume it's in pairs
-                # there's one corner case here, if the waveform data is exactly
-                # 2x2.
-                _zip(data)
-        except TypeError:
-            # zip objects (and maybe other generators) have no len
-            _zip(data)
-        # and then there was more nagging
-        if not isinstance(self.xdata, type(self.ydata)) != numpy.ndarray:
-            if not warned_2_already:
-                print_banner(f"WARNING: The waveform class initialized with non-numpy arrays ({type(self.xdata)},{type(self.ydata)}).", "They will be converted here to enable more computationally efficient internal methods, at some expense.",
-                             "Consider whether this data can travel from its source (SQLite?) to here without needing to become a Python list at any point in its journey.", "Contact pyice-developers@analog.com for help in converting column types and/or data.", "TODO box_filter, etc.", length=160)
-                self.xdata = numpy.array(self.xdata)
-                self.ydata = numpy.array(self.ydata)
-                warned_2_already = True
+
+        xdata, ydata = _as_columns(data)
+        self.xdata = numpy.ascontiguousarray(xdata, dtype=numpy.float64)
+        self.ydata = numpy.ascontiguousarray(ydata, dtype=numpy.float64)
+        if self.xdata.ndim != 1 or self.xdata.shape != self.ydata.shape:
+            raise ValueError(f"\nWaveform Analyser: x and y data must be 1-D and equal length, got {self.xdata.shape} and {self.ydata.shape}.\n")
 
         # Leadin and leadout.
         self.index_size = int(len(self.xdata) * LEADER_SIZE)
@@ -123,12 +161,9 @@ class waveform(object):
         self._trigger_level = trigger_level
         self.index_10 = 0
 
-        # Bokeh debug plots
-        from bokeh.plotting import figure  # , output_file, show
-        self.plt = figure(
-            title="Waveform Analyzer Data",
-            width=300,
-            height=300)
+        # Bokeh debug plots are built on first use; see plt.
+        self._plt = None
+        self._spans = []
         self.debug = debug
         if self.debug:
             self._plot()
@@ -138,6 +173,84 @@ class waveform(object):
         # self.trigger()
         # if self._trigger_polarity == 0:
             # raise ValueError("\nWaveform Analyser: No discernable trigger found within data record.\n")
+
+    @classmethod
+    def from_blobs(cls, xblob, yblob, dtype=numpy.float64, **kwargs):
+        """Build a waveform directly on top of raw binary x and y buffers.
+
+        The buffers are typically BLOB columns read from SQLite, a mmap of a
+        capture file, or any other object supporting the buffer protocol.
+        Native float64 buffers are wrapped without copying, so the waveform
+        arrays are read-only views of the BLOB memory.
+
+        >>> import numpy
+        >>> from PyICe.data_utils.wave_analysis import waveform
+        >>> x = numpy.arange(4.0).tobytes()
+        >>> y = numpy.array([0.0, 0.0, 1.0, 1.0]).tobytes()
+        >>> w = waveform.from_blobs(x, y, leader_size=0.25)
+        >>> w.ydata.tolist()
+        [0.0, 0.0, 1.0, 1.0]
+
+        Args:
+            xblob: Buffer of packed x values.
+            yblob: Buffer of packed y values.
+            dtype: numpy dtype of the packed values, e.g. '<f4' for
+                little-endian single precision.
+            kwargs: Passed to the waveform constructor.
+
+        Returns:
+            waveform: The new waveform.
+        """
+        return cls((numpy.frombuffer(xblob, dtype=dtype), numpy.frombuffer(yblob, dtype=dtype)), **kwargs)
+
+    @property
+    def data(self):
+        """Waveform as an N x 2 array of (x,y) pairs.
+
+        >>> from PyICe.data_utils.wave_analysis import waveform
+        >>> waveform(([0, 1, 2], [5, 6, 7]), leader_size=0.5).data.tolist()
+        [[0.0, 5.0], [1.0, 6.0], [2.0, 7.0]]
+
+        Returns:
+            numpy.ndarray: Newly stacked pair array.
+        """
+        return numpy.column_stack((self.xdata, self.ydata))
+
+    @property
+    def plt(self):
+        """Bokeh figure collecting the debug annotations, created on first use.
+
+        Building a figure costs far more than analyzing a typical capture, so
+        measurement annotations are queued and only drawn into a figure when
+        one is first requested.
+
+        >>> from PyICe.data_utils.wave_analysis import waveform
+        >>> isinstance(waveform.plt, property)
+        True
+
+        Returns:
+            bokeh.plotting.figure: The debug figure.
+        """
+        if self._plt is None:
+            from bokeh.plotting import figure  # , output_file, show
+            self._plt = figure(
+                title="Waveform Analyzer Data",
+                width=300,
+                height=300)
+            spans, self._spans = self._spans, []
+            for span in spans:
+                self._add_span(**span)
+        return self._plt
+
+    def _add_span(self, **kwargs):
+        # Measurement annotations are only turned into bokeh models once the
+        # debug figure exists, so batch analysis never pays for them.
+        if self._plt is None:
+            self._spans.append(kwargs)
+        else:
+            from bokeh.models import Span
+            self._plt.add_layout(Span(**kwargs))
+
     def dump_data(self, filename='waveform_analyzer_debug_data.pkl'):
         """Perform dump data operation.
 
@@ -204,37 +317,20 @@ class waveform(object):
         True
 
         """
-        for index, value in enumerate(self.ydata):
-            if value > self._average_in + \
-                    (self._trigger_sigma * self.stdev_in if self._trigger_level is None else self._trigger_level):
-                self._trigger_polarity = 1
-                self._trigger_index = index
-                self._trigger_value = value
-                self.trigger_time = self.xdata[index]
-                from bokeh.models import Span
-                self.plt.add_layout(Span(location=self.xdata[index],
-                                         dimension='height',
-                                         line_color='red',
-                                         line_dash='dashed',
-                                         line_width=3,
-                                         )
-                                    )
-                return
-            if value < self._average_in - \
-                    (self._trigger_sigma * self.stdev_in if self._trigger_level is None else self._trigger_level):
-                self._trigger_polarity = -1
-                self._trigger_index = index
-                self._trigger_value = value
-                self.trigger_time = self.xdata[index]
-                from bokeh.models import Span
-                self.plt.add_layout(Span(location=self.xdata[index],
-                                         dimension='height',
-                                         line_color='red',
-                                         line_dash='dashed',
-                                         line_width=3,
-                                         )
-                                    )
-                return
+        threshold = self._trigger_sigma * self.stdev_in if self._trigger_level is None else self._trigger_level
+        index = _first_index((self.ydata > self._average_in + threshold) | (self.ydata < self._average_in - threshold))
+        if index != -1:
+            value = self.ydata[index]
+            self._trigger_polarity = 1 if value > self._average_in + threshold else -1
+            self._trigger_index = index
+            self._trigger_value = value
+            self.trigger_time = self.xdata[index]
+            self._add_span(location=self.xdata[index],
+                           dimension='height',
+                           line_color='red',
+                           line_dash='dashed',
+                           line_width=3)
+            return
         self._trigger_polarity = 0
         self._trigger_index = -1
         self._trigger_value = 0
@@ -253,41 +349,30 @@ class waveform(object):
         True
 
         """
-        from bokeh.models import Span
         if self._average_out > self._average_in:
             self.trigger_10_90_polarity = 1
         elif self._average_out < self._average_in:
             self.trigger_10_90_polarity = -1
         else:
             self.trigger_10_90_polarity = 0
-        for index, value in enumerate(self.ydata):
-            if self.trigger_10_90_polarity == 1 and value > 0.1 * \
-                    (self._average_out - self._average_in) + self._average_in:    # Use average_out b'cos that's what is servoed for a load step
-                self.trigger_10_90_index = index
-                self.trigger_10_90_value = value
-                self.trigger_10_90_time = self.xdata[index]
-                self.plt.add_layout(Span(location=self.xdata[index],
-                                         dimension='height',
-                                         line_color='red',
-                                         line_dash='dashed',
-                                         line_width=2,
-                                         )
-                                    )
-
-                return
+        if self.trigger_10_90_polarity == 1:
+            # Use average_out b'cos that's what is servoed for a load step
+            index = _first_index(self.ydata > 0.1 * (self._average_out - self._average_in) + self._average_in)
+        elif self.trigger_10_90_polarity == -1:
             # Use average_in b'cos that's what is servoed for a load release
-            elif self.trigger_10_90_polarity == -1 and value < 0.9 * (self._average_in - self._average_out) + self._average_out:
-                self.trigger_10_90_index = index
-                self.trigger_10_90_value = value
-                self.trigger_10_90_time = self.xdata[index]
-                self.plt.add_layout(Span(location=self.xdata[index],
-                                         dimension='height',
-                                         line_color='red',
-                                         line_dash='dashed',
-                                         line_width=2,
-                                         )
-                                    )
-                return
+            index = _first_index(self.ydata < 0.9 * (self._average_in - self._average_out) + self._average_out)
+        else:
+            index = -1
+        if index != -1:
+            self.trigger_10_90_index = index
+            self.trigger_10_90_value = self.ydata[index]
+            self.trigger_10_90_time = self.xdata[index]
+            self._add_span(location=self.xdata[index],
+                           dimension='height',
+                           line_color='red',
+                           line_dash='dashed',
+                           line_width=2)
+            return
         self.trigger_10_90_polarity = 0
         self.trigger_10_90_index = -1
         self.trigger_10_90_value = 0
@@ -316,17 +401,13 @@ class waveform(object):
         if self._trigger_polarity == 0:
             raise ValueError(
                 "\nWaveform Analyser: No discernable trigger found within data record.\n")
-        xreverse = list(self.xdata)
-        yreverse = list(self.ydata)
-        xreverse.reverse()
-        yreverse.reverse()
-        for idx, value in enumerate(yreverse):
-            if value >= high_limit or value <= low_limit:
-                if idx == 0:
-                    print_banner(
-                        "Waveform Analyser: Warning, The waveform did not settle to the tolerance requested...", f"({low_limit}, {high_limit})")
-                    return -1
-                return xreverse[idx] - self.xdata[self._trigger_index]
+        index = _last_index((self.ydata >= high_limit) | (self.ydata <= low_limit))
+        if index == len(self.ydata) - 1:
+            print_banner(
+                "Waveform Analyser: Warning, The waveform did not settle to the tolerance requested...", f"({low_limit}, {high_limit})")
+            return -1
+        if index != -1:
+            return self.xdata[index] - self.xdata[self._trigger_index]
         print_banner("Waveform Analyser: Warning, waveform was never outside the tolerance region requested...",
                      f"({low_limit}, {high_limit})")
         return -1
@@ -357,53 +438,39 @@ class waveform(object):
         if deviation is None:
             raise ValueError("\ndeviation should be 'pos' or 'neg'\n")
         elif deviation.lower() == 'neg':
-            start_time = min(self.data, key=itemgetter(1))[0]
+            start_time = self.xdata[numpy.argmin(self.ydata)]
         elif deviation.lower() == 'pos':
-            start_time = max(self.data, key=itemgetter(1))[0]
+            start_time = self.xdata[numpy.argmax(self.ydata)]
         else:
             raise ValueError("\ndeviation should be 'pos' or 'neg'\n")
-        xreverse = list(self.xdata)
-        yreverse = list(self.ydata)
-        xreverse.reverse()
-        yreverse.reverse()
-        from bokeh.models import Span
-        for idx, value in enumerate(yreverse):
-            if value - \
-                    self._average_in >= abs(limit) or value - self._average_in <= -1 * abs(limit):
-                if idx == 0:
-                    print_banner(
-                        "Waveform Analyser: Warning, The waveform did not settle to the tolerance requested...",
-                        f"{limit}")
-                    return -1
-                self.plt.add_layout(Span(location=abs(limit) + self._average_in,
-                                         dimension='width',
-                                         line_color='red',
-                                         line_dash='dotted',
-                                         line_width=2,
-                                         )
-                                    )
-                self.plt.add_layout(Span(location=-1 * abs(limit) + self._average_in,
-                                         dimension='width',
-                                         line_color='red',
-                                         line_dash='dotted',
-                                         line_width=2,
-                                         )
-                                    )
-                self.plt.add_layout(Span(location=start_time,
-                                         dimension='height',
-                                         line_color='red',
-                                         line_dash='dashed',
-                                         line_width=2,
-                                         )
-                                    )
-                self.plt.add_layout(Span(location=xreverse[idx],
-                                         dimension='height',
-                                         line_color='red',
-                                         line_dash='dashed',
-                                         line_width=2,
-                                         )
-                                    )
-                return xreverse[idx] - start_time
+        index = _last_index(numpy.abs(self.ydata - self._average_in) >= abs(limit))
+        if index != -1:
+            if index == len(self.ydata) - 1:
+                print_banner(
+                    "Waveform Analyser: Warning, The waveform did not settle to the tolerance requested...",
+                    f"{limit}")
+                return -1
+            self._add_span(location=abs(limit) + self._average_in,
+                           dimension='width',
+                           line_color='red',
+                           line_dash='dotted',
+                           line_width=2)
+            self._add_span(location=-1 * abs(limit) + self._average_in,
+                           dimension='width',
+                           line_color='red',
+                           line_dash='dotted',
+                           line_width=2)
+            self._add_span(location=start_time,
+                           dimension='height',
+                           line_color='red',
+                           line_dash='dashed',
+                           line_width=2)
+            self._add_span(location=self.xdata[index],
+                           dimension='height',
+                           line_color='red',
+                           line_dash='dashed',
+                           line_width=2)
+            return self.xdata[index] - start_time
         print_banner(
             "Waveform Analyser: Warning, The waveform was never outside the tolerance region requested...",
             f"{limit}")
@@ -428,59 +495,43 @@ class waveform(object):
         Returns:
             The settling time outside limit result.
         """
-        xreverse = list(self.xdata)
-        yreverse = list(self.ydata)
-        xreverse.reverse()
-        yreverse.reverse()
-        from bokeh.models import Span
-        start_index: int | None = None
-        for idx, value in enumerate(self.ydata):
-            if value - \
-                    self._average_in >= abs(limit) or value - self._average_in <= -1 * abs(limit):
-                if idx == len(self.ydata) - 1:
-                    print_banner(
-                        "Waveform Analyser: Warning, The waveform was always outside the tolerance requested...",
-                        f"{limit}")
-                    return -1
-                start_index = idx
-                break
-        for idx, value in enumerate(yreverse):
-            if value - \
-                    self._average_in >= abs(limit) or value - self._average_in <= -1 * abs(limit):
-                if idx == start_index:
-                    print_banner(
-                        "Waveform Analyser: Warning, The waveform did not settle to the tolerance requested...",
-                        f"{limit}")
-                    return -1
-                self.plt.add_layout(Span(location=abs(limit) + self._average_in,
-                                         dimension='width',
-                                         line_color='orange',
-                                         line_dash='dotted',
-                                         line_width=2,
-                                         )
-                                    )
-                self.plt.add_layout(Span(location=-1 * abs(limit) + self._average_in,
-                                         dimension='width',
-                                         line_color='orange',
-                                         line_dash='dotted',
-                                         line_width=2,
-                                         )
-                                    )
-                self.plt.add_layout(Span(location=self.xdata[start_index],
-                                         dimension='height',
-                                         line_color='orange',
-                                         line_dash='dashed',
-                                         line_width=2,
-                                         )
-                                    )
-                self.plt.add_layout(Span(location=xreverse[idx],
-                                         dimension='height',
-                                         line_color='orange',
-                                         line_dash='dashed',
-                                         line_width=2,
-                                         )
-                                    )
-                return xreverse[idx] - self.xdata[start_index]
+        outside = numpy.abs(self.ydata - self._average_in) >= abs(limit)
+        start_index = _first_index(outside)
+        if start_index == len(self.ydata) - 1:
+            print_banner(
+                "Waveform Analyser: Warning, The waveform was always outside the tolerance requested...",
+                f"{limit}")
+            return -1
+        index = _last_index(outside)
+        if index != -1:
+            # the legacy check compared the reversed-record position of the
+            # last excursion with the forward position of the first one
+            if len(self.ydata) - 1 - index == start_index:
+                print_banner(
+                    "Waveform Analyser: Warning, The waveform did not settle to the tolerance requested...",
+                    f"{limit}")
+                return -1
+            self._add_span(location=abs(limit) + self._average_in,
+                           dimension='width',
+                           line_color='orange',
+                           line_dash='dotted',
+                           line_width=2)
+            self._add_span(location=-1 * abs(limit) + self._average_in,
+                           dimension='width',
+                           line_color='orange',
+                           line_dash='dotted',
+                           line_width=2)
+            self._add_span(location=self.xdata[start_index],
+                           dimension='height',
+                           line_color='orange',
+                           line_dash='dashed',
+                           line_width=2)
+            self._add_span(location=self.xdata[index],
+                           dimension='height',
+                           line_color='orange',
+                           line_dash='dashed',
+                           line_width=2)
+            return self.xdata[index] - self.xdata[start_index]
         print_banner(
             "Waveform Analyser: Warning, The waveform was never outside the tolerance region requested...",
             f"{limit}")
@@ -499,22 +550,17 @@ class waveform(object):
         Returns:
             The undershoot result.
         """
-        from bokeh.models import Span
-        self.plt.add_layout(Span(location=self._average_in,
-                                 dimension='width',
-                                 line_color='pink',
-                                 line_dash='dashed',
-                                 line_width=2,
-                                 )
-                            )
-        self.plt.add_layout(Span(location=min(self.ydata),
-                                 dimension='width',
-                                 line_color='pink',
-                                 line_dash='dashed',
-                                 line_width=2,
-                                 )
-                            )
-        return min(self.ydata) - self._average_in
+        self._add_span(location=self._average_in,
+                       dimension='width',
+                       line_color='pink',
+                       line_dash='dashed',
+                       line_width=2)
+        self._add_span(location=numpy.min(self.ydata),
+                       dimension='width',
+                       line_color='pink',
+                       line_dash='dashed',
+                       line_width=2)
+        return numpy.min(self.ydata) - self._average_in
 
     def overshoot(self):
         """Return the overshoot.
@@ -529,22 +575,17 @@ class waveform(object):
         Returns:
             The overshoot result.
         """
-        from bokeh.models import Span
-        self.plt.add_layout(Span(location=self._average_in,
-                                 dimension='width',
-                                 line_color='purple',
-                                 line_dash='dashed',
-                                 line_width=2,
-                                 )
-                            )
-        self.plt.add_layout(Span(location=max(self.ydata),
-                                 dimension='width',
-                                 line_color='purple',
-                                 line_dash='dashed',
-                                 line_width=2,
-                                 )
-                            )
-        return max(self.ydata) - self._average_in
+        self._add_span(location=self._average_in,
+                       dimension='width',
+                       line_color='purple',
+                       line_dash='dashed',
+                       line_width=2)
+        self._add_span(location=numpy.max(self.ydata),
+                       dimension='width',
+                       line_color='purple',
+                       line_dash='dashed',
+                       line_width=2)
+        return numpy.max(self.ydata) - self._average_in
 
     def slew_rate(self):
         """Return slew rate result.
@@ -568,14 +609,15 @@ class waveform(object):
             raise ValueError(
                 "\nWaveform Analyser: No discernable 10%/90% trigger found within data record to measure the slew rate.\n")
         if self.trigger_10_90_polarity == 1:
-            rampend_index = next(idx for (idx, data) in enumerate(
-                self.ydata) if data > 0.9 * (self._average_out - self._average_in) + self._average_in)
+            rampend_index = _first_index(self.ydata > 0.9 * (self._average_out - self._average_in) + self._average_in)
         elif self.trigger_10_90_polarity == -1:
-            rampend_index = next(idx for (idx, data) in enumerate(
-                self.ydata) if data < 0.1 * (self._average_in - self._average_out) + self._average_out)
+            rampend_index = _first_index(self.ydata < 0.1 * (self._average_in - self._average_out) + self._average_out)
         else:
             raise ValueError(
                 "\nWaveform Analyser: Reached unreachable code, contact Steve Martin.")
+        if rampend_index == -1:
+            raise ValueError(
+                "\nWaveform Analyser: No discernable 90%/10% end of ramp found within data record to measure the slew rate.\n")
         self.rampstart_time = self.xdata[self.trigger_10_90_index]
         self.rampend_time = self.xdata[rampend_index]
         self.rampstart_value = self.trigger_10_90_value
@@ -590,7 +632,6 @@ class waveform(object):
         self.ramp_intercept = ramp.intercept
         self.ramp_rvalue = ramp.rvalue
 
-        from bokeh.models import Span
         from bokeh.models import Label
 
         data_txt = f'ramp slope={1e-6 * self.ramp_slope}A/us'
@@ -608,13 +649,11 @@ class waveform(object):
                       line_color='red', line_dash=[50, 50], line_width=1
                       )
         self.plt.add_layout(data_label)
-        self.plt.add_layout(Span(location=self.xdata[rampend_index],
-                                 dimension='height',
-                                 line_color='red',
-                                 line_dash='dashed',
-                                 line_width=2,
-                                 )
-                            )
+        self._add_span(location=self.xdata[rampend_index],
+                       dimension='height',
+                       line_color='red',
+                       line_dash='dashed',
+                       line_width=2)
         return self.ramp_slope
 
     def rise_time(self, low_percentage=0.1, high_percentage=0.9):
@@ -634,41 +673,28 @@ class waveform(object):
         Returns:
             The rise time result.
         """
-        from bokeh.models import Span
         amplitude = self._average_out - self._average_in
-        value = None
-        for idx, value in enumerate(self.ydata):
-            if value > self._average_in + low_percentage * amplitude:
-                self.index_10 = idx
-                break
-        hline1 = Span(
-            location=value,
-            dimension='width',
-            line_color='red',
-            line_dash='dashed',
-            line_width=1)
-        vline1 = Span(location=self.xdata[self.index_10],
-                      dimension='height',
-                      line_color='red',
-                      line_dash='dashed',
-                      line_width=1)
-        for idx, value in enumerate(self.ydata):
-            if value > self._average_in + high_percentage * amplitude:
-                self.index_90 = idx
-                break
-        hline2 = Span(
-            location=value,
-            dimension='width',
-            line_color='red',
-            line_dash='dashed',
-            line_width=1)
-        vline2 = Span(location=self.xdata[self.index_90],
-                      dimension='height',
-                      line_color='red',
-                      line_dash='dashed',
-                      line_width=1)
+        idx = _first_index(self.ydata > self._average_in + low_percentage * amplitude)
+        if idx != -1:
+            self.index_10 = idx
+        value_10 = self.ydata[idx]
+        idx = _first_index(self.ydata > self._average_in + high_percentage * amplitude)
+        if idx != -1:
+            self.index_90 = idx
+        value_90 = self.ydata[idx]
         if self.debug:
-            self.plt.renderers.extend([vline1, hline1, vline2, hline2])
+            from bokeh.models import Span
+            for value, index in ((value_10, self.index_10), (value_90, self.index_90)):
+                self.plt.renderers.extend([Span(location=self.xdata[index],
+                                                dimension='height',
+                                                line_color='red',
+                                                line_dash='dashed',
+                                                line_width=1),
+                                           Span(location=value,
+                                                dimension='width',
+                                                line_color='red',
+                                                line_dash='dashed',
+                                                line_width=1)])
             self._plot()
             self.plot()
         return self.xdata[self.index_90] - self.xdata[self.index_10]
@@ -690,41 +716,28 @@ class waveform(object):
         Returns:
             The fall time result.
         """
-        from bokeh.models import Span
         amplitude = self._average_in - self._average_out
-        value = None
-        for idx, value in enumerate(self.ydata):
-            if value < self._average_out + low_percentage * amplitude:
-                self.index_10 = idx
-                break
-        hline1 = Span(
-            location=value,
-            dimension='width',
-            line_color='red',
-            line_dash='dashed',
-            line_width=1)
-        vline1 = Span(location=self.xdata[self.index_10],
-                      dimension='height',
-                      line_color='red',
-                      line_dash='dashed',
-                      line_width=1)
-        for idx, value in enumerate(self.ydata):
-            if value < self._average_out + high_percentage * amplitude:
-                self.index_90 = idx
-                break
-        hline2 = Span(
-            location=value,
-            dimension='width',
-            line_color='red',
-            line_dash='dashed',
-            line_width=1)
-        vline2 = Span(location=self.xdata[self.index_90],
-                      dimension='height',
-                      line_color='red',
-                      line_dash='dashed',
-                      line_width=1)
+        idx = _first_index(self.ydata < self._average_out + low_percentage * amplitude)
+        if idx != -1:
+            self.index_10 = idx
+        value_10 = self.ydata[idx]
+        idx = _first_index(self.ydata < self._average_out + high_percentage * amplitude)
+        if idx != -1:
+            self.index_90 = idx
+        value_90 = self.ydata[idx]
         if self.debug:
-            self.plt.renderers.extend([vline1, hline1, vline2, hline2])
+            from bokeh.models import Span
+            for value, index in ((value_10, self.index_10), (value_90, self.index_90)):
+                self.plt.renderers.extend([Span(location=self.xdata[index],
+                                                dimension='height',
+                                                line_color='red',
+                                                line_dash='dashed',
+                                                line_width=1),
+                                           Span(location=value,
+                                                dimension='width',
+                                                line_color='red',
+                                                line_dash='dashed',
+                                                line_width=1)])
             self._plot()
             self.plot()
         return self.xdata[self.index_10] - self.xdata[self.index_90]
@@ -860,7 +873,16 @@ class waveform(object):
         Returns:
             The amplitude result.
         """
-        return max(self.ydata) - min(self.ydata)
+        return float(numpy.ptp(self.ydata))
+
+    def _search(self, compare, vth, start_index, stop_index, increment):
+        # Vectorised equivalent of testing compare(ydata[i], vth) for i in
+        # range(start_index, stop_index + increment, increment).
+        stop = stop_index + increment
+        if increment < 0 and stop < 0:
+            stop = None
+        position = _first_index(compare(self.ydata[start_index:stop:increment], vth))
+        return -1 if position == -1 else start_index + position * increment
 
     def find_grt_than_or_equal_to(
             self, vth, start_index, stop_index, increment):
@@ -887,10 +909,7 @@ class waveform(object):
         Returns:
             The find grt than or equal to result.
         """
-        for i in range(start_index, stop_index + increment, increment):
-            if self.ydata[i] >= vth:
-                return i
-        return -1
+        return self._search(numpy.greater_equal, vth, start_index, stop_index, increment)
 
     def find_less_than_or_equal_to(
             self, vth, start_index, stop_index, increment):
@@ -917,10 +936,7 @@ class waveform(object):
         Returns:
             The find less than or equal to result.
         """
-        for i in range(start_index, stop_index + increment, increment):
-            if self.ydata[i] <= vth:
-                return i
-        return -1
+        return self._search(numpy.less_equal, vth, start_index, stop_index, increment)
 
     def find_first_rising_edge(self, vhigh, vlow=0, lvl=0.5, start_index=0):
         # This method finds the first time when the waveform is at or above 0.5 or lvl of [vhigh-vlow] and returns the corresponding index.
@@ -1103,21 +1119,16 @@ class waveform(object):
                 f"The {round(hi_lvl * 100, 1)}% level of the waveform was not found in the data record")
             return (-1, -1, -1)
 
-        from bokeh.models import Span
-        self.plt.add_layout(Span(location=self.xdata[index_lo],
-                                 dimension='height',
-                                 line_color='red',
-                                 line_dash='dashed',
-                                 line_width=2,
-                                 )
-                            )
-        self.plt.add_layout(Span(location=self.xdata[index_hi],
-                                 dimension='height',
-                                 line_color='red',
-                                 line_dash='dotted',
-                                 line_width=2,
-                                 )
-                            )
+        self._add_span(location=self.xdata[index_lo],
+                       dimension='height',
+                       line_color='red',
+                       line_dash='dashed',
+                       line_width=2)
+        self._add_span(location=self.xdata[index_hi],
+                       dimension='height',
+                       line_color='red',
+                       line_dash='dotted',
+                       line_width=2)
         return (round((self.ydata[index_lo] - vlow) / amplitude, 4), round(
             (self.ydata[index_hi] - vlow) / amplitude, 4), self.xdata[index_hi] - self.xdata[index_lo])
 
@@ -1198,21 +1209,16 @@ class waveform(object):
                 f"The {round(hi_lvl * 100, 1)}% level of the waveform was not found in the data record")
             return (-1, -1, -1)
 
-        from bokeh.models import Span
-        self.plt.add_layout(Span(location=self.xdata[index_lo],
-                                 dimension='height',
-                                 line_color='blue',
-                                 line_dash='dashed',
-                                 line_width=2,
-                                 )
-                            )
-        self.plt.add_layout(Span(location=self.xdata[index_hi],
-                                 dimension='height',
-                                 line_color='blue',
-                                 line_dash='dotted',
-                                 line_width=2,
-                                 )
-                            )
+        self._add_span(location=self.xdata[index_lo],
+                       dimension='height',
+                       line_color='blue',
+                       line_dash='dashed',
+                       line_width=2)
+        self._add_span(location=self.xdata[index_hi],
+                       dimension='height',
+                       line_color='blue',
+                       line_dash='dotted',
+                       line_width=2)
         return (round((self.ydata[index_lo] - vlow) / amplitude, 4), round(
             (self.ydata[index_hi] - vlow) / amplitude, 4), self.xdata[index_lo] - self.xdata[index_hi])
 
@@ -1243,7 +1249,6 @@ class waveform(object):
         Raises:
             ValueError: If the provided value is out of range or invalid.
         """
-        from bokeh.models import Span
         if vth is None:
             raise ValueError(
                 "\nWaveform Analyser: input arg vth has to be a positive value. nol_low_side = time duration for which vsw<vlow-vth. nol_high_side = time duration for which vsw>vhigh+vth.\n")
@@ -1273,27 +1278,21 @@ class waveform(object):
             else:
                 nol_low_side = self.xdata[nol_low_side_start_index] - \
                     self.xdata[nol_low_side_stop_index]
-                self.plt.add_layout(Span(location=vlow - vth,
-                                         dimension='width',
-                                         line_color='orange',
-                                         line_dash='dotdash',
-                                         line_width=2,
-                                         )
-                                    )
-                self.plt.add_layout(Span(location=self.xdata[nol_low_side_start_index],
-                                         dimension='height',
-                                         line_color='orange',
-                                         line_dash='dashed',
-                                         line_width=2,
-                                         )
-                                    )
-                self.plt.add_layout(Span(location=self.xdata[nol_low_side_stop_index],
-                                         dimension='height',
-                                         line_color='orange',
-                                         line_dash='dotted',
-                                         line_width=2,
-                                         )
-                                    )
+                self._add_span(location=vlow - vth,
+                               dimension='width',
+                               line_color='orange',
+                               line_dash='dotdash',
+                               line_width=2)
+                self._add_span(location=self.xdata[nol_low_side_start_index],
+                               dimension='height',
+                               line_color='orange',
+                               line_dash='dashed',
+                               line_width=2)
+                self._add_span(location=self.xdata[nol_low_side_stop_index],
+                               dimension='height',
+                               line_color='orange',
+                               line_dash='dotted',
+                               line_width=2)
 
         nol_high_side_start_index = self.find_grt_than_or_equal_to(
             vth=vhigh + vth,
@@ -1318,27 +1317,21 @@ class waveform(object):
             else:
                 nol_high_side = self.xdata[nol_high_side_stop_index] - \
                     self.xdata[nol_high_side_start_index]
-                self.plt.add_layout(Span(location=vhigh + vth,
-                                         dimension='width',
-                                         line_color='green',
-                                         line_dash='dotdash',
-                                         line_width=2,
-                                         )
-                                    )
-                self.plt.add_layout(Span(location=self.xdata[nol_high_side_start_index],
-                                         dimension='height',
-                                         line_color='green',
-                                         line_dash='dashed',
-                                         line_width=2,
-                                         )
-                                    )
-                self.plt.add_layout(Span(location=self.xdata[nol_high_side_stop_index],
-                                         dimension='height',
-                                         line_color='green',
-                                         line_dash='dotted',
-                                         line_width=2,
-                                         )
-                                    )
+                self._add_span(location=vhigh + vth,
+                               dimension='width',
+                               line_color='green',
+                               line_dash='dotdash',
+                               line_width=2)
+                self._add_span(location=self.xdata[nol_high_side_start_index],
+                               dimension='height',
+                               line_color='green',
+                               line_dash='dashed',
+                               line_width=2)
+                self._add_span(location=self.xdata[nol_high_side_stop_index],
+                               dimension='height',
+                               line_color='green',
+                               line_dash='dotted',
+                               line_width=2)
         return (nol_low_side, nol_high_side)
 
     def sw_nol_fall(self, vth, vhigh, vlow=0):
@@ -1368,7 +1361,6 @@ class waveform(object):
         Raises:
             ValueError: If the provided value is out of range or invalid.
         """
-        from bokeh.models import Span
         if vth is None:
             raise ValueError(
                 "\nWaveform Analyser: input arg vth has to be a positive value. nol_low_side = time duration for which vsw<vlow-vth. nol_high_side = time duration for which vsw>vhigh+vth.\n")
@@ -1407,27 +1399,21 @@ class waveform(object):
             else:
                 nol_low_side = self.xdata[nol_low_side_stop_index] - \
                     self.xdata[nol_low_side_start_index]
-                self.plt.add_layout(Span(location=vlow - vth,
-                                         dimension='width',
-                                         line_color='orange',
-                                         line_dash='dotdash',
-                                         line_width=2,
-                                         )
-                                    )
-                self.plt.add_layout(Span(location=self.xdata[nol_low_side_start_index],
-                                         dimension='height',
-                                         line_color='orange',
-                                         line_dash='dashed',
-                                         line_width=2,
-                                         )
-                                    )
-                self.plt.add_layout(Span(location=self.xdata[nol_low_side_stop_index],
-                                         dimension='height',
-                                         line_color='orange',
-                                         line_dash='dotted',
-                                         line_width=2,
-                                         )
-                                    )
+                self._add_span(location=vlow - vth,
+                               dimension='width',
+                               line_color='orange',
+                               line_dash='dotdash',
+                               line_width=2)
+                self._add_span(location=self.xdata[nol_low_side_start_index],
+                               dimension='height',
+                               line_color='orange',
+                               line_dash='dashed',
+                               line_width=2)
+                self._add_span(location=self.xdata[nol_low_side_stop_index],
+                               dimension='height',
+                               line_color='orange',
+                               line_dash='dotted',
+                               line_width=2)
 
         nol_high_side_start_index = self.find_grt_than_or_equal_to(
             vth=vhigh + vth, start_index=index_50, stop_index=0, increment=-1)
@@ -1444,27 +1430,21 @@ class waveform(object):
             else:
                 nol_high_side = self.xdata[nol_high_side_start_index] - \
                     self.xdata[nol_high_side_stop_index]
-                self.plt.add_layout(Span(location=vhigh + vth,
-                                         dimension='width',
-                                         line_color='green',
-                                         line_dash='dotdash',
-                                         line_width=2,
-                                         )
-                                    )
-                self.plt.add_layout(Span(location=self.xdata[nol_high_side_start_index],
-                                         dimension='height',
-                                         line_color='green',
-                                         line_dash='dashed',
-                                         line_width=2,
-                                         )
-                                    )
-                self.plt.add_layout(Span(location=self.xdata[nol_high_side_stop_index],
-                                         dimension='height',
-                                         line_color='green',
-                                         line_dash='dotted',
-                                         line_width=2,
-                                         )
-                                    )
+                self._add_span(location=vhigh + vth,
+                               dimension='width',
+                               line_color='green',
+                               line_dash='dotdash',
+                               line_width=2)
+                self._add_span(location=self.xdata[nol_high_side_start_index],
+                               dimension='height',
+                               line_color='green',
+                               line_dash='dashed',
+                               line_width=2)
+                self._add_span(location=self.xdata[nol_high_side_stop_index],
+                               dimension='height',
+                               line_color='green',
+                               line_dash='dotted',
+                               line_width=2)
         return (nol_low_side, nol_high_side)
 
     def read_xdata(self, index):
@@ -1476,27 +1456,25 @@ class waveform(object):
 
         >>> x = list(range(10))
         >>> y = [float(i) for i in range(10)]
-        >>> w = waveform((x, y), trigger_sigma=3)
+        >>> w = waveform((x, y), trigger_sigma=3, leader_size=0.2)
         >>> w.read_xdata(0)
-        0
+        0.0
         >>> w.read_xdata(5)
-        5
+        5.0
 
         Args:
             index: Zero-based position index.
 
         Returns:
-            The value read from the device or channel.
+            float: The x value at *index*.  Samples are stored as float64,
+            so this is a Python float rather than the original element.
         """
-        from bokeh.models import Span
-        self.plt.add_layout(Span(location=self.xdata[index],
-                                 dimension='height',
-                                 line_color='tomato',
-                                 line_dash='dashed',
-                                 line_width=2,
-                                 )
-                            )
-        return self.xdata[index]
+        self._add_span(location=self.xdata[index],
+                       dimension='height',
+                       line_color='tomato',
+                       line_dash='dashed',
+                       line_width=2)
+        return float(self.xdata[index])
 
     def read_ydata(self, index):
         # This method returns the ydata value for a given index.
@@ -1507,7 +1485,7 @@ class waveform(object):
 
         >>> x = list(range(10))
         >>> y = [float(i) for i in range(10)]
-        >>> w = waveform((x, y), trigger_sigma=3)
+        >>> w = waveform((x, y), trigger_sigma=3, leader_size=0.2)
         >>> w.read_ydata(0)
         0.0
         >>> w.read_ydata(5)
@@ -1517,14 +1495,393 @@ class waveform(object):
             index: Zero-based position index.
 
         Returns:
-            The value read from the device or channel.
+            float: The y value at *index*.  Samples are stored as float64,
+            so this is a Python float rather than the original element.
+        """
+        self._add_span(location=self.ydata[index],
+                       dimension='width',
+                       line_color='teal',
+                       line_dash='dashed',
+                       line_width=2)
+        return float(self.ydata[index])
+
+
+class waveform_batch(object):
+    """Many captures of equal length analyzed together as 2-D arrays.
+
+    Characterizing a sweep one :class:`waveform` at a time costs a Python
+    round trip per capture and per measurement. This class stacks the
+    captures into a (captures x points) float64 array and runs each
+    measurement across all of them in a single numpy pass. The
+    measurements follow the same definitions as the :class:`waveform`
+    methods of the same name, but where the single waveform method would
+    return -1, raise or print a warning, the batch result holds numpy.nan
+    (or -1 for indices) for that capture instead. Debug plotting is not
+    available; index the batch to get a :class:`waveform` for one capture.
+
+    >>> import numpy
+    >>> from PyICe.data_utils.wave_analysis import waveform_batch
+    >>> x = numpy.arange(100.0)
+    >>> y = numpy.array([numpy.where(x < 40, 0.0, 1.0), numpy.where(x < 60, 0.0, 2.0)])
+    >>> batch = waveform_batch(x, y, trigger_sigma=3)
+    >>> batch.trigger().tolist()
+    [40, 60]
+    >>> batch.amplitude().tolist()
+    [1.0, 2.0]
+    """
+    def __init__(self, xdata, ydata, trigger_sigma=10, trigger_level=None, leader_size=0.099):
+        """Initialize waveform_batch.
+
+        >>> from PyICe.data_utils.wave_analysis import waveform_batch
+        >>> hasattr(waveform_batch, '__init__')
+        True
+
+        Args:
+            xdata: Either one time base shared by every capture, or one row
+                of x values per capture.
+            ydata: One row of y values per capture; a 2-D array or a
+                sequence of equal length 1-D arrays.
+            trigger_sigma: Trigger sigma to use.
+            trigger_level: Trigger level to use.
+            leader_size: Fraction of each record at each end used to
+                measure the settled levels before and after the transient.
+
+        Raises:
+            ValueError: If the captures do not all have the same length as
+                the time base.
+        """
+        self.ydata = numpy.ascontiguousarray(ydata, dtype=numpy.float64)
+        self.xdata = numpy.ascontiguousarray(xdata, dtype=numpy.float64)
+        if self.ydata.ndim != 2 or self.xdata.shape not in (self.ydata.shape, self.ydata.shape[1:]):
+            raise ValueError(f"\nWaveform Analyser: expected a (captures x points) y array and a matching or shared x array, got {self.ydata.shape} and {self.xdata.shape}.\n")
+        self._trigger_sigma = trigger_sigma
+        self._trigger_level = trigger_level
+        self._leader_size = leader_size
+        self.index_size = int(self.ydata.shape[1] * leader_size)
+        leadin = self.ydata[:, :self.index_size]
+        leadout = self.ydata[:, -self.index_size:]
+        self._average_in = numpy.average(leadin, axis=1)
+        self._average_out = numpy.average(leadout, axis=1)
+        self.stdev_in = numpy.std(leadin, axis=1)
+        self.stdev_out = numpy.std(leadout, axis=1)
+
+    @classmethod
+    def from_blobs(cls, xblob, yblobs, dtype=numpy.float64, **kwargs):
+        """Build a batch from raw binary buffers, such as SQLite BLOB columns.
+
+        >>> import numpy
+        >>> from PyICe.data_utils.wave_analysis import waveform_batch
+        >>> x = numpy.arange(4.0).tobytes()
+        >>> ys = [numpy.array([0.0, 0.0, 1.0, 1.0]).tobytes(), numpy.array([0.0, 1.0, 1.0, 1.0]).tobytes()]
+        >>> waveform_batch.from_blobs(x, ys, leader_size=0.25).ydata.shape
+        (2, 4)
+
+        Args:
+            xblob: Buffer of packed x values shared by every capture, or a
+                sequence of buffers, one per capture.
+            yblobs: Sequence of buffers of packed y values, one per capture.
+            dtype: numpy dtype of the packed values.
+            kwargs: Passed to the waveform_batch constructor.
+
+        Returns:
+            waveform_batch: The new batch.
+        """
+        try:
+            xdata = numpy.frombuffer(memoryview(xblob), dtype=dtype)
+        except TypeError:
+            xdata = numpy.stack([numpy.frombuffer(blob, dtype=dtype) for blob in xblob])
+        ydata = numpy.stack([numpy.frombuffer(blob, dtype=dtype) for blob in yblobs])
+        return cls(xdata, ydata, **kwargs)
+
+    def __len__(self):
+        """Return the number of captures.
+
+        >>> import numpy
+        >>> from PyICe.data_utils.wave_analysis import waveform_batch
+        >>> len(waveform_batch(numpy.arange(10.0), numpy.zeros((3, 10)), leader_size=0.2))
+        3
+
+        Returns:
+            int: Number of captures.
+        """
+        return self.ydata.shape[0]
+
+    def __getitem__(self, index):
+        """Return one capture as a :class:`waveform`, e.g. to plot an outlier.
+
+        >>> import numpy
+        >>> from PyICe.data_utils.wave_analysis import waveform_batch
+        >>> batch = waveform_batch(numpy.arange(10.0), numpy.ones((3, 10)), leader_size=0.2)
+        >>> float(batch[1].average_out())
+        1.0
+
+        Args:
+            index: Zero-based capture index.
+
+        Returns:
+            waveform: The capture, sharing memory with the batch.
+        """
+        xdata = self.xdata if self.xdata.ndim == 1 else self.xdata[index]
+        return waveform((xdata, self.ydata[index]), trigger_sigma=self._trigger_sigma,
+                        trigger_level=self._trigger_level, leader_size=self._leader_size)
+
+    def _x_at(self, index):
+        # x value at one column index per capture, nan where index is -1
+        safe_index = numpy.maximum(index, 0)
+        if self.xdata.ndim == 1:
+            values = self.xdata[safe_index]
+        else:
+            values = numpy.take_along_axis(self.xdata, safe_index[:, None], axis=1)[:, 0]
+        return numpy.where(index == -1, numpy.nan, values)
+
+    def average_in(self):
+        """Return the settled level before the transient, per capture.
+
+        >>> from PyICe.data_utils.wave_analysis import waveform_batch
+        >>> hasattr(waveform_batch, 'average_in')
+        True
+
+        Returns:
+            numpy.ndarray: One value per capture.
+        """
+        return self._average_in
+
+    def average_out(self):
+        """Return the settled level after the transient, per capture.
+
+        >>> from PyICe.data_utils.wave_analysis import waveform_batch
+        >>> hasattr(waveform_batch, 'average_out')
+        True
+
+        Returns:
+            numpy.ndarray: One value per capture.
+        """
+        return self._average_out
+
+    def amplitude(self):
+        """Return the peak to peak amplitude, per capture.
+
+        >>> from PyICe.data_utils.wave_analysis import waveform_batch
+        >>> hasattr(waveform_batch, 'amplitude')
+        True
+
+        Returns:
+            numpy.ndarray: One value per capture.
+        """
+        return numpy.ptp(self.ydata, axis=1)
+
+    def overshoot(self):
+        """Return the maximum excursion above the leading level, per capture.
+
+        >>> from PyICe.data_utils.wave_analysis import waveform_batch
+        >>> hasattr(waveform_batch, 'overshoot')
+        True
+
+        Returns:
+            numpy.ndarray: One value per capture.
+        """
+        return numpy.max(self.ydata, axis=1) - self._average_in
+
+    def undershoot(self):
+        """Return the maximum excursion below the leading level, per capture.
+
+        >>> from PyICe.data_utils.wave_analysis import waveform_batch
+        >>> hasattr(waveform_batch, 'undershoot')
+        True
+
+        Returns:
+            numpy.ndarray: One value per capture (negative for a dip).
+        """
+        return numpy.min(self.ydata, axis=1) - self._average_in
+
+    def trigger(self):
+        """Find the first point of each capture outside the trigger band.
+
+        Also sets the ``trigger_index``, ``trigger_polarity`` (1, -1, or 0
+        if not triggered) and ``trigger_time`` (nan if not triggered)
+        arrays.
+
+        >>> from PyICe.data_utils.wave_analysis import waveform_batch
+        >>> hasattr(waveform_batch, 'trigger')
+        True
+
+        Returns:
+            numpy.ndarray: Trigger index per capture, -1 if not triggered.
+        """
+        threshold = self._trigger_sigma * self.stdev_in if self._trigger_level is None else numpy.full(len(self), self._trigger_level)
+        above = self.ydata > (self._average_in + threshold)[:, None]
+        below = self.ydata < (self._average_in - threshold)[:, None]
+        self.trigger_index = _first_index(above | below)
+        safe_index = numpy.maximum(self.trigger_index, 0)[:, None]
+        rising = numpy.take_along_axis(above, safe_index, axis=1)[:, 0]
+        self.trigger_polarity = numpy.where(self.trigger_index == -1, 0, numpy.where(rising, 1, -1))
+        self.trigger_time = self._x_at(self.trigger_index)
+        return self.trigger_index
+
+    def rise_time(self, low_percentage=0.1, high_percentage=0.9):
+        """Return the time between the low and high crossings of a rising step.
+
+        >>> from PyICe.data_utils.wave_analysis import waveform_batch
+        >>> hasattr(waveform_batch, 'rise_time')
+        True
+
+        Args:
+            low_percentage: Low threshold as a fraction of the step.
+            high_percentage: High threshold as a fraction of the step.
+
+        Returns:
+            numpy.ndarray: One time per capture, nan if a level is never crossed.
+        """
+        amplitude = self._average_out - self._average_in
+        index_lo = _first_index(self.ydata > (self._average_in + low_percentage * amplitude)[:, None])
+        index_hi = _first_index(self.ydata > (self._average_in + high_percentage * amplitude)[:, None])
+        return self._x_at(index_hi) - self._x_at(index_lo)
+
+    def fall_time(self, low_percentage=0.1, high_percentage=0.9):
+        """Return the time between the high and low crossings of a falling step.
+
+        >>> from PyICe.data_utils.wave_analysis import waveform_batch
+        >>> hasattr(waveform_batch, 'fall_time')
+        True
+
+        Args:
+            low_percentage: Low threshold as a fraction of the step.
+            high_percentage: High threshold as a fraction of the step.
+
+        Returns:
+            numpy.ndarray: One time per capture, nan if a level is never crossed.
+        """
+        amplitude = self._average_in - self._average_out
+        index_lo = _first_index(self.ydata < (self._average_out + low_percentage * amplitude)[:, None])
+        index_hi = _first_index(self.ydata < (self._average_out + high_percentage * amplitude)[:, None])
+        return self._x_at(index_lo) - self._x_at(index_hi)
+
+    def _settled_time(self, outside, start_time):
+        # time from start_time to the last excursion, nan if the capture
+        # never left the band or had not settled by the end of the record
+        index = _last_index(outside)
+        unsettled = (index == -1) | (index == self.ydata.shape[1] - 1)
+        return numpy.where(unsettled, numpy.nan, self._x_at(index) - start_time)
+
+    def settling_time(self, low_limit, high_limit):
+        """Return the time from the trigger until the last excursion outside a window.
+
+        >>> from PyICe.data_utils.wave_analysis import waveform_batch
+        >>> hasattr(waveform_batch, 'settling_time')
+        True
+
+        Args:
+            low_limit: Lower edge of the settling window.
+            high_limit: Upper edge of the settling window.
+
+        Returns:
+            numpy.ndarray: One time per capture, nan if not triggered, never
+            outside the window or not settled.
+        """
+        self.trigger()
+        return self._settled_time((self.ydata >= high_limit) | (self.ydata <= low_limit), self.trigger_time)
+
+    def settling_time_from_max_deviation(self, limit, deviation):
+        """Return the time from the peak deviation until the last excursion beyond *limit*.
+
+        >>> from PyICe.data_utils.wave_analysis import waveform_batch
+        >>> hasattr(waveform_batch, 'settling_time_from_max_deviation')
+        True
+
+        Args:
+            limit: Allowed deviation from the leading level.
+            deviation: 'pos' to start at the maximum, 'neg' at the minimum.
+
+        Returns:
+            numpy.ndarray: One time per capture, nan if never outside the
+            limit or not settled.
+
+        Raises:
+            ValueError: If *deviation* is not 'pos' or 'neg'.
+        """
+        if deviation is None or deviation.lower() not in ('pos', 'neg'):
+            raise ValueError("\ndeviation should be 'pos' or 'neg'\n")
+        peak_index = numpy.argmax(self.ydata, axis=1) if deviation.lower() == 'pos' else numpy.argmin(self.ydata, axis=1)
+        outside = numpy.abs(self.ydata - self._average_in[:, None]) >= abs(limit)
+        return self._settled_time(outside, self._x_at(peak_index))
+
+    def settling_time_outside_limit(self, limit):
+        """Return the time from the first to the last excursion beyond *limit*.
+
+        >>> from PyICe.data_utils.wave_analysis import waveform_batch
+        >>> hasattr(waveform_batch, 'settling_time_outside_limit')
+        True
+
+        Args:
+            limit: Allowed deviation from the leading level.
+
+        Returns:
+            numpy.ndarray: One time per capture, nan wherever
+            :meth:`waveform.settling_time_outside_limit` would return -1.
         """
-        from bokeh.models import Span
-        self.plt.add_layout(Span(location=self.ydata[index],
-                                 dimension='width',
-                                 line_color='teal',
-                                 line_dash='dashed',
-                                 line_width=2,
-                                 )
-                            )
-        return self.ydata[index]
+        points = self.ydata.shape[1]
+        outside = numpy.abs(self.ydata - self._average_in[:, None]) >= abs(limit)
+        start_index = _first_index(outside)
+        index = _last_index(outside)
+        failed = (start_index == points - 1) | (index == -1) | (points - 1 - index == start_index)
+        return numpy.where(failed, numpy.nan, self._x_at(index) - self._x_at(start_index))
+
+    def _first_crossing(self, reached, beyond, start_index):
+        # first point reaching the threshold, searching only after the
+        # capture first comes back from beyond it if it starts there
+        columns = numpy.arange(self.ydata.shape[1])
+        start = numpy.where(beyond[:, 0], _first_index(~beyond & (columns >= start_index)), start_index)
+        index = _first_index(reached & (columns >= start[:, None]))
+        return numpy.where(start == -1, -1, index)
+
+    def find_first_rising_edge(self, vhigh, vlow=0, lvl=0.5, start_index=0):
+        """Return the index of the first rising crossing of *lvl* of [vlow, vhigh].
+
+        >>> from PyICe.data_utils.wave_analysis import waveform_batch
+        >>> hasattr(waveform_batch, 'find_first_rising_edge')
+        True
+
+        Args:
+            vhigh: High voltage level.
+            vlow: Low voltage level.
+            lvl: Threshold as a fraction of [vhigh-vlow].
+            start_index: Index at which to start searching.
+
+        Returns:
+            numpy.ndarray: One index per capture, -1 if there is no rising edge.
+
+        Raises:
+            ValueError: If the levels or start_index are invalid.
+        """
+        if vhigh is None or vlow >= vhigh:
+            raise ValueError("\nWaveform Analyser: input arg vlow has to be less than vhigh.\n")
+        elif start_index < 0 or start_index > self.ydata.shape[1] - 1:
+            raise ValueError(f"\nWaveform Analyser: start_index is outside the range of the waveform data. Enter a value between 0 and {self.ydata.shape[1] - 1}\n")
+        vth = vlow + lvl * (vhigh - vlow)
+        return self._first_crossing(self.ydata >= vth, self.ydata > vth, start_index)
+
+    def find_first_falling_edge(self, vhigh, vlow=0, lvl=0.5, start_index=0):
+        """Return the index of the first falling crossing of *lvl* of [vlow, vhigh].
+
+        >>> from PyICe.data_utils.wave_analysis import waveform_batch
+        >>> hasattr(waveform_batch, 'find_first_falling_edge')
+        True
+
+        Args:
+            vhigh: High voltage level.
+            vlow: Low voltage level.
+            lvl: Threshold as a fraction of [vhigh-vlow].
+            start_index: Index at which to start searching.
+
+        Returns:
+            numpy.ndarray: One index per capture, -1 if there is no falling edge.
+
+        Raises:
+            ValueError: If the levels or start_index are invalid.
+        """
+        if vhigh is None or vlow >= vhigh:
+            raise ValueError("\nWaveform Analyser: input arg vlow has to be less than vhigh.\n")
+        elif start_index < 0 or start_index > self.ydata.shape[1] - 1:
+            raise ValueError(f"\nWaveform Analyser: start_index is outside the range of the waveform data. Enter a value between 0 and {self.ydata.shape[1] - 1}\n")
+        vth = vlow + lvl * (vhigh - vlow)
+        return self._first_crossing(self.ydata <= vth, self.ydata < vth, start_index)
@@ -72,21 +72,28 @@ import os
 import numbers
 import datetime
 import collections
+import concurrent.futures
 import atexit
 import time
+import pickle
+import tempfile
 import multiprocessing
 import multiprocessing.managers
 import traceback
 import _thread
+import threading
+import weakref
 import re
 import queue
 import sqlite3
+import numpy
 from PyICe.lab_utils.sqlite_data import sqlite_data
 from PyICe.lab_utils.clean_sql import clean_sql
 from PyICe.lab_utils.eng_string import eng_string
 from PyICe.lab_utils.signedToTwosComplement import signedToTwosComplement
 from PyICe.lab_utils.twosComplementToSigned import twosComplementToSigned
 from PyICe.lab_utils.egg_timer import egg_timer
+from PyICe.lab_utils.interpolator import interpolator
 from PyICe import lab_interfaces
 from PyICe import logo
 from . import DEFAULT_AUTHKEY
@@ -119,6 +126,44 @@ if debug_logging.getEffectiveLevel() > print_logging_level:
     root_logging.setLevel(print_logging_level)
     root_logging.addHandler(logging.StreamHandler())
 
+# Bumped whenever delegation, threading permission, interface assignment,
+# category or read access of any channel changes anywhere in the process.
+# Channel group membership is tracked per group instead (see
+# channel_group._invalidate_structure), so that temporary groups built while
+# resolving a read do not invalidate the caches of the live channel tree.
+_topology_generation = 0
+
+
+def invalidate_topology():
+    """Mark every cached scan plan as stale.
+
+    Called automatically by channels and delegators whenever their
+    delegation or interfaces change.  Call it directly after modifying
+    private state (for example appending to ``_interfaces`` by hand) that
+    the automatic hooks cannot see.
+
+    >>> from PyICe import lab_core
+    >>> before = lab_core.get_topology_generation()
+    >>> lab_core.invalidate_topology()
+    >>> lab_core.get_topology_generation() > before
+    True
+    """
+    global _topology_generation
+    _topology_generation += 1
+
+
+def get_topology_generation():
+    """Return the current channel/delegation topology generation.
+
+    >>> from PyICe import lab_core
+    >>> isinstance(lab_core.get_topology_generation(), int)
+    True
+
+    Returns:
+        int: Monotonically increasing counter, see :func:`invalidate_topology`.
+    """
+    return _topology_generation
+
 
 class results_ord_dict(collections.OrderedDict):
     """Ordered dictionary for channel results reporting with pretty print addition.
@@ -229,6 +274,7 @@ class delegator(object):
                 operations on behalf of this one.
         """
         self._delegator = delegator
+        invalidate_topology()
 
     def get_delegator(self):
         """Return the immediate delegator (one level up the chain).
@@ -269,6 +315,7 @@ class delegator(object):
                 sequential reads.
         """
         self._threadable = state
+        invalidate_topology()
 
     def threadable(self):
         """Check whether threaded (parallel) reads are allowed.
@@ -329,6 +376,7 @@ class delegator(object):
             interface: A ``lab_interfaces.interface`` instance to manage.
         """
         self._interfaces.append(interface)
+        invalidate_topology()
 
     def get_interfaces(self):
         """Collect all interfaces registered on the root delegator.
@@ -376,38 +424,44 @@ class delegator(object):
         for interface in self._interfaces:
             interface.unlock()
 
+    def _write_delegated_channel_list(self, channel_value_list):
+        try:
+            self.lock_interfaces()
+            data = self.write_delegated_channel_list(channel_value_list)
+            self.unlock_interfaces()
+            return data
+        except Exception as e:
+            self.unlock_interfaces()
+            raise e
+
     def write_delegated_channel_list(self, channel_value_list):
-        # (NOT IMPLEMENTED YET)
         # OVERLOAD THIS FUNCTION
-        # takes a list of (channels, value) tuples
+        # takes a list of (channel, value) tuples
         # writes each channel to its corresponding value
-        """Write a batch of channel/value pairs while holding interface locks.
+        # returns a list of channel.write() results in the same order
+        """Write a batch of channel/value pairs delegated to this object.
 
-        Subclasses should override this to provide hardware-optimised
-        batch writes.  The default implementation writes each channel
-        sequentially.
+        Called with interface locks held by
+        :meth:`channel_group.write_channel_list`.  Instrument subclasses
+        override this to combine several channel writes into fewer bus
+        transactions.  The default writes each channel sequentially.
 
 
         >>> from PyICe.lab_core import channel
-        >>> hasattr(channel, 'write_delegated_channel_list')
-        True
+        >>> a = channel('a', write_function=lambda v: None)
+        >>> b = channel('b', write_function=lambda v: None)
+        >>> a.write_delegated_channel_list([(a, 1), (b, 2)])
+        [1, 2]
 
         Args:
             channel_value_list: Iterable of ``(channel, value)`` tuples
-                to write.
+                to write, in order.
 
-        Raises:
-            Exception: Re-raised from the underlying write after releasing
-                interface locks.
+        Returns:
+            list: The value returned by each channel's ``write()``, in the
+            order of *channel_value_list*.
         """
-        try:
-            self.lock_interfaces()
-            for (channel, value) in channel_value_list:
-                channel.write(value)
-            self.unlock_interfaces()
-        except Exception as e:
-            self.unlock_interfaces()
-            raise e
+        return [channel.write(value) for (channel, value) in channel_value_list]
 
     def _read_delegated_channel_list(self, channel_list):
         try:
@@ -913,8 +967,13 @@ class channel(delegator):
         if self._write_delay:
             self.delay(self._write_delay)
         self._set_value(value)
-        if self._write_history.count(value):
-            self._write_history.remove(value)
+        try:
+            if self._write_history.count(value):
+                self._write_history.remove(value)
+        except ValueError:
+            # Values such as numpy arrays don't compare to a single bool.
+            # Keep them all.
+            pass
         self._write_history.append(value)
         for callback in self._write_callbacks:
             debug_logging.debug(
@@ -1314,6 +1373,7 @@ class channel(delegator):
         if not isinstance(category, str):
             raise TypeError("Category must be a string")
         self._category = category
+        invalidate_topology()
         return self
 
     def get_category(self):
@@ -1434,6 +1494,8 @@ class channel(delegator):
         """
         self._readable = readable
         self.set_attribute("readable", readable)
+        # logger scan lists only include readable channels
+        invalidate_topology()
         return self
 
     def is_writeable(self):
@@ -2161,6 +2223,8 @@ class integer_channel(channel):
     >>> ic.unformat('0xFF', 'hex', use_presets=False)
     255
     """
+    # format_array() looks presets up in a dense table up to this code span
+    _dense_preset_span = 1 << 16
     def __init__(self, name, size, read_function=None, write_function=None):
         """Initialize an integer channel with a fixed bit width.
         Initializes 7 instance attributes that configure the object's
@@ -2191,6 +2255,8 @@ class integer_channel(channel):
         self._size = size
         self.set_attribute("size", size)
         self._formats = results_ord_dict()
+        # format name -> sorted xypoints arrays used by format_array()
+        self._format_array_cache = {}
         self._presets_reverse = results_ord_dict()
         self._preset_descriptions = results_ord_dict()
         self._format = None
@@ -2552,6 +2618,7 @@ class integer_channel(channel):
         if xypoints is None:
             xypoints = []
         self._formats[format_name] = {}
+        self._format_array_cache.pop(format_name, None)
         if format_function is None and unformat_function is None and len(
                 xypoints) >= 2:
             # Auto piecewise-linear (PWL) formatter.
@@ -2569,45 +2636,14 @@ class integer_channel(channel):
             assert all(d > 0 for d in y_diffs) or all(d < 0 for d in y_diffs), \
                 f'ERROR: {self.get_name()} format {format_name}: y-values are not monotonic — inverse would be ambiguous.'
 
-            def _pwl_interp(val, in_pts, out_pts):
-                """Piecewise-linear interpolation / extrapolation along N-point sequences.
-
-                Handles both ascending and descending in_pts. Values outside the range
-                are extrapolated from the nearest endpoint segment.
-
-
-                >>> from PyICe.lab_core import integer_channel
-                >>> integer_channel._pwl_interp(5, [0, 10], [0, 100])
-                50.0
+            pwl = interpolator(sorted_pts)
 
-                Args:
-                    in_pts: In pts to use.
-                    out_pts: Out pts to use.
-                    val: Val to use.
+            def format_function(x, pwl=pwl):  # pylint: disable=function-redefined
+                # whole columns come back as arrays, single codes as float
+                y = pwl(x)
+                return y if isinstance(y, numpy.ndarray) else float(y)
 
-                Returns:
-                    The pwl interp result.
-                """
-                n = len(in_pts)
-                for i in range(n - 1):
-                    lo = min(in_pts[i], in_pts[i + 1])
-                    hi = max(in_pts[i], in_pts[i + 1])
-                    if lo <= val <= hi:
-                        break
-                else:
-                    # val is outside the calibrated range — extrapolate from the
-                    # nearest endpoint segment based on proximity to
-                    # end-points.
-                    i = 0 if abs(
-                        val - in_pts[0]) < abs(val - in_pts[-1]) else n - 2
-                dx = in_pts[i + 1] - in_pts[i]
-                dy = out_pts[i + 1] - out_pts[i]
-                return out_pts[i] + dy * (val - in_pts[i]) / dx
-
-            def format_function(x, xp=x_pts, yp=y_pts):  # pylint: disable=function-redefined
-                return _pwl_interp(x, xp, yp)
-
-            def unformat_function(y, xp=x_pts, yp=y_pts):  # pylint: disable=function-redefined
+            def unformat_function(y, pwl=pwl):  # pylint: disable=function-redefined
                 """Return unformat function result.
 
                 Converts between raw numeric values and human-readable representations.
@@ -2618,14 +2654,13 @@ class integer_channel(channel):
                 True
 
                 Args:
-                    xp: X-axis data points array.
+                    pwl: Interpolator through the calibration points.
                     y: Y-axis value.
-                    yp: Y-axis data points array.
 
                 Returns:
                     Formatted string representation.
                 """
-                return int(round(_pwl_interp(y, yp, xp)))
+                return int(round(pwl.get_x_val(y)))
         if signed:
             self._formats[format_name]['format_function'] = lambda x: format_function(
                 self.twosComplementToSigned(x))
@@ -2653,6 +2688,7 @@ class integer_channel(channel):
             format_name: Name of the format.
         """
         del self._formats[format_name]
+        self._format_array_cache.pop(format_name, None)
 
     def get_formats(self):
         """Return a list of format_names associate with this register.
@@ -2713,6 +2749,151 @@ class integer_channel(channel):
             return self._formats[format]['format_function'](data)
         return data
 
+    def format_array(self, data, format, use_presets):
+        """Format a whole column of raw integer codes at once.
+
+        The bulk counterpart of :meth:`format`, for register dumps read with
+        :meth:`sqlite_data.columns`.  Codes are converted from two's
+        complement with one array operation when the format is signed.
+        Formats defined by two or more ``xypoints`` (straight-line or
+        piecewise-linear, as also used by :meth:`sql_format`) are evaluated
+        with vectorised interpolation; other formats fall back to calling
+        their ``format_function`` per element.  Presets are looked up in a
+        dense code-indexed table when their codes span at most
+        ``_dense_preset_span`` values, and by binary search otherwise, so
+        sparse presets on a wide register cost no more memory than the
+        presets themselves.  Registers of up to 64 bits are formatted in
+        fixed-width integer arrays; wider ones use Python integers.  NULL
+        entries (``None`` or ``NaN``) format to ``None``.
+
+
+        >>> from PyICe.lab_core import integer_channel
+        >>> ic = integer_channel('temp', size=8)
+        >>> _ = ic.add_format('degC', signed=True, xypoints=[(0, 25.0), (100, 75.0)])
+        >>> ic.format_array([0, 20, 236], 'degC', use_presets=False)
+        array([25., 35., 15.])
+        >>> _ = ic.add_preset('OFF', 0)
+        >>> ic.format_array([0.0, 20.0, float('nan')], 'degC', use_presets=True)
+        array(['OFF', 35.0, None], dtype=object)
+
+        Args:
+            data: Array-like of raw integer codes.
+            format: Format name string, or None to leave codes unformatted.
+            use_presets: If True, replace codes matching a preset value with
+                the preset name.
+
+        Returns:
+            numpy.ndarray: Formatted values.  Float when every value came
+            from an xypoints format, object otherwise.
+
+        Raises:
+            RegisterFormatException: If the register has no such format.
+        """
+        # wide enough for every code of the register, including 64-bit ones
+        code_dtype = numpy.int64 if self._size < 64 else numpy.uint64 if self._size == 64 else object
+        if code_dtype is numpy.int64 or isinstance(data, numpy.ndarray):
+            data = numpy.asarray(data)
+        else:
+            # keep codes above 2**63 exact instead of letting numpy pick float64
+            data = numpy.array(data, dtype=object)
+        if data.dtype.kind == 'O':
+            valid = numpy.array([d is not None and d == d for d in data.ravel()],
+                                dtype=bool).reshape(data.shape)
+            codes = numpy.where(valid, data, 0)
+        elif data.dtype.kind == 'f':
+            valid = ~numpy.isnan(data)
+            codes = numpy.where(valid, data, 0)
+        else:
+            valid = numpy.ones(data.shape, dtype=bool)
+            codes = data
+        if code_dtype is object:
+            codes = numpy.frompyfunc(int, 1, 1)(codes).astype(object)
+        else:
+            codes = codes.astype(code_dtype)
+        if format is None:
+            result = data.astype(object) if data.dtype.kind == 'O' else codes
+        else:
+            if format not in self._formats:
+                raise RegisterFormatException(
+                    'Register {} has no format {}'.format(
+                        self.name, format))
+            fmt = self._formats[format]
+            if len(fmt['xypoints']) >= 2:
+                x = codes
+                if fmt['signed']:
+                    if code_dtype is object:
+                        x = numpy.frompyfunc(self.twosComplementToSigned, 1, 1)(codes)
+                    else:
+                        # sign-extend from bit size - 1 without leaving 64 bits
+                        shift = 64 - self._size
+                        x = (codes.astype(numpy.int64) << shift) >> shift
+                xy_arrays = self._format_array_cache.get(format)
+                if xy_arrays is None:
+                    xypoints = sorted(fmt['xypoints'], key=lambda point: point[0])
+                    xy_arrays = self._format_array_cache[format] = (
+                        numpy.array([p[0] for p in xypoints], dtype=float),
+                        numpy.array([p[1] for p in xypoints], dtype=float))
+                result = interpolator.find_array(x.astype(float), *xy_arrays)
+            else:
+                result = numpy.frompyfunc(fmt['format_function'], 1, 1)(codes.astype(object))
+        preset_hits = None
+        if use_presets and len(self._presets_reverse):
+            preset_hits, preset_names = self._lookup_presets(codes, valid)
+        if preset_hits is not None and preset_hits.any():
+            result = result.astype(object)
+            result[preset_hits] = preset_names[preset_hits]
+        if not valid.all():
+            result = result.astype(object)
+            result[~valid] = None
+        return result
+
+    def _lookup_presets(self, codes, valid):
+        """Match an array of raw codes against the integer presets.
+
+        >>> from PyICe.lab_core import integer_channel
+        >>> import numpy
+        >>> ic = integer_channel('r', size=8)
+        >>> _ = ic.add_preset('LOW', 1)
+        >>> hits, names = ic._lookup_presets(numpy.array([1, 2]), numpy.array([True, True]))
+        >>> hits.tolist(), names[hits].tolist()
+        ([True, False], ['LOW'])
+
+        Args:
+            codes: Integer code array from :meth:`format_array`.
+            valid: Boolean array, False where the code is NULL.
+
+        Returns:
+            tuple: ``(hits, names)`` arrays shaped like *codes*; *names* holds
+            the preset name wherever *hits* is True.  ``(None, None)`` if no
+            preset can match.
+        """
+        presets = sorted((int(value), name) for value, name in self._presets_reverse.items()
+                         if isinstance(value, numbers.Integral) and not isinstance(value, bool))
+        if codes.dtype.kind in 'iu':
+            code_range = numpy.iinfo(codes.dtype)
+            presets = [(value, name) for value, name in presets if code_range.min <= value <= code_range.max]
+        if not presets:
+            return None, None
+        lowest, highest = presets[0][0], presets[-1][0]
+        if highest - lowest < self._dense_preset_span:
+            # dense tables indexed by code - lowest
+            table_names = numpy.full(highest - lowest + 1, None, dtype=object)
+            table_hits = numpy.zeros(highest - lowest + 1, dtype=bool)
+            for value, name in presets:
+                table_names[value - lowest] = name
+                table_hits[value - lowest] = True
+            lowest_code, highest_code = codes.dtype.type(lowest), codes.dtype.type(highest)
+            hits = valid & (codes >= lowest_code) & (codes <= highest_code)
+            index = (codes[hits] - lowest_code).astype(numpy.intp)
+            names = numpy.full(codes.shape, None, dtype=object)
+            names[hits] = table_names[index]
+            hits[hits] = table_hits[index]
+            return hits, names
+        sorted_codes = numpy.array([value for value, _ in presets], dtype=codes.dtype)
+        sorted_names = numpy.array([name for _, name in presets], dtype=object)
+        lookup = numpy.minimum(numpy.searchsorted(sorted_codes, codes), len(sorted_codes) - 1)
+        return valid & (sorted_codes[lookup] == codes), sorted_names[lookup]
+
     def sql_format(self, format, use_presets):
         """Return SQL legal column selection text for insertion into a query/view.
 
@@ -3421,6 +3602,277 @@ class register(integer_channel):
                 'Unknown register side effect special access.. Please contact PyICe developers.')
 
 
+class _work_unit(list):
+    """List of channels read together, carrying their precomputed delegator grouping."""
+    def __init__(self, delegator_groups=()):
+        self.delegator_groups = list(delegator_groups)
+        list.__init__(self, (ch for (_, channels) in self.delegator_groups for ch in channels))
+
+    def get_label(self):
+        """Return the delegator names in this unit, used to key per-thread-group read statistics."""
+        return ', '.join(delegator.get_name() for delegator, _ in self.delegator_groups)
+
+
+class _read_context(threading.local):
+    """Per-thread bookkeeping of an in-progress read_channel_list().
+
+    The GUI and the logger may scan the same master at the same time from
+    different threads; each needs its own partial results and caching depth.
+    """
+    def __init__(self):
+        self.partial_delegation_results = results_ord_dict()
+        self.self_delegation_channels = []
+        self.caching_mode = 0
+
+
+class _read_future(concurrent.futures.Future):
+    """Future of one work unit, remembering when a worker picked it up."""
+    def __init__(self):
+        concurrent.futures.Future.__init__(self)
+        self.started = None
+        self.abandoned = False
+
+
+class _read_pool(object):
+    """Thread pool for threaded channel reads whose workers are daemon threads.
+
+    ``concurrent.futures.ThreadPoolExecutor`` joins its workers when the
+    interpreter exits, so a read hung on an instrument bus would hang the
+    exit.  These workers never block it, like the ``_thread`` workers they
+    replace.  A worker stuck on a timed-out work unit can be written off
+    with :meth:`abandon`; a replacement takes its place so queued units
+    still run.
+    """
+    def __init__(self, max_workers, thread_name_prefix):
+        self._max_workers = max_workers
+        self._thread_name_prefix = thread_name_prefix
+        self._work_queue = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._idle = threading.Semaphore(0)
+        self._live_workers = 0
+        self._thread_count = 0
+        self._shutdown = False
+
+    def submit(self, fn, *args):
+        """Queue ``fn(*args)`` and return its :class:`_read_future`."""
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError('cannot schedule new futures after shutdown')
+            future = _read_future()
+            self._work_queue.put((future, fn, args))
+            if not self._idle.acquire(timeout=0) and self._live_workers < self._max_workers:
+                self._start_worker()
+        return future
+
+    def _start_worker(self):
+        # caller holds self._lock
+        self._live_workers += 1
+        self._thread_count += 1
+        threading.Thread(target=self._worker, daemon=True,
+                         name='{}_{}'.format(self._thread_name_prefix, self._thread_count - 1)).start()
+
+    def _worker(self):
+        while True:
+            item = self._work_queue.get()
+            if item is None:
+                return
+            (future, fn, args) = item
+            del item
+            if future.set_running_or_notify_cancel():
+                future.started = time.monotonic()
+                try:
+                    result = fn(*args)
+                except BaseException as e:
+                    future.set_exception(e)
+                else:
+                    future.set_result(result)
+            with self._lock:
+                if future.abandoned:
+                    # a replacement has already been started
+                    return
+            self._idle.release()
+
+    def abandon(self, future):
+        """Write off the worker running *future* and start a replacement.
+
+        Returns:
+            bool: True if *future* was still running.
+        """
+        with self._lock:
+            if future.done() or not future.running() or future.abandoned:
+                return False
+            future.abandoned = True
+            self._live_workers -= 1
+            if not self._shutdown:
+                self._start_worker()
+            return True
+
+    def shutdown(self, cancel_futures=False):
+        """Stop accepting work and let the workers exit once idle.
+
+        Workers are never joined; one stuck on an instrument exits when its
+        read returns, or with the interpreter.
+
+        Args:
+            cancel_futures: Cancel work units that have not started.
+        """
+        with self._lock:
+            self._shutdown = True
+            if cancel_futures:
+                while True:
+                    try:
+                        item = self._work_queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is not None:
+                        item[0].cancel()
+            for _ in range(self._live_workers):
+                self._work_queue.put(None)
+
+
+class scan_plan(object):
+    """Precomputed read partition for one list of channels.
+
+    Splitting a channel list into self-delegated, threadable and
+    non-threadable channels, grouping each by root delegator and matching
+    delegators to interface thread groups only depends on the list itself
+    and on the delegation/interface topology, not on the data being read.
+    A ``scan_plan`` does that work once, resolving each channel's delegator
+    a single time, so that repeated reads of the same list (every
+    ``logger.log()``) just walk the stored groups.
+
+    Plans are built and cached by :meth:`channel_group.get_scan_plan` and
+    go stale as soon as :func:`invalidate_topology` is called, the owner's
+    channels change or the communication node tree changes.
+
+    >>> from PyICe.lab_core import channel_group, channel
+    >>> g = channel_group('grp')
+    >>> a = g.add(channel('a', read_function=lambda: 1))
+    >>> b = g.add(channel('b', read_function=lambda: 2))
+    >>> plan = g.get_scan_plan([a, b])
+    >>> plan.is_current()
+    True
+    >>> [[ch.get_name() for ch in chs] for _, chs in plan.threadable_groups]
+    [['a'], ['b']]
+    >>> g.get_scan_plan([a, b]) is plan
+    True
+    """
+    def __init__(self, owner, channel_list):
+        """Partition *channel_list* for reads issued by *owner*.
+
+        >>> from PyICe.lab_core import channel_group, scan_plan
+        >>> plan = scan_plan(channel_group('grp'), [])
+        >>> plan.channels
+        ()
+
+        Args:
+            owner: The channel_group (usually a master) that will issue the
+                reads.  Channels delegated to *owner* itself are kept apart
+                so that the master's caching mode can read them last.
+            channel_list: Iterable of channel objects to read.
+        """
+        self.generation = _scan_plan_generation(owner)
+        self._owner = owner
+        self.channels = tuple(channel_list)
+        self_delegation_channels = []
+        threadable = []
+        non_threadable = []
+        every = []
+        for ch in self.channels:
+            delegator = ch.resolve_delegator()
+            every.append((delegator, ch))
+            if delegator is owner:
+                self_delegation_channels.append(ch)
+            elif not ch.threadable() or not delegator.threadable():
+                non_threadable.append((delegator, ch))
+            else:
+                threadable.append((delegator, ch))
+        self.self_delegation_channels = tuple(self_delegation_channels)
+        self.threadable_channels = tuple(ch for (_, ch) in threadable)
+        self.threadable_groups = self._group_by_delegator(threadable)
+        self.non_threadable_groups = self._group_by_delegator(non_threadable)
+        self.delegator_groups = self._group_by_delegator(every)
+        self._thread_partition = None
+
+    @staticmethod
+    def _group_by_delegator(delegator_channel_pairs):
+        groups = collections.OrderedDict()
+        for delegator, ch in delegator_channel_pairs:
+            groups.setdefault(delegator, []).append(ch)
+        return list(groups.items())
+
+    def is_current(self):
+        """Check whether the topology has changed since this plan was built.
+
+        >>> from PyICe.lab_core import channel_group, scan_plan, invalidate_topology
+        >>> plan = scan_plan(channel_group('grp'), [])
+        >>> plan.is_current()
+        True
+        >>> invalidate_topology()
+        >>> plan.is_current()
+        False
+
+        Returns:
+            bool: True if the plan may still be used.
+        """
+        return self.generation == _scan_plan_generation(self._owner)
+
+    def get_thread_partition(self):
+        """Split the threadable delegator groups into per-thread work units.
+
+        Computed on first use because only threaded reads need it.
+        Delegators whose interfaces all fall inside one of the owner's
+        ``group_com_nodes_for_threads_filter`` groups share a work unit;
+        delegators without interfaces, or spanning several groups, are
+        returned separately to be read in the calling thread.
+
+        >>> from PyICe.lab_core import channel_group, channel, scan_plan
+        >>> ch = channel('a', read_function=lambda: 1)
+        >>> work_units, unthreaded = scan_plan(channel_group('grp'), [ch]).get_thread_partition()
+        >>> work_units
+        []
+        >>> [c.get_name() for c in unthreaded]
+        ['a']
+
+        Returns:
+            tuple: ``(work_units, unthreaded)``.  Each work unit is a list
+            of channels to be read by one worker thread; *unthreaded* lists
+            the channels to be read by the calling thread.  Both remember
+            their delegator grouping in a ``delegator_groups`` attribute.
+        """
+        if self._thread_partition is None:
+            remaining = list(self.threadable_groups)
+            work_units = []
+            # dont read threaded unless i know how to group interfaces for
+            # threads (only interface_factory's know this, ie a master)
+            if hasattr(self._owner, 'group_com_nodes_for_threads_filter') and len(remaining):
+                interfaces = []
+                for delegator, _ in remaining:
+                    interfaces.extend(delegator.get_interfaces())
+                for interface_group in self._owner.group_com_nodes_for_threads_filter(interfaces):
+                    interface_group = set(interface_group)
+                    work_unit = []
+                    not_in_group = []
+                    for delegator, channels in remaining:
+                        delegator_interfaces = delegator.get_interfaces()
+                        # a delegator without interfaces cannot be threaded
+                        # since I dont know how it works
+                        if len(delegator_interfaces) and delegator_interfaces.issubset(interface_group):
+                            work_unit.append((delegator, channels))
+                        else:
+                            not_in_group.append((delegator, channels))
+                    if len(work_unit):
+                        work_units.append(_work_unit(work_unit))
+                    remaining = not_in_group
+            self._thread_partition = (work_units, _work_unit(remaining))
+        return self._thread_partition
+
+
+def _scan_plan_generation(owner):
+    return (_topology_generation, lab_interfaces.communication_node.get_com_node_generation(),
+            owner._structure_generation)
+
+
 class channel_group(object):
     """Collection of channels, optionally organized into sub-groups.
 
@@ -3434,6 +3886,12 @@ class channel_group(object):
     >>> g.get_all_channel_names()
     ['voltage']
     """
+    # number of distinct channel lists whose scan plans are remembered
+    _scan_plan_cache_size = 16
+    # bumped when channels or sub groups of this group, or of any group
+    # below it, are added, removed or reordered
+    _structure_generation = 0
+
     def __init__(self, name='Unnamed Channel Group'):
         """Initialize a channel group with a name and empty channel/group collections.
         Initializes 5 instance attributes that configure the object's
@@ -3457,8 +3915,24 @@ class channel_group(object):
         # a list of other groups contained by this object
         self._sub_channel_groups = []
         self._threaded = False
-        self._partial_delegation_results = results_ord_dict()
-        self._self_delegation_channels = []
+        self._threads = 0
+        self._read_executor = None
+        # copies share the pool but only the group that started it stops it
+        self._owns_read_executor = False
+        self._read_timeout = None
+        self._read_futures = set()
+        self._read_stats = results_ord_dict()
+        self._read_lock = threading.Lock()
+        self._read_context = _read_context()
+        self._scan_plans = collections.OrderedDict()
+        self._scan_plans_lock = threading.Lock()
+        # name -> channel for every channel resolvable through this group,
+        # kept current as channels and sub groups come and go
+        self._name_index = {}
+        # groups holding this one as a sub group; told about index changes
+        self._parent_groups = weakref.WeakSet()
+        # (generations, ordered dict, category dict) built on demand
+        self._all_channels_cache = None
         debug_logging.debug("Created new channel group: %s", self.get_name())
 
     def __str__(self):
@@ -3477,6 +3951,22 @@ class channel_group(object):
         """
         return "channel_group Object: {}".format(self.get_name())
 
+    @property
+    def _partial_delegation_results(self):
+        return self._read_context.partial_delegation_results
+
+    @_partial_delegation_results.setter
+    def _partial_delegation_results(self, value):
+        self._read_context.partial_delegation_results = value
+
+    @property
+    def _self_delegation_channels(self):
+        return self._read_context.self_delegation_channels
+
+    @_self_delegation_channels.setter
+    def _self_delegation_channels(self, value):
+        self._read_context.self_delegation_channels = value
+
     def __iter__(self):
         """Iterate over all channels in this group, including sub-groups.
         Enables iteration over the object's elements.
@@ -3552,8 +4042,24 @@ class channel_group(object):
         copy_self._channel_dict = results_ord_dict()
         # Populate the copy of the dictionary with copies of original channels
         copy_self._channel_dict.update(self._channel_dict)
-        # How should _partial_delegation_results, _self_delegation_channels,
-        # _sub_channel_groups be handled by this copy routine?
+        # The copy shares the read executor, but not in-flight reads or stats,
+        # and stopping the copy's threads leaves the original's pool running.
+        copy_self._owns_read_executor = False
+        copy_self._read_futures = set()
+        copy_self._read_stats = results_ord_dict()
+        copy_self._read_lock = threading.Lock()
+        copy_self._read_context = _read_context()
+        # Cached scan plans remember which delegator issued them; never share.
+        copy_self._scan_plans = collections.OrderedDict()
+        copy_self._scan_plans_lock = threading.Lock()
+        # The copy gets its own sub group list and name index so that later
+        # additions to either group cannot leave the other's index stale.
+        copy_self._sub_channel_groups = list(self._sub_channel_groups)
+        copy_self._name_index = dict(self._name_index)
+        copy_self._parent_groups = weakref.WeakSet()
+        copy_self._all_channels_cache = None
+        for sub_channel_group in copy_self._sub_channel_groups:
+            sub_channel_group._parent_groups.add(copy_self)
         if isinstance(self, delegator):
             if self.get_delegator() is self:
                 copy_self.set_delegator(copy_self)
@@ -3632,6 +4138,7 @@ class channel_group(object):
             kwargs['key'] = lambda kv_tuple: kv_tuple[0]
         self._channel_dict = results_ord_dict(
             sorted(list(self._channel_dict.items()), **kwargs))
+        self._invalidate_structure()
         if deep:  # should this go deep and sort sub channel groups too?
             for scg in self._sub_channel_groups:
                 scg.sort(**kwargs)
@@ -3683,12 +4190,12 @@ class channel_group(object):
             err_str = 'Attempted to add a non-channel to a channel_group'
             debug_logging.error(err_str)
             raise Exception(err_str)
-        if channel_object.get_name() in list(self._channel_dict.keys()):
+        if channel_object.get_name() in self._channel_dict:
             debug_logging.warning(
                 "WARNING: Re-defined channel %s",
                 channel_object.get_name())
             print(("WARNING: Re-defined channel {}".format(channel_object.get_name())))
-        elif channel_object.get_name() in list(self.get_all_channels_dict().keys()):
+        elif channel_object.get_name() in self._name_index:
             err_str = '\nName Conflict: Attempted to create an already named channel {} existing in another subgroup'.format(
                 channel_object.get_name())
             debug_logging.error(err_str)
@@ -3698,8 +4205,69 @@ class channel_group(object):
             channel_object.get_name(),
             self.get_name())
         self._channel_dict[channel_object.get_name()] = channel_object
+        self._update_name_index(channel_object.get_name(), channel_object)
+        self._invalidate_structure()
         return channel_object
 
+    def _invalidate_structure(self):
+        """Mark cached channel lists and scan plans of this group and every group above it as stale.
+
+        Membership changes only affect the groups that can see them, so a
+        temporary group (such as the one built by
+        :meth:`resolve_channel_list`) never disturbs the live channel tree.
+
+        >>> from PyICe.lab_core import channel_group, get_topology_generation
+        >>> parent, child = channel_group('parent'), channel_group('child')
+        >>> _ = parent.add(child)
+        >>> before = (get_topology_generation(), parent._structure_generation)
+        >>> child._invalidate_structure()
+        >>> get_topology_generation() == before[0], parent._structure_generation > before[1]
+        (True, True)
+        """
+        self._structure_generation += 1
+        for parent_group in list(self._parent_groups):
+            parent_group._invalidate_structure()
+
+    def _update_name_index(self, channel_name, channel_object=None):
+        """Re-resolve one name in this group's index and pass any change up to parent groups.
+
+        The index answers the same way :meth:`_resolve_channel` always has:
+        this group's own channels first, then sub groups in the order they
+        were added. A full walk is only needed when the name was already
+        claimed; a brand-new name simply resolves to *channel_object*.
+
+        >>> from PyICe.lab_core import channel_group, channel
+        >>> parent, child = channel_group('parent'), channel_group('child')
+        >>> parent.add(child).get_name()
+        'child'
+        >>> ch = child.add(channel(name='late_arrival'))
+        >>> parent._name_index['late_arrival'] is ch
+        True
+
+        Args:
+            channel_name: The name whose resolution may have changed.
+            channel_object: The channel newly reachable under *channel_name*,
+                or None when something reachable under that name went away.
+        """
+        current = self._name_index.get(channel_name)
+        if channel_object is not None and current is None:
+            resolved = channel_object
+        else:
+            resolved = self._channel_dict.get(channel_name)
+            if resolved is None:
+                for sub_channel_group in self._sub_channel_groups:
+                    resolved = sub_channel_group._name_index.get(channel_name)
+                    if resolved is not None:
+                        break
+        if resolved is current:
+            return
+        if resolved is None:
+            del self._name_index[channel_name]
+        else:
+            self._name_index[channel_name] = resolved
+        for parent_group in list(self._parent_groups):
+            parent_group._update_name_index(channel_name, resolved)
+
     def merge_in_channel_group(self, channel_group_object):
         """Merge all channels from another channel group into this group's top level.
 
@@ -3748,13 +4316,17 @@ class channel_group(object):
         if not isinstance(channel_group_object, channel_group):
             raise Exception('\nAttempted to add a "{}" to a channel_group as a sub group'.format(
                 channel_group_object))
-        channel_name_conflicts = set(
-            self.get_all_channels_dict().keys()) & set(
-            channel_group_object.get_all_channels_dict().keys())
+        channel_name_conflicts = self._name_index.keys(
+        ) & channel_group_object._name_index.keys()
         for channel_name_conflict in channel_name_conflicts:
             raise Exception(
                 '\nChannel name conflict for "{}"'.format(channel_name_conflict))
         self._sub_channel_groups.append(channel_group_object)
+        channel_group_object._parent_groups.add(self)
+        for channel_name, channel_object in list(
+                channel_group_object._name_index.items()):
+            self._update_name_index(channel_name, channel_object)
+        self._invalidate_structure()
         return channel_group_object
 
     def get_channel_groups(self):
@@ -3887,21 +4459,68 @@ class channel_group(object):
     def write_channels(self, item_list):
         """Write values to multiple channels from a list of (name, value) pairs.
 
-        Writes data to the underlying target.
+        The writes are handed to :meth:`write_channel_list`, which lets each
+        delegator batch the channels it owns.
 
 
-        >>> from PyICe.lab_core import channel_group
-        >>> hasattr(channel_group, 'write_channels')
-        True
+        >>> from PyICe.lab_core import channel_group, channel
+        >>> g = channel_group('grp')
+        >>> _ = g.add(channel('a', write_function=lambda v: None))
+        >>> _ = g.add(channel('b', write_function=lambda v: None))
+        >>> g.write_channels([('a', 1), ('b', 2)])
+        [1, 2]
 
         Args:
-            item_list: An iterable of ``(channel_name, value)`` tuples to write.
+            item_list: An iterable of ``(channel_name, value)`` tuples to
+                write.  Channel objects are accepted in place of names.
 
         Returns:
-            list: A list of results from each individual write_channel call.
+            list: The result of each channel write, in order.
         """
-        return [self.write_channel(ch_name, ch_value)
-                for (ch_name, ch_value) in item_list]
+        channel_value_list = []
+        for (ch, ch_value) in item_list:
+            if not isinstance(ch, channel):
+                ch = self.get_channel(ch)
+            channel_value_list.append((ch, ch_value))
+        return self.write_channel_list(channel_value_list)
+
+    def write_channel_list(self, channel_value_list):
+        """Write a list of (channel object, value) pairs, batching by delegator.
+
+        Consecutive writes whose channels share a root delegator are passed
+        to that delegator's ``write_delegated_channel_list`` in one call,
+        with its interfaces locked, so that the instrument can merge them
+        into fewer bus transactions.  Runs are kept in list order, so writes
+        to different delegators are never reordered.
+
+
+        >>> from PyICe.lab_core import channel_group, channel
+        >>> g = channel_group('grp')
+        >>> ch = g.add(channel('x', write_function=lambda v: None))
+        >>> g.write_channel_list([(ch, 3), (ch, 4)])
+        [3, 4]
+        >>> ch.read()
+        4
+
+        Args:
+            channel_value_list: An iterable of ``(channel, value)`` tuples.
+
+        Returns:
+            list: The result of each channel write, in order.
+        """
+        results = []
+        run_delegator = None
+        run = []
+        for (ch, value) in channel_value_list:
+            delegator = ch.resolve_delegator()
+            if run and delegator is not run_delegator:
+                results.extend(run_delegator._write_delegated_channel_list(run))
+                run = []
+            run_delegator = delegator
+            run.append((ch, value))
+        if run:
+            results.extend(run_delegator._write_delegated_channel_list(run))
+        return results
 
     def get_channel(self, channel_name):
         """Retrieve a channel object by name, resolving through sub-groups.
@@ -3958,22 +4577,36 @@ class channel_group(object):
         return new_group
 
     def _resolve_channel(self, channel_name):
-        if channel_name in self._channel_dict:
-            debug_logging.debug(
-                "%s resolved %s to self.",
-                self.get_name(),
-                channel_name)
-            return self._channel_dict[channel_name]
+        return self._name_index.get(channel_name)
+
+    def _get_all_channels_cache(self):
+        """Return the ordered channel dict and per-category dicts, rebuilding them if the topology changed.
+
+        >>> from PyICe.lab_core import channel_group
+        >>> hasattr(channel_group, '_get_all_channels_cache')
+        True
+
+        Returns:
+            tuple: ``(all_channels, by_category)`` where *all_channels* is a
+            results_ord_dict of name to channel and *by_category* maps each
+            category to a results_ord_dict in the same order. Callers must
+            not modify either.
+        """
+        generation = (_topology_generation, self._structure_generation)
+        cache = self._all_channels_cache
+        if cache is not None and cache[0] == generation:
+            return cache[1], cache[2]
+        all_channels = results_ord_dict(self._channel_dict)
         for sub_channel_group in self._sub_channel_groups:
-            channel = sub_channel_group._resolve_channel(channel_name)
-            if channel is not None:
-                debug_logging.debug(
-                    "%s resolved %s to %s.",
-                    self.get_name(),
-                    channel_name,
-                    sub_channel_group.get_name())
-                return channel
-        return None
+            all_channels.update(sub_channel_group._get_all_channels_cache()[0])
+        by_category = collections.OrderedDict()
+        for channel_name, channel_object in all_channels.items():
+            category = channel_object.get_category()
+            if category not in by_category:
+                by_category[category] = results_ord_dict()
+            by_category[category][channel_name] = channel_object
+        self._all_channels_cache = (generation, all_channels, by_category)
+        return all_channels, by_category
 
     def get_all_channels_dict(self, categories=None):
         # returns a dictionary of all channels by name
@@ -3993,14 +4626,14 @@ class channel_group(object):
         Returns:
             results_ord_dict: Ordered dict mapping channel names to channel objects.
         """
-        all_channels = results_ord_dict(self._channel_dict)
-        for sub_channel_group in self._sub_channel_groups:
-            all_channels.update(sub_channel_group.get_all_channels_dict())
-        if categories is not None:
-            for k, v in list(all_channels.items()):
-                if v.get_category() not in categories:
-                    del all_channels[k]
-        return all_channels
+        all_channels, by_category = self._get_all_channels_cache()
+        if categories is None:
+            return results_ord_dict(all_channels)
+        selected = [category for category in by_category if category in categories]
+        if len(selected) == 1:
+            return results_ord_dict(by_category[selected[0]])
+        return results_ord_dict((k, v) for k, v in all_channels.items()
+                                if v.get_category() in selected)
 
     def get_all_channel_names(self, categories=None):
         """Return a list of all channel names in this group and its sub-groups.
@@ -4089,30 +4722,17 @@ class channel_group(object):
         Returns:
             results_ord_dict: Ordered dict mapping channel names to their read values.
         """
-        threadable_channels = []
-        non_threadable_channels = []
+        plan = self.get_scan_plan(channel_list)
         self._partial_delegation_results = results_ord_dict()
-        self._self_delegation_channels = []
-        for channel in channel_list:
-            if channel.resolve_delegator() is self:
-                # if the user asked the delegator directly to read do not thread
-                # this is also useful for the masters caching mode to do it
-                # last
-                self._self_delegation_channels.append(channel)
-            elif not channel.threadable():
-                non_threadable_channels.append(channel)
-            elif not channel.resolve_delegator().threadable():
-                non_threadable_channels.append(channel)
-            else:
-                threadable_channels.append(channel)
+        self._self_delegation_channels = plan.self_delegation_channels
         if self._threaded:
             debug_logging.debug("*** threaded read_channel_list() called")
-            results = self._read_channels_threaded(threadable_channels)
+            results = self._read_scan_plan_threaded(plan)
         else:
             debug_logging.debug("Nonthreaded read_channel_list() called")
-            results = self._read_channels_non_threaded(threadable_channels)
+            results = self._read_delegator_groups(plan.threadable_groups)
         results.update(
-            self._read_channels_non_threaded(non_threadable_channels))
+            self._read_delegator_groups(plan.non_threadable_groups))
         if len(self._self_delegation_channels):
             self._partial_delegation_results.update(results)
             results.update(
@@ -4126,21 +4746,65 @@ class channel_group(object):
             raise PartialReadException(results, failures)
         return results
 
-    def _read_channels_non_threaded(self, channel_list):
-        # get a dictionary of delegators for list of channel objects
-        delegator_list = []
-        for channel in channel_list:
-            delegator_list.append(channel.resolve_delegator())
-        # remove all duplicates
-        delegator_list = list(set(delegator_list))
+    def get_scan_plan(self, channel_list):
+        """Return the cached :class:`scan_plan` for *channel_list*, building it if needed.
+
+        Plans are keyed by the exact sequence of channel objects and are
+        rebuilt automatically once the channel/delegation topology or the
+        communication node tree changes.  A small number of plans is kept
+        per group, least recently used first out.
+
+
+        >>> from PyICe.lab_core import channel_group, channel
+        >>> g = channel_group('grp')
+        >>> ch = g.add(channel('x', read_function=lambda: 0))
+        >>> plan = g.get_scan_plan([ch])
+        >>> g.get_scan_plan([ch]) is plan
+        True
+        >>> _ = g.add(channel('y', read_function=lambda: 1))
+        >>> g.get_scan_plan([ch]) is plan
+        False
+
+        Args:
+            channel_list: Iterable of channel objects (a channel_group is
+                accepted too).
+
+        Returns:
+            scan_plan: Partition of *channel_list* for this group.
+        """
+        key = tuple(channel_list)
+        with self._scan_plans_lock:
+            plan = self._scan_plans.get(key)
+            if plan is not None:
+                if plan.is_current():
+                    self._scan_plans.move_to_end(key)
+                    return plan
+                del self._scan_plans[key]
+        plan = scan_plan(self, key)
+        with self._scan_plans_lock:
+            self._scan_plans[key] = plan
+            while len(self._scan_plans) > self._scan_plan_cache_size:
+                self._scan_plans.popitem(last=False)
+        return plan
+
+    def invalidate_scan_plans(self):
+        """Discard all cached scan plans held by this group.
+
+        Normally unnecessary; see :func:`invalidate_topology` for the
+        process-wide equivalent.
+
+
+        >>> from PyICe.lab_core import channel_group
+        >>> channel_group('grp').invalidate_scan_plans()
+
+        """
+        with self._scan_plans_lock:
+            self._scan_plans.clear()
+
+    def _read_delegator_groups(self, delegator_groups):
         # have each delegator read its channels
         results = results_ord_dict()
-        for delegator in delegator_list:
-            # for each delegator get the list of channels it is responsible for
-            channel_delegation_list = []
-            for channel in channel_list:
-                if delegator == channel.resolve_delegator():
-                    channel_delegation_list.append(channel)
+        for delegator, channel_delegation_list in delegator_groups:
             try:
                 results.update(
                     delegator._read_delegated_channel_list(channel_delegation_list))
@@ -4152,89 +4816,63 @@ class channel_group(object):
                         'READ_ERROR', original_exception=e, original_traceback=tb)
         return results
 
+    def _read_channels_non_threaded(self, channel_list):
+        # thread work units arrive already grouped by delegator
+        delegator_groups = getattr(channel_list, 'delegator_groups', None)
+        if delegator_groups is None:
+            delegator_groups = self.get_scan_plan(channel_list).delegator_groups
+        return self._read_delegator_groups(delegator_groups)
+
     def _read_channels_threaded(self, channel_list):
-        # dont read threaded unless i know how to group interfaces for theads (only interface_factory's
-        #    know this, ie a master
-        if not hasattr(self, 'group_com_nodes_for_threads_filter'):
-            return self._read_channels_non_threaded(channel_list)
-        # get a dictionary of delegator's by channel name
-        delegator_list = [channel.resolve_delegator()
-                          for channel in channel_list]
-        # remove all duplicates
-        delegator_list = list(set(delegator_list))
-        # build a list of interfaces that will be used in this read
-        interfaces = []
-        for delegator in delegator_list:
-            for interface in delegator.get_interfaces():
-                interfaces.append(interface)
-
-        remaining_delegators = []
-        interface_thread_groups = self.group_com_nodes_for_threads_filter(  # pylint: disable=no-member; defined in master subclass, guarded by hasattr check above
-            interfaces)
-        work_units = 0
-        if len(interface_thread_groups):
-            for interface_group in interface_thread_groups:
-                # build a group of delegators for each potential thread
-                delegator_group = []
-                remaining_delegators = []
-                for delegator in delegator_list:
-                    interfaces = delegator.get_interfaces()
-                    # a delegator without interfaces cannot be threaded since I
-                    # dont know how it works
-                    if len(interfaces) and interfaces.issubset(
-                            interface_group):
-                        delegator_group.append(delegator)
-                    else:
-                        remaining_delegators.append(delegator)
-
-                # build a list of channels for that group of delegators to read
-                delegator_groups_channel_list = []
-                # this is where the channel reads become unordered...
-                for delegator in delegator_group:
-                    for channel in channel_list:
-                        if channel.resolve_delegator() == delegator:
-                            delegator_groups_channel_list.append(channel)
-                # start the threaded read here
-                # not threaded yet
-                work_units += 1
-                # send channels to thread pool
-                self._read_queue.put(delegator_groups_channel_list)
-                delegator_list = remaining_delegators
-        else:
-            remaining_delegators = delegator_list
-        results = self.get_threaded_results(work_units)
-        # group all the thread results here
-        # find the channels for any decelerators that couldn't be threaded
-        delegator_groups_channel_list = []
-        for delegator in remaining_delegators:
-            for channel in channel_list:
-                if channel.resolve_delegator() == delegator:
-                    delegator_groups_channel_list.append(channel)
-        results.update(self._read_channels_non_threaded(
-            delegator_groups_channel_list))
+        plan = self.get_scan_plan(channel_list)
+        results = self._read_scan_plan_threaded(plan)
+        results.update(self._read_delegator_groups(plan.non_threadable_groups))
+        if len(plan.self_delegation_channels):
+            results.update(self._read_delegator_groups(
+                [(self, list(plan.self_delegation_channels))]))
+        return results
+
+    def _read_scan_plan_threaded(self, plan):
+        # reads the threadable part of a plan, one future per interface
+        # thread group; the futures belong to this call alone, so
+        # concurrent scans can never collect each other's results
+        work_units, unthreaded = plan.get_thread_partition()
+        futures = {self._submit_work_unit(work_unit): work_unit for work_unit in work_units}
+        try:
+            # read the channels for any delegators that couldn't be threaded
+            # while the pool works on the rest
+            unthreaded_results = self._read_channels_non_threaded(unthreaded)
+        finally:
+            results = self.get_threaded_results(futures)
+        results.update(unthreaded_results)
         # check results to make sure every channel in channel_list is present,
         # otherwise it is a read error
-        for channel in channel_list:
-            if channel.get_name() in results:
-                pass
-            else:
+        for channel in plan.threadable_channels:
+            if channel.get_name() not in results:
                 results[channel.get_name()] = ChannelReadException(
                     'READ_ERROR')
         return results
 
     def start_threads(self, number):
-        """Start worker threads for concurrent channel reads.
+        """Start a pool of worker threads for concurrent channel reads.
 
-        Creates the specified number of background threads that pull channel
-        lists from a shared queue and read them in parallel.
+        Each interface thread group of a threaded read is submitted to the
+        pool as its own work unit and tracked by its own future.  The
+        workers are daemon threads, so a read hung on an instrument never
+        keeps the interpreter from exiting.
 
 
         >>> from PyICe.lab_core import channel_group
-        >>> hasattr(channel_group, 'start_threads')
-        True
+        >>> g = channel_group('grp')
+        >>> g.start_threads(2)
+        >>> g.start_threads(2)
+        Traceback (most recent call last):
+        ...
+        Exception: Threads already started, do not start again
+        >>> g.stop_threads()
 
         Args:
-            number: The number of worker threads to start.
+            number: The maximum number of worker threads.
 
         Raises:
             Exception: If threads have already been started.
@@ -4242,102 +4880,273 @@ class channel_group(object):
         if self._threaded is False:
             self._threaded = True
             self._threads = number
-            self._read_queue = queue.Queue()
-            self._read_results_queue = queue.Queue()
-            for i in range(number):
-                _thread.start_new_thread(self.threaded_read_function, ())
+            self._read_executor = _read_pool(
+                max_workers=number, thread_name_prefix='{}_read'.format(self.get_name()))
+            self._owns_read_executor = True
         else:
             raise Exception('Threads already started, do not start again')
 
     def stop_threads(self):
-        """Stop worker threads started by start_threads.
+        """Stop the worker pool started by start_threads.
 
-        Supports the ``channel_group`` workflow by performing the described operation.
+        Work units that have not started yet are cancelled; units already
+        talking to an instrument are allowed to finish in the background.
+        A copy made by :meth:`copy` only stops using the pool it shares with
+        the original group.
 
         >>> from PyICe.lab_core import channel_group
-        >>> hasattr(channel_group, 'stop_threads')
-        True
+        >>> channel_group('grp').stop_threads()
 
         """
         if self._threaded:
             self._threaded = False
-            for _ in range(self._threads):
-                self._read_queue.put(None)
+            if self._owns_read_executor:
+                self._read_executor.shutdown(cancel_futures=True)
+            self._owns_read_executor = False
+            self._read_executor = None
 
-    def threaded_read_function(self):
-        """Run the worker-thread loop that consumes channel-read requests from the queue.
+    def set_read_timeout(self, timeout):
+        """Set how long a threaded read waits for each interface thread group.
 
-        Supports the ``channel_group`` workflow by performing the described operation.
+        Each group's clock starts when a worker picks it up, so groups
+        queued behind a busy pool keep their whole budget.  A group still
+        running when its timeout expires is abandoned to its worker thread,
+        which is replaced, and its channels are returned as
+        ``ChannelReadException('READ_TIMEOUT')``; results from the other
+        groups are kept.
 
         >>> from PyICe.lab_core import channel_group
-        >>> hasattr(channel_group, 'threaded_read_function')
-        True
+        >>> g = channel_group('grp')
+        >>> g.set_read_timeout(2.5)
+        >>> g.get_read_timeout()
+        2.5
 
+        Args:
+            timeout: Seconds per interface thread group, or None to wait
+                indefinitely (the default).
         """
-        while self._threaded:
-            try:
-                channel_list = self._read_queue.get(block=True)
-            except queue.Empty:
-                # shouldn't get here
-                pass
-            else:
-                if channel_list is None:
-                    break
-                try:
-                    results = self._read_channels_non_threaded(channel_list)
-                except Exception as e:
-                    print((traceback.format_exc()))
-                    self._read_results_queue.put(e)
-                else:
-                    self._read_results_queue.put(results)
+        self._read_timeout = timeout
+
+    def get_read_timeout(self):
+        """Return the threaded read timeout in seconds, or None if reads wait indefinitely.
+
+        >>> from PyICe.lab_core import channel_group
+        >>> channel_group('grp').get_read_timeout() is None
+        True
 
-    def get_threaded_results(self, work_units):
-        """Collect results from threaded channel reads.
+        Returns:
+            float or None: The timeout set by :meth:`set_read_timeout`.
+        """
+        return self._read_timeout
 
-        Blocks until all *work_units* results have been received from the
-        result queue.
+    def cancel_threaded_reads(self):
+        """Cancel every queued work unit of in-progress threaded reads.
 
+        Channels of cancelled units are returned as
+        ``ChannelReadException('READ_CANCELLED')``.  Units already running
+        cannot be interrupted mid-transaction and complete normally.
 
         >>> from PyICe.lab_core import channel_group
-        >>> hasattr(channel_group, 'get_threaded_results')
-        True
+        >>> channel_group('grp').cancel_threaded_reads()
+        0
 
-        Args:
-            work_units: The number of completed work-unit results to wait for.
+        Returns:
+            int: The number of work units cancelled.
+        """
+        with self._read_lock:
+            futures = list(self._read_futures)
+        return sum(1 for future in futures if future.cancel())
+
+    def get_read_stats(self):
+        """Return wall-time statistics of threaded reads, per interface thread group.
+
+        Groups are labelled by the names of the delegators read together.
+        The slowest group bounds the duration of a threaded scan.
+
+        >>> from PyICe.lab_core import channel_group
+        >>> len(channel_group('grp').get_read_stats())
+        0
 
         Returns:
-            results_ord_dict: Aggregated results from all worker threads.
+            results_ord_dict: Label to dict with ``count``, ``total``,
+            ``mean``, ``max`` and ``last`` seconds, plus ``failures`` and
+            ``timeouts`` counts.  Timed-out units are timed when they
+            eventually finish.
+        """
+        with self._read_lock:
+            stats = results_ord_dict()
+            for label, entry in self._read_stats.items():
+                stats[label] = dict(entry, mean=entry['total'] / entry['count'] if entry['count'] else 0.0)
+            return stats
+
+    def reset_read_stats(self):
+        """Discard the statistics reported by :meth:`get_read_stats`.
+
+        >>> from PyICe.lab_core import channel_group
+        >>> channel_group('grp').reset_read_stats()
 
-        Raises:
-            Exception: If all work units failed and no results were collected.
         """
-        results = results_ord_dict()
-        for i in range(work_units):
-            thread_results = self._read_results_queue.get(block=True)
-            if isinstance(thread_results, Exception):
-                _error = thread_results  # noqa: F841
-                # raise thread_results
-            else:
-                results.update(thread_results)
-        if len(results) == 0 and work_units > 0:
-            # if we get here every work unit failed, raise exception
-            debug_logging.error("error out {}".format(len(results)))
-            raise Exception
-        return results
+        with self._read_lock:
+            self._read_stats = results_ord_dict()
 
-    def read_all_channels(self, categories=None, exclusions=None):
-        """Read all readable channels and return results sorted by channel name.
+    def _submit_work_unit(self, work_unit):
+        future = self._read_executor.submit(self.threaded_read_function, work_unit)
+        with self._read_lock:
+            self._read_futures.add(future)
+        future.add_done_callback(self._discard_read_future)
+        return future
 
-        Optionally filters channels by category and excludes specific channels.
+    def _discard_read_future(self, future):
+        with self._read_lock:
+            self._read_futures.discard(future)
 
+    def threaded_read_function(self, channel_list):
+        """Read one work unit in a pool thread and record how long it took.
 
-        >>> from PyICe.lab_core import master
-        >>> hasattr(master, 'read_all_channels')
-        True
+        >>> from PyICe.lab_core import channel_group, channel
+        >>> g = channel_group('grp')
+        >>> ch = g.add(channel('x', read_function=lambda: 7))
+        >>> g.threaded_read_function([ch])['x']
+        7
 
         Args:
-            categories: An iterable of category strings to include.  If None,
-                all readable channels are read.
+            channel_list: The channels to read, normally a work unit
+                produced by :meth:`scan_plan.get_thread_partition`.
+
+        Returns:
+            results_ord_dict: Channel names mapped to values.
+        """
+        t_start = time.perf_counter()
+        failed = True
+        try:
+            results = self._read_channels_non_threaded(channel_list)
+            failed = any(isinstance(value, ChannelReadException) for value in results.values())
+            return results
+        finally:
+            self._record_read_time(channel_list, time.perf_counter() - t_start, failed)
+
+    @staticmethod
+    def _get_work_unit_label(channel_list):
+        if hasattr(channel_list, 'get_label'):
+            return channel_list.get_label()
+        return ', '.join(channel.get_name() for channel in channel_list)
+
+    def _get_read_stats_entry(self, label):
+        # caller holds self._read_lock
+        entry = self._read_stats.get(label)
+        if entry is None:
+            entry = self._read_stats[label] = {
+                'count': 0, 'total': 0.0, 'max': 0.0, 'last': 0.0, 'failures': 0, 'timeouts': 0}
+        return entry
+
+    def _record_read_time(self, channel_list, elapsed, failed):
+        label = self._get_work_unit_label(channel_list)
+        with self._read_lock:
+            entry = self._get_read_stats_entry(label)
+            entry['count'] += 1
+            entry['total'] += elapsed
+            entry['max'] = max(entry['max'], elapsed)
+            entry['last'] = elapsed
+            entry['failures'] += bool(failed)
+
+    def get_threaded_results(self, futures):
+        """Collect the results of threaded work units.
+
+        Waits up to the :meth:`set_read_timeout` timeout for each future,
+        counted from when its work unit started running.  Nothing is dropped: a work unit that raised, timed out or was
+        cancelled contributes a ``ChannelReadException`` for each of its
+        channels (``READ_ERROR``, ``READ_TIMEOUT`` or ``READ_CANCELLED``).
+
+
+        >>> from PyICe.lab_core import channel_group
+        >>> len(channel_group('grp').get_threaded_results({}))
+        0
+
+        Args:
+            futures: Dict mapping each :class:`concurrent.futures.Future` to
+                the channel list it is reading.
+
+        Returns:
+            results_ord_dict: Results of all work units, in submission order.
+        """
+        not_done = self._wait_for_work_units(futures)
+        results = results_ord_dict()
+        for future, channel_list in futures.items():
+            if future in not_done:
+                debug_logging.error("Threaded read of %s timed out after %ss",
+                                    ', '.join(ch.get_name() for ch in channel_list), self._read_timeout)
+                with self._read_lock:
+                    self._get_read_stats_entry(self._get_work_unit_label(channel_list))['timeouts'] += 1
+                for channel in channel_list:
+                    results[channel.get_name()] = ChannelReadException('READ_TIMEOUT')
+            elif future.cancelled():
+                for channel in channel_list:
+                    results[channel.get_name()] = ChannelReadException('READ_CANCELLED')
+            elif future.exception() is not None:
+                e = future.exception()
+                tb = ''.join(traceback.format_exception(type(e), e, e.__traceback__))
+                debug_logging.error(f"Threaded read failed: {e}\n{tb}")
+                for channel in channel_list:
+                    results[channel.get_name()] = ChannelReadException(
+                        'READ_ERROR', original_exception=e, original_traceback=tb)
+            else:
+                results.update(future.result())
+        return results
+
+    def _wait_for_work_units(self, futures):
+        """Wait for *futures*, timing each from when its work unit started.
+
+        Returns:
+            set: The futures that ran past the read timeout.  Their workers
+            have been abandoned.
+        """
+        timeout = self._read_timeout
+        if timeout is None:
+            concurrent.futures.wait(list(futures))
+            return set()
+        # futures from elsewhere than the read pool are timed from now
+        submitted = time.monotonic()
+        pending = set(futures)
+        timed_out = set()
+        while pending:
+            now = time.monotonic()
+            deadlines = []
+            queued = False
+            for future in list(pending):
+                started = getattr(future, 'started', submitted)
+                if future.done():
+                    pending.discard(future)
+                elif started is None:
+                    queued = True
+                elif now - started >= timeout:
+                    pending.discard(future)
+                    timed_out.add(future)
+                    if isinstance(self._read_executor, _read_pool):
+                        self._read_executor.abandon(future)
+                else:
+                    deadlines.append(started + timeout)
+            if not pending:
+                break
+            wait = min(deadlines) - now if deadlines else timeout
+            if queued:
+                # queued units start when a worker frees up; look again soon
+                wait = min(wait, 0.01)
+            concurrent.futures.wait(pending, timeout=wait, return_when=concurrent.futures.FIRST_COMPLETED)
+        return timed_out
+
+    def read_all_channels(self, categories=None, exclusions=None):
+        """Read all readable channels and return results sorted by channel name.
+
+        Optionally filters channels by category and excludes specific channels.
+
+
+        >>> from PyICe.lab_core import master
+        >>> hasattr(master, 'read_all_channels')
+        True
+
+        Args:
+            categories: An iterable of category strings to include.  If None,
+                all readable channels are read.
             exclusions: A list of channel objects, names, or groups to skip.
 
         Returns:
@@ -4374,11 +5183,13 @@ class channel_group(object):
             Exception: If the channel is not a direct member of this group.
         """
         channel_name = channel.get_name()
-        if channel_name not in list(self._channel_dict.keys()):
+        if channel_name not in self._channel_dict:
             raise Exception(
                 'Channel "{}" is not a member of {}'.format(
                     channel_name, self.get_name()))
         del self._channel_dict[channel_name]
+        self._update_name_index(channel_name)
+        self._invalidate_structure()
 
     def remove_channel_group(self, channel_group_to_remove):
         """Remove all channels belonging to a channel group from this group.
@@ -4426,8 +5237,13 @@ class channel_group(object):
         True
 
         """
+        for sub_channel_group in self._sub_channel_groups:
+            sub_channel_group._parent_groups.discard(self)
         self._channel_dict = results_ord_dict()
         self._sub_channel_groups = []
+        for channel_name in list(self._name_index):
+            self._update_name_index(channel_name)
+        self._invalidate_structure()
 
     def remove_sub_channel_group(self, sub_channel_group):
         """Remove a sub-channel group from this group's sub-group list.
@@ -4443,6 +5259,11 @@ class channel_group(object):
             sub_channel_group: The sub-group object to detach.
         """
         self._sub_channel_groups.remove(sub_channel_group)
+        if sub_channel_group not in self._sub_channel_groups:
+            sub_channel_group._parent_groups.discard(self)
+        for channel_name in list(sub_channel_group._name_index):
+            self._update_name_index(channel_name)
+        self._invalidate_structure()
 
     def remove_category(self, category):
         # note this delete will only remove from this channel_group, not from
@@ -4801,6 +5622,7 @@ class instrument(channel_group):
 
     def _add_interface(self, interface):
         self._interfaces.append(interface)
+        invalidate_topology()
 
     def get_interface(self, num=0):
         """Return an attached communication interface by index.
@@ -4975,6 +5797,58 @@ class instrument(channel_group):
         return channel
 
 
+class _scpi_command_batch(object):
+    """Interface stand-in that queues SCPI writes and sends them joined.
+
+    Used by :meth:`scpi_instrument.write_delegated_channel_list`.  Any
+    attribute other than ``write`` flushes the queue and is then looked up
+    on the real interface.
+
+    >>> from PyICe.lab_core import _scpi_command_batch
+    >>> class iface(object):
+    ...     def write(self, message):
+    ...         print(message)
+    ...     def ask(self, message):
+    ...         return '1'
+    >>> batch = _scpi_command_batch(iface(), ';', None)
+    >>> batch.write('SOUR:VOLT 1')
+    >>> batch.write('OUTP ON')
+    >>> batch.ask('OUTP?')
+    SOUR:VOLT 1;:OUTP ON
+    '1'
+    """
+    def __init__(self, interface, separator, max_length):
+        self._interface = interface
+        self._separator = separator
+        self._max_length = max_length
+        self._commands = []
+        self._length = 0
+
+    def write(self, message):
+        command = message.strip()
+        if self._commands and not command.startswith((':', '*')):
+            command = ':' + command
+        if (self._max_length is not None and self._commands
+                and self._length + len(self._separator) + len(command) > self._max_length):
+            self.flush()
+            command = command.lstrip(':')
+        if self._commands:
+            self._length += len(self._separator)
+        self._commands.append(command)
+        self._length += len(command)
+
+    def flush(self):
+        if self._commands:
+            message = self._separator.join(self._commands)
+            self._commands = []
+            self._length = 0
+            self._interface.write(message)
+
+    def __getattr__(self, name):
+        self.flush()
+        return getattr(self._interface, name)
+
+
 class scpi_instrument(instrument):
     """SCPI Instrument Base Class. Implements methods common to all SCPI instruments.
 
@@ -4986,6 +5860,12 @@ class scpi_instrument(instrument):
     True
 
     """
+    # write concatenation settings, see set_write_concatenation(). Class
+    # defaults so that drivers which skip scpi_instrument.__init__ work too.
+    _write_separator = None
+    _write_max_length = None
+    _write_batches = None
+
     def __init__(self, name):
         """Initialize a SCPI instrument with debug-communications mode disabled.
         Calls the parent class constructor and initializes instance-specific
@@ -5011,6 +5891,10 @@ class scpi_instrument(instrument):
         read, write, and ask call automatically checks ``SYST:ERROR?``
         and raises on SCPI errors.
 
+        While a batch of delegated channel writes is in progress (see
+        :meth:`set_write_concatenation`), a stand-in is returned that
+        queues ``write()`` calls and sends them joined into one message.
+
 
         >>> from PyICe.lab_core import scpi_instrument
         >>> hasattr(scpi_instrument, 'get_interface')
@@ -5022,6 +5906,17 @@ class scpi_instrument(instrument):
         Returns:
             The (possibly error-checking wrapped) interface object.
         """
+        if self._write_batches is not None:
+            batch = self._write_batches.get(num)
+            if batch is None:
+                batch = _scpi_command_batch(self._get_scpi_interface(num=num),
+                                            self._write_separator,
+                                            self._write_max_length)
+                self._write_batches[num] = batch
+            return batch
+        return self._get_scpi_interface(num=num)
+
+    def _get_scpi_interface(self, num=0):
         if not self._debug_comms:
             return super(scpi_instrument, self).get_interface(num=num)
         else:
@@ -5122,7 +6017,80 @@ class scpi_instrument(instrument):
                     write_check, self._debug_if)
                 self._debug_if.ask = types.MethodType(
                     ask_check, self._debug_if)
-                return self.get_interface(num=num)
+                return self._get_scpi_interface(num=num)
+
+    def set_write_concatenation(self, separator=';', max_length=None):
+        """Join batched channel writes into a single SCPI message.
+
+        When channels delegated to this instrument are written together
+        (``master.write_channels()``), the commands their write functions
+        send are queued and sent as one program message, e.g.
+        ``SOUR:VOLT 1;:SOUR:CURR 0.1``.  Each command after the first gets a
+        leading colon so that it is parsed from the root of the command
+        tree.  Any other interface access (``ask()``, ``read()``, ...)
+        sends the queued commands first, so ordering is preserved.
+
+        Only instruments that also inherit from :class:`delegator` and
+        delegate their channels to themselves receive batched writes.
+        Leave concatenation off for instruments whose commands carry
+        binary blocks or that don't accept compound messages.
+
+
+        >>> from PyICe.lab_core import scpi_instrument
+        >>> inst = scpi_instrument('inst')
+        >>> inst.set_write_concatenation(';', max_length=256)
+        >>> inst.set_write_concatenation(None)
+
+        Args:
+            separator: Message unit separator, or None to send every
+                command separately (default behaviour).
+            max_length: Optional cap on the length of one joined message.
+                Longer batches are split into several messages.
+        """
+        self._write_separator = separator
+        self._write_max_length = max_length
+
+    def write_delegated_channel_list(self, channel_value_list):
+        """Write a batch of channels, concatenating their SCPI commands.
+
+        Without :meth:`set_write_concatenation` this is the plain sequential
+        :meth:`delegator.write_delegated_channel_list`.  Channels with a
+        write delay are written on their own so that the delay still
+        follows the command reaching the instrument.
+
+
+        >>> from PyICe.lab_core import scpi_instrument
+        >>> hasattr(scpi_instrument, 'write_delegated_channel_list')
+        True
+
+        Args:
+            channel_value_list: Iterable of ``(channel, value)`` tuples.
+
+        Returns:
+            list: The value returned by each channel's ``write()``, in order.
+        """
+        if self._write_separator is None:
+            return delegator.write_delegated_channel_list(self, channel_value_list)
+        results = []
+        self._write_batches = {}
+        try:
+            for (ch, value) in channel_value_list:
+                if ch.get_write_delay():
+                    self._flush_write_batches()
+                    self._write_batches = None
+                    results.append(ch.write(value))
+                    self._write_batches = {}
+                else:
+                    results.append(ch.write(value))
+        finally:
+            self._flush_write_batches()
+            self._write_batches = None
+        return results
+
+    def _flush_write_batches(self):
+        if self._write_batches is not None:
+            for batch in self._write_batches.values():
+                batch.flush()
 
     def get_error(self, interface=None):
         """Query the SCPI error queue and return the first error string.
@@ -5714,6 +6682,15 @@ class channel_master(channel_group, delegator):
         self._write_callbacks = []
         self.start_threads(24)
 
+    @property
+    def _caching_mode(self):
+        # nesting depth of cached reads, tracked per calling thread
+        return self._read_context.caching_mode
+
+    @_caching_mode.setter
+    def _caching_mode(self, value):
+        self._read_context.caching_mode = value
+
     def add(self, channel_or_group):
         """Return the add.
         Registers channels with the master so they participate in
@@ -6116,6 +7093,46 @@ class channel_master(channel_group, delegator):
             function({channel_name: data})
         return data
 
+    def write_channels(self, item_list):
+        """Write several channels in one batch, then run write callbacks.
+
+        Writes are batched by delegator (see
+        :meth:`channel_group.write_channel_list`).  Master write callbacks
+        still receive one single-channel dictionary per channel written.
+
+
+        >>> from PyICe.lab_core import channel_master
+        >>> m = channel_master()
+        >>> _ = m.add_channel_dummy('a')
+        >>> _ = m.add_channel_dummy('b')
+        >>> seen = []
+        >>> m.add_write_callback(seen.append)
+        >>> m.write_channels([('a', 1), ('b', 2)])
+        [1, 2]
+        >>> seen
+        [{'a': 1}, {'b': 2}]
+
+        Args:
+            item_list: An iterable of ``(channel_name, value)`` tuples to
+                write.  Channel objects are accepted in place of names.
+
+        Returns:
+            list: The result of each channel write, in order.
+        """
+        channel_value_list = []
+        for (ch, ch_value) in item_list:
+            if not isinstance(ch, channel):
+                ch = self.get_channel(ch)
+            debug_logging.debug("Writing Channel %s to %s", ch.get_name(), ch_value)
+            channel_value_list.append((ch, ch_value))
+        results = self.write_channel_list(channel_value_list)
+        for ((ch, _), data) in zip(channel_value_list, results):
+            for function in self._write_callbacks:
+                debug_logging.debug(
+                    "Channel master running write callback %s.", function)
+                function({ch.get_name(): data})
+        return results
+
     def read_delegated_channel_list(self, channel_list):
         """Return read delegated channel list result.
 
@@ -6433,6 +7450,120 @@ class channel_access_wrapper(object):
         return self.channels[channel_name].write(value)
 
 
+_utc_second_prefix = (None, None)
+
+
+def _utc_timestamp():
+    """Return the current UTC time in the logger's datetime column format.
+
+    Equivalent to ``datetime.datetime.now(datetime.timezone.utc).strftime(
+    '%Y-%m-%dT%H:%M:%S.%fZ')``, but only runs ``strftime`` once per second.
+
+    >>> from PyICe.lab_core import _utc_timestamp
+    >>> stamp = _utc_timestamp()
+    >>> len(stamp), stamp[10], stamp[19], stamp[-1]
+    (27, 'T', '.', 'Z')
+
+    Returns:
+        str: ISO-8601 timestamp with microseconds and a ``Z`` suffix.
+    """
+    global _utc_second_prefix
+    now = time.time()
+    second = int(now)
+    cached_second, prefix = _utc_second_prefix
+    if second != cached_second:
+        prefix = time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(second))
+        _utc_second_prefix = (second, prefix)
+    return '{}.{:06d}Z'.format(prefix, int((now - second) * 1000000))
+
+
+class compiled_scan(object):
+    """Frozen scan list for repeated :meth:`logger.log_fast` calls.
+
+    ``logger.log()`` rebuilds its scan list on every call: it copies the
+    channel tree, filters unreadable channels and removes exclusions by
+    name.  A ``compiled_scan`` does that once and remembers the channel
+    order, the database column order, the delegator grouping (through the
+    master's :class:`scan_plan`) and the log callbacks to run.
+
+    Built by :meth:`logger.compile_scan`.  A compiled scan goes stale when
+    channels are added to or removed from its logger or master, when the
+    delegation topology changes (see :func:`invalidate_topology`), when a
+    channel's read access changes, or when log callbacks are added to or
+    removed from its logger; ``log_fast()`` then recompiles it with the
+    same exclusions.  Reads and logs that resolve channel lists or
+    exclusions do not make it stale.
+
+    >>> from PyICe.lab_core import logger, master
+    >>> m = master()
+    >>> _ = m.add_channel_dummy('a')
+    >>> _ = m.add_channel_dummy('b')
+    >>> lg = logger(m, database=':memory:', use_threads=False)
+    >>> scan = lg.compile_scan(exclusions=['b'])
+    >>> scan.column_names
+    ('a', 'rowid', 'datetime')
+    >>> scan.is_current()
+    True
+    >>> _ = m.add_channel_dummy('c')
+    >>> scan.is_current()
+    False
+    >>> lg.stop()
+    """
+    def __init__(self, logger_object, exclusions=None):
+        """Freeze the readable, non-excluded channels of *logger_object*.
+
+        >>> from PyICe.lab_core import compiled_scan, logger
+        >>> lg = logger(database=':memory:', use_threads=False)
+        >>> compiled_scan(lg).channels
+        ()
+        >>> lg.stop()
+
+        Args:
+            logger_object: The logger whose channels will be scanned.
+            exclusions: Channels to leave out, given by name, channel_group
+                (instrument) or directly, as for :meth:`logger.log`.
+
+        Raises:
+            Exception: If an excluded channel is not part of the scan list.
+        """
+        self._logger = logger_object
+        self._callback_generation = logger_object._log_callback_generation
+        self.exclusions = tuple(exclusions) if exclusions is not None else ()
+        scan_list = results_ord_dict(
+            (name, channel) for name, channel in logger_object.get_all_channels_dict().items()
+            if channel.is_readable())
+        for channel in logger_object.resolve_channel_list(self.exclusions):
+            if channel.get_name() not in scan_list:
+                raise Exception('Channel "{}" is not a member of scan_list'.format(
+                    channel.get_name()))
+            del scan_list[channel.get_name()]
+        self.channels = tuple(scan_list.values())
+        self.column_names = tuple(scan_list.keys()) + ('rowid', 'datetime')
+        self.plan = logger_object.master.get_scan_plan(self.channels)
+        self.callbacks = tuple(logger_object._log_callbacks)
+        self.generation = _scan_plan_generation(logger_object)
+
+    def is_current(self):
+        """Check whether the scan still matches its logger's channels and callbacks.
+
+        >>> from PyICe.lab_core import compiled_scan, logger, invalidate_topology
+        >>> lg = logger(database=':memory:', use_threads=False)
+        >>> scan = compiled_scan(lg)
+        >>> scan.is_current()
+        True
+        >>> invalidate_topology()
+        >>> scan.is_current()
+        False
+        >>> lg.stop()
+
+        Returns:
+            bool: True if the scan may still be used.
+        """
+        return (self.generation == _scan_plan_generation(self._logger)
+                and self.plan.is_current()
+                and self._callback_generation == self._logger._log_callback_generation)
+
+
 class logger(master):
     """SQLite-backed data logger for channel measurements.
 
@@ -6480,7 +7611,12 @@ class logger(master):
         atexit.register(self.stop)
         self._table_name = None
         self._log_callbacks = []
+        self._log_callback_generation = 0
+        self._compiled_scan = None
         self._previously_logged_data = None
+        # column tuples indexed once collection into a table finishes
+        self._indexes = [('datetime',)]
+        self._index_categories = set()
 
     def __enter__(self):
         """Enter the context manager.
@@ -6521,7 +7657,7 @@ class logger(master):
         return None
 
     def stop(self):
-        """Close sqlite database connection.
+        """Build indexes on the current table and close sqlite database connection.
 
         Releases resources and restores the system to a safe state.
 
@@ -6530,6 +7666,11 @@ class logger(master):
         True
 
         """
+        if self._table_name is not None:
+            try:
+                self.build_indexes()
+            except Exception as e:
+                debug_logging.error("Indexes not built: {} {}".format(type(e), e))
         self._backend.stop()
 
     def add_channel(self, channel_object):
@@ -6560,6 +7701,7 @@ class logger(master):
         Args:
             table_name: Database table name.
         """
+        self._finish_table(table_name)
         self._table_name = table_name
         columns = {ch.get_name(): ch.get_type_affinity() for ch in self}
         self._backend.append_table(table_name, columns)
@@ -6601,6 +7743,7 @@ class logger(master):
             table_name: Database table name.
             warn: Warn to use.
         """
+        self._finish_table(table_name)
         self._table_name = table_name
         columns = {ch.get_name(): ch.get_type_affinity() for ch in self}
         self._backend.new_table(table_name, columns, replace_table, warn)
@@ -6622,6 +7765,7 @@ class logger(master):
         Returns:
             The switch table result.
         """
+        self._finish_table(table_name)
         self._table_name = table_name
         return self._backend.switch_table(table_name)
 
@@ -6816,26 +7960,28 @@ class logger(master):
         return self._table_name
 
     def _fetch_channel_data(self, exclusions):
-        scan_list = self.get_flat_channel_group('scan_list')
-        # only log channels that are readable
-        for channel in scan_list.get_all_channels_list():
-            if not channel.is_readable():
-                scan_list.remove_channel(channel)
+        # only log channels that are readable; the name index already holds
+        # the flattened tree, so there is no need to build a scan_list group
+        scan_list = results_ord_dict(
+            (name, channel) for name, channel in self.get_all_channels_dict().items()
+            if channel.is_readable())
         # remove the excluded items from the scan list
-        scan_list.remove_channel_list(exclusions)
+        for channel in self.resolve_channel_list(exclusions):
+            if channel.get_name() not in scan_list:
+                raise Exception('Channel "{}" is not a member of scan_list'.format(
+                    channel.get_name()))
+            del scan_list[channel.get_name()]
         try:
-            channel_data = self.master.read_channel_list(scan_list)
+            channel_data = self.master.read_channel_list(list(scan_list.values()))
         except PartialReadException as e:
             e.results['rowid'] = None
             if 'datetime' not in e.results:
-                e.results['datetime'] = datetime.datetime.now(
-                    datetime.timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.%fZ')
+                e.results['datetime'] = _utc_timestamp()
             raise
         # add additional database columns
         channel_data['rowid'] = None
         if 'datetime' not in channel_data:
-            channel_data['datetime'] = datetime.datetime.now(
-                datetime.timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.%fZ')
+            channel_data['datetime'] = _utc_timestamp()
         return channel_data
 
     def log(self, exclusions=None):
@@ -6882,6 +8028,93 @@ class logger(master):
             callback(data)
         return data
 
+    def compile_scan(self, exclusions=None):
+        """Freeze the scan list for repeated logging with :meth:`log_fast`.
+
+        The returned :class:`compiled_scan` also becomes the default scan
+        used by ``log_fast()`` when it is called without one.
+
+
+        >>> from PyICe.lab_core import logger, master
+        >>> m = master()
+        >>> _ = m.add_channel_dummy('a')
+        >>> lg = logger(m, database=':memory:', use_threads=False)
+        >>> [ch.get_name() for ch in lg.compile_scan().channels]
+        ['a']
+        >>> lg.stop()
+
+        Args:
+            exclusions: Channels to leave out, given by name, channel_group
+                (instrument) or directly.
+
+        Returns:
+            compiled_scan: The frozen scan.
+        """
+        self._compiled_scan = compiled_scan(self, exclusions)
+        return self._compiled_scan
+
+    def log_fast(self, scan=None):
+        """Log one row using a frozen scan list.
+
+        Equivalent to :meth:`log` for the scan's exclusions, without
+        rebuilding the scan list each call.  Callbacks receive a shallow
+        copy of the results instead of a deep copy, so they must not
+        modify read values in place.  Stale scans are recompiled
+        automatically.
+
+
+        >>> from PyICe.lab_core import logger, master
+        >>> m = master()
+        >>> _ = m.add_channel_dummy('a').write(1.5)
+        >>> lg = logger(m, database=':memory:', use_threads=False)
+        >>> lg.new_table('fast', replace_table=True)
+        >>> lg.log_fast()['a']
+        1.5
+        >>> lg.stop()
+
+        Args:
+            scan: A :class:`compiled_scan` from :meth:`compile_scan`.  If
+                None, the most recently compiled scan is used, compiling one
+                without exclusions on first use.
+
+        Returns:
+            The logged results dictionary.
+        """
+        if scan is None:
+            scan = self._compiled_scan
+            if scan is None or not scan.is_current():
+                scan = self.compile_scan(
+                    scan.exclusions if scan is not None else None)
+        elif not scan.is_current():
+            recompiled = compiled_scan(self, scan.exclusions)
+            if scan is self._compiled_scan:
+                self._compiled_scan = recompiled
+            scan = recompiled
+        self._backend.check_exception()
+        try:
+            data = self.master.read_channel_list(scan.channels)
+        except PartialReadException as e:
+            e.results['rowid'] = None
+            if 'datetime' not in e.results:
+                e.results['datetime'] = _utc_timestamp()
+            self._backend.store(e.results)
+            self._previously_logged_data = e.results
+            raise
+        data['rowid'] = None
+        if 'datetime' not in data:
+            data['datetime'] = _utc_timestamp()
+        self._backend.store(data)
+        self._previously_logged_data = data
+        # the backend thread owns data now; hand out a copy
+        results = results_ord_dict(data)
+        for (key, value) in results.items():
+            if isinstance(value, channel):
+                results[key] = value.get_name()
+        for callback in scan.callbacks:
+            debug_logging.debug("Logger running log callback %s.", callback)
+            callback(results)
+        return results
+
     def check_data_changed(self, data, compare_exclusions=None):
         """Return True if data is different than self._previously_logged_data.
 
@@ -7104,6 +8337,7 @@ class logger(master):
             log_callback: Log callback to use.
         """
         self._log_callbacks.append(log_callback)
+        self._log_callback_generation += 1
 
     def remove_log_callback(self, log_callback):
         """Remove a log callback.
@@ -7119,6 +8353,7 @@ class logger(master):
             log_callback: Log callback to use.
         """
         self._log_callbacks.remove(log_callback)
+        self._log_callback_generation += 1
 
     def get_master(self):
         """Return the current master.
@@ -7186,6 +8421,59 @@ class logger(master):
         """
         self._backend.sync_threads()
 
+    def set_batching(self, max_rows=100, max_latency=1.0, durability='flush'):
+        """Write logged rows to the database in batches instead of one at a time.
+
+        Rows are buffered in the database thread and inserted with one
+        ``executemany`` per batch and one transaction per flush, which raises
+        the sustainable logging rate substantially for small rows.
+        :meth:`flush` and table changes always write out the buffer first.
+        See :meth:`logger_backend.set_batching` for the arguments.
+
+        >>> from PyICe.lab_core import logger
+        >>> hasattr(logger, 'set_batching')
+        True
+
+        Args:
+            max_rows: Rows per batch.  1 restores one INSERT per row.
+            max_latency: Longest time in seconds a row may wait unwritten, or
+                None to write whenever the database thread goes idle.
+            durability: ``'flush'`` to commit each batch, ``'idle'`` to
+                commit only when the database thread goes idle.
+        """
+        self._backend.set_batching(max_rows, max_latency, durability)
+
+    def set_queue_policy(self, max_rows=10000, policy='block', journal_dir=None):
+        """Bound the rows waiting to be written and choose what happens when the database falls behind.
+
+        See :meth:`logger_backend.set_queue_policy`.
+
+        >>> from PyICe.lab_core import logger
+        >>> hasattr(logger, 'set_queue_policy')
+        True
+
+        Args:
+            max_rows: Rows held in memory before the policy applies; 0 for
+                no bound.
+            policy: ``'block'``, ``'drop_oldest'`` or ``'spill'``.
+            journal_dir: Directory for the spill journal.
+        """
+        self._backend.set_queue_policy(max_rows, policy, journal_dir)
+
+    def get_storage_metrics(self):
+        """Return queue depth, latency, retry and commit statistics of the database writer.
+
+        See :meth:`logger_backend.get_metrics` for the keys.
+
+        >>> from PyICe.lab_core import logger
+        >>> hasattr(logger, 'get_storage_metrics')
+        True
+
+        Returns:
+            dict: Snapshot of the storage metrics.
+        """
+        return self._backend.get_metrics()
+
     def set_journal_mode(self, journal_mode='WAL',
                          synchronous='NORMAL', timeout_ms=10000):
         """Configure database connection for more reliable concurrent read/write operations with high data throughput or large data sets.
@@ -7250,6 +8538,120 @@ class logger(master):
         self.execute("VACUUM")
         self.execute("ANALYZE")
 
+    def add_index(self, *column_names):
+        """Request an index over one or more columns of every table this logger fills.
+
+        Indexes are not maintained while rows are being logged.  They are built
+        by build_indexes() when collection into a table ends: on switching to
+        another table with new_table(), append_table() or switch_table(), and
+        on stop().  Several column names make one composite index, for
+        queries filtering on all of them.  The datetime column is indexed by
+        default.
+
+        Single channels can instead be marked declaratively, with
+        channel.set_attribute('index_key', True) or set_index_categories().
+
+        >>> from PyICe.lab_core import logger
+        >>> lg = logger(database=':memory:', use_threads=False)
+        >>> lg.add_index('vin', 'iload')
+        >>> lg.get_indexes()
+        [('datetime',), ('vin', 'iload')]
+        >>> lg.stop()
+
+        Args:
+            *column_names: Channel (column) names, in index key order.
+        """
+        if tuple(column_names) not in self._indexes:
+            self._indexes.append(tuple(column_names))
+
+    def remove_index(self, *column_names):
+        """Withdraw an index requested with add_index(), including the default datetime index.
+
+        Indexes already built in the database are not dropped.
+
+        >>> from PyICe.lab_core import logger
+        >>> lg = logger(database=':memory:', use_threads=False)
+        >>> lg.remove_index('datetime')
+        >>> lg.get_indexes()
+        []
+        >>> lg.stop()
+
+        Args:
+            *column_names: Column names exactly as passed to add_index().
+        """
+        self._indexes.remove(tuple(column_names))
+
+    def set_index_categories(self, *categories):
+        """Index every channel whose category is one of categories.
+
+        Convenient for marking all sweep (forcing) channels as index keys at
+        once.  Replaces any categories set previously.
+
+        >>> from PyICe.lab_core import logger
+        >>> lg = logger(database=':memory:', use_threads=False)
+        >>> _ = lg.add_channel_dummy('vin').set_category('sweep')
+        >>> lg.set_index_categories('sweep')
+        >>> lg.get_indexes()
+        [('datetime',), ('vin',)]
+        >>> lg.stop()
+
+        Args:
+            *categories: Channel category names.
+        """
+        self._index_categories = set(categories)
+
+    def get_indexes(self):
+        """Return the indexes build_indexes() will create.
+
+        Combines add_index() requests with single-column indexes for channels
+        that have a true 'index_key' attribute or belong to a category given
+        to set_index_categories().
+
+        >>> from PyICe.lab_core import logger
+        >>> lg = logger(database=':memory:', use_threads=False)
+        >>> _ = lg.add_channel_dummy('temp').set_attribute('index_key', True)
+        >>> lg.get_indexes()
+        [('datetime',), ('temp',)]
+        >>> lg.stop()
+
+        Returns:
+            list: Column name tuples, one per index.
+        """
+        indexes = list(self._indexes)
+        for channel in self.get_all_channels_list():
+            try:
+                index_key = channel.get_attribute('index_key')
+            except ChannelAttributeException:
+                index_key = False
+            if index_key or channel.get_category() in self._index_categories:
+                if (channel.get_name(),) not in indexes:
+                    indexes.append((channel.get_name(),))
+        return indexes
+
+    def build_indexes(self):
+        """Create missing indexes on the current table and refresh query planner statistics.
+
+        Called automatically when collection into a table ends (see
+        add_index()).  Call it directly to make a table fast to query while
+        logging continues; SQLite then keeps the indexes up to date.
+
+        >>> from PyICe.lab_core import logger
+        >>> hasattr(logger, 'build_indexes')
+        True
+
+        Raises:
+            Exception: If no table has been created yet.
+        """
+        if self.get_table_name() is None:
+            raise Exception(
+                'Table name unspecified!\nCall new_table() or append_table() before build_indexes()')
+        self._backend.build_indexes(self.get_table_name(), self.get_indexes())
+
+    def _finish_table(self, next_table_name):
+        """Build indexes on the current table before the logger moves on to another one."""
+        if self._table_name is not None and self._table_name != next_table_name:
+            self.build_indexes()
+
     def execute(self, sql_query, *params):
         """Execute arbitrary SQL statements on database.
 
@@ -7268,6 +8670,220 @@ class logger(master):
         self._backend.execute(sql_query, *params)
 
 
+def _percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted sequence; None when empty.
+
+    >>> from PyICe.lab_core import _percentile
+    >>> _percentile([1, 2, 3, 4], 0.5)
+    2
+    >>> _percentile([], 0.9) is None
+    True
+    """
+    if not sorted_values:
+        return None
+    rank = max(int(-(-fraction * len(sorted_values) // 1)), 1)
+    return sorted_values[rank - 1]
+
+
+class _storage_metrics(object):
+    """Counters and recent timings of a logger_backend, safe to read from any thread."""
+    # number of most recent latencies/commit durations kept for statistics
+    history = 1000
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._latencies = collections.deque(maxlen=self.history)
+        self._commit_durations = collections.deque(maxlen=self.history)
+        self._counters = collections.Counter()
+        self._max_queue_depth = 0
+
+    def count(self, name, increment=1):
+        with self._lock:
+            self._counters[name] += increment
+
+    def record_enqueue(self, queue_depth):
+        with self._lock:
+            self._counters['rows_enqueued'] += 1
+            self._max_queue_depth = max(self._max_queue_depth, queue_depth)
+
+    def record_commit(self, duration, enqueue_times):
+        now = time.monotonic()
+        with self._lock:
+            self._counters['commits'] += 1
+            self._counters['rows_committed'] += len(enqueue_times)
+            self._commit_durations.append(duration)
+            self._latencies.extend(now - enqueued for enqueued in enqueue_times)
+
+    def snapshot(self):
+        with self._lock:
+            latencies = sorted(self._latencies)
+            durations = list(self._commit_durations)
+            metrics = {name: self._counters[name] for name in (
+                'rows_enqueued', 'rows_committed', 'rows_dropped', 'rows_spilled',
+                'store_retries', 'commits')}
+            metrics['max_queue_depth'] = self._max_queue_depth
+        metrics['latency_p50'] = _percentile(latencies, 0.50)
+        metrics['latency_p90'] = _percentile(latencies, 0.90)
+        metrics['latency_p99'] = _percentile(latencies, 0.99)
+        metrics['latency_max'] = latencies[-1] if latencies else None
+        metrics['commit_time_mean'] = sum(durations) / len(durations) if durations else None
+        metrics['commit_time_max'] = max(durations) if durations else None
+        return metrics
+
+
+class _spill_journal(object):
+    """Temporary file holding rows that did not fit in the storage queue."""
+
+    def __init__(self, directory=None):
+        self._file = tempfile.TemporaryFile(prefix='pyice_spill_', suffix='.journal', dir=directory)
+        self._lock = threading.Lock()
+        self._outstanding = 0
+
+    def write(self, data):
+        with self._lock:
+            self._file.seek(0, os.SEEK_END)
+            offset = self._file.tell()
+            pickle.dump(data, self._file, protocol=pickle.HIGHEST_PROTOCOL)
+            self._outstanding += 1
+            return offset
+
+    def read(self, offset):
+        with self._lock:
+            self._file.seek(offset)
+            data = pickle.load(self._file)
+            self._outstanding -= 1
+            if self._outstanding == 0:
+                # everything spilled has been read back; reclaim the space
+                self._file.seek(0)
+                self._file.truncate()
+            return data
+
+    def close(self):
+        self._file.close()
+
+
+class _queued_row(object):
+    """A row waiting in the storage queue, either in memory or spilled to a journal."""
+    __slots__ = ('handler', 'data', 'enqueued', 'journal', 'offset')
+
+    def __init__(self, handler, data):
+        self.handler = handler
+        self.data = data
+        self.enqueued = time.monotonic()
+        self.journal = None
+        self.offset = None
+
+    def spill(self, journal):
+        # channels and other live objects don't pickle; store what the
+        # database would have received anyway
+        self.offset = journal.write({key: logger_backend.db_clean(value)
+                                     for key, value in self.data.items()})
+        self.journal = journal
+        self.data = None
+
+    def __call__(self):
+        if self.journal is None:
+            data = self.data
+        else:
+            data = self.journal.read(self.offset)
+        self.handler(data, self.enqueued)
+
+
+class _storage_queue(queue.Queue):
+    """Queue of logger_backend operations in which stored rows are bounded by a policy.
+
+    Control operations (table changes, commits, stop) use plain ``put`` and
+    are never refused or dropped.  Rows use :meth:`put_row` and count
+    against ``max_rows`` while held in memory; once that many are waiting
+    the policy decides: ``'block'`` the caller, ``'drop_oldest'`` waiting
+    row, or ``'spill'`` the new row to a temporary journal file (a small
+    placeholder keeps its place in the queue, so ordering is preserved).
+
+    >>> from PyICe.lab_core import _storage_queue, _storage_metrics
+    >>> q = _storage_queue(_storage_metrics(), max_rows=2, policy='drop_oldest')
+    >>> for value in range(3):
+    ...     _ = q.put_row(lambda data, enqueued: None, {'value': value})
+    >>> [item.data['value'] for item in list(q.queue)]
+    [1, 2]
+    """
+    policies = ('block', 'drop_oldest', 'spill')
+
+    def __init__(self, metrics, max_rows=0, policy='block', journal_dir=None, abort=None):
+        queue.Queue.__init__(self)  # unbounded; rows are limited by put_row
+        self.metrics = metrics
+        self.max_rows = max_rows
+        self.policy = policy
+        self.journal_dir = journal_dir
+        # called while blocked; True means the consumer died and waiting is futile
+        self._abort = abort
+        self._journal = None
+        self.rows_in_memory = 0
+        self.rows_spilled = 0
+
+    def configure(self, max_rows, policy, journal_dir):
+        with self.mutex:
+            self.max_rows = max_rows
+            self.policy = policy
+            self.journal_dir = journal_dir
+            self.not_full.notify_all()
+
+    def put_row(self, handler, data):
+        """Queue *data* for ``handler(data, enqueue_time)``; False if the consumer has died."""
+        row = _queued_row(handler, data)
+        with self.not_full:
+            if self.max_rows and self.rows_in_memory >= self.max_rows:
+                if self.policy == 'block':
+                    while self.max_rows and self.rows_in_memory >= self.max_rows:
+                        if self._abort is not None and self._abort():
+                            return False
+                        self.not_full.wait(0.5)
+                elif self.policy == 'drop_oldest':
+                    self._drop_oldest_row()
+                else:
+                    if self._journal is None:
+                        self._journal = _spill_journal(self.journal_dir)
+                    row.spill(self._journal)
+                    self.rows_spilled += 1
+                    self.metrics.count('rows_spilled')
+            self._put(row)
+            self.unfinished_tasks += 1
+            self.not_empty.notify()
+            self.metrics.record_enqueue(self._qsize())
+        return True
+
+    def _drop_oldest_row(self):
+        for index, item in enumerate(self.queue):
+            if isinstance(item, _queued_row) and item.journal is None:
+                del self.queue[index]
+                self.rows_in_memory -= 1
+                self.unfinished_tasks -= 1
+                if self.unfinished_tasks == 0:
+                    self.all_tasks_done.notify_all()
+                self.metrics.count('rows_dropped')
+                return
+
+    def _put(self, item):
+        if isinstance(item, _queued_row):
+            if item.journal is None:
+                self.rows_in_memory += 1
+        self.queue.append(item)
+
+    def _get(self):
+        item = self.queue.popleft()
+        if isinstance(item, _queued_row):
+            if item.journal is None:
+                self.rows_in_memory -= 1
+            else:
+                self.rows_spilled -= 1
+        return item
+
+    def close_journal(self):
+        with self.mutex:
+            if self._journal is not None:
+                self._journal.close()
+                self._journal = None
+
+
 class logger_backend(object):
     """SQLite logging backend that records channel data to a database.
 
@@ -7299,10 +8915,26 @@ class logger_backend(object):
         self._thread_exception = None
         self._run = True
         self._stopped = False
+        self._metrics = _storage_metrics()
+        # enqueue times of rows written but not yet committed
+        self._uncommitted_enqueue_times = []
+        # write-behind batching, see set_batching(); one row per write by default
+        self._batch_max_rows = 1
+        self._batch_max_latency = None
+        self._batch_durability = 'flush'
+        self._pending_rows = []
+        self._pending_since = None
+        # INSERT statement text by (table, columns); sqlite3 keeps the
+        # compiled statements in its own per-connection cache
+        self._insert_sql_cache = {}
+        # SQLITE_MAX_VARIABLE_NUMBER; queried from the library once connected
+        self._max_variables = 999
         database = os.path.expanduser(
             os.path.expandvars(database))  # resolve env vars + ~
         if self._use_thread:
-            self.storage_queue = queue.Queue()
+            self.storage_queue = _storage_queue(
+                self._metrics, max_rows=10000, policy='block',
+                abort=lambda: self._thread_exception is not None or self._stopped)
             self._thread = _thread.start_new_thread(self._db_thread, ())
             self.storage_queue.put(lambda: self._connect_db(database))
         else:
@@ -7347,12 +8979,81 @@ class logger_backend(object):
 
         """
         if self._use_thread:
+            # buffered rows are flushed ahead of any queued non-row operation
             self.storage_queue.put(self._commit)
             self.storage_queue.join()
             self.check_exception()
         else:
             self._commit()
 
+    def set_batching(self, max_rows=100, max_latency=1.0, durability='flush'):
+        """Buffer stored rows in the database thread and write them in multi-row transactions.
+
+        Rows handed to :meth:`store` accumulate until *max_rows* are waiting,
+        the oldest has waited *max_latency* seconds, or any other database
+        operation (table change, :meth:`sync_threads`, :meth:`execute`,
+        :meth:`stop`) is queued behind them.  Each flush inserts the rows with
+        ``executemany`` inside a single transaction.  Only threaded backends
+        batch; unthreaded ones keep writing and committing row by row.
+
+        >>> from PyICe.lab_core import logger_backend
+        >>> lb = logger_backend(database=':memory:', use_threads=False)
+        >>> lb.set_batching(max_rows=500, max_latency=0.25)
+        >>> lb.get_batching()
+        {'max_rows': 500, 'max_latency': 0.25, 'durability': 'flush'}
+        >>> lb.set_batching(durability='never')
+        Traceback (most recent call last):
+        ...
+        ValueError: durability must be 'flush' or 'idle', not 'never'
+        >>> lb.stop()
+
+        Args:
+            max_rows: Rows per batch.  1 restores one INSERT per row.
+            max_latency: Longest time in seconds a row may wait in the buffer,
+                or None to flush whenever the storage queue runs empty.
+            durability: ``'flush'`` commits every batch as it is written.
+                ``'idle'`` leaves the transaction open until the storage
+                queue runs empty or ``_max_lock_time`` passes, trading
+                crash-safety of the newest rows for fewer commits under
+                sustained load.
+
+        Raises:
+            ValueError: If an argument is out of range.
+        """
+        if int(max_rows) < 1:
+            raise ValueError('max_rows must be at least 1, not {}'.format(max_rows))
+        if max_latency is not None and max_latency < 0:
+            raise ValueError('max_latency must be positive or None, not {}'.format(max_latency))
+        if durability not in ('flush', 'idle'):
+            raise ValueError("durability must be 'flush' or 'idle', not '{}'".format(durability))
+        self._check_exception()
+        if self._use_thread:
+            self.storage_queue.put(lambda: self._set_batching(int(max_rows), max_latency, durability))
+        else:
+            self._set_batching(int(max_rows), max_latency, durability)
+        self.sync_threads()
+
+    def _set_batching(self, max_rows, max_latency, durability):
+        self._batch_max_rows = max_rows
+        self._batch_max_latency = max_latency
+        self._batch_durability = durability
+
+    def get_batching(self):
+        """Return the batching settings made by :meth:`set_batching`.
+
+        >>> from PyICe.lab_core import logger_backend
+        >>> lb = logger_backend(database=':memory:', use_threads=False)
+        >>> lb.get_batching()['max_rows']
+        1
+        >>> lb.stop()
+
+        Returns:
+            dict: ``max_rows``, ``max_latency`` and ``durability``.
+        """
+        return {'max_rows': self._batch_max_rows,
+                'max_latency': self._batch_max_latency,
+                'durability': self._batch_durability}
+
     def check_exception(self):
         """Perform check exception operation.
 
@@ -7402,6 +9103,9 @@ class logger_backend(object):
         # automatic BEGIN and COMMIT: we'll handle transactions ourselves.
         self.conn = sqlite3.connect(self.db, isolation_level=None)
         # self.cur = self.conn.cursor()
+        if hasattr(self.conn, 'getlimit'):  # Python 3.11+
+            self._max_variables = self.conn.getlimit(
+                sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER)
 
     def _db_thread(self):
         self.lock_time = None
@@ -7413,40 +9117,64 @@ class logger_backend(object):
                 self._commit()
                 self.lock_time = None
                 # print 'max lock timed out'
-            function = None
+            from_queue = True
             try:
                 function = self.storage_queue.get(block=False)
             except queue.Empty:
-                if self.lock_time is not None:
-                    try:
-                        self.conn.commit()  # not self._commit to avoid infinite retry
-                        # no effect if DB not in write-ahead log journal mode
-                        checkpoint_command = "PRAGMA wal_checkpoint(PASSIVE);"
-                        try:
-                            self.conn.execute(checkpoint_command)
-                        except sqlite3.OperationalError as e:
-                            debug_logging.warning(
-                                "{} raised exception {}".format(
-                                    checkpoint_command, e))
-                    except sqlite3.OperationalError:
-                        debug_logging.warning(
-                            "Opportunistic commit failed. Not retrying.")
-                    else:
-                        self.lock_time = None
-                function = self.storage_queue.get(block=True)
+                function = self._wait_for_work()
+                if function is None:
+                    # buffered rows ran out of latency budget
+                    function, from_queue = self._flush_rows, False
+            try:
+                if self._pending_rows and not isinstance(function, _queued_row):
+                    # keep buffered rows ahead of whatever was queued after them
+                    self._flush_rows()
+                if self.lock_time is None:
+                    self.lock_time = datetime.datetime.now(datetime.timezone.utc)
+                function()
+            except Exception as e:
+                print((traceback.format_exc()))
+                self._thread_exception = e
+                raise e
             finally:
-                try:
-                    if self.lock_time is None:
-                        self.lock_time = datetime.datetime.now(datetime.timezone.utc)
-                    function()
-                except Exception as e:
-                    print((traceback.format_exc()))
-                    self._thread_exception = e
-                    raise e
-                finally:
+                if from_queue:
                     self.storage_queue.task_done()
         self._stopped = True
 
+    def _wait_for_work(self):
+        """Block for the next queued function, using idle time to flush and commit.
+
+        Returns None instead of a function when buffered rows must be flushed
+        because their latency budget ran out while waiting.
+        """
+        if self._pending_rows:
+            if self._batch_max_latency is None:
+                return None
+            remaining = self._batch_max_latency - (time.monotonic() - self._pending_since)
+            try:
+                return self.storage_queue.get(timeout=max(remaining, 0))
+            except queue.Empty:
+                return None
+        if self.lock_time is not None:
+            try:
+                t_start = time.monotonic()
+                self.conn.commit()  # not self._commit to avoid infinite retry
+                self._committed(time.monotonic() - t_start)
+                # no effect if DB not in write-ahead log journal mode
+                checkpoint_command = "PRAGMA wal_checkpoint(PASSIVE);"
+                try:
+                    self.conn.execute(checkpoint_command)
+                except sqlite3.OperationalError as e:
+                    debug_logging.warning(
+                        "{} raised exception {}".format(
+                            checkpoint_command, e))
+            except sqlite3.OperationalError:
+                debug_logging.warning(
+                    "Opportunistic commit failed. Not retrying.")
+            else:
+                self.lock_time = None
+        return self.storage_queue.get(block=True)
+
     def store(self, data):
         """Run the store step.
 
@@ -7461,10 +9189,185 @@ class logger_backend(object):
             data: Data to write.
         """
         if self._use_thread:
-            self.storage_queue.put(lambda: self._store(data))
+            self._check_exception()
+            if not self.storage_queue.put_row(self._buffer_row, data):
+                self._check_exception()
+                raise Exception('Database thread is no longer running')
         else:
+            t_start = time.monotonic()
             self._store(data)
             self.conn.commit()
+            self._metrics.record_enqueue(0)
+            self._metrics.record_commit(time.monotonic() - t_start, [t_start])
+
+    def set_queue_policy(self, max_rows=10000, policy='block', journal_dir=None):
+        """Bound the rows waiting for the database thread and choose what happens when the bound is hit.
+
+        If the database stalls (a locked WAL, a slow network share) rows pile
+        up in the storage queue.  At most *max_rows* are held in memory:
+
+        * ``'block'`` makes :meth:`store` (and so ``logger.log()``) wait for room.
+        * ``'drop_oldest'`` discards the oldest waiting row; drops are counted
+          in :meth:`get_metrics`.
+        * ``'spill'`` writes further rows to a temporary journal file in
+          *journal_dir* and reads them back in order when the database catches
+          up.  Spilled rows are stored in their database form, so the
+          ``rowid`` is not reported back into the logged dictionary.
+
+        Table changes, commits and other control operations are never
+        bounded.  Only threaded backends queue; unthreaded ones ignore this.
+
+        >>> from PyICe.lab_core import logger_backend
+        >>> lb = logger_backend(database=':memory:')
+        >>> lb.set_queue_policy(max_rows=500, policy='spill')
+        >>> lb.get_metrics()['queue_policy']
+        'spill'
+        >>> lb.set_queue_policy(policy='newest')
+        Traceback (most recent call last):
+        ...
+        ValueError: policy must be one of ('block', 'drop_oldest', 'spill'), not 'newest'
+        >>> lb.stop()
+
+        Args:
+            max_rows: Rows held in memory before the policy applies; 0 for
+                no bound.
+            policy: ``'block'``, ``'drop_oldest'`` or ``'spill'``.
+            journal_dir: Directory for the spill journal; the system
+                temporary directory if None.
+
+        Raises:
+            ValueError: If an argument is out of range.
+        """
+        if int(max_rows) < 0:
+            raise ValueError('max_rows must not be negative, not {}'.format(max_rows))
+        if policy not in _storage_queue.policies:
+            raise ValueError('policy must be one of {}, not {!r}'.format(_storage_queue.policies, policy))
+        if self._use_thread:
+            self.storage_queue.configure(int(max_rows), policy, journal_dir)
+
+    def get_metrics(self):
+        """Return a snapshot of storage queue and database write statistics.
+
+        Latencies run from :meth:`store` to the commit that made the row
+        durable; they and the commit durations cover the most recent 1000
+        rows/commits and are in seconds (None until there is data).
+
+        >>> from PyICe.lab_core import logger_backend
+        >>> lb = logger_backend(database=':memory:')
+        >>> sorted(lb.get_metrics())[:4]
+        ['commit_time_max', 'commit_time_mean', 'commits', 'latency_max']
+        >>> lb.stop()
+
+        Returns:
+            dict: ``queue_depth`` (operations waiting), ``rows_in_memory``,
+            ``rows_in_journal``, ``pending_batch_rows``, ``max_queue_depth``,
+            ``queue_max_rows``, ``queue_policy``, counters ``rows_enqueued``,
+            ``rows_committed``, ``rows_dropped``, ``rows_spilled``,
+            ``store_retries`` and ``commits``, latency percentiles
+            ``latency_p50``/``p90``/``p99``/``max`` and ``commit_time_mean``/``max``.
+        """
+        metrics = self._metrics.snapshot()
+        if self._use_thread:
+            with self.storage_queue.mutex:
+                metrics['queue_depth'] = self.storage_queue._qsize()
+                metrics['rows_in_memory'] = self.storage_queue.rows_in_memory
+                metrics['rows_in_journal'] = self.storage_queue.rows_spilled
+                metrics['queue_max_rows'] = self.storage_queue.max_rows
+                metrics['queue_policy'] = self.storage_queue.policy
+        else:
+            metrics.update(queue_depth=0, rows_in_memory=0, rows_in_journal=0,
+                           queue_max_rows=0, queue_policy=None)
+        metrics['pending_batch_rows'] = len(self._pending_rows)
+        return metrics
+
+    def _buffer_row(self, data, enqueued=None):
+        self._uncommitted_enqueue_times.append(time.monotonic() if enqueued is None else enqueued)
+        if not self._pending_rows:
+            self._pending_since = time.monotonic()
+        self._pending_rows.append(data)
+        if len(self._pending_rows) >= self._batch_max_rows:
+            self._flush_rows()
+
+    def _flush_rows(self):
+        """Write all buffered rows, grouping runs with identical columns into one executemany each."""
+        rows = self._pending_rows
+        self._pending_rows = []
+        self._pending_since = None
+        if len(rows) == 1:
+            self._store(rows[0])
+        elif rows:
+            if self.table_name is None:
+                raise Exception("Need to create a table before logging")
+            if not self.conn.in_transaction:
+                self._execute_retrying("BEGIN")
+            start = 0
+            while start < len(rows):
+                columns = tuple(rows[start].keys())
+                end = start + 1
+                while end < len(rows) and tuple(rows[end].keys()) == columns:
+                    end += 1
+                self._insert_rows(rows[start:end], columns)
+                start = end
+        if self._batch_durability == 'flush':
+            self._commit()
+
+    def _insert_rows(self, rows, columns):
+        if len(columns) > self._max_variables:
+            for row in rows:
+                self._store(row)
+            return
+        sql = self._get_insert_sql(columns)
+        values = [tuple(self.db_clean(column) for column in row.values()) for row in rows]
+        # a savepoint makes a failed executemany all-or-nothing, so a retry
+        # cannot duplicate the rows that went in before the failure
+        self._execute_retrying("SAVEPOINT batch")
+        num = 0
+        while True:
+            try:
+                self.conn.executemany(sql, values)
+                break
+            except sqlite3.OperationalError as e:
+                self.conn.execute("ROLLBACK TO batch")
+                if num > 2:
+                    debug_logging.warning(e)
+                    debug_logging.warning(
+                        "Try {} failed. Trying again...".format(num))
+                self._metrics.count('store_retries')
+                time.sleep(0.01)
+                num += 1
+        self.conn.execute("RELEASE batch")
+        if all(row.get('rowid') is None for row in rows):
+            # nothing else can write while this transaction holds the write
+            # lock, so automatically assigned rowids are consecutive
+            last_rowid = self.conn.execute('SELECT last_insert_rowid()').fetchone()[0]
+            for offset, row in enumerate(reversed(rows)):
+                row['rowid'] = last_rowid - offset
+
+    def _execute_retrying(self, sql):
+        num = 0
+        while True:
+            try:
+                return self.conn.execute(sql)
+            except sqlite3.OperationalError as e:
+                if num > 2:
+                    debug_logging.warning(e)
+                    debug_logging.warning(
+                        "Try {} failed. Trying again...".format(num))
+                self._metrics.count('store_retries')
+                time.sleep(0.01)
+                num += 1
+
+    def _get_insert_sql(self, columns):
+        key = (self.table_name, columns)
+        try:
+            return self._insert_sql_cache[key]
+        except KeyError:
+            if len(self._insert_sql_cache) > 256:
+                self._insert_sql_cache.clear()
+            sql = self._insert_sql_cache[key] = 'INSERT INTO {} ({}) VALUES ({})'.format(
+                self.table_name, ', '.join('"{}"'.format(column) for column in columns),
+                ("?," * len(columns))[:-1])
+            return sql
 
     def storemany(self, data):
         """Run the storemany step.
@@ -7655,27 +9558,23 @@ class logger_backend(object):
         """
         if self.table_name is None:
             raise Exception("Need to create a table before logging")
-        if len(data) <= 999:
-            # SQLITE_MAX_VARIABLE_NUMBER defaults to 999
-            q = ("?," * len(data))[:-1]
+        if len(data) <= self._max_variables:
+            sql = self._get_insert_sql(tuple(data.keys()))
             values = tuple([self.db_clean(column)
                            for column in list(data.values())])
-            cursor = self.conn.cursor()
-            sql = "INSERT INTO {} {} VALUES ({})".format(
-                self.table_name, tuple(data.keys()), q)
-            try:
-                cursor.execute(sql, values)
-                data['rowid'] = cursor.execute(
-                    'SELECT last_insert_rowid() FROM {}'.format(
-                        self.table_name)).fetchone()[0]
-            except sqlite3.OperationalError as e:
-                if num > 2:
-                    debug_logging.warning(data)
-                    debug_logging.warning(e)
-                    debug_logging.warning(
-                        "Try {} failed. Trying again...".format(num))
-                time.sleep(0.01)
-                self._store(data, num=num + 1)  # keep trying forever
+            while True:
+                try:
+                    data['rowid'] = self.conn.execute(sql, values).lastrowid
+                    break
+                except sqlite3.OperationalError as e:
+                    if num > 2:
+                        debug_logging.warning(data)
+                        debug_logging.warning(e)
+                        debug_logging.warning(
+                            "Try {} failed. Trying again...".format(num))
+                    self._metrics.count('store_retries')
+                    time.sleep(0.01)
+                    num += 1  # keep trying forever
         else:
             # SQLITE_MAX_COLUMN defaults to 2000
             data_cp = data.copy()  # don't delete rowid from original dict
@@ -7683,30 +9582,27 @@ class logger_backend(object):
                 del data_cp['rowid']
             except KeyError:
                 pass
-            q = ("?," * 999)[:-1]
+            columns = tuple(data_cp.keys())
+            sql = self._get_insert_sql(columns[:self._max_variables])
             values = tuple([self.db_clean(column)
-                           for column in list(data_cp.values())[:999]])
-            sql = "INSERT INTO {} {} VALUES ({})".format(
-                self.table_name, tuple(list(data_cp.keys())[:999]), q)
-            try:
-                self.conn.execute(sql, values)
-            except sqlite3.OperationalError as e:
-                if num > 2:
-                    debug_logging.warning(data_cp)
-                    debug_logging.warning(e)
-                    debug_logging.warning(
-                        "Try {} failed. Trying again...".format(num))
-                time.sleep(0.01)
-                self._store(data, num=num + 1)  # keep trying forever
-            cursor = self.conn.execute(
-                'SELECT last_insert_rowid() FROM {}'.format(
-                    self.table_name))
-            data['rowid'] = cursor.fetchone()[0]
-            # data['rowid'] = self.cur.execute('SELECT last_insert_rowid() FROM {}'.format(self.table_name)).fetchone()[0]
+                           for column in list(data_cp.values())[:self._max_variables]])
+            while True:
+                try:
+                    data['rowid'] = self.conn.execute(sql, values).lastrowid
+                    break
+                except sqlite3.OperationalError as e:
+                    if num > 2:
+                        debug_logging.warning(data_cp)
+                        debug_logging.warning(e)
+                        debug_logging.warning(
+                            "Try {} failed. Trying again...".format(num))
+                    self._metrics.count('store_retries')
+                    time.sleep(0.01)
+                    num += 1  # keep trying forever
             assignments = ', '.join(["'{}' = ?".format(k)
-                                    for k in list(data_cp.keys())[999:]])
+                                    for k in columns[self._max_variables:]])
             values = tuple([self.db_clean(column)
-                           for column in list(data_cp.values())[999:]])
+                           for column in list(data_cp.values())[self._max_variables:]])
             sql = "UPDATE {} SET {} WHERE rowid == {}".format(
                 self.table_name, assignments, data['rowid'])
             while True:
@@ -7719,6 +9615,7 @@ class logger_backend(object):
                         debug_logging.warning(e)
                         debug_logging.warning(
                             "Try {} failed. Trying again...".format(num))
+                    self._metrics.count('store_retries')
                     time.sleep(0.01)
                     num += 1
 
@@ -7746,12 +9643,10 @@ class logger_backend(object):
         assert len(
             set_of_data_lengths) == 1, f'storemany iterable element has items of disparate dimension {set_of_data_lengths}'
         example_row = (next(iter(data_iter)))
-        q = ("?," * len(example_row))[:-1]
         values = tuple(tuple(self.db_clean(column)
                        for column in row.values()) for row in data_iter)
         cursor = self.conn.cursor()
-        sql = "INSERT INTO {} {} VALUES ({})".format(
-            self.table_name, tuple(example_row.keys()), q)
+        sql = self._get_insert_sql(tuple(example_row.keys()))
         try:
             cursor.executemany(sql, values)
             # data['rowid'] = cursor.execute('SELECT last_insert_rowid() FROM {}'.format(self.table_name)).fetchone()[0]
@@ -7762,6 +9657,7 @@ class logger_backend(object):
                 debug_logging.warning(e)
                 debug_logging.warning(
                     "Try {} failed. Trying again...".format(num))
+            self._metrics.count('store_retries')
             time.sleep(0.01)
             self._storemany(data_iter, num=num + 1)  # keep trying forever
 
@@ -7833,14 +9729,23 @@ class logger_backend(object):
 
     def _commit(self, retries=10):
         for try_count in range(retries):
+            t_start = time.monotonic()
             try:
                 self.conn.commit()
             except sqlite3.OperationalError as e:
                 debug_logging.warning(e)
                 debug_logging.warning("Trying commit again...")
+                self._metrics.count('store_retries')
             else:
+                self._committed(time.monotonic() - t_start)
                 break
 
+    def _committed(self, duration):
+        # rows written so far are durable now
+        if self._uncommitted_enqueue_times:
+            self._metrics.record_commit(duration, self._uncommitted_enqueue_times)
+            self._uncommitted_enqueue_times = []
+
     def switch_table(self, table_name):
         """Perform switch table operation.
 
@@ -7913,6 +9818,52 @@ class logger_backend(object):
                     "Added column: {} to table: {}".format(
                         column, self.table_name))
 
+    def build_indexes(self, table_name, indexes):
+        """Create any missing indexes on table_name, then refresh query planner statistics.
+
+        Intended to run once collection into a table is finished, so that rows
+        are not paying for index maintenance while they are being logged.
+        Indexes are named <table>_<col1>_<col2>_idx.  Once built, SQLite keeps
+        them current for any rows appended later.  Columns missing from the
+        table are skipped with a warning.  Does nothing after stop().
+
+        >>> from PyICe.lab_core import logger_backend
+        >>> hasattr(logger_backend, 'build_indexes')
+        True
+
+        Args:
+            table_name: Database table name.
+            indexes: Iterable of column name tuples, one per index.
+        """
+        if self._stopped:
+            return
+        indexes = [tuple(columns) for columns in indexes]
+        if self._use_thread:
+            self.storage_queue.put(lambda: self._build_indexes(table_name, indexes))
+        else:
+            self._build_indexes(table_name, indexes)
+        self.sync_threads()
+
+    def _build_indexes(self, table_name, indexes):
+        table_columns = {row[1] for row in self.conn.execute(f'PRAGMA table_info({table_name})')}
+        for columns in indexes:
+            index_name = '{}_{}_idx'.format(table_name, '_'.join(columns))
+            missing = [column for column in columns if column not in table_columns]
+            if missing:
+                # SQLite would quietly index "missing" as a string constant.
+                debug_logging.warning(
+                    "Index {} not created: no such column {}".format(index_name, ', '.join(missing)))
+                continue
+            column_list = ', '.join(f'"{column}"' for column in columns)
+            try:
+                self.conn.execute(
+                    f'CREATE INDEX IF NOT EXISTS "{index_name}" ON {table_name} ({column_list})')
+            except sqlite3.OperationalError as e:
+                debug_logging.warning(
+                    "Index {} not created: {}".format(index_name, e))
+        # ANALYZE, limited to tables whose statistics are missing or stale.
+        self.conn.execute('PRAGMA optimize')
+
     def _check_name(self, name):
         if not re.match("[_A-Za-z][_a-zA-Z0-9]*$", name):
             raise Exception('Bad Table Name "{}"'.format(name))
@@ -7960,6 +9911,7 @@ class logger_backend(object):
             if not self._stopped:
                 self.storage_queue.put(self._stop)
                 self.storage_queue.join()
+                self.storage_queue.close_journal()
         else:
             # non-threaded case
             if not self._stopped:
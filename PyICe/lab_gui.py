@@ -36,6 +36,8 @@ the module still imports but all GUI classes are unavailable.
   for a single channel.
 - :class:`logger_view` — widget that collects logger_items and exposes
   start / stop controls.
+- :class:`logger_metrics_view` — periodically refreshed table of the
+  logger's storage queue and database write statistics.
 
 **Background worker**
 
@@ -3504,6 +3506,8 @@ class gui_logger(QtCore.QObject):
         self._channel_group = channel_group
         self.logger_view = logger_view(channel_group, None)
         self.logger_view.hide()
+        self.metrics_view = logger_metrics_view(self.get_storage_metrics, None)
+        self.metrics_view.hide()
         self.create_connect_dialog()
 
     def display_select_channels(self):
@@ -3513,6 +3517,24 @@ class gui_logger(QtCore.QObject):
         """
         self.logger_view.show()
 
+    def display_metrics(self):
+        """Show the storage metrics window.
+
+        The window refreshes itself while visible.
+        """
+        self.metrics_view.show()
+
+    def get_storage_metrics(self):
+        """Return the connected logger's storage metrics.
+
+        Returns:
+            dict or None: See ``lab_core.logger.get_storage_metrics``; None
+            when no database is connected.
+        """
+        if self._logger:
+            return self._logger.get_storage_metrics()
+        return None
+
     def log(self):
         """Run the log step.
 
@@ -3705,6 +3727,83 @@ class gui_logger(QtCore.QObject):
         self.connect_dialog.close()
 
 
+class logger_metrics_view(QtWidgets.QWidget):
+    """Table of logger storage metrics, refreshed once a second while shown."""
+    # (metric key, row label, unit scale, format)
+    rows = (('queue_depth', 'Queued operations', None, '{:d}'),
+            ('rows_in_memory', 'Rows waiting in memory', None, '{:d}'),
+            ('rows_in_journal', 'Rows spilled to journal', None, '{:d}'),
+            ('pending_batch_rows', 'Rows in current batch', None, '{:d}'),
+            ('max_queue_depth', 'Peak queue depth', None, '{:d}'),
+            ('queue_policy', 'Queue policy', None, '{}'),
+            ('rows_enqueued', 'Rows stored', None, '{:d}'),
+            ('rows_committed', 'Rows committed', None, '{:d}'),
+            ('rows_dropped', 'Rows dropped', None, '{:d}'),
+            ('rows_spilled', 'Rows spilled', None, '{:d}'),
+            ('store_retries', 'Write retries', None, '{:d}'),
+            ('commits', 'Commits', None, '{:d}'),
+            ('latency_p50', 'Store to commit p50 (ms)', 1e3, '{:.1f}'),
+            ('latency_p90', 'Store to commit p90 (ms)', 1e3, '{:.1f}'),
+            ('latency_p99', 'Store to commit p99 (ms)', 1e3, '{:.1f}'),
+            ('latency_max', 'Store to commit max (ms)', 1e3, '{:.1f}'),
+            ('commit_time_mean', 'Commit time mean (ms)', 1e3, '{:.2f}'),
+            ('commit_time_max', 'Commit time max (ms)', 1e3, '{:.2f}'))
+
+    def __init__(self, get_metrics, parent):
+        """Initialize logger_metrics_view.
+
+        Args:
+            get_metrics: Callable returning the metrics dict, or None when no
+                logger is connected.
+            parent: Parent object in the hierarchy.
+        """
+        QtWidgets.QWidget.__init__(self, parent)
+        self._get_metrics = get_metrics
+        self.setWindowTitle('Logger Storage Metrics')
+        layout = QtWidgets.QVBoxLayout()
+        self.table = QtWidgets.QTableWidget(len(self.rows), 1)
+        self.table.setHorizontalHeaderLabels(['Value'])
+        self.table.setVerticalHeaderLabels([label for _, label, _, _ in self.rows])
+        self.table.horizontalHeader().setStretchLastSection(True)
+        self.table.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        layout.addWidget(self.table)
+        self.setLayout(layout)
+        self.resize(420, 560)
+        self.timer = QtCore.QTimer(self)
+        self.timer.setInterval(1000)
+        self.timer.timeout.connect(self.refresh)
+
+    def refresh(self):
+        """Re-read the metrics and update the table."""
+        metrics = self._get_metrics()
+        for row, (key, _, scale, fmt) in enumerate(self.rows):
+            value = None if metrics is None else metrics.get(key)
+            if value is None:
+                text = '-' if metrics is not None else 'not connected'
+            else:
+                text = fmt.format(value * scale if scale else value)
+            self.table.setItem(row, 0, QtWidgets.QTableWidgetItem(text))
+
+    def showEvent(self, event):
+        """Start refreshing when the window is shown.
+
+        Args:
+            event: Event object or identifier.
+        """
+        self.refresh()
+        self.timer.start()
+        QtWidgets.QWidget.showEvent(self, event)
+
+    def hideEvent(self, event):
+        """Stop refreshing when the window is hidden.
+
+        Args:
+            event: Event object or identifier.
+        """
+        self.timer.stop()
+        QtWidgets.QWidget.hideEvent(self, event)
+
+
 class logger_item(QtWidgets.QCheckBox, channel_wrapper):
     """Logger_item."""
     def __init__(self, channel_object):
@@ -4554,6 +4653,10 @@ class ltc_lab_gui_main_window(QtWidgets.QMainWindow):
         logger_select_channels.triggered.connect(
             self._gui_logger.display_select_channels)
         logger_menu.addAction(logger_select_channels)
+        logger_metrics = QtWidgets.QAction(
+            "Storage Metrics...", logger_menu)
+        logger_metrics.triggered.connect(self._gui_logger.display_metrics)
+        logger_menu.addAction(logger_metrics)
         logger_log = QtWidgets.QAction("Log Once", logger_menu)
         logger_log.setShortcut(
             QtGui.QKeySequence(
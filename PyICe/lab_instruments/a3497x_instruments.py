@@ -5,6 +5,7 @@
 """
 from PyICe.lab_utils.eng_string import eng_string
 from PyICe.lab_utils.banners import print_banner
+from PyICe.lab_instruments.scan_mainframe import scan_mainframe
 from ..lab_core import *  # noqa: F403
 import math
 
@@ -13,7 +14,7 @@ relay_count_bay2_warned_already = False
 relay_count_bay3_warned_already = False
 
 
-class a3497xa_instrument(scpi_instrument, delegator):
+class a3497xa_instrument(scan_mainframe, scpi_instrument, delegator):
     """Superclass of all Agilent 34970 plugin instruments."""
 
     def __init__(self, name, automatic_monitor):
@@ -58,8 +59,10 @@ class a3497xa_instrument(scpi_instrument, delegator):
         """Return read delegated channel list result.
         Sends the appropriate command to the instrument and parses the
         response.
-        Sends the ``ROUTe:SCAN`` SCPI command to the instrument.
-        Sends the appropriate query to the instrument and parses the response.
+        The ``ROUTe:SCAN`` list is only rewritten and read back when the set
+        of channels changes or a channel was reconfigured since the last
+        scan (see get_config_generation()); otherwise a single ``READ?``
+        runs the scan and returns the readings.
 
         Sends the corresponding SCPI command string to the instrument over the bus.
 
@@ -109,34 +112,14 @@ class a3497xa_instrument(scpi_instrument, delegator):
             results[channel_list[0].get_name()] = self.get_monitor_data()
             return results
         self.scan_active = True
-        scan_internal_addresses = [channel.get_attribute(
-            'internal_address') for channel in channel_list]
+        scan_internal_addresses = set(channel.get_attribute(
+            'internal_address') for channel in channel_list)
         if self.monitor_channel_num is not None:
-            scan_internal_addresses.append(self.monitor_channel_num)
-        scan_internal_addresses = list(
-            set(scan_internal_addresses))  # remove duplicates
-        # note cannot store last scan and avoid writing it reconfiguring
-        # channels breaks it
-        self._last_scan_internal_addresses = scan_internal_addresses
-        cmd = "ROUTe:SCAN (@"
-        for internal_address in scan_internal_addresses:
-            cmd += str(internal_address) + ','
-        cmd = cmd.rstrip(',') + ")"
-        self.get_interface().write(cmd)
-        # then get the list back to learn channel order
-        txt_scanlist = self.get_interface().ask("ROUTe:SCAN?")
-        try:
-            txt_scanlist = txt_scanlist.split("(@")[1]
-        except BaseException:
-            print('Communication problem; attempting resyc.')
-            self.get_interface().resync()
-            raise Exception('Resync complete; better luck next time.')
-        txt_scanlist = txt_scanlist.strip(")'")
-        self._scanlist_ordered = list(map(int, txt_scanlist.split(",")))
-        self.init()
-        self.operation_complete()
-        txt = self.fetch()
-        vals = txt.split(",")
+            scan_internal_addresses.add(self.monitor_channel_num)
+        state = self._get_scan_state()
+        vals = self._scan(state, scan_internal_addresses)
+        self._last_scan_internal_addresses = list(scan_internal_addresses)
+        self._scanlist_ordered = state.scanlist_ordered
         self.scan_results = results_ord_dict()
         for (internal_address, val) in zip(self._scanlist_ordered, vals):
             self.scan_results[internal_address] = val
@@ -146,9 +129,10 @@ class a3497xa_instrument(scpi_instrument, delegator):
         if len(channel_list) == 1:
             self.monitor_channel_num = channel_list[0].get_attribute(
                 'internal_address')
-            self.get_interface().write(
-                f"ROUTe:MONitor (@{self.monitor_channel_num})")
-            self.get_interface().write("ROUTe:MONitor:STATe ON")
+            if state.monitor != self.monitor_channel_num:
+                self.get_interface().write(
+                    f"ROUTe:MONitor (@{self.monitor_channel_num});:ROUTe:MONitor:STATe ON")
+                state.monitor = self.monitor_channel_num
         return results
 
     def read_raw(self, internal_address):
@@ -208,6 +192,9 @@ class a3497xa_instrument(scpi_instrument, delegator):
             self.monitor_channel_num = channel_number
             self.get_interface().write(f"ROUTe:MONitor (@{channel_number})")
             self.get_interface().write("ROUTe:MONitor:STATe ON")
+            state = self._get_scan_state()
+            state.scan_addresses = None
+            state.monitor = channel_number
 
     def get_monitor_data(self, channel_name=None):
         """Return data from last monitor reading.
@@ -501,10 +488,10 @@ class agilent_3497xa_20ch_40ch(a3497xa_instrument):
         internal_address = channel.get_attribute('internal_address')
         channel.set_attribute('input_impedance_hiz', high_z)
         if (high_z is True):
-            self.get_interface().write(
+            self._write_config(
                 f"INPut:IMPedance:AUTO ON , (@{internal_address})")
         else:
-            self.get_interface().write(
+            self._write_config(
                 f"INPut:IMPedance:AUTO OFF , (@{internal_address})")
 
     def _config_dc_voltage(self, channel, NPLC, range,
@@ -522,7 +509,7 @@ class agilent_3497xa_20ch_40ch(a3497xa_instrument):
             disable_autozero: True to disable autozero, False to enable.
         """
         internal_address = channel.get_attribute('internal_address')
-        self.get_interface().write(
+        self._write_config(
             f"CONFigure:VOLTage:DC {range} , (@{internal_address})")
         self._configure_channel_nplc(channel, NPLC)
         self._set_impedance_10GOhm(channel, high_z)
@@ -533,7 +520,7 @@ class agilent_3497xa_20ch_40ch(a3497xa_instrument):
     def _config_thermocouple(self, internal_address, thermocouple_type):
         if thermocouple_type.upper() not in ['J', 'K', 'T']:
             raise Exception('Invalid thermocouple type, valid types are J,K,T')
-        self.get_interface().write(
+        self._write_config(
             f"CONFigure:TEMPerature TCouple,{thermocouple_type.upper()},(@{internal_address})")
 
     def _config_rtd(self, internal_address, rtd_type, ptype, nom_res):
@@ -541,14 +528,14 @@ class agilent_3497xa_20ch_40ch(a3497xa_instrument):
             raise Exception(
                 'Invalid RTD type. Acceptable values are 85 and 91')
         if ptype == 4:
-            self.get_interface().write(
+            self._write_config(
                 f"CONFigure:TEMPerature FRTD,{rtd_type}, (@{internal_address})")
-            self.get_interface().write(
+            self._write_config(
                 f"SENS:TEMP:TRAN:FRTD:RES {nom_res}, (@{internal_address})")
         elif ptype == 2:
-            self.get_interface().write(
+            self._write_config(
                 f"CONFigure:TEMPerature RTD,{rtd_type}, (@{internal_address})")
-            self.get_interface().write(
+            self._write_config(
                 f"SENS:TEMP:TRAN:RTD:RES {nom_res}, (@{internal_address})")
         else:
             raise Exception(
@@ -566,7 +553,7 @@ class agilent_3497xa_20ch_40ch(a3497xa_instrument):
         """
         internal_address = channel.get_attribute('internal_address')
         channel.set_attribute('delay', delay)
-        self.get_interface().write(
+        self._write_config(
             f"ROUT:CHAN:DELAY {delay},(@{internal_address})")
 
     def _configure_channel_autozero(self, channel, disable_autozero):
@@ -587,7 +574,7 @@ class agilent_3497xa_20ch_40ch(a3497xa_instrument):
             disable_autozero: True to disable autozero, False to enable.
         """
         internal_address = channel.get_attribute('internal_address')
-        self.get_interface().write(
+        self._write_config(
             f"SENSe:ZERO:AUTO {'ONCE' if disable_autozero else 'ON'},(@{internal_address})")
         channel.set_attribute('auto_zero', not (disable_autozero))
 
@@ -605,21 +592,21 @@ class agilent_3497xa_20ch_40ch(a3497xa_instrument):
         """
         internal_address = channel.get_attribute('internal_address')
         if gain is not None:
-            self.get_interface().write(
+            self._write_config(
                 f"CALCulate:SCALe:GAIN {gain}, (@{internal_address})")
             channel.set_attribute('gain', gain)
         if offset is not None:
-            self.get_interface().write(
+            self._write_config(
                 f"CALCulate:SCALe:OFFSet {offset}, (@{internal_address})")
             channel.set_attribute('offset', offset)
         if unit is not None:
-            self.get_interface().write(
+            self._write_config(
                 f'CALCulate:SCALe:UNIT "{unit}", (@{internal_address})')
             channel.set_attribute('unit', unit)
             channel.set_display_format_function(
                 function=lambda float_data: eng_string(
                     float_data, fmt=':3.6g', si=True) + unit)
-        self.get_interface().write(
+        self._write_config(
             f"CALCulate:SCALe:STATe ON ,(@{internal_address})")
 
     def _configure_channel_nplc(self, channel, nplc):
@@ -630,16 +617,16 @@ class agilent_3497xa_20ch_40ch(a3497xa_instrument):
         except ChannelAttributeException:
             raise Exception(f'Cannot configure nplc for channel {channel}')
         if channel_type == 'volts_dc':
-            self.get_interface().write(
+            self._write_config(
                 f"VOLTage:DC:NPLC {nplc}, (@{internal_address})")
         elif channel_type == 'current_dc':
-            self.get_interface().write(
+            self._write_config(
                 f"CURRent:DC:NPLC {nplc},(@{internal_address})")
         elif channel_type == 'thermocouple':
-            self.get_interface().write(
+            self._write_config(
                 f"SENSe:TEMPerature:NPLC {nplc},(@{internal_address})")
         elif channel_type == 'RTD':
-            self.get_interface().write(
+            self._write_config(
                 f"SENSe:TEMPerature:NPLC {nplc},(@{internal_address})")
         else:
             raise Exception(
@@ -929,7 +916,7 @@ class agilent_3497xa_20ch(agilent_3497xa_20ch_40ch):
         """
         internal_address = channel.get_attribute('internal_address')
         channel.set_attribute('range', range)
-        self.get_interface().write(
+        self._write_config(
             f"CONFigure:CURRent:DC {range},(@{internal_address})")
 
     def add_channel_ammeter_range(self, channel_name, base_channel):
@@ -970,7 +957,7 @@ class agilent_3497xa_20ch(agilent_3497xa_20ch_40ch):
         """
         print('config_freq expect this to change and become an add_channel')
         internal_address = self._get_internal_address_by_name(channel_name)
-        self.get_interface().write(
+        self._write_config(
             f"CONFigure:FREQuency (@{internal_address})")
 
     def config_res(self, channel_name):
@@ -1031,12 +1018,12 @@ class agilent_3497xa_20ch(agilent_3497xa_20ch_40ch):
         ####################################
         def _set_range(value):
             if value == "AUTO" or value is None:
-                self.get_interface().write(
+                self._write_config(
                     f'SENSe:RESistance:RANGe:AUTO ON, (@{channel_num + self.bay * 100})')
             else:
                 '''TODO set presets for MIN and MAX'''
                 '''Presumably AUTO OFF not needed if range being set to MIN, MAX or value.'''
-                self.get_interface().write(
+                self._write_config(
                     f'SENSe:RESistance:RANGe {value}, (@{channel_num + self.bay * 100})')
 
         def _get_range():
@@ -1057,7 +1044,7 @@ class agilent_3497xa_20ch(agilent_3497xa_20ch_40ch):
         ####################################
         '''Power Line Cycles'''
         def _set_NPLC(value):
-            self.get_interface().write(
+            self._write_config(
                 f'SENSe:RESistance:NPLC {value}, (@{channel_num + self.bay * 100})')
 
         def _get_NPLC():
@@ -1078,7 +1065,7 @@ class agilent_3497xa_20ch(agilent_3497xa_20ch_40ch):
         ####################################
         '''Integration Time, Linked with / Inverse of NPLC'''
         def _set_aperature(value):
-            self.get_interface().write(
+            self._write_config(
                 f'SENSe:RESistance:APERture {value}, (@{channel_num + self.bay * 100})')
 
         def _get_aperature():
@@ -1099,9 +1086,9 @@ class agilent_3497xa_20ch(agilent_3497xa_20ch_40ch):
         ####################################
         '''Linked with Aperature Time and NPLC'''
         def _set_resolution(value):
-            self.get_interface().write(
+            self._write_config(
                 f'SENSe:RESistance:RANGe:AUTO OFF, (@{channel_num + self.bay * 100})')
-            self.get_interface().write(
+            self._write_config(
                 f'SENSe:RESistance:RESolution {value}, (@{channel_num + self.bay * 100})')
 
         def _get_resolution():
@@ -1122,7 +1109,7 @@ class agilent_3497xa_20ch(agilent_3497xa_20ch_40ch):
         ####################################
         '''Enable Offset Compensation'''
         def _set_offset_compensated(value):
-            self.get_interface().write(
+            self._write_config(
                 f'SENSe:RESistance:OCOMpensated {"ON" if value in [1, True, "ON"] else "OFF"}, (@{channel_num + self.bay * 100})')
 
         def _get_offset_compensated():
@@ -1145,7 +1132,7 @@ class agilent_3497xa_20ch(agilent_3497xa_20ch_40ch):
         main_channel.set_display_format_function(
             function=lambda float_data: eng_string(
                 float_data, fmt=':0.5g', si=True) + 'Ω')
-        self.get_interface().write("CONFigure:RESistance " +
+        self._write_config("CONFigure:RESistance " +
                                    f"(@{channel_num + self.bay * 100})")
         if delay is not None:
             self._config_channel_delay(main_channel, delay)
@@ -1211,12 +1198,12 @@ class agilent_3497xa_20ch(agilent_3497xa_20ch_40ch):
         ####################################
         def _set_range(value):
             if value == "AUTO" or value is None:
-                self.get_interface().write(
+                self._write_config(
                     f'SENSe:FRESistance:RANGe:AUTO ON, (@{channel_num + self.bay * 100})')
             else:
                 '''TODO set presets for MIN and MAX'''
                 '''Presumably AUTO OFF not needed if range being set to MIN, MAX or value.'''
-                self.get_interface().write(
+                self._write_config(
                     f'SENSe:FRESistance:RANGe {value}, (@{channel_num + self.bay * 100})')
 
         def _get_range():
@@ -1237,7 +1224,7 @@ class agilent_3497xa_20ch(agilent_3497xa_20ch_40ch):
         ####################################
         '''Power Line Cycles'''
         def _set_NPLC(value):
-            self.get_interface().write(
+            self._write_config(
                 f'SENSe:FRESistance:NPLC {value}, (@{channel_num + self.bay * 100})')
 
         def _get_NPLC():
@@ -1258,7 +1245,7 @@ class agilent_3497xa_20ch(agilent_3497xa_20ch_40ch):
         ####################################
         '''Integration Time, Linked with / Inverse of NPLC'''
         def _set_aperature(value):
-            self.get_interface().write(
+            self._write_config(
                 f'SENSe:FRESistance:APERture {value}, (@{channel_num + self.bay * 100})')
 
         def _get_aperature():
@@ -1279,9 +1266,9 @@ class agilent_3497xa_20ch(agilent_3497xa_20ch_40ch):
         ####################################
         '''Linked with Aperature Time and NPLC'''
         def _set_resolution(value):
-            self.get_interface().write(
+            self._write_config(
                 f'SENSe:FRESistance:RANGe:AUTO OFF, (@{channel_num + self.bay * 100})')
-            self.get_interface().write(
+            self._write_config(
                 f'SENSe:FRESistance:RESolution {value}, (@{channel_num + self.bay * 100})')
 
         def _get_resolution():
@@ -1302,7 +1289,7 @@ class agilent_3497xa_20ch(agilent_3497xa_20ch_40ch):
         ####################################
         '''Enable Offset Compensation'''
         def _set_offset_compensated(value):
-            self.get_interface().write(
+            self._write_config(
                 f'SENSe:FRESistance:OCOMpensated {"ON" if value in [1, True, "ON"] else "OFF"}, (@{channel_num + self.bay * 100})')
 
         def _get_offset_compensated():
@@ -1325,7 +1312,7 @@ class agilent_3497xa_20ch(agilent_3497xa_20ch_40ch):
         main_channel.set_display_format_function(
             function=lambda float_data: eng_string(
                 float_data, fmt=':0.5g', si=True) + 'Ω')
-        self.get_interface().write("CONFigure:FRESistance " +
+        self._write_config("CONFigure:FRESistance " +
                                    f"(@{channel_num + self.bay * 100})")
         if delay is not None:
             self._config_channel_delay(main_channel, delay)
@@ -1730,7 +1717,7 @@ class agilent_3497xa_dig_in8(a3497xa_instrument):
         a3497xa_instrument.__init__(
             self, f'34970a_digital bay: {self.bay},{self.channel_number} @ {interface_visa}', automatic_monitor=False)
         self.add_interface_visa(interface_visa)
-        self.get_interface().write(
+        self._write_config(
             f'CONFigure:DIGital:BYTE (@{self.internal_address})')
 
     def add_channel(self, channel_name, start=0, size=8):
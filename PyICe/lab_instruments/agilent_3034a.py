@@ -134,6 +134,7 @@ class agilent_3034a(oscilloscope):
         # done once it appears to stick through reseting and clearing the
         # scope.
         self.get_interface().write(':SYSTem:MENU OFF')
+        self.invalidate_waveform_cache()
         self.get_interface().write(":WAVeform:FORMat BYTE")
         # Maximum number of points by default (scope must be stopped)
         self.get_interface().write(":WAVeform:POINts:MODE RAW")
@@ -185,6 +186,7 @@ class agilent_3034a(oscilloscope):
         self._add_channel(new_channel)
         new_channel._set_type_affinity('PyICeBLOB')
         new_channel.set_attribute('dependent_physical_channels', (number,))
+        new_channel.set_attribute('waveform_source', f'CHANnel{number}')
         self.add_Ycontrol_Yreadback_channels(name, number)
         return new_channel
 
@@ -338,8 +340,7 @@ class agilent_3034a(oscilloscope):
             # Pick the first enabled channel
         ) if enstatus][0]
         # Set the first enabled channel as waveform source
-        self.get_interface().write(
-            f':WAVeform:SOURce CHANnel{an_enabled_channel}')
+        self.set_waveform_source(f'CHANnel{an_enabled_channel}')
         self.time_info["points"] = int(self.get_interface().ask(
             # int(preamble[2])
             ":WAVeform:POINts?"))
@@ -395,6 +396,7 @@ class agilent_3034a(oscilloscope):
             raise ValueError(
                 f"\nAgilent 3034a: {self.get_name()}: set_points: points argument muse be in: {allowed_points}")
         self.get_interface().write(f":WAVeform:POINts {points}")
+        self.invalidate_waveform_cache()
 
     def get_channel_enable_status(self, number):
         """Return the channel enable status.
@@ -480,9 +482,7 @@ class agilent_3034a(oscilloscope):
         Returns:
             The measured value.
         """
-        self.get_interface().write(
-            f':WAVeform:SOURce CHANnel{scope_channel_number}')
-        return self.fetch_waveform_data()
+        return self.fetch_waveform_data(f'CHANnel{scope_channel_number}')
 
     def read_delegated_channel_list(self, channels):
         """Return read delegated channel list result.
@@ -505,8 +505,17 @@ class agilent_3034a(oscilloscope):
         while (True):
             if self.scope_stopped():
                 self._read_scope_time_info()
+                # fetch all requested waveforms in one pass over the sources
+                sources = {channel.get_name(): channel.get_attributes().get('waveform_source')
+                           for channel in channels}
+                waveforms = self.fetch_waveforms(
+                    source for source in dict.fromkeys(sources.values()) if source is not None)
                 for channel in channels:
-                    results[channel.get_name()] = channel.read_without_delegator()
+                    if sources[channel.get_name()] is not None:
+                        results[channel.get_name()] = channel.read_without_delegator(
+                            force_data=True, data=waveforms[sources[channel.get_name()]])
+                    else:
+                        results[channel.get_name()] = channel.read_without_delegator()
                 return results
             elif time.time() > timeout_time:
                 for channel in channels:
@@ -3,9 +3,37 @@
 >>> from PyICe.lab_instruments.agilent_8110a import Agilent_8110a
 
 """
+import numpy
 from PyICe.lab_core import *  # noqa: F403
 
 
+def _pattern_digits(pattern):
+    """Return *pattern* as the string of digits sent in a pattern data block.
+
+    numpy integer arrays, such as the uint8 records of
+    PyICe.data_utils.pattern_generators.TWI_Pattern, are converted in one
+    step instead of value by value.
+
+    >>> _pattern_digits("1,0,1")
+    '101'
+    >>> _pattern_digits(numpy.array([3, 0, 7], dtype=numpy.uint8))
+    '307'
+
+    Args:
+        pattern: CSV string, list of integers or numpy array.
+
+    Returns:
+        str: One character per time slice.
+    """
+    if isinstance(pattern, numpy.ndarray) and pattern.ndim == 1 and pattern.dtype.kind in 'biu' \
+            and (not len(pattern) or pattern.max() <= 9):
+        return (pattern.astype(numpy.uint8) + ord('0')).tobytes().decode('ascii')
+    if type(pattern) is str:
+        # Always a list of strings hereafter
+        pattern = pattern.split(",")
+    return ''.join(str(value) for value in pattern)
+
+
 class Agilent_8110a(scpi_instrument):
     """HP 150MHz Dual Channel Pattern Generator from the early 1990's.
 
@@ -507,6 +535,7 @@ class Agilent_8110a(scpi_instrument):
         Data types supported are:
             - CSV lists (no encompassing brackets of any kind). This is useful for use with the PyICe GUI.
             - Python list of integers of either 0 to 1.
+            - numpy integer array of 0 and 1.
 
         Args:
             channel_name: Name for the new channel.
@@ -516,10 +545,7 @@ class Agilent_8110a(scpi_instrument):
             The newly created channel object.
         """
         def set_pattern(pattern):
-            if type(pattern) is str:
-                # Always a list of strings hereafter
-                pattern = pattern.split(",")
-            pattern = ''.join(str(value) for value in pattern)
+            pattern = _pattern_digits(pattern)
             length_of_data = len(pattern)
             if length_of_data > 4096:
                 raise Exception(
@@ -551,6 +577,7 @@ class Agilent_8110a(scpi_instrument):
         Data types supported are:
             - CSV lists (no encompassing brackets of any kind). This is useful for use with the PyICe GUI.
             - Python list of integers of either 0 to 1.
+            - numpy integer array of 0 to 7, such as TWI_Pattern.get_ALL(SCL_channel=1, SDA_channel=2, STB_channel=3).
 
         Args:
             channel_name: Name for the new channel.
@@ -559,10 +586,7 @@ class Agilent_8110a(scpi_instrument):
             The newly created channel object.
         """
         def set_patterns(pattern):
-            if type(pattern) is str:
-                # Always a list of strings hereafter
-                pattern = pattern.split(",")
-            pattern = ''.join(str(value) for value in pattern)
+            pattern = _pattern_digits(pattern)
             length_of_data = len(pattern)
             if length_of_data > 4096:
                 raise Exception(
@@ -6,7 +6,9 @@
 # pylint: disable=no-member; _ai_channels and _scale_fn are provided by hardware-specific
 # mixin subclasses (u2331a_base, u2352a_base, etc.) combined via multiple inheritance
 from PyICe.lab_utils.eng_string import eng_string
+from PyICe.lab_utils.stream_pipeline import stream_pipeline
 from numpy import fromiter, dtype
+import numpy
 import struct
 import time
 import datetime
@@ -21,6 +23,15 @@ class u2300aBufferUnderflowError(Exception):
     """Python Deque is empty."""
 
 
+class _stream_block(bytes):
+    """Raw streaming block tagged with its byte offset in the acquisition."""
+
+    def __new__(cls, data, offset):
+        block = super().__new__(cls, data)
+        block.offset = offset
+        return block
+
+
 class u2300a_scope(scpi_instrument, delegator):
     """Superclass of all Keysight U2300A series instruments treated as scope."""
 
@@ -805,11 +816,26 @@ class u2300a_scope(scpi_instrument, delegator):
         Returns:
             The scale fn result.
         """
+        lsb, offset, shift = self._scale_params(channel)
+        return lambda x, lsb=lsb, offset=offset, shift=shift: lsb * (
+            x >> shift) + offset
+
+    def _scale_params(self, channel):
+        """Return the ``(lsb, offset, shift)`` used to scale raw readings of *channel*.
+
+        Scaled value is ``lsb * (raw >> shift) + offset``, which works
+        equally for a single integer and for a numpy array of readings.
+
+        Args:
+            channel: Channel object.
+
+        Returns:
+            tuple: ``(lsb, offset, shift)``.
+        """
         gains = self._ai_channels[channel.get_attribute(
             'polarity')]['range'][channel.get_attribute('sig_range')]
         offset = 0.5 * (gains['max'] + gains['min'])
-        return lambda x, lsb=gains['lsb'], offset=offset, shift=self._ai_channels['bit_offset']: lsb * (
-            x >> shift) + offset
+        return gains['lsb'], offset, self._ai_channels['bit_offset']
 
     def arm_trigger(self, channel_list=None):
         """Perform arm trigger operation.
@@ -1029,16 +1055,31 @@ class u2300a_datalogger(u2300a_scope):
         self.table_name = table_name
         self.set_burst_mode(True)
 
-    def log(self, record_time=0):
+    def log(self, record_time=0, queue_depth=16, overflow='block'):
         """Run the log step.
-        Reads all registered channels, stores results in the database, and
-        invokes any registered callbacks.
+        Streams all registered channels into the logger database until
+        *record_time* elapses.
         Sends the ``WAVeform:STATus`` SCPI command to the instrument.
 
-        Sends the corresponding SCPI command string to the instrument over the bus.
+        Acquisition, decoding and storage run in separate threads (see
+        :class:`PyICe.lab_utils.stream_pipeline.stream_pipeline`), so a slow
+        database commit no longer delays reading the instrument buffer.
+        Raw blocks are scaled with numpy and stored with
+        ``logger.log_many()``.
 
         Args:
-            record_time: Record time to use.
+            record_time: Seconds to record for, or None to record until
+                interrupted with Ctrl-C.
+            queue_depth: Maximum number of raw blocks, and of decoded
+                blocks, buffered between the pipeline stages.
+            overflow: 'block' to hold off reading the instrument while the
+                decode queue is full, or 'drop' to discard blocks instead.
+                Rows after a dropped block keep their true ``DAQ_time``
+                and ``datetime``; the lost points are simply absent.
+
+        Returns:
+            dict: Pipeline statistics from
+            :meth:`stream_pipeline.get_metrics`.
 
         Raises:
             Exception: If an unexpected error occurs.
@@ -1051,76 +1092,171 @@ class u2300a_datalogger(u2300a_scope):
             warn=False)
         idx_primes = [ch.get_name() for ch in self.get_all_channels_list(
         ) if ch.get_attribute('u2300a_type') == 'ain_time']
-        idx_prime = ''
+        # Indexed (along with datetime) by logger.stop() once streaming is done,
+        # so the inserts don't pay for index maintenance.
         for idx_prime in idx_primes:
-            self.logger.execute(
-                f'CREATE INDEX IF NOT EXISTS {self.table_name}_{idx_prime}_idx ON {self.table_name} ({idx_prime})')
-        self.logger.execute(
-            f'CREATE INDEX IF NOT EXISTS {self.table_name}_datetime_idx ON {self.table_name} (datetime)')
+            self.logger.add_index(idx_prime)
         self._setup()
-        self.stopping = False
-        self.stopped = False
-        unhandled_exception_occurred = False
-        databank = collections.deque()
+        self._stream_setup()
         time.sleep(10)
         self.get_interface().write('RUN')
         while self.get_interface().ask('WAVeform:STATus?') != 'DATA':
             print(self.get_interface().ask('WAVeform:STATus?'))
         print("TRIG'D!")
+        # This is one block away from where we triggered.
         start_time = datetime.datetime.now(datetime.timezone.utc)
+        self._stream_start = numpy.datetime64(start_time.replace(tzinfo=None), 'us')
+        pipeline = stream_pipeline(acquire=self._stream_acquire,
+                                   decode=self._stream_decode,
+                                   store=self._stream_store,
+                                   queue_depth=queue_depth,
+                                   overflow=overflow,
+                                   poll_interval=0.01,
+                                   finish=lambda: self.get_interface().write('STOP'),
+                                   name=self.get_name())
+        pipeline.start()
+        unhandled_exception = None
         try:
-            # This is one block away from where we triggered.
-            start_time = datetime.datetime.now(datetime.timezone.utc)
-            self.time_since = time.time()
-            reset_clock = time.time()
-            while True if record_time is None else (
+            while record_time is None or (
                     datetime.datetime.now(datetime.timezone.utc) - start_time).total_seconds() < record_time:
-                data = self.read_all_channels()
-                data['datetime'] = (start_time + datetime.timedelta(seconds=data[idx_prime])).strftime(
-                    '%Y-%m-%dT%H:%M:%S.%fZ')  # Repair datetime by means of DAQ_time
-                # data['datetime']=datetime.datetime.now(datetime.timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.%fZ')
-                if data is not None:
-                    databank.append(data)
-                time_now = time.time()
-                if time_now - reset_clock > 1:
-                    print(f'Logging {len(databank)} rows')
-                    reset_clock = time_now
-                    self.logger.log_many(databank.copy())
-                    databank.clear()
+                if pipeline.wait(timeout=min(1, record_time) if record_time is not None else 1):
+                    break  # acquisition ended by itself
+                print(f"Logged {pipeline.get_metrics()['store']['items']} block(s)")
         except (KeyboardInterrupt, ):
             print('Bye!')
-        except u2300aBufferOverflowError as e:
-            print(e)
-        except Exception as e:
-            print(e)
-            unhandled_exception_occurred = True
         finally:
-            self.get_interface().write('STOP')
-            self.stopping = True
-            self.stopped = True
-            print(
-                f"Acquisition stopped. There are {len(databank)} row(s) in the log queue. Some still need processing. One moment please.")
+            print("Acquisition stopping. Remaining blocks still need processing. One moment please.")
             try:
-                while True:
-                    data = self.read_all_channels()
-                    data['datetime'] = (start_time + datetime.timedelta(seconds=data['DAQ_time'])).strftime(
-                        '%Y-%m-%dT%H:%M:%S.%fZ')  # Repair datetime by means of DAQ_time
-                    # data['datetime']=datetime.datetime.now(datetime.timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.%fZ')
-                    databank.append(data)
-            except u2300aBufferUnderflowError:
-                print(
-                    f'All channels processed. Logging the last {len(databank)} rows now.')
-                self.logger.log_many(databank)
-                # This is passing mutable data pass the boundary, but we
-                # promise not to mutate it until it does what it needs to do.
-                print(
-                    f"All data has been sent to logger thread. It took {(datetime.datetime.now(datetime.timezone.utc) - start_time).total_seconds()} seconds to log {record_time} seconds from the start. Thank you for your patience.")
+                pipeline.stop(drain=True)
+            except u2300aBufferOverflowError as e:
+                print(e)
+            except Exception as e:
+                print(e)
+                unhandled_exception = e
+            metrics = pipeline.get_metrics()
+            print(
+                f"Acquisition stopped. Raw queue high water {metrics['raw_queue']['high_water']}, "
+                f"{metrics['raw_queue']['dropped']} block(s) dropped, "
+                f"{metrics['raw_queue']['blocked_time']:0.1f}s spent waiting for the decoder.")
             self.logger.stop()
             print(
                 f'Logger thread complete. It took {(datetime.datetime.now(datetime.timezone.utc) - start_time).total_seconds()} seconds from the start.')
-            databank.clear()  # We expect the threads to be joined by now.
-            if unhandled_exception_occurred:
-                raise e  # pyright: ignore[reportUnboundVariable]
+        if unhandled_exception is not None:
+            raise unhandled_exception
+        return metrics
+
+    def _stream_setup(self):
+        """Precompute the per-column layout used by the streaming decoder.
+
+        Must run after :meth:`_setup` has fixed the scan list.
+        """
+        scan_count = len(self._last_scan_internal_addresses)
+        self._stream_scan_count = scan_count
+        self._stream_time_channels = []
+        self._stream_columns = []
+        for ch in self.get_all_channels_list():
+            if ch.get_attribute('u2300a_type') == 'ain_time':
+                self._stream_time_channels.append(ch.get_name())
+            elif ch.get_attribute('u2300a_type') in self._waveform_channel_types:
+                column = self._last_scan_internal_addresses.index(
+                    ch.get_attribute('internal_address'))
+                self._stream_columns.append(
+                    (ch.get_name(), column) + self._scale_params(ch))
+        self._stream_partial = b''
+        self._stream_acquired = 0
+        self.point_idx = 0
+
+    def _stream_acquire(self):
+        """Poll the instrument once and return a raw data block if one is ready.
+
+        Runs in the acquisition thread of the streaming pipeline.
+
+        Returns:
+            bytes: Raw little-endian int16 readings, tagged with their byte
+            offset in the acquisition, or None if no complete block is
+            available yet.
+
+        Raises:
+            u2300aBufferOverflowError: If the instrument buffer overflowed.
+            Exception: If the status response is not understood.
+        """
+        resp = self.get_interface().ask('WAVeform:STATus?')
+        if resp == 'DATA':
+            # Indicates that at least one block of data is completed and
+            # ready to be read back.
+            self.get_interface().write('WAVeform:DATA?')
+            raw_data = self.get_interface().read_raw()
+            header = raw_data[:10]
+            assert header[:2] == b'#8'
+            block = _stream_block(raw_data[10:10 + int(header[2:])], self._stream_acquired)
+            self._stream_acquired += len(block)
+            return block
+        elif resp in ('FRAG', 'EPTY'):
+            # Acquisition started but no block complete yet, or nothing captured.
+            return None
+        elif resp == 'OVER':
+            # Indicates that the buffer is full and the acquisition is
+            # stopped.
+            raise u2300aBufferOverflowError('Too slow!')
+        raise Exception('Eh?')
+
+    def _stream_decode(self, raw_data):
+        """Scale one raw block into columns.
+
+        Runs in the decode thread of the streaming pipeline.  Readings
+        are interleaved by scan list position; a trailing partial scan is
+        carried over to the next block.  If the block does not start where
+        the previous one ended (blocks were dropped upstream), the carried
+        partial scan is discarded and decoding resumes at the block's next
+        whole scan, with ``point_idx`` advanced past the lost points.
+
+        Args:
+            raw_data: Raw block from :meth:`_stream_acquire`.  Untagged
+                bytes are taken to follow the previous block.
+
+        Returns:
+            dict: Column name to numpy array, including ``datetime``, or
+            None if the block did not complete a scan.
+        """
+        scan_bytes = 2 * self._stream_scan_count
+        expected = self.point_idx * scan_bytes + len(self._stream_partial)
+        offset = getattr(raw_data, 'offset', expected)
+        if offset != expected:
+            skip = -offset % scan_bytes
+            self._stream_partial = b''
+            self.point_idx = (offset + skip) // scan_bytes
+            raw_data = raw_data[skip:]
+        raw_data = self._stream_partial + raw_data
+        whole = len(raw_data) - len(raw_data) % scan_bytes
+        self._stream_partial = raw_data[whole:]
+        if not whole:
+            return None
+        int_data = numpy.frombuffer(raw_data, dtype='<i2', count=whole // 2).reshape(
+            -1, self._stream_scan_count)
+        points = int_data.shape[0]
+        daq_time = (self.point_idx + numpy.arange(points)) / self._sample_rate
+        self.point_idx += points
+        chunk = {}
+        for name in self._stream_time_channels:
+            chunk[name] = daq_time
+        for name, column, lsb, offset, shift in self._stream_columns:
+            chunk[name] = lsb * (int_data[:, column] >> shift) + offset
+        # Repair datetime by means of DAQ_time
+        timestamps = self._stream_start + numpy.round(daq_time * 1e6).astype('timedelta64[us]')
+        chunk['datetime'] = numpy.char.add(numpy.datetime_as_string(timestamps, unit='us'), 'Z')
+        return chunk
+
+    def _stream_store(self, chunk):
+        """Write one decoded chunk to the logger as a single executemany batch.
+
+        Runs in the storage thread of the streaming pipeline.
+
+        Args:
+            chunk: Columns from :meth:`_stream_decode`.
+        """
+        names = list(chunk)
+        columns = [chunk[name].tolist() for name in names]
+        self.logger.log_many([dict(zip(names, row)) for row in zip(*columns)])
 
     def _setup(self):
         scan_internal_addresses = [
@@ -1148,6 +1284,9 @@ class u2300a_datalogger(u2300a_scope):
             channel_count=len(scan_internal_addresses))
         self.data_buffer = {ia: collections.deque()
                             for ia in scan_internal_addresses}
+        self.stopping = False
+        self.stopped = False
+        self.time_since = time.time()
         self._point_count = int(self.get_interface().ask('ACQuire:SRATe?'))
         self.get_interface().write(
             f'WAVeform:POINts {self._point_count}')  # Target ~1s update??
@@ -8,9 +8,11 @@ import struct
 import abc
 
 try:
+    import numpy
     from numpy import fromiter, dtype
     numpy_missing = False
 except ImportError:
+    numpy = None  # type: ignore[assignment]
     fromiter = None  # type: ignore[assignment]
     dtype = None  # type: ignore[assignment]
     numpy_missing = True
@@ -18,18 +20,29 @@ except ImportError:
 
 class oscilloscope(scpi_instrument, delegator):
     """Oscilloscope."""
-    pass
+    # Waveform transfer settings cached by get_waveform_format() and
+    # get_waveform_scaling(); cleared by invalidate_waveform_cache().
+    _waveform_format = None
+    _waveform_scalings = None
+    _waveform_source = None
     # binary unpack
     # scaling
     # trigger status polling / timeout (force trigger)
 
-    def fetch_waveform_data(self):
-        # assumes :WAVeform:SOURce set correctly before call!
+    def fetch_waveform_data(self, source=None):
         """Return fetch waveform data result.
-        Sends the ``:WAVeform:BYTeorder`` SCPI command to the instrument.
-        Sends the ``Unknown`` SCPI command to the instrument.
+        Sends the ``:WAVeform:DATA`` SCPI command to the instrument.
 
-        Sends the corresponding SCPI command string to the instrument over the bus.
+        The data format, byte order and signedness are queried once and
+        cached (see :meth:`get_waveform_format`), and binary data is decoded
+        and scaled with numpy in one pass.
+
+        Args:
+            source: ``:WAVeform:SOURce`` argument to fetch, for example
+                ``'CHANnel1'``.  The source switch is sent together with the
+                data query and its preamble is cached.  If None,
+                ``:WAVeform:SOURce`` must already be set correctly and the
+                preamble is queried afresh.
 
         Returns:
             The fetched data.
@@ -37,63 +50,142 @@ class oscilloscope(scpi_instrument, delegator):
         Raises:
             Exception: If an unexpected error occurs.
         """
-        self.get_interface().write(':WAVeform:DATA?')
-        raw_data = self.get_interface().read_raw()
-        # Example: "#800027579 4.03266e-002, 1.25647e-004, 1.25647e-004, 1.25647e-004,......."
-        # Since bytes objects are sequences of integers (akin to a tuple), for
-        # a bytes object b, b[0] will be an integer, while b[0:1] will be a
-        # bytes object of length 1. (This contrasts with text strings, where
-        # both indexing and slicing will produce a string of length 1)
-        assert raw_data[0:1] == b'#'
-        raw_data_header_length = int(raw_data[1:2])
-        _raw_data_length_bytes = int(raw_data[2:raw_data_header_length + 2])  # noqa: F841
-        raw_data = raw_data[raw_data_header_length + 2:]  # remove header
+        if source is None:
+            # selected outside of set_waveform_source(); don't trust the cache
+            self._waveform_source = None
+            self.get_interface().write(':WAVeform:DATA?')
+            return self._decode_waveform_data(self.get_interface().read_raw())
+        return self.fetch_waveforms([source])[source]
+
+    def fetch_waveforms(self, sources):
+        """Fetch several waveforms, switching the waveform source for each.
+
+        Each source switch is sent in the same message as the data query
+        for that source.  The query for a source is sent before the
+        previous block is decoded, so decoding overlaps the instrument
+        preparing the next block.
+
+        Args:
+            sources: Iterable of ``:WAVeform:SOURce`` arguments, for
+                example ``['CHANnel1', 'CHANnel3']``.
 
+        Returns:
+            results_ord_dict: Source to fetched data, in request order.
+        """
+        sources = list(sources)
+        for source in sources:
+            # preamble queries need their own source switch; do them first so
+            # the data queries below can follow back to back
+            self._get_waveform_scaling(source)
+        self.get_waveform_format()
+        results = results_ord_dict()
+        pending = None
+        for source in sources:
+            if source == self._waveform_source:
+                self.get_interface().write(':WAVeform:DATA?')
+            else:
+                self.get_interface().write(f':WAVeform:SOURce {source};:WAVeform:DATA?')
+                self._waveform_source = source
+            if pending is not None:
+                results[pending[0]] = self._decode_waveform_data(pending[1], pending[0])
+            pending = (source, self.get_interface().read_raw())
+        if pending is not None:
+            results[pending[0]] = self._decode_waveform_data(pending[1], pending[0])
+        return results
+
+    def set_waveform_source(self, source):
+        """Select the ``:WAVeform:SOURce``, skipping the write if it is already selected.
+
+        Args:
+            source: Source argument, for example ``'CHANnel1'``.
+        """
+        if source != self._waveform_source:
+            self.get_interface().write(f':WAVeform:SOURce {source}')
+            self._waveform_source = source
+
+    def invalidate_waveform_cache(self):
+        """Forget cached waveform format, preambles and source selection.
+
+        Called automatically when any writable channel of this instrument is
+        written.  Call it directly after changing scope setup through the
+        interface rather than through channels.
+        """
+        self._waveform_format = None
+        self._waveform_scalings = None
+        self._waveform_source = None
+
+    def _add_channel(self, channel):
+        # setup channels may change the data format or any preamble
+        if channel.is_writeable():
+            channel.add_write_callback(lambda ch, value: self.invalidate_waveform_cache())
+        return super()._add_channel(channel)
+
+    def get_waveform_format(self):
+        """Return the binary layout of ``:WAVeform:DATA?`` responses, cached until invalidated.
+        Sends the ``:WAVeform:FORMat``, ``:WAVeform:BYTeorder`` and
+        ``:WAVeform:UNSigned`` SCPI commands to the instrument.
+
+        Returns:
+            dict: ``format`` ('WORD', 'BYTE' or 'ASC') and, for binary
+            formats, the ``struct`` code ``fmt`` including byte order.
+
+        Raises:
+            Exception: If an unexpected error occurs.
+        """
+        if self._waveform_format is not None:
+            return self._waveform_format
         data_format = self.get_interface().ask(':WAVeform:FORMat?')
         if data_format == 'WORD':
             byte_order = self.get_interface().ask(':WAVeform:BYTeorder?')
-            byte_type = self.get_interface().ask(':WAVeform:UNSigned?')
-            if int(byte_type) == 1:
-                fmt_str = 'H'
-            elif int(byte_type) == 0:
-                fmt_str = 'h'
-            else:
-                raise Exception(
-                    "I'm lost. Contact PyICe-developers@analog.com for more information.")
-            # Remove trailing newline; data should be even number of bytes.
-            assert len(raw_data[:-1]) % 2 == 0
+            byte_type = int(self.get_interface().ask(':WAVeform:UNSigned?'))
             if byte_order == 'LSBF':
-                data = struct.unpack(
-                    f'<{fmt_str * (len(raw_data[:-1]) // 2)}', raw_data[:-1])
+                order = '<'
             elif byte_order == 'MSBF':
-                data = struct.unpack(
-                    f'>{fmt_str * (len(raw_data[:-1]) // 2)}', raw_data[:-1])
+                order = '>'
             else:
                 raise Exception(
                     'Unknown WORD byte order. Contact PyICe-developers@analog.com for more information.')
-            data = self.scale_waveform_data(data)
+            code = {1: 'H', 0: 'h'}.get(byte_type)
         elif data_format == 'BYTE':
-            byte_type = self.get_interface().ask(':WAVeform:UNSigned?')
-            if int(byte_type) == 1:
-                fmt_str = 'B'
-            elif int(byte_type) == 0:
-                fmt_str = 'b'
-            else:
-                raise Exception(
-                    "I'm lost. Contact PyICe-developers@analog.com for more information.")
-            data = struct.unpack(
-                f'{fmt_str * len(raw_data[:-1])}', raw_data[:-1])
-            data = self.scale_waveform_data(data)
+            byte_type = int(self.get_interface().ask(':WAVeform:UNSigned?'))
+            order = '<'
+            code = {1: 'B', 0: 'b'}.get(byte_type)
         elif data_format == 'ASC':
-            raw_data = raw_data.decode(encoding='latin-1').split(',')
-            data = [float(x) for x in raw_data]
-            print(list(data)[:100])
+            order = code = ''
         else:
             raise Exception(
                 f'Unknown data format: {data_format}. Contact PyICe-developers@analog.com for more information.')
-        return data
+        if code is None:
+            raise Exception(
+                "I'm lost. Contact PyICe-developers@analog.com for more information.")
+        self._waveform_format = {'format': data_format, 'fmt': order + code}
+        return self._waveform_format
+
+    def _decode_waveform_data(self, raw_data, source=None):
+        # Example: "#800027579 4.03266e-002, 1.25647e-004, 1.25647e-004, 1.25647e-004,......."
+        # Since bytes objects are sequences of integers (akin to a tuple), for
+        # a bytes object b, b[0] will be an integer, while b[0:1] will be a
+        # bytes object of length 1. (This contrasts with text strings, where
+        # both indexing and slicing will produce a string of length 1)
+        assert raw_data[0:1] == b'#'
+        raw_data_header_length = int(raw_data[1:2])
+        raw_data_length_bytes = int(raw_data[2:raw_data_header_length + 2])
+        # remove header and trailing newline
+        raw_data = raw_data[raw_data_header_length + 2:raw_data_header_length + 2 + raw_data_length_bytes]
+        waveform_format = self.get_waveform_format()
+        if waveform_format['format'] == 'ASC':
+            raw_data = raw_data.decode(encoding='latin-1').split(',')
+            return [float(x) for x in raw_data]
+        fmt = waveform_format['fmt']
+        point_count = len(raw_data) // struct.calcsize(fmt)
+        assert point_count * struct.calcsize(fmt) == len(raw_data)
+        if not numpy_missing:
+            data = numpy.frombuffer(raw_data, dtype=numpy.dtype(fmt))
+        else:
+            data = struct.unpack(f'{fmt[0]}{point_count}{fmt[1]}', raw_data)
+        return self.scale_waveform_data(data, source)
 
-    def scale_waveform_data(self, data):
+    def scale_waveform_data(self, data, source=None):
         # Data Conversion
         # Word or byte data sent from the oscilloscope must be scaled for useful
         # interpretation. The values used to interpret the data are the X and Y references, X
@@ -130,26 +222,24 @@ class oscilloscope(scpi_instrument, delegator):
         Supports the ``oscilloscope`` workflow by performing the described operation.
 
         Args:
-            data: Data to write.
+            data: Raw integer codes, preferably a numpy array.
+            source: Waveform source the data came from.  If None, the
+                preamble of the currently selected source is queried.
 
         Returns:
             The scale waveform data result.
         """
-        waveform_scaling = self.get_waveform_scaling()
-        data = map(
-            lambda pt: (
-                (pt -
-                 waveform_scaling['yreference']) *
-                waveform_scaling['yincrement']) +
-            waveform_scaling['yorigin'],
-            data)
+        waveform_scaling = self._get_waveform_scaling(source)
+        yreference = waveform_scaling['yreference']
+        yincrement = waveform_scaling['yincrement']
+        yorigin = waveform_scaling['yorigin']
         if not numpy_missing:
             # This will cause trouble if _set_type_affinity('BLOB') isn't on.
-            return fromiter(data, dtype=dtype('<d'))
-        return list(data)
+            return (numpy.asarray(data, dtype=dtype('<d')) - yreference) * yincrement + yorigin
+        return [(pt - yreference) * yincrement + yorigin for pt in data]
 
-    def get_waveform_scaling(self):
-        # Requires Waveform Source to be previously set
+    def get_waveform_scaling(self, source=None):
+        # Requires Waveform Source to be previously set if source is None
         """Return the waveform scaling.
         Sends the ``:WAVeform:PREamble`` SCPI command to the instrument.
         Queries the instrument for its current waveform scaling and returns
@@ -157,9 +247,23 @@ class oscilloscope(scpi_instrument, delegator):
 
         Sends the corresponding SCPI command string to the instrument over the bus.
 
+        The preamble is cached per waveform source until a setup channel
+        is written (see :meth:`invalidate_waveform_cache`).
+
+        Args:
+            source: ``:WAVeform:SOURce`` argument.  If None, the currently
+                selected source is queried without caching.
+
         Returns:
             The current waveform scaling.
         """
+        return dict(self._get_waveform_scaling(source))
+
+    def _get_waveform_scaling(self, source=None):
+        if source is not None:
+            if self._waveform_scalings is not None and source in self._waveform_scalings:
+                return self._waveform_scalings[source]
+            self.set_waveform_source(source)
         waveform_scaling = {}
         preamble = self.get_interface().ask(':WAVeform:PREamble?')
         (waveform_scaling['fmt'],
@@ -175,7 +279,10 @@ class oscilloscope(scpi_instrument, delegator):
         waveform_scaling['yincrement'] = float(yincrement)
         waveform_scaling['yorigin'] = float(yorigin)
         waveform_scaling['yreference'] = int(yreference)
-
+        if source is not None:
+            if self._waveform_scalings is None:
+                self._waveform_scalings = {}
+            self._waveform_scalings[source] = waveform_scaling
         return waveform_scaling
 
     @abc.abstractmethod
@@ -0,0 +1,154 @@
+"""Scan list handling shared by the 34970A/34972A and DAQ970A drivers.
+
+>>> from PyICe.lab_instruments.scan_mainframe import scan_mainframe
+
+"""
+import weakref
+
+try:
+    import numpy
+    numpy_missing = False
+except ImportError:
+    numpy = None  # type: ignore[assignment]
+    numpy_missing = True
+
+# ROUTe:SCAN is a single setting of the mainframe, shared by every plugin
+# object talking to it, so the scan list last programmed is tracked per
+# interface rather than per instrument object.
+_scan_states = weakref.WeakKeyDictionary()
+
+
+class _scan_state(object):
+    """Scan list last programmed into one mainframe."""
+
+    def __init__(self):
+        """Initialize _scan_state with nothing programmed."""
+        self.config_generation = 0
+        self.scan_generation = None
+        self.scan_addresses = None
+        self.scanlist_ordered = []
+        self.monitor = None
+
+
+def _decode_readings(txt):
+    """Convert a ``READ?``/``FETCh?`` response into a list of floats.
+
+    >>> _decode_readings('+1.00000000E+00,-2.50000000E-03,+9.90000000E+37')
+    [1.0, -0.0025, 9.9e+37]
+
+    Args:
+        txt: Comma separated readings, as sent with all FORMat:READing
+            fields turned off.
+
+    Returns:
+        list: One float per reading.
+    """
+    if numpy_missing:
+        return [float(val) for val in txt.split(',')]
+    return numpy.fromstring(txt, sep=',').tolist()
+
+
+class scan_mainframe(object):
+    """Mixin giving mainframe plugin instruments a cached ``ROUTe:SCAN`` list.
+
+    The scan list last programmed into a mainframe is kept per interface
+    and reused by _scan() until the scanned channels change or a channel is
+    reconfigured.  Mixed into a3497xa_instrument and daq970a_instrument
+    ahead of scpi_instrument.
+    """
+
+    def _get_scan_state(self):
+        interface = self._interfaces[0]
+        try:
+            return _scan_states[interface]
+        except KeyError:
+            return _scan_states.setdefault(interface, _scan_state())
+
+    def get_config_generation(self):
+        """Return the configuration generation of the mainframe.
+
+        The count goes up whenever a channel of any plugin sharing this
+        mainframe is reconfigured.  The scan list written by
+        read_delegated_channel_list() is reused only while it is unchanged.
+
+        Returns:
+            int: Configuration generation.
+        """
+        return self._get_scan_state().config_generation
+
+    def invalidate_scanlist(self):
+        """Make the next scan rewrite and read back the mainframe scan list.
+
+        Configuration setters of this driver do this automatically.  Call it
+        after sending configuration commands to the mainframe by other means.
+        """
+        self._get_scan_state().config_generation += 1
+
+    def _write_config(self, cmd):
+        # CONFigure rewrites the mainframe scan list, so treat every
+        # configuration write as making the programmed scan list stale.
+        self.invalidate_scanlist()
+        self.get_interface().write(cmd)
+
+    def _program_scanlist(self, state, scan_internal_addresses):
+        """Write the scan list, then read it back to learn channel order.
+
+        Reading fields are turned off in the same message so that readings
+        come back as bare comma separated numbers.
+
+        Args:
+            state: _scan_state of the mainframe.
+            scan_internal_addresses: Set of internal addresses to scan.
+
+        Raises:
+            Exception: If the scan list readback is garbled.
+        """
+        addresses = ','.join(str(internal_address)
+                             for internal_address in sorted(scan_internal_addresses))
+        txt_scanlist = self.get_interface().ask(
+            "FORMat:READing:ALARm OFF;:FORMat:READing:CHANnel OFF;"
+            ":FORMat:READing:TIME OFF;:FORMat:READing:UNIT OFF;"
+            f":ROUTe:SCAN (@{addresses});:ROUTe:SCAN?")
+        try:
+            txt_scanlist = txt_scanlist.split("(@")[1]
+        except BaseException:
+            state.scan_addresses = None
+            print('Communication problem; attempting resyc.')
+            self.get_interface().resync()
+            raise Exception('Resync complete; better luck next time.')
+        txt_scanlist = txt_scanlist.strip(")'\n")
+        state.scanlist_ordered = list(map(int, txt_scanlist.split(",")))
+        state.scan_addresses = set(scan_internal_addresses)
+        state.scan_generation = state.config_generation
+        state.monitor = None
+
+    def _scan(self, state, scan_internal_addresses):
+        """Scan *scan_internal_addresses* once and return the readings in scan order.
+
+        The scan list is only rewritten when it differs from the one last
+        programmed into the mainframe, or when a channel was reconfigured
+        since, so repeated reads of the same channels take a single
+        ``READ?`` round trip.
+
+        Args:
+            state: _scan_state of the mainframe.
+            scan_internal_addresses: Set of internal addresses to scan.
+
+        Returns:
+            list: Float readings, ordered like state.scanlist_ordered.
+
+        Raises:
+            Exception: If the reading count does not match the scan list
+                even after reprogramming it.
+        """
+        for _attempt in range(2):
+            if state.scan_generation != state.config_generation \
+               or state.scan_addresses != scan_internal_addresses:
+                self._program_scanlist(state, scan_internal_addresses)
+            vals = _decode_readings(self.get_interface().ask("READ?"))
+            if len(vals) == len(state.scanlist_ordered):
+                return vals
+            # scan list changed behind our back, from the front panel for example
+            self.invalidate_scanlist()
+        raise Exception(
+            f'{self.get_name()}: scan returned {len(vals)} readings for {len(state.scanlist_ordered)} channels.')
@@ -146,6 +146,10 @@ class communication_node(object):
     True
 
     concurrent data collection."""
+    # Shared by every node.  Bumped whenever the tree shape or a thread-safety
+    # flag changes so that cached thread groupings (lab_core.scan_plan) can
+    # tell they are stale without walking the tree.
+    _com_node_generation = 0
 
     def __init__(self, *args, **kwargs):
         """Initialize the communication node with no parent and an unlocked state.
@@ -172,6 +176,26 @@ class communication_node(object):
         self._thread_safe = False
         self._children = []
         self._lock = multiprocessing.RLock()
+        communication_node._com_node_generation += 1
+
+    @staticmethod
+    def get_com_node_generation():
+        """Return the process-wide communication node tree generation.
+
+        The value increases every time any node is created, re-parented or
+        has its thread safety changed.
+
+
+        >>> from PyICe.lab_interfaces import communication_node
+        >>> before = communication_node.get_com_node_generation()
+        >>> communication_node().set_com_node_thread_safe(True)
+        >>> communication_node.get_com_node_generation() > before
+        True
+
+        Returns:
+            int: Monotonically increasing counter.
+        """
+        return communication_node._com_node_generation
 
     def debug_com_nodes(self, indent=""):
         """Print the communication-node tree to stdout for debugging.
@@ -267,6 +291,7 @@ class communication_node(object):
             safe: ``True`` if concurrent access through this node is safe.
         """
         self._thread_safe = safe
+        communication_node._com_node_generation += 1
 
     def com_node_register_child(self, child):
         """Add a child node to this node's list of dependents.
@@ -286,6 +311,7 @@ class communication_node(object):
             child: The ``communication_node`` to register as a child.
         """
         self._children.append(child)
+        communication_node._com_node_generation += 1
 
     def com_node_get_root(self):
         """Walk up the parent chain and return the root communication node.
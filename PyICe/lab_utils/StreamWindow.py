@@ -26,6 +26,12 @@ class StreamWindow(object):
     buffer. This makes incremental peek-based parsing impossible.
     StreamWindow was developed to fill that gap.
 
+    The FIFO is a ring buffer: consuming bytes only advances the head
+    index, so ``read()`` costs the same no matter how large ``buffer_size``
+    is. ``peek_view()`` and ``read_view()`` return ``memoryview`` objects
+    into the ring instead of copies, for parsers that only need to decode
+    the bytes in place.
+
     Examples:
         >>> import io
         >>> sw = StreamWindow(io.BytesIO(b'hello world'), buffer_size=64)
@@ -39,6 +45,13 @@ class StreamWindow(object):
         6
         >>> sw.read(6)  # consume the rest
         bytearray(b' world')
+        >>> sw = StreamWindow(io.BytesIO(b'abcdefgh'), buffer_size=6)
+        >>> sw.peek(4), sw.read(3)
+        (bytearray(b'abcd'), bytearray(b'abc'))
+        >>> sw.peek(5)  # content now wraps around the end of the ring
+        bytearray(b'defgh')
+        >>> bytes(sw.peek_view(5))
+        b'defgh'
     """
     # FYI: This class should be here in PyICe.lab_utils rather than corraled in labcomm
     # because it is generally applicable to any I/O stream that follows the io.RawIOBase
@@ -74,15 +87,16 @@ class StreamWindow(object):
         self.stream = stream
         self.buf = bytearray(buffer_size * b'\x00')
         self.buffer_size = buffer_size
+        self.head = 0  # Position in buf of the oldest valid byte.
         self.content_size = 0
         self.debug = debug
 
     def _shift_buffer(self, num_bytes):
-        """Discard the first *num_bytes* from the buffer by sliding remaining data forward.
+        """Discard the first *num_bytes* from the buffer by advancing the ring head.
 
-        After this operation the first ``num_bytes`` positions in the buffer
-        are freed for new data from the underlying stream. The valid content
-        that was beyond *num_bytes* is moved to the front of the buffer.
+        After this operation the ``num_bytes`` positions at the head of the
+        ring are freed for new data from the underlying stream. Nothing is
+        copied; the caller is responsible for ``content_size``.
 
 
         >>> from PyICe.lab_utils.StreamWindow import StreamWindow
@@ -93,7 +107,72 @@ class StreamWindow(object):
             num_bytes: How many bytes to remove from the head of the
                 internal buffer.
         """
-        self.buf[:self.buffer_size - num_bytes] = self.buf[num_bytes:]
+        self.head = (self.head + num_bytes) % self.buffer_size
+
+    def _copy(self, start, stop):
+        """Return a copy of buffered content between two FIFO offsets.
+
+        >>> from PyICe.lab_utils.StreamWindow import StreamWindow
+        >>> hasattr(StreamWindow, '_copy')
+        True
+
+        Args:
+            start: Offset from the head of the first byte, ``0 <= start``.
+            stop: Offset from the head past the last byte,
+                ``start <= stop <= content_size``.
+
+        Returns:
+            A ``bytearray`` joining the one or two pieces of the ring that hold the bytes.
+        """
+        first = self.head + start
+        last = self.head + stop
+        if last <= self.buffer_size:
+            return self.buf[first:last]
+        if first >= self.buffer_size:
+            return self.buf[first - self.buffer_size:last - self.buffer_size]
+        return self.buf[first:] + self.buf[:last - self.buffer_size]
+
+    def _write_buffer(self, new_bytes):
+        """Append *new_bytes* at the tail of the ring.
+
+        The caller must ensure they fit in the free space.
+
+        >>> from PyICe.lab_utils.StreamWindow import StreamWindow
+        >>> hasattr(StreamWindow, '_write_buffer')
+        True
+
+        Args:
+            new_bytes: Bytes read from the stream.
+        """
+        num_bytes = len(new_bytes)
+        tail = (self.head + self.content_size) % self.buffer_size
+        first_piece = min(num_bytes, self.buffer_size - tail)
+        self.buf[tail:tail + first_piece] = new_bytes[:first_piece]
+        if first_piece < num_bytes:
+            self.buf[:num_bytes - first_piece] = new_bytes[first_piece:]
+        self.content_size += num_bytes
+
+    def _contiguous(self, num_bytes):
+        """Return a memoryview of the first *num_bytes* buffered bytes.
+
+        If those bytes straddle the end of the ring, the content is first
+        rotated to the start of ``buf``. That happens at most once per trip
+        around the ring, so it adds no per-packet cost.
+
+        >>> from PyICe.lab_utils.StreamWindow import StreamWindow
+        >>> hasattr(StreamWindow, '_contiguous')
+        True
+
+        Args:
+            num_bytes: Number of bytes, ``<= content_size``.
+
+        Returns:
+            A ``memoryview`` of ``buf``.
+        """
+        if self.head + num_bytes > self.buffer_size:
+            self.buf[:self.content_size] = self._copy(0, self.content_size)
+            self.head = 0
+        return memoryview(self.buf)[self.head:self.head + num_bytes]
 
     def _read_buffer(self, num_bytes):
         """Consume and return *num_bytes* from the head of the FIFO buffer.
@@ -116,7 +195,7 @@ class StreamWindow(object):
         """
         assert num_bytes <= self.content_size
         # Save result bytes into new bytearray.
-        result = bytearray(self.buf[:num_bytes])
+        result = self._copy(0, num_bytes)
         self._shift_buffer(num_bytes)
         self.content_size -= num_bytes
         return result
@@ -175,25 +254,23 @@ class StreamWindow(object):
                 content range.
         """
         if isinstance(k, int):
-            if (k > 0 and k >= self.content_size) or (
+            if (k >= 0 and k >= self.content_size) or (
                     k < 0 and -k > self.content_size):
                 raise IndexError
             k = k if k >= 0 else self.content_size + k
-        elif isinstance(k, slice):
-            # Need to adjust the slice argument based on content_size.
-            start, stop, step = k.indices(self.content_size)
-            k = slice(start, stop, step)
-        return self.buf[k]
+            return self.buf[(self.head + k) % self.buffer_size]
+        # Need to adjust the slice argument based on content_size.
+        start, stop, step = k.indices(self.content_size)
+        if step == 1:
+            return self._copy(start, max(start, stop))
+        return self._copy(0, self.content_size)[start:stop:step]
 
     def find(self, sub, start=0, end=None):
         """Return the lowest index in the FIFO buffer where *sub* is found.
 
         Search only the valid buffered content (ignoring any stale bytes
-        beyond ``content_size``). Returns ``-1`` if *sub* is not present.
-
-        Note: The *start* and *end* parameters are accepted for API
-        compatibility but are not used; the search always covers the
-        full valid buffer range ``[0, content_size)``.
+        beyond ``content_size``), including matches that straddle the end
+        of the ring. Returns ``-1`` if *sub* is not present.
 
         Examples:
             >>> import io
@@ -204,18 +281,42 @@ class StreamWindow(object):
             6
             >>> sw.find(b'xyz')  # not found
             -1
+            >>> sw.find(b'o', 5)  # search from offset 5
+            7
 
         Args:
             sub: The byte sequence to search for (``bytes`` or
-                ``bytearray``).
-            start: Reserved for API compatibility; currently unused.
-            end: Reserved for API compatibility; currently unused.
+                ``bytearray``), or a single byte value (``int``).
+            start: Offset from the head to start searching at, interpreted
+                as in slice notation.
+            end: Offset from the head to stop searching at, interpreted as
+                in slice notation. Defaults to the end of the content.
 
         Returns:
             The zero-based index of the first occurrence of *sub* within
             the buffered content, or ``-1`` if not found.
         """
-        return self.buf.find(sub, 0, self.content_size)
+        if isinstance(sub, int):
+            sub = bytes((sub,))
+        start, end, _ = slice(start, end).indices(self.content_size)
+        # Content occupies buf[head:] followed, once it wraps, by buf[:tail].
+        first_len = self.buffer_size - self.head
+        if end <= first_len:
+            idx = self.buf.find(sub, self.head + start, self.head + end)
+            return idx - self.head if idx >= 0 else -1
+        if start >= first_len:
+            idx = self.buf.find(sub, start - first_len, end - first_len)
+            return idx + first_len if idx >= 0 else -1
+        idx = self.buf.find(sub, self.head + start, self.buffer_size)
+        if idx >= 0:
+            return idx - self.head
+        # A match straddling the wrap point starts within len(sub) - 1 bytes of it.
+        straddle_start = max(start, first_len - len(sub) + 1)
+        idx = self._copy(straddle_start, min(end, first_len + len(sub) - 1)).find(sub)
+        if idx >= 0:
+            return straddle_start + idx
+        idx = self.buf.find(sub, 0, end - first_len)
+        return idx + first_len if idx >= 0 else -1
 
     def read(self, num=1):
         """Read and consume up to *num* bytes from the FIFO-buffered stream.
@@ -336,11 +437,9 @@ class StreamWindow(object):
                 available = 0  # Support streams without in(_w|W)aiting.
             how_many = max(available, num_bytes_from_stream)
             how_many = min(how_many, self.buffer_size - self.content_size)
-            new_bytes = self.stream.read(how_many)
-            self.buf[self.content_size:self.content_size +
-                     len(new_bytes)] = new_bytes
-            # Updated count of valid bytes in buffer.
-            self.content_size += len(new_bytes)
+            new_bytes = self.stream.read(how_many) if how_many else b''
+            # Appending also updates the count of valid bytes in buffer.
+            self._write_buffer(new_bytes)
             if self.debug:
                 print(("  peek({}) read {} new bytes from stream. "
                        "FIFO now has {:d} bytes").format(num, len(new_bytes), self.content_size), end=' ')
@@ -355,7 +454,58 @@ class StreamWindow(object):
         # The buffer now contains the bytes we'll return. Return a copy of
         # these bytes.
         num_bytes_to_return = min(num, self.content_size)
-        result = bytearray(self.buf[:num_bytes_to_return])
+        result = self._copy(0, num_bytes_to_return)
+        return result
+
+    def peek_view(self, num=1):
+        """Like ``peek()``, but return a ``memoryview`` into the FIFO instead of a copy.
+
+        The view stays valid until the next ``peek()``, ``peek_view()``,
+        ``read()`` or ``read_view()`` call. Convert it with ``bytes()`` to keep it.
+
+        Examples:
+            >>> import io, struct
+            >>> sw = StreamWindow(io.BytesIO(b'\\x00\\x05rest'), buffer_size=32)
+            >>> struct.unpack_from('>H', sw.peek_view(2))
+            (5,)
+            >>> len(sw)  # still buffered
+            2
+
+        Args:
+            num: Maximum number of bytes to peek at. Clamped to
+                ``buffer_size`` if larger. Must be positive.
+
+        Returns:
+            A read-only ``memoryview`` of up to *num* bytes.
+        """
+        num_bytes = len(self.peek(num)) if num > self.content_size else num
+        return self._contiguous(num_bytes).toreadonly()
+
+    def read_view(self, num=1):
+        """Like ``read()``, but return a ``memoryview`` into the FIFO instead of a copy.
+
+        Unlike ``read()``, bytes always pass through the FIFO, so at most
+        ``buffer_size`` bytes are returned per call. The view stays valid
+        until the next ``peek()``, ``peek_view()``, ``read()`` or
+        ``read_view()`` call, which may overwrite the consumed bytes.
+
+        Examples:
+            >>> import io
+            >>> sw = StreamWindow(io.BytesIO(b'abcdef'), buffer_size=32)
+            >>> bytes(sw.read_view(4))
+            b'abcd'
+            >>> sw.read(2)
+            bytearray(b'ef')
+
+        Args:
+            num: Maximum number of bytes to consume. Must be positive.
+
+        Returns:
+            A read-only ``memoryview`` of up to *num* consumed bytes.
+        """
+        result = self.peek_view(num)
+        self._shift_buffer(len(result))
+        self.content_size -= len(result)
         return result
 
     def close(self):
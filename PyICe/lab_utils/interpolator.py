@@ -1,4 +1,4 @@
-"""Linear interpolator implemented in pure Python.
+"""Linear interpolator backed by sorted point arrays.
 
 >>> from PyICe.lab_utils.interpolator import interpolator
 
@@ -23,7 +23,9 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
 
+import bisect
 import operator
+import numpy
 
 
 class interpolator(object):
@@ -46,6 +48,8 @@ class interpolator(object):
     >>> multi = interpolator([[0, 0], [1, 10], [2, 40], [3, 90]])
     >>> multi(1.5)
     25.0
+    >>> multi([0.5, 1.5, 4])
+    array([  5.,  25., 140.])
     """
     def __init__(self, points_list=None):
         """Create an interpolator, optionally pre-loaded with calibration points.
@@ -66,24 +70,32 @@ class interpolator(object):
         """
         self._points = []
         self._points_ysort = []
+        self._x_pts = []
+        self._y_pts = []
+        self._ysort_x_pts = []
+        self._ysort_y_pts = []
         self.y_slope = 0
         if points_list is not None:
             self.add_points(points_list)
-            self.sort()
+        self.sort()
 
     def __call__(self, x_value):
         """Interpolate (or extrapolate) to find y at the given x.
-        Enables calling the object as a function.
 
-        Makes the object callable like a function.
+        Accepts a single number or an array-like of x values; arrays are
+        evaluated in one vectorised pass and return a float ndarray.
 
 
         >>> from PyICe.lab_utils.interpolator import interpolator
-        >>> hasattr(interpolator, '__call__')
-        True
+        >>> interp = interpolator([[0, 0], [10, 100]])
+        >>> interp(2.5)
+        25.0
+        >>> interp(numpy.array([[1, 2], [3, 20]]))
+        array([[ 10.,  20.],
+               [ 30., 200.]])
 
         Args:
-            x_value: X coordinate to evaluate.
+            x_value: X coordinate(s) to evaluate.
         """
         return self.get_y_val(x_value)
 
@@ -127,6 +139,15 @@ class interpolator(object):
         self._points.sort(key=operator.itemgetter(0))  # increasing values in x
         self._points_ysort = sorted(self._points, key=operator.itemgetter(1))
         # increasing values in y
+        # lookup tables: lists for bisect on scalars, arrays for searchsorted
+        self._x_pts = [pt[0] for pt in self._points]
+        self._y_pts = [pt[1] for pt in self._points]
+        self._ysort_x_pts = [pt[0] for pt in self._points_ysort]
+        self._ysort_y_pts = [pt[1] for pt in self._points_ysort]
+        self._x_arr = numpy.array(self._x_pts, dtype=float)
+        self._y_arr = numpy.array(self._y_pts, dtype=float)
+        self._ysort_x_arr = numpy.array(self._ysort_x_pts, dtype=float)
+        self._ysort_y_arr = numpy.array(self._ysort_y_pts, dtype=float)
 
     def add_point(self, x_val, y_val):
         """Add a single calibration point and re-sort.
@@ -164,7 +185,9 @@ class interpolator(object):
             point_list: List of [x, y] pairs.
         """
         for point in point_list:
-            self.add_point(point[0], point[1])
+            self._points.append([point[0], point[1]])
+        self.sort()
+        self.check_monotonicity()
 
     def find(self, key, sorted_key_list, value_list):
         """Function operates independent of object internal data.
@@ -188,38 +211,62 @@ class interpolator(object):
             value_list: Value list to use.
 
         Returns:
-            The index of the first match, or -1 if not found.
+            The value interpolated (or extrapolated) at *key*.
 
         Raises:
             Exception: If an unexpected error occurs.
         """
-        points = list(zip(sorted_key_list, value_list))
-        if len(points) < 2:
+        n = min(len(sorted_key_list), len(value_list))
+        if n < 2:
             raise Exception('At least two points are required '
                             'to define a line.')
-        low_pts = [pt for pt in points if pt[0] <= key]
-        high_pts = [pt for pt in points if pt[0] >= key]
-        if len(low_pts) == 0:
+        i = bisect.bisect_left(sorted_key_list, key, 0, n)
+        if i < n and sorted_key_list[i] == key:
+            return value_list[i]
+        if i == 0:
             # no points below value; extrapolate from first two points
-            # print 'Bottom extrapolation'
-            low_pt = points[0]
-            high_pt = points[1]
-        elif len(high_pts) == 0:
+            i = 1
+        elif i == n:
             # no points above value; extrapolate from last two points
-            # print 'Top extrapolation'
-            low_pt = points[-2]
-            high_pt = points[-1]
-        else:
-            # interpolate between points lower and higher than key argument
-            # print 'Interpolation'
-            low_pt = low_pts[-1]
-            high_pt = high_pts[0]
-        if low_pt == high_pt:
-            # avoid divide by 0
-            return low_pt[1]
-        else:
-            slope = float(high_pt[1] - low_pt[1]) / (high_pt[0] - low_pt[0])
-            return low_pt[1] + (key - low_pt[0]) * slope
+            i = n - 1
+        # interpolate between points lower and higher than key argument
+        low_x, high_x = sorted_key_list[i - 1], sorted_key_list[i]
+        low_y, high_y = value_list[i - 1], value_list[i]
+        slope = float(high_y - low_y) / (high_x - low_x)
+        return low_y + (key - low_x) * slope
+
+    @staticmethod
+    def find_array(keys, sorted_key_array, value_array):
+        """Vectorised :meth:`find` over an array of keys.
+
+        Uses ``numpy.searchsorted`` to locate every key's segment at once.
+        Keys beyond either end are extrapolated from the end segment.
+
+
+        >>> interpolator.find_array([-5, 0, 5, 10], numpy.array([0., 10.]), numpy.array([0., 100.]))
+        array([-50.,   0.,  50., 100.])
+
+        Args:
+            keys: Array-like of lookup keys.
+            sorted_key_array: Strictly increasing float ndarray.
+            value_array: Float ndarray of values matching *sorted_key_array*.
+
+        Returns:
+            numpy.ndarray: Interpolated values, shaped like *keys*.
+
+        Raises:
+            Exception: If fewer than two points are supplied.
+        """
+        n = len(sorted_key_array)
+        if n < 2:
+            raise Exception('At least two points are required '
+                            'to define a line.')
+        keys = numpy.asarray(keys, dtype=float)
+        low = numpy.clip(numpy.searchsorted(sorted_key_array, keys, side='right') - 1, 0, n - 2)
+        low_x = sorted_key_array[low]
+        low_y = value_array[low]
+        slope = (value_array[low + 1] - low_y) / (sorted_key_array[low + 1] - low_x)
+        return low_y + (keys - low_x) * slope
 
     def get_x_val(self, y_val):
         """Return the x val.
@@ -241,8 +288,9 @@ class interpolator(object):
         Returns:
             The current x val.
         """
-        [x_pts, y_pts] = list(zip(*self._points_ysort))
-        return self.find(y_val, y_pts, x_pts)
+        if isinstance(y_val, (list, tuple, numpy.ndarray)):
+            return self.find_array(y_val, self._ysort_y_arr, self._ysort_x_arr)
+        return self.find(y_val, self._ysort_y_pts, self._ysort_x_pts)
 
     def get_y_val(self, x_val):
         """Return the y val.
@@ -264,8 +312,9 @@ class interpolator(object):
         Returns:
             The current y val.
         """
-        [x_pts, y_pts] = list(zip(*self._points))
-        return self.find(x_val, x_pts, y_pts)
+        if isinstance(x_val, (list, tuple, numpy.ndarray)):
+            return self.find_array(x_val, self._x_arr, self._y_arr)
+        return self.find(x_val, self._x_pts, self._y_pts)
 
 
 def cmp(a, b):
@@ -5,6 +5,7 @@ Examples:
 """
 import datetime
 import sqlite3
+import pathlib
 import re
 import ast
 import numpy
@@ -24,6 +25,218 @@ ChannelFailure = collections.namedtuple('ChannelFailure', ['exception_type', 'me
 'bus timeout'
 """
 
+QueryPlanStep = collections.namedtuple('QueryPlanStep', ['id', 'parent', 'detail', 'full_scan'])
+"""One row of ``EXPLAIN QUERY PLAN`` output, as returned by :meth:`sqlite_data.explain`.
+
+``full_scan`` is ``True`` for steps that read every row of a table or
+index (``SCAN ...``) rather than seeking into it (``SEARCH ...``).
+
+>>> from PyICe.lab_utils.sqlite_data import QueryPlanStep
+>>> QueryPlanStep(id=2, parent=0, detail='SCAN log', full_scan=True).full_scan
+True
+"""
+
+_FULL_SCAN = re.compile(r'^SCAN (?!CONSTANT ROW)')
+_ISO_TIMESTAMP = re.compile(r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d+)?Z$')
+
+
+class _column_builder(object):
+    """Accumulate one query column, chunk by chunk, into a typed numpy array.
+
+    The column kind is chosen from the declared SQLite type and the Python
+    types found in each chunk.  Integer, real, ISO timestamp and PyICeBLOB
+    columns are converted a whole chunk at a time; anything else falls back
+    to an object array with the registered converter applied per cell.
+
+    >>> b = _column_builder(3)
+    >>> b.append((1, 2))
+    >>> b.append((3.5,))
+    >>> b.finish()
+    array([1. , 2. , 3.5])
+    >>> b = _column_builder(2, 'DATETIME')
+    >>> b.append(('2026-01-02T03:04:05.000006Z', None))
+    >>> b.finish()
+    array(['2026-01-02T03:04:05.000006',                        'NaT'],
+          dtype='datetime64[us]')
+    """
+
+    _dtypes = {'int': numpy.int64,
+               'float': numpy.float64,
+               'datetime': 'datetime64[us]'}
+    _missing = {'float': numpy.nan,
+                'datetime': numpy.datetime64('NaT')}
+
+    def __init__(self, length, declared_type=None):
+        """Preallocate storage for *length* rows.
+
+        Args:
+            length: Expected row count.  The array grows if more rows arrive.
+            declared_type: SQLite declared type of the column, or ``None`` if
+                unknown (expressions, parameterized queries).
+        """
+        self.length = length
+        self.declared_type = declared_type.split()[0].upper() if declared_type else None
+        self.converter = sqlite3.converters.get(self.declared_type)
+        self.kind = None
+        self.array = None
+        self.filled = 0
+        self._blob_dtypes = {}
+
+    def _classify(self, values):
+        """Return the column kind needed to hold *values*.
+
+        Args:
+            values: One chunk of raw column values.
+
+        Returns:
+            One of 'null', 'int', 'float', 'datetime', 'str', 'blob', 'object'.
+        """
+        types = set(map(type, values))
+        has_null = type(None) in types
+        types.discard(type(None))
+        if not types:
+            return 'null'
+        if types <= {int}:
+            return 'float' if has_null else 'int'
+        if types <= {int, float}:
+            return 'float'
+        if types == {str}:
+            if self.declared_type == 'DATETIME' or (
+                    self.declared_type is None
+                    and all(_ISO_TIMESTAMP.match(v) for v in values if v is not None)):
+                return 'datetime'
+            if self.converter is None:
+                return 'str'
+        if types == {bytes} and (self.declared_type == 'PYICEBLOB' or (
+                self.declared_type is None
+                and all(self._decode_blob(v) is not None for v in values if v is not None))):
+            return 'blob'
+        return 'object'
+
+    def _merge(self, kind):
+        """Widen the column kind so it can hold both existing rows and *kind*.
+
+        Args:
+            kind: Kind of the incoming chunk.
+        """
+        if self.kind is None or self.kind == 'null':
+            target = 'float' if kind == 'int' and self.filled else kind
+        elif kind == self.kind:
+            return
+        elif kind == 'null':
+            target = 'float' if self.kind == 'int' else self.kind
+        elif {self.kind, kind} == {'int', 'float'}:
+            target = 'float'
+        else:
+            target = 'object'
+        if target == self.kind:
+            return
+        dtype = self._dtypes.get(target, object)
+        if self.kind not in (None, 'null'):
+            self.array = self.array.astype(dtype)
+        elif target != 'null':
+            self.array = numpy.empty(self.length, dtype=dtype)
+            if self.filled:
+                # Rows seen so far were all NULL.
+                self.array[:self.filled] = self._missing.get(target)
+        self.kind = target
+
+    def _decode_blob(self, value):
+        """Return a zero-copy ndarray view of a PyICeBLOB value, or None if it isn't one.
+
+        Args:
+            value: Raw bytes; a length byte, a numpy dtype string, then the data.
+
+        Returns:
+            A read-only 1-D ``numpy.ndarray`` or ``None``.
+        """
+        if value is None or not len(value):
+            return None
+        header = value[:value[0] + 1]
+        dtype = self._blob_dtypes.get(header)
+        if dtype is None:
+            try:
+                dtype = numpy.dtype(header[1:].decode('latin1'))
+            except (TypeError, ValueError, UnicodeDecodeError):
+                return None
+            self._blob_dtypes[header] = dtype
+        if (len(value) - len(header)) % dtype.itemsize:
+            return None
+        return numpy.frombuffer(value, offset=len(header), dtype=dtype)
+
+    def _convert_cell(self, value):
+        """Apply the registered converter to a single text or BLOB cell.
+
+        Args:
+            value: Raw cell value.
+
+        Returns:
+            The converted value, or *value* unchanged if no converter applies.
+        """
+        if self.converter is None or not isinstance(value, (str, bytes)):
+            return value
+        return self.converter(value.encode('utf-8') if isinstance(value, str) else value)
+
+    def _convert(self, kind, values):
+        """Convert one chunk of raw values into an array of the current kind.
+
+        Args:
+            kind: Kind returned by :meth:`_classify` for this chunk.
+            values: One chunk of raw column values.
+
+        Returns:
+            A numpy array, or a sequence assignable to an array slice.
+        """
+        count = len(values)
+        if self.kind == 'int':
+            return numpy.fromiter(values, dtype=numpy.int64, count=count)
+        if self.kind == 'float':
+            return numpy.array(values, dtype=numpy.float64)
+        if self.kind == 'datetime':
+            text = numpy.array(['NaT' if v is None else v for v in values])
+            return numpy.char.rstrip(text, 'Z').astype('datetime64[us]')
+        if self.kind == 'str' or kind == 'null':
+            return numpy.fromiter(values, dtype=object, count=count)
+        if kind == 'blob':
+            return numpy.fromiter(map(self._decode_blob, values), dtype=object, count=count)
+        return numpy.fromiter(map(self._convert_cell, values), dtype=object, count=count)
+
+    def append(self, values):
+        """Convert and store one chunk of raw column values.
+
+        Args:
+            values: Sequence of raw values fetched from SQLite.
+        """
+        kind = self._classify(values)
+        self._merge(kind)
+        if self.kind == 'null':
+            self.filled += len(values)
+            return
+        try:
+            chunk = self._convert(kind, values)
+        except ValueError:
+            # Malformed timestamp or similar; keep the raw cells.
+            self._merge('object')
+            chunk = self._convert('object', values)
+        end = self.filled + len(values)
+        if end > self.length:
+            self.length = max(end, 2 * self.length)
+            grown = numpy.empty(self.length, dtype=self.array.dtype)
+            grown[:self.filled] = self.array[:self.filled]
+            self.array = grown
+        self.array[self.filled:end] = chunk
+        self.filled = end
+
+    def finish(self):
+        """Return the column truncated to the number of rows received.
+
+        Returns:
+            A 1-D numpy array.  Columns that held only NULL are float NaN.
+        """
+        if self.kind in (None, 'null'):
+            return numpy.full(self.filled, numpy.nan)
+        return self.array[:self.filled]
+
 
 class sqlite_data(
         collections.abc.Sequence):  # collections.Iterable to disable slicing?
@@ -45,9 +258,13 @@ class sqlite_data(
     True
 
     """
+    # positional keyset reads fetch this many keys per query; also bounds the
+    # number of IN (...) parameters below SQLite's historical limit of 999
+    _keyset_page_size = 900
+    _order_by = re.compile(r'\border\s+by\b', re.IGNORECASE)
 
     def __init__(self, table_name=None,
-                 database_file='data_log.sqlite', timezone=None):
+                 database_file='data_log.sqlite', timezone=None, read_only=False):
         """Open a SQLite database connection and prepare type converters.
 
         Register custom SQLite type converters for DATETIME, NUMERIC,
@@ -71,6 +288,9 @@ class sqlite_data(
                 produced by ``lab_core.logger`` or any other writer.
             timezone: A ``tzinfo`` instance used to localize stored UTC
                 timestamps.  Defaults to UTC when ``None``.
+            read_only: Open the file with SQLite's ``mode=ro`` so that no
+                statement can modify it, for example from a worker
+                process reading a database another process owns.
         """
         if timezone is None:
             self.timezone = UTC()
@@ -87,9 +307,15 @@ class sqlite_data(
         sqlite3.register_converter("PyICeIntList", lambda d: numpy.fromstring(
             d[1:-1], sep=',', dtype=numpy.dtype('int')))
         # automatically convert datetime column to Python datetime object
-        self.conn = sqlite3.connect(
-            database_file,
-            detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES)
+        if read_only:
+            self.conn = sqlite3.connect(
+                f'{pathlib.Path(database_file).absolute().as_uri()}?mode=ro',
+                uri=True,
+                detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES)
+        else:
+            self.conn = sqlite3.connect(
+                database_file,
+                detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES)
         self.conn.row_factory = sqlite3.Row  # index row data tuple by column name
         self.set_table(table_name)
         self.sql_query = None
@@ -226,50 +452,221 @@ class sqlite_data(
     def __getitem__(self, key):
         """Retrieve one row by integer index, or a list of rows by slice.
 
-        Translates the Python index or slice into SQL ``LIMIT``/``OFFSET``
-        clauses applied to the active query, so only the requested rows
-        are fetched from the database.  Negative indices and slice steps
-        are not supported.
+        Negative indices and slice steps (including negative steps) follow
+        normal Python sequence rules.
 
+        When the active query exposes ``rowid`` (logger tables, or any plain
+        table read with the default query) and has no ``ORDER BY``, rows
+        are numbered in ``rowid`` order and located by keyset pagination
+        over ``rowid``, as in :meth:`chunks`.  Negative indices walk back
+        from the end of the table instead of counting it first, and slices
+        page through the keys alone, fetching only the selected rows, so a
+        stepped slice never holds the rows it skips.  Skipping to a start
+        position still steps over the keys before it.
+
+        Other queries are sliced in their own order with SQL
+        ``LIMIT``/``OFFSET``, where reading a large table slice by slice
+        is quadratic; use :meth:`chunks` for that instead.
 
         >>> from PyICe.lab_utils.sqlite_data import sqlite_data
         >>> hasattr(sqlite_data, '__getitem__')
         True
 
         Args:
-            key: An integer row index (0-based) returning a single
-                ``sqlite3.Row``, or a ``slice`` object returning a list
-                of rows.
+            key: An integer row index (0-based, negative counts from the
+                end) returning a single ``sqlite3.Row``, or a ``slice``
+                object returning a list of rows.
 
         Returns:
             A single ``sqlite3.Row`` when *key* is an integer, or a list
             of ``sqlite3.Row`` objects when *key* is a slice.
 
         Raises:
-            Exception: If the slice has ``start >= stop`` (reverse
-                iteration) or if a slice step is provided.
+            IndexError: If an integer *key* is out of range.
+            TypeError: If *key* is neither an integer nor a slice.
         """
-        subs = {}
         if isinstance(key, slice):
-            if key.start is None:
-                subs['start'] = 0
-            else:
-                subs['start'] = key.start
-            if key.stop is None:
-                subs['limit'] = -1  # no limit
-            else:
-                if subs['start'] >= key.stop:
-                    raise Exception('Reverse iteration not supported.')
-                subs['limit'] = key.stop - subs['start']
-            if key.step is not None:
-                raise Exception('Slice step not supported.')
-            fetch = sqlite3.Cursor.fetchall
-        else:
-            subs['start'] = key
-            subs['limit'] = 1
-            fetch = sqlite3.Cursor.fetchone
-        return fetch(self.conn.execute(
-            self.sql_query + " LIMIT {limit} OFFSET {start};".format(**subs), self.params))
+            if key.step == 0:
+                raise ValueError('slice step cannot be zero')
+            step = 1 if key.step is None else key.step
+            source = self._rowid_source()
+            if step > 0 and (key.start or 0) >= 0 and (key.stop is None or key.stop >= 0):
+                # no length needed for a plain forward slice
+                start = key.start or 0
+                if key.stop is not None and start >= key.stop:
+                    return []
+                count = None if key.stop is None else -(-(key.stop - start) // step)
+                if source is not None:
+                    return self._keyset_walk(source, start, step, count)
+                rows = self._fetch_range(start, key.stop)
+                return rows if step == 1 else rows[::step]
+            length = len(self)
+            positions = range(*key.indices(length))
+            if not positions:
+                return []
+            if source is not None:
+                if step > 0:
+                    return self._keyset_walk(source, positions[0], step, len(positions))
+                return self._keyset_walk(source, length - 1 - positions[0], -step, len(positions),
+                                         descending=True)
+            first = min(positions[0], positions[-1])
+            rows = self._fetch_range(first, max(positions[0], positions[-1]) + 1)
+            return [rows[i - first] for i in positions]
+        if not isinstance(key, int):
+            raise TypeError(f'sqlite_data indices must be integers or slices, not {type(key).__name__}')
+        source = self._rowid_source()
+        if source is not None:
+            rows = self._keyset_walk(source, key if key >= 0 else -key - 1, 1, 1,
+                                     descending=key < 0)
+            if not rows:
+                raise IndexError('sqlite_data index out of range')
+            return rows[0]
+        if key < 0:
+            key += len(self)
+        row = None if key < 0 else self.conn.execute(
+            f"{self._bare_query()} LIMIT 1 OFFSET {key};", self.params).fetchone()
+        if row is None:
+            raise IndexError('sqlite_data index out of range')
+        return row
+
+    def _rowid_source(self):
+        """Return the relation to number rows over by ``rowid``, or None to use ``OFFSET``.
+
+        >>> sd = sqlite_data(database_file=":memory:")
+        >>> _ = sd.conn.execute("CREATE TABLE t (v REAL)")
+        >>> sd.sql_query = "SELECT * FROM t ORDER BY v"
+        >>> sd._rowid_source() is None
+        True
+
+        Returns:
+            SQL relation text for :meth:`_keyset_walk`, or None if the query
+            has its own order or no ``rowid``.
+        """
+        if self._order_by.search(self._bare_query()):
+            return None
+        try:
+            return self._keyset_source(('rowid',))
+        except (ValueError, sqlite3.Error):
+            return None
+
+    def _keyset_walk(self, source, skip, step, count, descending=False):
+        """Return every *step*-th row after skipping *skip* rows, in ``rowid`` order.
+
+        >>> sd = sqlite_data(database_file=":memory:")
+        >>> _ = sd.conn.execute("CREATE TABLE t (v REAL)")
+        >>> _ = sd.conn.executemany("INSERT INTO t VALUES (?)", [(i,) for i in range(10)])
+        >>> [row['v'] for row in sd._keyset_walk('t', 1, 3, None)]
+        [1.0, 4.0, 7.0]
+        >>> [row['v'] for row in sd._keyset_walk('t', 0, 4, 2, descending=True)]
+        [9.0, 5.0]
+
+        Args:
+            source: Relation from :meth:`_keyset_source` exposing ``rowid``.
+            skip: Number of leading rows to pass over.
+            step: Positive stride between returned rows.
+            count: Maximum number of rows to return, or None for all.
+            descending: Walk from the last row backwards.
+
+        Returns:
+            A list of ``sqlite3.Row`` objects.
+        """
+        params = tuple(self.params)
+        order, compare = ('DESC', '<') if descending else ('ASC', '>')
+        key_cursor = self.conn.cursor()
+        key_cursor.row_factory = None
+        after = ()
+        if skip:
+            after = key_cursor.execute(
+                f'SELECT +"rowid" FROM {source} ORDER BY "rowid" {order} LIMIT 1 OFFSET {int(skip) - 1}',
+                params).fetchone()
+            if after is None:
+                return []
+        rows = []
+        phase = 0
+        while count is None or len(rows) < count:
+            where = f'"rowid" {compare} ?' if after else '1'
+            keys = [k for (k,) in key_cursor.execute(
+                f'SELECT +"rowid" FROM {source} WHERE {where} ORDER BY "rowid" {order} '
+                f'LIMIT {self._keyset_page_size}', params + tuple(after)).fetchall()]
+            if not keys:
+                break
+            picked = keys[phase::step]
+            if count is not None:
+                picked = picked[:count - len(rows)]
+            phase = (phase - len(keys)) % step
+            if picked:
+                if step == 1:
+                    low, high = (picked[-1], picked[0]) if descending else (picked[0], picked[-1])
+                    selected, selected_params = '"rowid" BETWEEN ? AND ?', (low, high)
+                else:
+                    selected = '"rowid" IN ({})'.format(', '.join('?' * len(picked)))
+                    selected_params = tuple(picked)
+                rows.extend(self.conn.execute(
+                    f'SELECT * FROM {source} WHERE {selected} ORDER BY "rowid" {order}',
+                    params + selected_params).fetchall())
+            if len(keys) < self._keyset_page_size:
+                break
+            after = (keys[-1],)
+        return rows
+
+    def _keyset_source(self, keys):
+        """Return the relation to page the active query over *keys*.
+
+        A quoted key that is not a result column would silently compare as
+        a string literal, so the keys are checked against the query's
+        result columns.  The default query reads the table itself, where
+        ``rowid`` is implicit.
+
+        >>> sd = sqlite_data(database_file=":memory:")
+        >>> _ = sd.conn.execute("CREATE TABLE t (v REAL)")
+        >>> sd.sql_query = "SELECT v FROM t"
+        >>> sd._keyset_source(('v',))
+        '(SELECT v FROM t)'
+
+        Args:
+            keys: Tuple of key column names.
+
+        Returns:
+            SQL relation text: the parenthesised query, or the table name.
+
+        Raises:
+            ValueError: If a key column is not among the query's result
+                columns.
+        """
+        query = self._bare_query()
+        params = tuple(self.params)
+        source = f'({query})'
+        columns = [d[0] for d in self.conn.execute(f'SELECT * FROM {source} LIMIT 0', params).description]
+        missing = [k for k in keys if k.lower() not in {c.lower() for c in columns}]
+        if ([k.lower() for k in missing] == ['rowid'] and not params
+                and query == "SELECT * from {}".format(self.table_name)):
+            source = self.table_name
+            try:
+                self.conn.execute(f'SELECT rowid FROM {source} LIMIT 0')
+                missing = []
+            except sqlite3.OperationalError:
+                pass
+        if missing:
+            raise ValueError(f'key column(s) {missing} not in query result columns {columns}')
+        return source
+
+    def _fetch_range(self, start, stop):
+        """Fetch rows ``start`` up to (not including) ``stop`` of the active query.
+
+        >>> from PyICe.lab_utils.sqlite_data import sqlite_data
+        >>> hasattr(sqlite_data, '_fetch_range')
+        True
+
+        Args:
+            start: First row position, non-negative.
+            stop: Position after the last row, or ``None`` for the end.
+
+        Returns:
+            A list of ``sqlite3.Row`` objects.
+        """
+        limit = -1 if stop is None else stop - start
+        return self.conn.execute(
+            f"{self._bare_query()} LIMIT {limit} OFFSET {start};", self.params).fetchall()
 
     def __iter__(self):
         """Yield rows from the active query by executing it against the database.
@@ -279,7 +676,6 @@ class sqlite_data(
         item is a ``sqlite3.Row`` supporting both column-name and
         positional access.
 
-
         >>> from PyICe.lab_utils.sqlite_data import sqlite_data
         >>> hasattr(sqlite_data, '__iter__')
         True
@@ -290,25 +686,87 @@ class sqlite_data(
         """
         return self.conn.execute(self.sql_query, self.params)
 
-    def __len__(self):
-        """Return the total number of rows matched by the active SQL query.
+    def chunks(self, chunk_size=10000, key_column='rowid'):
+        """Yield the active query's rows in lists of up to *chunk_size*, ordered by a key.
 
-        WARNING: This fetches *all* rows into memory just to count them,
-        which is very expensive on large result sets.  Prefer iterating
-        or slicing when possible instead of calling ``len()``.
+        Uses keyset pagination: each page is fetched with
+        ``WHERE key > <last key seen> ORDER BY key LIMIT chunk_size``, so
+        with an indexed key every page costs the same no matter how deep
+        into the table it is.  Compare ``LIMIT``/``OFFSET`` slicing, where
+        page *n* re-walks all *n - 1* earlier pages.
 
+        Rows come out in key order, which need not match the query's own
+        order.  The key must be unique and non-NULL and must appear in the
+        query's result columns.  The default ``rowid`` satisfies this for
+        logger tables, and for any plain table read with the default
+        ``SELECT *`` query, whose implicit ``rowid`` is used directly.  For a
+        non-unique column such as ``datetime``, pass a tuple like
+        ``('datetime', 'rowid')`` to break ties.
 
         >>> from PyICe.lab_utils.sqlite_data import sqlite_data
-        >>> hasattr(sqlite_data, '__len__')
+        >>> hasattr(sqlite_data, 'chunks')
         True
 
+        Args:
+            chunk_size: Maximum rows per yielded list.
+            key_column: Result column name, or a tuple of names, that
+                uniquely orders the rows.  Should be indexed in the
+                underlying table.
+
+        Yields:
+            Lists of ``sqlite3.Row`` objects.
+
+        Raises:
+            ValueError: If a key column is not among the query's result
+                columns.
+        """
+        keys = (key_column,) if isinstance(key_column, str) else tuple(key_column)
+        source = self._keyset_source(keys)
+        params = tuple(self.params)
+        key_list = ', '.join('"{}"'.format(k.replace('"', '""')) for k in keys)
+        if len(keys) == 1:
+            key_sql, marker = key_list, '?'
+        else:
+            key_sql, marker = f'({key_list})', '({})'.format(', '.join('?' * len(keys)))
+        # Keys are paged with unary + so they come back unconverted and can be
+        # bound straight back into the next comparison.
+        raw_keys = ', '.join('+"{}"'.format(k.replace('"', '""')) for k in keys)
+        key_page = (f"SELECT {raw_keys} FROM {source} WHERE {{}} "
+                    f"ORDER BY {key_list} LIMIT {int(chunk_size)}")
+        first_keys = key_page.format('1')
+        next_keys = key_page.format(f'{key_sql} > {marker}')
+        first_rows = f"SELECT * FROM {source} WHERE {key_sql} <= {marker} ORDER BY {key_list}"
+        next_rows = (f"SELECT * FROM {source} WHERE {key_sql} > {marker} "
+                     f"AND {key_sql} <= {marker} ORDER BY {key_list}")
+        key_cursor = self.conn.cursor()
+        key_cursor.row_factory = None
+        page_keys = key_cursor.execute(first_keys, params).fetchall()
+        if not page_keys:
+            return
+        yield self.conn.execute(first_rows, params + page_keys[-1]).fetchall()
+        while len(page_keys) == chunk_size:
+            last = page_keys[-1]
+            page_keys = key_cursor.execute(next_keys, params + last).fetchall()
+            if not page_keys:
+                return
+            yield self.conn.execute(next_rows, params + last + page_keys[-1]).fetchall()
+
+    def __len__(self):
+        """Return the total number of rows matched by the active SQL query.
+
+        Wraps the query in ``SELECT COUNT(*)`` so SQLite counts the rows
+        without returning them to Python.
+
+        >>> with sqlite_data(database_file=":memory:") as sd:
+        ...     _ = sd.query("SELECT 1 UNION ALL SELECT 2")
+        ...     len(sd)
+        2
+
         Returns:
             The integer count of rows in the full result set.
         """
-        # this is hard because the iterable doesn't actually know its length
-        # self.cursor.rowcount doesn't work; returns -1 when database isn't modified.
-        # not very efficient for big dataset!
-        return len(self.conn.execute(self.sql_query, self.params).fetchall())
+        return self.conn.execute(
+            f"SELECT COUNT(*) FROM ({self._bare_query()})", self.params).fetchone()[0]
 
     def __enter__(self):
         """Enter the context manager, returning this instance for use in a ``with`` block.
@@ -660,7 +1118,139 @@ class sqlite_data(
         """
         return [row for row in self]
 
-    def numpy_recarray(self, force_float_dtype=False, data_types=None):
+    def _get_declared_types(self, column_count):
+        """Return the SQLite declared type of each column of the active query.
+
+        The Python ``sqlite3`` module does not expose ``decltype``, so the
+        query is wrapped in a temporary view and inspected with
+        ``PRAGMA table_info``.  Views cannot hold bind parameters; for
+        parameterized queries every type is reported as unknown and
+        :class:`_column_builder` infers the conversion from the data.
+
+        >>> from PyICe.lab_utils.sqlite_data import sqlite_data
+        >>> hasattr(sqlite_data, '_get_declared_types')
+        True
+
+        Args:
+            column_count: Number of columns produced by the query.
+
+        Returns:
+            A list of declared type strings, or ``None`` where unknown.
+        """
+        if self.params:
+            return [None] * column_count
+        view_name = f'_pyice_columns_{id(self)}'
+        try:
+            self.conn.execute(f'CREATE TEMP VIEW "{view_name}" AS {self._bare_query()}')
+        except sqlite3.Error:
+            return [None] * column_count
+        try:
+            info = self.conn.execute(f'PRAGMA temp.table_info("{view_name}")').fetchall()
+        finally:
+            self.conn.execute(f'DROP VIEW temp."{view_name}"')
+        return [row[2] or None for row in info]
+
+    def _bare_query(self):
+        """Return the active query without trailing whitespace or semicolon.
+
+        >>> sd = sqlite_data(database_file=":memory:")
+        >>> sd.sql_query = "SELECT * FROM t; "
+        >>> sd._bare_query()
+        'SELECT * FROM t'
+
+        Returns:
+            SQL text suitable for use as a sub-select.
+        """
+        if self.sql_query is None:
+            raise Exception('table_name not specified')
+        return self.sql_query.strip().rstrip(';')
+
+    def columns(self, column_names=None, chunk_size=65536, formats=None):
+        """Read the active query column-wise into typed NumPy arrays.
+
+        The bulk-read counterpart of iterating rows.  The query is wrapped so
+        that SQLite returns raw values, bypassing the per-cell type
+        converters, and streamed with ``fetchmany`` in chunks of
+        *chunk_size* rows into arrays preallocated from a ``COUNT(*)``.
+        Each chunk is converted with one vectorized call per column:
+
+        * INTEGER/REAL data becomes ``int64``/``float64`` (``NaN`` for NULL).
+        * DATETIME columns become ``datetime64[us]`` in UTC.  Unlike the
+          row interface, the instance timezone is not applied because NumPy
+          datetimes are timezone-naive.
+        * PyICeBLOB columns become object arrays of read-only ``frombuffer``
+          views onto the fetched bytes, without copying the samples.
+        * Text columns become object arrays of ``str``; NUMERIC and PyICe
+          collection columns holding text are decoded by the registered
+          converters, as with row access.
+
+        For columns without a declared type (expressions, or any column of a
+        parameterized query) ISO-8601 ``...Z`` strings and PyICeBLOB byte
+        strings are recognized from the data.
+
+        *formats* applies channel formats in Python instead of through a
+        ``_formatted`` SQL view.  Each entry maps a column name to either a
+        callable taking and returning an array, or a ``(channel, format)`` /
+        ``(channel, format, use_presets)`` tuple whose channel provides
+        ``format_array()`` (see ``lab_core.integer_channel``)::
+
+            cols = sqlite_data('log', 'data_log.sqlite').columns(
+                formats={'vout_dac': (dac_channel, 'volts', True)})
+
+        >>> from PyICe.lab_utils.sqlite_data import sqlite_data
+        >>> hasattr(sqlite_data, 'columns')
+        True
+
+        Args:
+            column_names: Optional iterable of result column names to read.
+                Defaults to every column of the query.
+            chunk_size: Number of rows fetched from SQLite per chunk.
+            formats: Optional mapping of column name to a formatter, as
+                described above.
+
+        Returns:
+            An ``OrderedDict`` mapping column names to 1-D numpy arrays, all
+            of the same length.
+
+        Raises:
+            Exception: If no table name or query has been set on this
+                instance.
+        """
+        query = self._bare_query()
+        names = [d[0] for d in self.conn.execute(
+            f'SELECT * FROM ({query}) LIMIT 0', self.params).description]
+        declared_types = self._get_declared_types(len(names))
+        if column_names is None:
+            selected = list(range(len(names)))
+        else:
+            selected = [names.index(name) for name in column_names]
+        row_count = self.conn.execute(
+            f'SELECT COUNT(*) FROM ({query})', self.params).fetchone()[0]
+        builders = [_column_builder(row_count, declared_types[i]) for i in selected]
+        # Unary + makes each result column an expression, which has no declared
+        # type, so the registered converters are not invoked.
+        select_list = ', '.join('+"{}"'.format(names[i].replace('"', '""')) for i in selected)
+        cursor = self.conn.cursor()
+        cursor.row_factory = None
+        cursor.execute(f'SELECT {select_list} FROM ({query})', self.params)
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                break
+            for builder, values in zip(builders, zip(*rows)):
+                builder.append(values)
+        columns = collections.OrderedDict(
+            (names[i], builder.finish()) for i, builder in zip(selected, builders))
+        for name, formatter in (formats or {}).items():
+            if callable(formatter):
+                columns[name] = formatter(columns[name])
+            else:
+                channel, format_name, use_presets = (tuple(formatter) + (False,))[:3]
+                columns[name] = channel.format_array(columns[name], format_name, use_presets)
+        return columns
+
+    def numpy_recarray(self, force_float_dtype=False,
+                       data_types=None, columnar=False):
         """Convert the active query results into a NumPy record array.
 
         Record arrays allow column access by attribute name
@@ -685,6 +1275,10 @@ class sqlite_data(
                 pairs used to build the ``numpy.dtype``.  The Python
                 type of each *example_value* determines the column
                 dtype.  Mutually exclusive with *force_float_dtype*.
+            columnar: When ``True``, read through :meth:`columns` instead
+                of row by row.  Much faster for large tables; dtypes are
+                then inferred from the whole column rather than the first
+                row, and DATETIME columns are ``datetime64[us]``.
 
         Returns:
             A ``numpy.recarray`` whose fields correspond to the query
@@ -694,12 +1288,24 @@ class sqlite_data(
             Exception: If both *force_float_dtype* and *data_types* are
                 specified at the same time.
         """
-        if force_float_dtype and data_types is None:
-            dtype = numpy.dtype([(key, type(float()))
-                                for key in self.get_column_types()])
-        elif force_float_dtype and data_types is not None:
+        if force_float_dtype and data_types is not None:
             raise Exception(
                 'Specify only one of force_float_dtype, data_types arguments.')
+        if columnar:
+            columns = self.columns()
+            if force_float_dtype:
+                dtypes = {name: float for name in columns}
+            elif data_types is not None:
+                dtypes = {name: type(example) for name, example in data_types}
+            else:
+                dtypes = {}
+            return numpy.rec.fromarrays(
+                [column.astype(dtypes[name]) if name in dtypes else column
+                 for name, column in columns.items()],
+                names=list(columns))
+        if force_float_dtype:
+            dtype = numpy.dtype([(key, type(float()))
+                                for key in self.get_column_types()])
         elif data_types is None:
             dtype = numpy.dtype([(k, v)
                                 for k, v in self.get_column_types().items()])
@@ -709,7 +1315,7 @@ class sqlite_data(
         arr = numpy.array([tuple(row) for row in self], dtype)
         return arr.view(numpy.recarray)
 
-    def pandas_dataframe(self):
+    def pandas_dataframe(self, columnar=False):
         """Convert the active query results into a Pandas DataFrame.
 
         Delegates to ``pandas.read_sql_query`` using the current
@@ -723,10 +1329,18 @@ class sqlite_data(
         >>> hasattr(sqlite_data, 'pandas_dataframe')
         True
 
+        Args:
+            columnar: When ``True``, build the DataFrame from
+                :meth:`columns` instead of ``pandas.read_sql_query``.  Much
+                faster for large tables; DATETIME columns are then
+                ``datetime64`` in UTC.
+
         Returns:
             A ``pandas.DataFrame`` with one column per query column and
             one row per result row.
         """
+        if columnar:
+            return pandas.DataFrame(self.columns())
         return pandas.read_sql_query(self.sql_query,
                                      self.conn,
                                      params=self.params,
@@ -879,6 +1493,47 @@ class sqlite_data(
             return tuple(sorted(first_row + row_ids + preceding_row_ids))
         return tuple(sorted(first_row + row_ids))
 
+    def explain(self, sql_query=None, *params):
+        """Return SQLite's query plan for the active query, flagging full table scans.
+
+        A full scan reads every row, so on a large logged table a filter on
+        an unindexed column costs time proportional to the table size.
+        Mark such columns as index keys in the logger (``logger.add_index``
+        or the ``index_key`` channel attribute).  Any other statement, for
+        example one built by :meth:`get_distinct`, can be checked by passing
+        it explicitly.
+
+        >>> with sqlite_data(database_file=":memory:") as sd:
+        ...     _ = sd.conn.execute("CREATE TABLE log (rowid INTEGER PRIMARY KEY, vin REAL)")
+        ...     _ = sd.query("SELECT * FROM log WHERE vin = 3.3")
+        ...     [step.full_scan for step in sd.explain()]
+        ...     [step.full_scan for step in sd.explain("SELECT * FROM log WHERE rowid = ?", 1)]
+        [True]
+        [False]
+
+        Args:
+            sql_query: Statement to explain.  Defaults to the active query
+                and its parameters.
+            *params: Bind-parameter values for *sql_query*.
+
+        Returns:
+            A list of :data:`QueryPlanStep` namedtuples in plan order.
+        """
+        if sql_query is None:
+            sql_query, params = self._bare_query(), self.params
+        cursor = self.conn.cursor()
+        cursor.row_factory = None
+        # EXPLAIN never checks the schema cookie, so neither a cached EXPLAIN
+        # statement nor the connection's copy of the schema notice an index
+        # added by another connection.  Reading sqlite_master reloads the
+        # schema, and keying the statement text on its version forces a new plan.
+        schema_version = cursor.execute(
+            'SELECT (SELECT schema_version FROM pragma_schema_version) FROM sqlite_master LIMIT 1').fetchone()
+        schema_version = 0 if schema_version is None else schema_version[0]
+        return [QueryPlanStep(step_id, parent, detail, _FULL_SCAN.match(detail) is not None)
+                for step_id, parent, _, detail in cursor.execute(
+                    f'EXPLAIN QUERY PLAN /* schema {schema_version} */ {sql_query}', params)]
+
     def optimize(self):
         """Defragment and analyze the database to reduce file size and improve query speed.
 
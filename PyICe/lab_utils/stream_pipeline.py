@@ -0,0 +1,334 @@
+"""Stream pipeline utility.
+
+>>> from PyICe.lab_utils.stream_pipeline import stream_pipeline
+
+"""
+import queue
+import threading
+import time
+
+_END = object()
+
+
+class stream_pipeline(object):
+    """Three stage producer/consumer pipeline for buffered digitizers.
+
+    Instruments that stream into an on-board buffer (for example the
+    Keysight U2300A in continuous mode) overflow when the host stops
+    draining them for too long.  Reading, decoding and storing in one loop
+    means a slow database commit stalls the instrument reads.  This class
+    splits the work over three threads connected by bounded queues:
+
+    * **acquire** reads raw blocks from the instrument as soon as they are
+      ready and does nothing else.
+    * **decode** converts raw blocks into chunks of scaled data, typically
+      with numpy.
+    * **store** hands chunks to their destination, typically
+      ``logger.log_many()``.
+
+    Each queue records its high water mark, the time its producer spent
+    blocked on a full queue and the number of items dropped, so that an
+    overflowing acquisition can be traced back to the stage that could not
+    keep up.  Items thrown away by ``stop(drain=False)`` are counted
+    separately as discarded.
+
+    The pipeline is instrument agnostic: *acquire*, *decode* and *store*
+    are plain callables supplied by the driver.
+
+    >>> from PyICe.lab_utils.stream_pipeline import stream_pipeline
+    >>> blocks = [b'ab', None, b'cd']
+    >>> def acquire():
+    ...     if not blocks:
+    ...         raise StopIteration
+    ...     return blocks.pop(0)
+    >>> stored = []
+    >>> p = stream_pipeline(acquire, bytes.upper, stored.append).start()
+    >>> p.wait(timeout=5)
+    True
+    >>> p.stop()
+    >>> stored
+    [b'AB', b'CD']
+    >>> p.get_metrics()['acquire']['items']
+    2
+    """
+    def __init__(self, acquire, decode, store, queue_depth=16,
+                 overflow='block', poll_interval=0.001, finish=None,
+                 name='stream'):
+        """Create a stopped pipeline.
+
+        >>> from PyICe.lab_utils.stream_pipeline import stream_pipeline
+        >>> stream_pipeline(None, None, None).is_running()
+        False
+
+        Args:
+            acquire: Callable returning the next raw block, or None when no
+                block is ready yet.  Raising StopIteration ends the
+                acquisition normally; any other exception ends it and is
+                re-raised by :meth:`stop`.  Blocks already acquired are
+                still decoded and stored.
+            decode: Callable converting one raw block into a chunk, or None
+                to discard the block.
+            store: Callable consuming one chunk.
+            queue_depth: Maximum number of items held between stages.
+            overflow: What the acquire stage does when the decode queue is
+                full.  'block' waits for room, letting the instrument's own
+                buffer absorb the delay.  'drop' discards the new block and
+                counts it.
+            poll_interval: Seconds to wait after *acquire* returns None.
+            finish: Optional callable run in the acquire thread once a stop
+                is requested (or acquisition fails), before the remaining
+                blocks are drained, for example to halt the instrument.
+            name: Prefix for the worker thread names.
+
+        Raises:
+            ValueError: If *overflow* is not 'block' or 'drop'.
+        """
+        if overflow not in ('block', 'drop'):
+            raise ValueError("overflow must be 'block' or 'drop'.")
+        self._acquire = acquire
+        self._decode = decode
+        self._store = store
+        self._overflow = overflow
+        self._poll_interval = poll_interval
+        self._finish = finish
+        self._name = name
+        self._raw_queue = queue.Queue(maxsize=queue_depth)
+        self._chunk_queue = queue.Queue(maxsize=queue_depth)
+        self._stop_event = threading.Event()
+        self._abort_event = threading.Event()
+        self._done_event = threading.Event()
+        self._threads = []
+        self._exception = None
+        self._start_time = None
+        self._metrics = {
+            'acquire': {'items': 0, 'bytes': 0, 'busy_time': 0.0},
+            'decode': {'items': 0, 'busy_time': 0.0},
+            'store': {'items': 0, 'busy_time': 0.0},
+            'raw_queue': {'depth': 0, 'high_water': 0, 'blocked_time': 0.0, 'dropped': 0, 'discarded': 0},
+            'chunk_queue': {'depth': 0, 'high_water': 0, 'blocked_time': 0.0, 'dropped': 0, 'discarded': 0},
+        }
+
+    def start(self):
+        """Start the acquire, decode and store threads.
+
+        >>> from PyICe.lab_utils.stream_pipeline import stream_pipeline
+        >>> hasattr(stream_pipeline, 'start')
+        True
+
+        Returns:
+            The pipeline, so that construction and start can be chained.
+
+        Raises:
+            RuntimeError: If the pipeline was already started.
+        """
+        if self._threads:
+            raise RuntimeError('stream_pipeline cannot be restarted. Make a new one.')
+        self._start_time = time.monotonic()
+        for stage, target in (('acquire', self._acquire_loop),
+                              ('decode', self._decode_loop),
+                              ('store', self._store_loop)):
+            thread = threading.Thread(target=target, name='{}_{}'.format(self._name, stage))
+            thread.daemon = True
+            self._threads.append(thread)
+        for thread in self._threads:
+            thread.start()
+        return self
+
+    def is_running(self):
+        """Return True while any stage still has work to do.
+
+        >>> from PyICe.lab_utils.stream_pipeline import stream_pipeline
+        >>> hasattr(stream_pipeline, 'is_running')
+        True
+
+        Returns:
+            bool: True if started and not yet finished.
+        """
+        return bool(self._threads) and not self._done_event.is_set()
+
+    def wait(self, timeout=None):
+        """Block until the pipeline finishes on its own or *timeout* elapses.
+
+        The pipeline finishes on its own when *acquire* raises, or when a
+        stop was requested and everything acquired has been stored.
+
+        >>> from PyICe.lab_utils.stream_pipeline import stream_pipeline
+        >>> hasattr(stream_pipeline, 'wait')
+        True
+
+        Args:
+            timeout: Maximum seconds to wait, or None to wait indefinitely.
+
+        Returns:
+            bool: True if the pipeline has finished.
+        """
+        return self._done_event.wait(timeout)
+
+    def stop(self, drain=True, timeout=None):
+        """Stop acquiring, wait for the stages to finish and re-raise any stage error.
+
+        >>> from PyICe.lab_utils.stream_pipeline import stream_pipeline
+        >>> hasattr(stream_pipeline, 'stop')
+        True
+
+        Args:
+            drain: If True, blocks still available from *acquire* and
+                everything already queued are decoded and stored before
+                returning.  If False, queued data is discarded and counted
+                in the queue metrics; only items already being decoded or
+                stored finish.
+            timeout: Maximum seconds to wait for each thread, or None.
+
+        Raises:
+            Exception: The first exception raised by any stage.
+        """
+        if not drain:
+            self._abort_event.set()
+        self._stop_event.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self.check_exception()
+
+    def check_exception(self):
+        """Re-raise the first exception raised by any stage, if there was one.
+
+        >>> from PyICe.lab_utils.stream_pipeline import stream_pipeline
+        >>> stream_pipeline(None, None, None).check_exception()
+
+        Raises:
+            Exception: The stage exception.
+        """
+        if self._exception is not None:
+            raise self._exception
+
+    def get_metrics(self):
+        """Return a snapshot of stage throughput and queue overflow statistics.
+
+        >>> from PyICe.lab_utils.stream_pipeline import stream_pipeline
+        >>> sorted(stream_pipeline(None, None, None).get_metrics())
+        ['acquire', 'chunk_queue', 'decode', 'elapsed', 'raw_queue', 'store']
+
+        Returns:
+            dict: One dictionary per stage (items processed, busy seconds)
+            and per queue (current depth, high water mark, seconds the
+            producer spent blocked, items dropped on overflow, items
+            discarded by an aborting stop), plus the seconds elapsed since
+            :meth:`start`.
+        """
+        self._metrics['raw_queue']['depth'] = self._raw_queue.qsize()
+        self._metrics['chunk_queue']['depth'] = self._chunk_queue.qsize()
+        metrics = {key: dict(value) for key, value in self._metrics.items()}
+        metrics['elapsed'] = 0.0 if self._start_time is None else time.monotonic() - self._start_time
+        return metrics
+
+    def _fail(self, exception, abort):
+        if self._exception is None:
+            self._exception = exception
+        self._stop_event.set()
+        if abort:
+            self._abort_event.set()
+
+    def _put(self, q, metrics, item, may_drop=False):
+        try:
+            q.put_nowait(item)
+        except queue.Full:
+            if may_drop:
+                metrics['dropped'] += 1
+                return
+            t_start = time.monotonic()
+            while not self._abort_event.is_set():
+                try:
+                    q.put(item, timeout=0.1)
+                    break
+                except queue.Full:
+                    pass
+            metrics['blocked_time'] += time.monotonic() - t_start
+        depth = q.qsize()
+        if depth > metrics['high_water']:
+            metrics['high_water'] = depth
+
+    def _get(self, q, metrics):
+        while not self._abort_event.is_set():
+            try:
+                return q.get(timeout=0.1)
+            except queue.Empty:
+                pass
+        # aborted: empty the queue without handing anything on
+        while True:
+            try:
+                item = q.get_nowait()
+            except queue.Empty:
+                return _END
+            if item is not _END:
+                metrics['discarded'] += 1
+
+    def _run_finish(self):
+        finish, self._finish = self._finish, None
+        if finish is not None:
+            finish()
+
+    def _acquire_loop(self):
+        metrics = self._metrics['acquire']
+        may_drop = self._overflow == 'drop'
+        try:
+            while not self._abort_event.is_set():
+                stopping = self._stop_event.is_set()
+                if stopping:
+                    self._run_finish()
+                t_start = time.monotonic()
+                try:
+                    raw = self._acquire()
+                except StopIteration:
+                    break
+                if raw is None:
+                    if stopping:
+                        break
+                    self._stop_event.wait(self._poll_interval)
+                    continue
+                metrics['items'] += 1
+                metrics['bytes'] += len(raw) if hasattr(raw, '__len__') else 0
+                metrics['busy_time'] += time.monotonic() - t_start
+                self._put(self._raw_queue, self._metrics['raw_queue'], raw, may_drop)
+        except Exception as e:
+            # keep decoding and storing what was already acquired
+            self._fail(e, abort=False)
+        finally:
+            try:
+                self._run_finish()
+            except Exception as e:
+                self._fail(e, abort=False)
+            self._put(self._raw_queue, self._metrics['raw_queue'], _END)
+
+    def _decode_loop(self):
+        metrics = self._metrics['decode']
+        try:
+            while True:
+                raw = self._get(self._raw_queue, self._metrics['raw_queue'])
+                if raw is _END:
+                    break
+                t_start = time.monotonic()
+                chunk = self._decode(raw)
+                metrics['items'] += 1
+                metrics['busy_time'] += time.monotonic() - t_start
+                if chunk is not None:
+                    self._put(self._chunk_queue, self._metrics['chunk_queue'], chunk)
+        except Exception as e:
+            self._fail(e, abort=True)
+        finally:
+            self._put(self._chunk_queue, self._metrics['chunk_queue'], _END)
+
+    def _store_loop(self):
+        metrics = self._metrics['store']
+        try:
+            while True:
+                chunk = self._get(self._chunk_queue, self._metrics['chunk_queue'])
+                if chunk is _END:
+                    break
+                t_start = time.monotonic()
+                self._store(chunk)
+                metrics['items'] += 1
+                metrics['busy_time'] += time.monotonic() - t_start
+        except Exception as e:
+            self._fail(e, abort=True)
+        finally:
+            self._done_event.set()
@@ -20,6 +20,8 @@ import json
 import linecache
 import shutil
 import warnings
+import pickle
+import concurrent.futures
 from PyICe.plugins.bench_configuration_management import bench_visualizer
 from PyICe.plugins.test_results import Test_Results, Failed_Eval
 from PyICe.plugins.traceability_items import Traceability_items
@@ -86,6 +88,102 @@ class Callback_logger(logger):
         return readings
 
 
+def _open_plot_database(test, read_only=False):
+    """Open the database a test's plot() method reads from.
+
+    Redirects to the presets-joined ``<table>_all`` table when it exists.
+
+    Args:
+        test: Test whose _db_file and _table_name are already set.
+        read_only: Open the file read-only.
+
+    Returns:
+        sqlite_data: Connection, also stored in test._db.
+    """
+    test._db = sqlite_data(
+        database_file=test.get_db_file(),
+        table_name=test.get_table_name(),
+        read_only=read_only)
+    if f"{test.get_table_name()}_all" in test._db.get_table_names():
+        # Redirect to presets-joined table
+        test._table_name = f"{test.get_table_name()}_all"
+        test._db.set_table(test.get_table_name())
+    return test._db
+
+
+def _convert_test_plots(test, returned_plots):
+    """Replace test.plot_list and test.linked_plots with SVG source.
+
+    Args:
+        test: Test whose plot() method just ran.
+        returned_plots: Whatever plot() returned.
+    """
+    if isinstance(test.plot_list, (LTC_plot.plot, LTC_plot.Page)):
+        test.plot_list = [Plugin_Manager._convert_svg(test.plot_list)]
+    else:
+        assert isinstance(test.plot_list, list)
+        test.plot_list = [
+            Plugin_Manager._convert_svg(plt) for plt in test.plot_list]
+    if isinstance(returned_plots, (LTC_plot.plot, LTC_plot.Page)):
+        test.plot_list = [Plugin_Manager._convert_svg(returned_plots)]
+    elif isinstance(returned_plots, list):
+        test.plot_list = [
+            Plugin_Manager._convert_svg(plt) for plt in returned_plots]
+    else:
+        assert returned_plots is None
+    for plot_group in test.linked_plots:
+        test.linked_plots[plot_group] = [
+            Plugin_Manager._convert_svg(plt) for plt in test.linked_plots[plot_group]]
+
+
+def _plot_worker_state(test):
+    # The plugin manager, its master and open connections stay behind;
+    # anything else that pickles travels with the test.
+    state = {}
+    for (key, value) in vars(test).items():
+        if key in ('pm', '_db'):
+            continue
+        try:
+            pickle.dumps(value)
+        except Exception:
+            continue
+        state[key] = value
+    return state
+
+
+# LTC_plot settings that change what a plot worker renders.
+_PLOT_WORKER_SETTINGS = ('DECIMATE_ABOVE', 'DECIMATION_DPI', 'RENDER_CACHE_DIR', 'RENDER_CACHE_MAX_BYTES')
+
+
+def _plot_worker_init(settings):
+    # Spawned workers (Windows, macOS) import LTC_plot afresh; carry over
+    # whatever the main process changed.
+    for (name, value) in settings.items():
+        setattr(LTC_plot, name, value)
+
+
+def _plot_worker(test_class, test_state):
+    """Run one test's plot() and SVG conversion in a worker process.
+
+    Args:
+        test_class: Class of the test, importable by the worker.
+        test_state: Attributes of the test from _plot_worker_state().
+
+    Returns:
+        tuple: (plot_list, linked_plots, crash) where crash is None or the
+        formatted traceback of the exception that stopped plotting.
+    """
+    test = test_class.__new__(test_class)
+    test.__dict__.update(test_state)
+    print_banner(f'{test.get_name()} Plotting. . .')
+    try:
+        _open_plot_database(test, read_only=True)
+        _convert_test_plots(test, test.plot())
+    except Exception:
+        return (None, None, traceback.format_exc())
+    return (test.plot_list, test.linked_plots, None)
+
+
 class Plugin_Manager():  # pylint: disable=no-member; attributes (plugins, project_path, verbose, component_list, project_folder_name, bench_image_locations, traceability_items) are set dynamically via setattr from the settings dict in __init__
     """Plugin_ manager.
 
@@ -664,7 +762,8 @@ class Plugin_Manager():  # pylint: disable=no-member; attributes (plugins, proje
         """
         self._notification_functions.append(fn)
 
-    def _convert_svg(self, plot):
+    @staticmethod
+    def _convert_svg(plot):
         if isinstance(plot, LTC_plot.plot):
             page = LTC_plot.Page(
                 rows_x_cols=None,
@@ -1461,12 +1560,23 @@ class Plugin_Manager():  # pylint: disable=no-member; attributes (plugins, proje
                     pass
 
     def plot(self, database=None, table_name=None, plot_filepath=None,
-             test_list=None, skip_email_input=False):
+             test_list=None, skip_email_input=False, processes=None):
         """Run the plot method of each test in self.tests. Any plots returned by a test script's plot method will be emailed if the notifications plugin is used.
         Configures or updates the plot with the specified parameters.
 
         Generates or configures a visual representation of the data.
 
+        With *processes* above 1, each test's plot() and SVG conversion run
+        in a pool of worker processes, each with its own read-only
+        connection to the database.  Test classes must then be importable
+        from their module (guard scripts with ``if __name__ == '__main__':``)
+        and plot() cannot use self.pm or any other attribute that does not
+        pickle.  Results are merged in test order, so _plots and
+        _linked_plots come out the same as when plotting serially.
+
+        Set LTC_plot.RENDER_CACHE_DIR to reuse the SVGs of plots whose data
+        and settings have not changed since an earlier run.
+
 
         >>> from PyICe.plugins.plugin_manager import Plugin_Manager
         >>> hasattr(Plugin_Manager, 'plot')
@@ -1478,45 +1588,31 @@ class Plugin_Manager():  # pylint: disable=no-member; attributes (plugins, proje
             plot_filepath: Where the plots will be placed upon creation. If left blank, a plots directory is created next to the plot script.
             test_list: List of test class objects that have plot methods you want to run. Defaults to every test added to the plugin manager.
             skip_email_input: If True, will not empty the _plots list. Useful in replotting during archive.
+            processes: Number of worker processes to plot with. None or 1 plots every test in this process, one after another.
         """
         if not skip_email_input:
             self._plots = []
             self._linked_plots = {}
-        reset_db = False
-        reset_tn = False
-        reset_pf = False
         if test_list is None:
             test_list = self.tests
         print_banner('Plotting. . .')
+        if processes is not None and processes > 1:
+            plot_tests = []
+            for test in test_list:
+                if not test._skip_plot and hasattr(
+                        test, 'plot') and not test._is_crashed:
+                    self._prepare_plot(test, database, table_name, plot_filepath)
+                    plot_tests.append(test)
+                elif test._is_crashed:
+                    print(f"{test.get_name()} crashed. Skipping plot.")
+            self._plot_parallel(plot_tests, skip_email_input, processes)
+            return
         for test in test_list:
             if not test._skip_plot and hasattr(
                     test, 'plot') and not test._is_crashed:
-                test.plot_list = []
-                test.linked_plots = {}
                 print_banner(f'{test.get_name()} Plotting. . .')
-                if database is None:
-                    database = test.get_db_file()
-                    reset_db = True
-                else:
-                    test._db_file = database
-                if table_name is None:
-                    test._table_name = test.get_name()
-                    reset_tn = True
-                else:
-                    test._table_name = table_name
-                if plot_filepath is None:
-                    test._plot_filepath = os.path.dirname(
-                        os.path.abspath(database))
-                    reset_pf = True
-                else:
-                    test._plot_filepath = plot_filepath
-                test._db = sqlite_data(
-                    database_file=database,
-                    table_name=test.get_table_name())
-                if f"{test.get_table_name()}_all" in test._db.get_table_names():
-                    # Redirect to presets-joined table
-                    test._table_name = f"{test.get_table_name()}_all"
-                    test._db.set_table(test.get_table_name())
+                self._prepare_plot(test, database, table_name, plot_filepath)
+                _open_plot_database(test)
                 returned_plots = None
                 try:
                     returned_plots = test.plot()
@@ -1531,35 +1627,76 @@ class Plugin_Manager():  # pylint: disable=no-member; attributes (plugins, proje
                                 'y', 'yes']:
                             pdb.post_mortem()
                     continue
-                if isinstance(test.plot_list, (LTC_plot.plot, LTC_plot.Page)):
-                    test.plot_list = [self._convert_svg(test.plot_list)]
-                else:
-                    assert isinstance(test.plot_list, list)
-                    test.plot_list = [
-                        self._convert_svg(plt) for plt in test.plot_list]
-                if isinstance(returned_plots, (LTC_plot.plot, LTC_plot.Page)):
-                    test.plot_list = [self._convert_svg(returned_plots)]
-                elif isinstance(returned_plots, list):
-                    test.plot_list = [
-                        self._convert_svg(plt) for plt in returned_plots]
-                else:
-                    assert returned_plots is None
-                for plot_group in test.linked_plots:
-                    test.linked_plots[plot_group] = [
-                        self._convert_svg(plt) for plt in test.linked_plots[plot_group]]
+                _convert_test_plots(test, returned_plots)
                 if not skip_email_input:
                     self._plots.extend(test.plot_list)
                     self._linked_plots.update(test.linked_plots)
                 print_banner(f'Plotting for {test.get_name()} complete.')
-                if reset_db:
-                    database = None
-                if reset_tn:
-                    table_name = None
-                if reset_pf:
-                    plot_filepath = None
             elif test._is_crashed:
                 print(f"{test.get_name()} crashed. Skipping plot.")
 
+    def _prepare_plot(self, test, database, table_name, plot_filepath):
+        test.plot_list = []
+        test.linked_plots = {}
+        if database is None:
+            database = test.get_db_file()
+        else:
+            test._db_file = database
+        if table_name is None:
+            test._table_name = test.get_name()
+        else:
+            test._table_name = table_name
+        if plot_filepath is None:
+            test._plot_filepath = os.path.dirname(os.path.abspath(database))
+        else:
+            test._plot_filepath = plot_filepath
+
+    def _plot_parallel(self, tests, skip_email_input, processes):
+        """Plot *tests* in worker processes and merge the SVG source in test order.
+
+        A test whose plot() raises, or whose worker process dies, is
+        reported and skipped like in serial plotting.  In debug mode its
+        plot() is replayed in this process so that pdb.post_mortem() can
+        inspect the failure.
+
+        Args:
+            tests: Tests already set up by _prepare_plot().
+            skip_email_input: If True, leave _plots and _linked_plots alone.
+            processes: Maximum number of worker processes.
+        """
+        settings = {name: getattr(LTC_plot, name) for name in _PLOT_WORKER_SETTINGS}
+        with concurrent.futures.ProcessPoolExecutor(max_workers=processes, initializer=_plot_worker_init,
+                                                    initargs=(settings,)) as executor:
+            futures = [executor.submit(_plot_worker, type(test), _plot_worker_state(test))
+                       for test in tests]
+            for (test, future) in zip(tests, futures):
+                try:
+                    (plot_list, linked_plots, crash) = future.result()
+                except Exception:
+                    # The worker could not run the test at all.
+                    (plot_list, linked_plots, crash) = (None, None, traceback.format_exc())
+                if crash is not None:
+                    # Don't stop other test's plotting or archiving because of
+                    # a plotting error.
+                    print(f"Plot method for {test.get_name()} crashed.")
+                    print(crash, end='')
+                    if test._debug:
+                        response = input("Debug [y/n]? ")
+                        if response is not None and response.lower() in [
+                                'y', 'yes']:
+                            _open_plot_database(test)
+                            try:
+                                test.plot()
+                            except Exception:
+                                pdb.post_mortem()
+                    continue
+                test.plot_list = plot_list
+                test.linked_plots = linked_plots
+                if not skip_email_input:
+                    self._plots.extend(test.plot_list)
+                    self._linked_plots.update(test.linked_plots)
+                print_banner(f'Plotting for {test.get_name()} complete.')
+
     def evaluate(self, database=None, table_name=None, test_list=None):
         """Run the evaluate method of each test in self.tests.
 
@@ -41,6 +41,7 @@ import xml.etree.ElementTree as ET
 from PyICe.lab_utils.str2num import str2num
 from PyICe.lab_utils.interpolator import interpolator
 import json
+import numpy
 import traceback
 from PyICe.ipxact_parser import (IpxactParser, ipxact_access_to_rw,
                                  ipxact_modified_write_to_pyice)
@@ -108,6 +109,7 @@ class twi_instrument(lab_core.instrument, lab_core.delegator):
         self._streaming_enabled = False
         # self._previous_command_codes = []
         self._addr7 = None
+        self._rmw_write_queue = None
 
     def add_register(self, name, addr7, command_code, size, offset,
                      word_size, is_readable, is_writable, overwrite_others=False):
@@ -269,6 +271,7 @@ class twi_instrument(lab_core.instrument, lab_core.delegator):
         Returns:
             ``results_ord_dict`` mapping channel name → read value.
         """
+        self._flush_rmw_write_queue()
         start_streaming = False
         cc_data = {}
         for data_size in set([ch.get_attribute('word_size')
@@ -541,6 +544,10 @@ class twi_instrument(lab_core.instrument, lab_core.delegator):
 
     def _read_merge_write(self, data, addr7, command_code,
                           size, offset, word_size, is_readable, overwrite_others):
+        if self._rmw_write_queue is not None:
+            self._queue_rmw_write(data, addr7, command_code, size, offset,
+                                  word_size, is_readable, overwrite_others)
+            return
         new_data = self.compute_rmw_writeback_data(data=data,
                                                    addr7=addr7,
                                                    command_code=command_code,
@@ -556,6 +563,120 @@ class twi_instrument(lab_core.instrument, lab_core.delegator):
                                                                       data_size=word_size,
                                                                       use_pec=self._PEC))
 
+    def write_delegated_channel_list(self, channel_value_list):
+        """Batch-write bitfields, merging consecutive writes to one register.
+
+        Each channel is written normally (limits, formats, presets and
+        callbacks all apply) but the bus transaction is deferred.  Bitfields
+        that land in the same register are merged into one
+        read-modify-write, and the resulting register writes are sent with
+        ``write_register_list`` once every channel has been processed.
+
+        Only consecutive bitfield writes to the same register are merged;
+        registers are written in program order, so a write to another
+        register in between starts a new register write.
+        A bitfield written twice in one batch starts a new register write
+        rather than overwriting the pending one, so pulses survive.
+        Channels with a write delay flush the pending writes and are
+        written immediately so that the delay follows the bus write.
+
+
+        >>> from PyICe.twi_instrument import twi_instrument
+        >>> hasattr(twi_instrument, 'write_delegated_channel_list')
+        True
+
+        Args:
+            channel_value_list: Iterable of ``(twi_register, value)`` tuples.
+
+        Returns:
+            list: The value returned by each channel's ``write()``, in order.
+        """
+        results = []
+        self._rmw_write_queue = []
+        try:
+            for (register, value) in channel_value_list:
+                if register.get_write_delay():
+                    self._flush_rmw_write_queue()
+                    self._rmw_write_queue = None
+                    results.append(register.write(value))
+                    self._rmw_write_queue = []
+                else:
+                    results.append(register.write(value))
+        finally:
+            self._flush_rmw_write_queue()
+            self._rmw_write_queue = None
+        return results
+
+    def _queue_rmw_write(self, data, addr7, command_code, size, offset,
+                         word_size, is_readable, overwrite_others):
+        mask = (2**size - 1) << offset if word_size > 0 else None
+        if self._rmw_write_queue:
+            pending = self._rmw_write_queue[-1]
+            if (pending['addr7'] == addr7
+                    and pending['command_code'] == command_code
+                    and pending['word_size'] == word_size
+                    and mask is not None and pending['mask'] is not None
+                    and not pending['mask'] & mask
+                    and pending['is_readable'] == is_readable
+                    and pending['overwrite_others'] == overwrite_others):
+                pending['mask'] |= mask
+                pending['bitfields'].append((data, size, offset))
+                return
+        self._rmw_write_queue.append({'addr7': addr7,
+                                      'command_code': command_code,
+                                      'word_size': word_size,
+                                      'is_readable': is_readable,
+                                      'overwrite_others': overwrite_others,
+                                      'mask': mask,
+                                      'bitfields': [(data, size, offset)],
+                                      })
+
+    def _flush_rmw_write_queue(self):
+        if not self._rmw_write_queue:
+            return
+        queue, self._rmw_write_queue = self._rmw_write_queue, []
+        burst = []
+        for pending in queue:
+            if any(command_code == pending['command_code'] for (_, cc_data_list) in burst
+                   for (command_code, _) in cc_data_list):
+                # the read-back for this write must see the earlier one
+                self._write_register_burst(burst)
+                burst = []
+            (data, size, offset) = pending['bitfields'][0]
+            (reg_data, command_code) = self.compute_rmw_writeback_data(data=data,
+                                                                       addr7=pending['addr7'],
+                                                                       command_code=pending['command_code'],
+                                                                       size=size,
+                                                                       offset=offset,
+                                                                       word_size=pending['word_size'],
+                                                                       is_readable=pending['is_readable'],
+                                                                       overwrite_others=pending['overwrite_others'] or pending['mask'] == 2**pending['word_size'] - 1
+                                                                       )
+            for (data, size, offset) in pending['bitfields'][1:]:
+                reg_data = self._replace(bf_data=int(data),
+                                         bf_size=size,
+                                         bf_offset=offset,
+                                         reg_data=reg_data,
+                                         reg_size=pending['word_size']
+                                         )
+            # consecutive registers of the same width go out in one call
+            if burst and burst[-1][0] == (pending['addr7'], pending['word_size']):
+                burst[-1][1].append((command_code, reg_data))
+            else:
+                burst.append(((pending['addr7'], pending['word_size']), [(command_code, reg_data)]))
+        self._write_register_burst(burst)
+
+    def _write_register_burst(self, burst):
+        for ((addr7, word_size), cc_data_list) in burst:
+            debug_logging.debug(
+                "TWI instrument writing %s registers to %s",
+                len(cc_data_list),
+                addr7)
+            self._twi_try_function(lambda: self._interface.write_register_list(addr7=addr7,
+                                                                               cc_data_list=cc_data_list,
+                                                                               data_size=word_size,
+                                                                               use_pec=self._PEC))
+
     def enable_cached_read(self, include_readable_registers=False):
         """Disable remote read of writable register and instead return cached previous write.
 
@@ -1088,13 +1209,23 @@ class twi_instrument(lab_core.instrument, lab_core.delegator):
                 raise Exception(
                     "'transform_from_points()' requires one of either: 'format' or 'unformat'")
         else:
-            # revert to PyICe.lab_utils.interpolator
+            # revert to PyICe.lab_utils.interpolator, built on first use
+            # (unused formats with bad points must not break populate)
+            pwl = []
+
+            def get_pwl():
+                if not pwl:
+                    pwl.append(interpolator(xyevalpoints))
+                return pwl[0]
             if direction == "format":
-                return lambda x: None if x is None else float(
-                    interpolator(xyevalpoints)(x))
+                def format_function(x):
+                    if x is None:
+                        return None
+                    y = get_pwl()(x)
+                    return y if isinstance(y, numpy.ndarray) else float(y)
+                return format_function
             elif direction == "unformat":
-                return lambda y: int(
-                    round(interpolator(xyevalpoints).get_x_val(float(y))))
+                return lambda y: int(round(get_pwl().get_x_val(float(y))))
             else:
                 raise Exception(
                     "'transform_from_points()' requires one of either: 'format' or 'unformat'")
@@ -1216,7 +1347,9 @@ class pmbus_instrument(twi_instrument):
             Returns:
                 The paged write result.
             """
-            self.set_page(channel.get_attribute('page'))
+            if self._rmw_write_queue is None:
+                # batched writes set the page once per run instead
+                self.set_page(channel.get_attribute('page'))
             return channel.pmbus_unpaged_write(data)
         new_register = twi_instrument.add_register(
             self,
@@ -1290,6 +1423,39 @@ class pmbus_instrument(twi_instrument):
                 'page') == page or merge_none and not idx and ch.get_attribute('page') is None]))
         return results
 
+    def write_delegated_channel_list(self, channel_value_list):
+        """Batch-write registers, one merged burst per run of same-page writes.
+
+        The page register is set once for each run of consecutive writes to
+        the same page; see :meth:`twi_instrument.write_delegated_channel_list`.
+
+
+        >>> from PyICe.twi_instrument import pmbus_instrument
+        >>> hasattr(pmbus_instrument, 'write_delegated_channel_list')
+        True
+
+        Args:
+            channel_value_list: Iterable of ``(twi_register, value)`` tuples.
+
+        Returns:
+            list: The value returned by each channel's ``write()``, in order.
+        """
+        results = []
+        run = []
+        run_page = None
+        for (register, value) in channel_value_list:
+            page = register.get_attribute('page')
+            if run and page != run_page:
+                self.set_page(run_page)
+                results.extend(twi_instrument.write_delegated_channel_list(self, run))
+                run = []
+            run_page = page
+            run.append((register, value))
+        if run:
+            self.set_page(run_page)
+            results.extend(twi_instrument.write_delegated_channel_list(self, run))
+        return results
+
 
 class twi_instrument_dummy(twi_instrument):
     """Use for formatters, etc without having to set up a master and physical hardware.
@@ -1313,6 +1479,7 @@ class twi_instrument_dummy(twi_instrument):
         """
         lab_core.instrument.__init__(self, name="twi_instrument_dummy")
         self._addr7 = None
+        self._rmw_write_queue = None
         self.formatters = {}
         self._constants = {}
 
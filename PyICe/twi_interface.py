@@ -65,6 +65,33 @@ if s is a string, then: s.encode('latin-1') == bytes([ord(c) for c in s])'''
 STR_ENCODING = 'latin-1'
 PMBUS_COMMAND_EXTENSION = 0xFF
 MFR_SPECIFIC_COMMAND_EXT = 0xFE
+
+
+def _pec_table():
+    """Build the byte-wise look-up table used by twi_interface.pec().
+
+    Entry n is the SMBus CRC-8 (x^8 + x^2 + x^1 + 1) of the single byte n, computed bit-serially msb first.
+
+    >>> _pec_table()[1]
+    7
+
+    Returns:
+        Tuple of 256 ints.
+    """
+    table = []
+    for byte in range(256):
+        crc = byte
+        for cycle in range(8):
+            crc <<= 1
+            if crc & 0x100:  # msb was set before left shift
+                crc ^= 0x107
+        table.append(crc)
+    return tuple(table)
+
+
+_PEC_TABLE = _pec_table()
+
+
 class twi_interface(object, metaclass=abc.ABCMeta):
     """Base class for all I2C/SMBus hardware backends.
 
@@ -93,6 +120,7 @@ class twi_interface(object, metaclass=abc.ABCMeta):
     - write_register(addr7, commandCode, data, data_size, use_pec)
     - read_register(addr7, commandCode, data_size, use_pec)
     - read_register_list(addr7, cc_list, data_size, use_pec)
+    - write_register_list(addr7, cc_data_list, data_size, use_pec)
     - Protocol convenience: write_byte, write_word, write_32, write_64,
       read_byte, read_word, read_32, read_64, send_byte, receive_byte,
       and their _pec variants.
@@ -206,6 +234,9 @@ class twi_interface(object, metaclass=abc.ABCMeta):
                 return self._hw_batch_read(addr7, cc_list)
             return super()._do_read_register_list(addr7, cc_list, data_size, use_pec)
 
+    _do_write_register_list(addr7, cc_data_list, data_size, use_pec) is the
+    write-side counterpart, used by twi_instrument for batched channel writes.
+
     Rules for Backend Authors
     -------------------------
     1. NEVER override write_register, read_register, or protocol-named methods
@@ -611,17 +642,40 @@ class twi_interface(object, metaclass=abc.ABCMeta):
         # http://smbus.org/faq/crc8Applet.htm
         # http://www.hackersdelight.org/crc.pdf
 
+        # Byte-wise look-up table: _PEC_TABLE[n] is the bit-serial result of shifting byte n through the CRC register.
         crc = 0
-        poly = 0x07  # x^8 + x^2 + x^1 + 1, discard x^8 term
         for byte in byteList:
-            # big endian -> msb goes in first
-            crc ^= byte
-            for cycle in range(8):
-                crc <<= 1
-                if (crc & 0x100):  # msb was set before left shift ( & 0x80)
-                    # xor with crc if pre-shift msb was 1
-                    crc ^= poly
-        return int(crc & 0xFF)
+            crc = _PEC_TABLE[crc ^ byte]
+        return crc
+
+    @classmethod
+    def pec_array(cls, byteLists):
+        """PEC of many equal-length transactions at once.
+
+        Runs the same look-up table as pec() down the columns of a 2-D array, so the Python loop is over byte
+        position rather than over transactions. Passing transactions that include their received PEC byte
+        returns 0 for every transaction that checks out.
+
+        >>> twi_interface.pec_array([[0x90, 0x01, 0x91, 0xAB, 0xCD], [0x00, 0x00, 0x00, 0x00, 0x01]]).tolist()
+        [147, 7]
+        >>> twi_interface.pec_array([[0x90, 0x01, 0x91, 0xAB, 0xCD, 147]]).tolist()
+        [0]
+
+        Args:
+            byteLists: Sequence of equal-length byte lists, or a 2-D integer array with one transaction per row.
+
+        Returns:
+            numpy.ndarray of uint8, one PEC per transaction.
+        """
+        import numpy
+        frames = numpy.asarray(byteLists, dtype=numpy.uint8)
+        if frames.ndim != 2:
+            raise ValueError(f"pec_array expects one transaction per row, got shape {frames.shape}")
+        table = numpy.array(_PEC_TABLE, dtype=numpy.uint8)
+        crc = numpy.zeros(frames.shape[0], dtype=numpy.uint8)
+        for column in frames.T:
+            crc = table[crc ^ column]
+        return crc
 
     @classmethod
     def get_byte(cls, data, bytenum):
@@ -1938,6 +1992,48 @@ class twi_interface(object, metaclass=abc.ABCMeta):
         """
         return {cc: self._do_read_register(addr7, cc, data_size, use_pec) for cc in cc_list}
 
+    def write_register_list(self, addr7, cc_data_list, data_size, use_pec):
+        """Write several registers of one device in a single burst.
+
+        Validates every ``(commandCode, data)`` pair before anything is sent,
+        then delegates to the backend-specific _do_write_register_list
+        implementation.  Registers are written in list order.
+
+
+        >>> d = i2c_dummy(delay=0, p_change=0, seed=42)
+        >>> d.write_register_list(0x48, [(0x10, 0xAB), (0x20, 0xCD)], data_size=8, use_pec=False)
+        >>> d.read_register_list(0x48, [0x10, 0x20], data_size=8, use_pec=False)
+        {16: 171, 32: 205}
+        >>> d.write_register_list(0x48, [(0x10, 0x1AB)], data_size=8, use_pec=False)
+        Traceback (most recent call last):
+            ...
+        ValueError: Data value 0x1AB exceeds 8-bit range (max 0xFF)
+
+        Args:
+            addr7: 7-bit I2C device address.
+            cc_data_list: List of ``(commandCode, data)`` tuples to write.
+            data_size: Number of data bits to transfer (-1, 0, 8, 16, 32, or 64).
+            use_pec: If True, use PEC (Packet Error Checking).
+
+        Raises:
+            TypeError: If a required argument is None.
+            ValueError: If arguments are out of range or inconsistent.
+        """
+        for (commandCode, data) in cc_data_list:
+            self._validate_write_args(addr7, commandCode, data, data_size)
+        return self._do_write_register_list(addr7, cc_data_list, data_size, use_pec)
+
+    def _do_write_register_list(self, addr7, cc_data_list, data_size, use_pec):
+        """Default sequential implementation. Override for HW-accelerated batch writes.
+
+        >>> d = i2c_dummy(delay=0, p_change=0, seed=42)
+        >>> d._do_write_register_list(0x48, [(0x10, 0x01), (0x10, 0x02)], data_size=8, use_pec=False)
+        >>> d.read_register(0x48, 0x10, data_size=8, use_pec=False)
+        2
+        """
+        for (commandCode, data) in cc_data_list:
+            self._do_write_register(addr7, commandCode, data, data_size, use_pec)
+
     def print_warning(self, operation):
         """Perform print warning operation.
         Outputs the warning to the console or display.
@@ -3914,25 +4010,22 @@ class i2c_scpi(twi_interface):
                 pec_list = data[1::2]
             else:
                 raise Exception("Implementation incomplete")
-            for cc, value, pec in zip(cc_list, data_list, pec_list):
-                if fmt_str == 'H':
-                    if self.pec([self.write_addr(addr7), cc, self.read_addr(
-                            addr7), self.get_byte(value, 0), self.get_byte(value, 1), pec]):
-                        raise i2cPECError(
-                            'PEC failure at address: {}, command code: {}. Read: {}. Expected: {}'.format(
-                                addr7, cc, pec, self.pec(
-                                    [
-                                        self.write_addr(addr7), cc, self.read_addr(addr7), self.get_byte(
-                                            value, 0), self.get_byte(
-                                            value, 1)])))
-                elif fmt_str == 'B':
-                    if self.pec([self.write_addr(addr7), cc,
-                                self.read_addr(addr7), value, pec]):
-                        raise i2cPECError('PEC failure at address: {}, command code: {}. Read: {}. Expected: {}'.format(
-                            addr7, cc, pec, self.pec([self.write_addr(addr7), cc, self.read_addr(addr7), value])))
-                else:
-                    raise Exception("Implementation incomplete")
-                results[cc] = value
+            # Check every register's PEC in one pass; each transaction is [wr_addr, cc, rd_addr, data..., pec].
+            wr_addr, rd_addr = self.write_addr(addr7), self.read_addr(addr7)
+            if fmt_str == 'H':
+                frames = [[wr_addr, cc, rd_addr, self.get_byte(value, 0), self.get_byte(value, 1), pec]
+                          for cc, value, pec in zip(cc_list, data_list, pec_list)]
+            elif fmt_str == 'B':
+                frames = [[wr_addr, cc, rd_addr, value, pec] for cc, value, pec in zip(cc_list, data_list, pec_list)]
+            else:
+                raise Exception("Implementation incomplete")
+            if frames:
+                failures = self.pec_array(frames).nonzero()[0]
+                if len(failures):
+                    frame = frames[failures[0]]
+                    raise i2cPECError('PEC failure at address: {}, command code: {}. Read: {}. Expected: {}'.format(
+                        addr7, frame[1], frame[-1], self.pec(frame[:-1])))
+            results.update((cc, value) for cc, value, pec in zip(cc_list, data_list, pec_list))
         else:
             for cc, value in zip(cc_list, data):
                 results[cc] = value
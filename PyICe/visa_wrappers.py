@@ -74,6 +74,12 @@ try:
 except BaseException:
     telnetlib = None  # type: ignore[assignment]
     telnetlibMissing = True
+try:
+    import numpy  # pylint: disable=import-error; optional dependency guarded by try/except
+    numpyMissing = False
+except BaseException:
+    numpy = None  # type: ignore[assignment]
+    numpyMissing = True
 
 # Default str to bytes encoding to use. latin-1 is the simplest encoding -- it requires all characters of a string to
 # be amongst Unicode code points 0x000000 - 0x0000ff inclusive, and converts each code point value to a byte. Hence
@@ -234,7 +240,7 @@ class visa_wrapper(object):
             'Interface Not Fully Implemented: read_values()')
 
     def read_values_binary(self, format_str='=B',
-                           byte_order='=', terminationCharacter=''):
+                           byte_order='=', terminationCharacter='', as_array=False):
         """Read binary data in IEEE 488.2 Definite Length Arbitrary Block format.
 
         Parses the ``#<header_len><data_len><data>`` framing used by most
@@ -256,6 +262,7 @@ class visa_wrapper(object):
                 ``'<'`` little-endian, ``'>'`` big-endian).
             terminationCharacter: Expected trailing character(s) after the
                 binary payload (often empty or ``'\\n'``).
+            as_array: Return a ``numpy`` array instead of a tuple.
 
         Raises:
             NotImplementedError: Always; subclasses must override.
@@ -306,7 +313,7 @@ class visa_wrapper(object):
         return self.read_values()
 
     def ask_for_values_binary(
-            self, message, format_str='B', byte_order='=', terminationCharacter=''):
+            self, message, format_str='B', byte_order='=', terminationCharacter='', as_array=False):
         """Send a query and read the response as IEEE 488.2 binary block data.
 
         Combines ``write_raw(message)`` and ``read_values_binary()`` into a
@@ -325,6 +332,7 @@ class visa_wrapper(object):
                 ``'>'``).
             terminationCharacter: Expected trailing character(s) after the
                 binary payload.
+            as_array: Return a ``numpy`` array instead of a tuple.
 
         Returns:
             A tuple of unpacked numeric values from the binary response.
@@ -332,7 +340,7 @@ class visa_wrapper(object):
         assert isinstance(message, bytes)
         self.write_raw(message)  # pylint: disable=no-member; write_raw is defined in subclasses (visa_wrapper_serial, visa_wrapper_vxi11, etc.) that actually use this method
         return self.read_values_binary(
-            format_str, byte_order, terminationCharacter)
+            format_str, byte_order, terminationCharacter, as_array=as_array)
 
     def clear(self):
         """Clear buffered data and status registers.
@@ -442,6 +450,309 @@ class visa_wrapper(object):
 str_encoding = 'latin-1'
 
 
+_block_dtypes = {}
+
+
+def _block_dtype(format_str, byte_order):
+    """Return the numpy dtype matching a one-element struct format.
+
+    >>> _block_dtype('H', '>').str
+    '>u2'
+
+    Args:
+        format_str: struct format character, e.g. ``'H'`` or ``'f'``.
+        byte_order: struct byte order character.
+
+    Returns:
+        numpy.dtype with the same size and byte order as the struct format.
+
+    Raises:
+        ValueError: If format_str has no single-element numpy equivalent.
+    """
+    try:
+        return _block_dtypes[(format_str, byte_order)]
+    except KeyError:
+        pass
+    if numpyMissing:
+        raise ValueError('as_array requires numpy')
+    try:
+        dtype = numpy.dtype(byte_order + format_str)
+    except TypeError:
+        dtype = None
+    if dtype is None or dtype.itemsize != struct.calcsize(byte_order + format_str):
+        # e.g. multi-field formats like 'HB', or 'l', which numpy sizes per platform.
+        raise ValueError('Binary block format {!r} has no single numpy dtype; '
+                         'read it with as_array=False.'.format(byte_order + format_str))
+    _block_dtypes[(format_str, byte_order)] = dtype
+    return dtype
+
+
+def _unpack_block(format_str, byte_order, data):
+    """Unpack a block of repeated struct records into a flat tuple.
+
+    Single-character formats use a counted struct format (``'>500H'``) rather
+    than repeating the character once per sample.
+
+    >>> _unpack_block('HB', '>', bytes([0, 1, 2, 0, 3, 4]))
+    (1, 2, 3, 4)
+
+    Args:
+        format_str: struct format for one record, e.g. ``'H'`` or ``'HB'``.
+        byte_order: struct byte order character.
+        data: Block payload.
+
+    Returns:
+        Tuple of every field of every record.
+    """
+    record = struct.Struct(byte_order + format_str)
+    if len(format_str) == 1 and format_str not in 'spx':
+        return struct.unpack('{}{}{}'.format(byte_order, len(data) // record.size, format_str), data)
+    return tuple(field for fields in record.iter_unpack(data) for field in fields)
+
+
+class _buffered_reader(object):
+    """Buffered line and binary-block reader over a serial-like port.
+
+    Pulls everything the port reports in ``in_waiting`` with a single
+    ``read()`` call and keeps it in a ``bytearray``, so that lines and
+    IEEE 488.2 definite length blocks are parsed from memory instead of one
+    ``read(1)`` call per byte. Bytes past the end of a line or block stay
+    buffered for the next call. Ports that return ``str`` (such as
+    ``interface_raw_serial.read``) are read through their ``read_raw``
+    method when available, or re-encoded with latin-1 otherwise.
+
+    >>> from PyICe.visa_wrappers import _buffered_reader
+    >>> hasattr(_buffered_reader, 'readline')
+    True
+
+    """
+    def __init__(self, port, port_name, empty_reads=1):
+        """Initialize _buffered_reader.
+
+        >>> from PyICe.visa_wrappers import _buffered_reader
+        >>> hasattr(_buffered_reader, '__init__')
+        True
+
+        Args:
+            port: PySerial-like object with ``read(size)`` and optionally
+                ``in_waiting``/``inWaiting()`` and ``read_raw(size)``.
+            port_name: Port name used in timeout messages.
+            empty_reads: Number of consecutive empty reads treated as a
+                timeout. A real serial port only returns nothing once its own
+                timeout has expired, so the default is 1.
+        """
+        self.port = port
+        self.port_name = port_name
+        self.empty_reads = empty_reads
+        self.buffer = bytearray()
+        self._read = getattr(port, 'read_raw', port.read)
+
+    def _in_waiting(self):
+        """Return the number of bytes the port reports ready, for PySerial <3.0 too."""
+        try:
+            return self.port.in_waiting
+        except AttributeError:
+            return self.port.inWaiting()
+
+    def _read_chunk(self, size):
+        """Read at least one byte, or whatever the port reports waiting if that's more.
+
+        Args:
+            size: Number of bytes the caller still needs.
+
+        Returns:
+            The bytes read, empty on timeout.
+        """
+        return self._read(max(self._in_waiting(), size, 1))
+
+    def _read_available(self):
+        """Read whatever is waiting without blocking.
+
+        Returns:
+            The bytes read, possibly empty.
+        """
+        waiting = self._in_waiting()
+        return self._read(waiting) if waiting else b''
+
+    def _fill(self, size=1):
+        """Append at least one new byte to the buffer.
+
+        Args:
+            size: Number of bytes the caller still needs.
+
+        Returns:
+            False if the port timed out without returning data.
+        """
+        for _ in range(self.empty_reads):
+            data = self._read_chunk(size)
+            if data:
+                if isinstance(data, str):
+                    data = data.encode(str_encoding)
+                self.buffer += data
+                return True
+        return False
+
+    def readline(self, terminator):
+        """Return buffered bytes up to and including the next terminator.
+
+        >>> from PyICe.visa_wrappers import _buffered_reader
+        >>> hasattr(_buffered_reader, 'readline')
+        True
+
+        Args:
+            terminator: Line termination bytes.
+
+        Returns:
+            The line as a bytearray, terminator included.
+
+        Raises:
+            visaWrapperException: If the port times out before a terminator
+                arrives. The partial line is discarded.
+        """
+        start = 0
+        while True:
+            end = self.buffer.find(terminator, start)
+            if end >= 0:
+                end += len(terminator)
+                line = self.buffer[:end]
+                del self.buffer[:end]
+                return line
+            start = max(len(self.buffer) - len(terminator) + 1, 0)
+            if not self._fill():
+                del self.buffer[:]
+                raise visaWrapperException(
+                    "Serial timeout on port {}!".format(self.port_name))
+
+    def read_exact(self, size):
+        """Return exactly size bytes.
+
+        >>> from PyICe.visa_wrappers import _buffered_reader
+        >>> hasattr(_buffered_reader, 'read_exact')
+        True
+
+        Args:
+            size: Number of bytes to return.
+
+        Returns:
+            A bytearray of length size.
+
+        Raises:
+            visaWrapperException: If the port times out first.
+        """
+        while len(self.buffer) < size:
+            if not self._fill(size - len(self.buffer)):
+                raise visaWrapperException(
+                    "Serial timeout on port {} after {} of {} bytes!".format(
+                        self.port_name, len(self.buffer), size))
+        data = self.buffer[:size]
+        del self.buffer[:size]
+        return data
+
+    def read_block(self):
+        """Return the payload of the next definite length arbitrary block.
+
+        Bytes ahead of the ``#`` are discarded, as the byte-wise reader did.
+
+        >>> from PyICe.visa_wrappers import _buffered_reader
+        >>> hasattr(_buffered_reader, 'read_block')
+        True
+
+        Returns:
+            The block payload as a bytearray, without its ``#<n><len>`` header.
+
+        Raises:
+            visaWrapperException: On timeout, or for indefinite length (``#0``)
+                blocks, which have no byte count to read.
+        """
+        while True:
+            start = self.buffer.find(b'#')
+            if start >= 0:
+                break
+            if self.buffer:
+                print('Saw {} extra characters in read_values_binary header: {!r}'.format(
+                    len(self.buffer), bytes(self.buffer)))
+                del self.buffer[:]
+            if not self._fill():
+                raise visaWrapperException(
+                    'Timeout in read_values_binary header')
+        if start:
+            print('Saw {} extra characters in read_values_binary header: {!r}'.format(
+                start, bytes(self.buffer[:start])))
+        del self.buffer[:start + 1]
+        header_len = int(self.read_exact(1))
+        if header_len == 0:
+            raise visaWrapperException(
+                'Indefinite length block (#0) not supported by read_values_binary')
+        data_len = int(self.read_exact(header_len))
+        return self.read_exact(data_len)
+
+    def drain(self):
+        """Discard and return everything buffered or waiting at the port.
+
+        >>> from PyICe.visa_wrappers import _buffered_reader
+        >>> hasattr(_buffered_reader, 'drain')
+        True
+
+        Returns:
+            The discarded bytes.
+        """
+        data = self._read_available()
+        if isinstance(data, str):
+            data = data.encode(str_encoding)
+        drained = bytes(self.buffer) + bytes(data)
+        del self.buffer[:]
+        return drained
+
+
+class _buffered_telnet_reader(_buffered_reader):
+    """_buffered_reader over a ``telnetlib.Telnet`` connection.
+
+    Telnet has no ``in_waiting``; eagerly available data is taken with
+    ``read_very_eager()`` and otherwise ``read_until()`` blocks for the line
+    terminator or the timeout, whichever comes first.
+
+    >>> from PyICe.visa_wrappers import _buffered_telnet_reader
+    >>> hasattr(_buffered_telnet_reader, 'readline')
+    True
+
+    """
+    def __init__(self, port, port_name, timeout):
+        """Initialize _buffered_telnet_reader.
+
+        >>> from PyICe.visa_wrappers import _buffered_telnet_reader
+        >>> hasattr(_buffered_telnet_reader, '__init__')
+        True
+
+        Args:
+            port: Open telnetlib.Telnet object.
+            port_name: Port name used in timeout messages.
+            timeout: Timeout in seconds for each blocking read.
+        """
+        super().__init__(port, port_name)
+        self.timeout = timeout
+        self.terminator = b'\n'
+
+    def readline(self, terminator):
+        """Return the next line, remembering terminator for blocking reads.
+
+        Args:
+            terminator: Line termination bytes.
+
+        Returns:
+            The line as a bytearray, terminator included.
+        """
+        self.terminator = terminator
+        return super().readline(terminator)
+
+    def _read_chunk(self, size):
+        """Read what's available, else block until the terminator or timeout."""
+        return self.port.read_very_eager() or self.port.read_until(self.terminator, self.timeout)
+
+    def _read_available(self):
+        """Read what's available without blocking."""
+        return self.port.read_very_eager()
+
+
 class visa_wrapper_serial(visa_wrapper):
     """Visa_wrapper_serial.
 
@@ -481,6 +792,7 @@ class visa_wrapper_serial(visa_wrapper):
         elif isinstance(address_or_serial_obj, telnetlib.Telnet):
             self.ser = address_or_serial_obj
             serial_port_name = "telnetlib.Telnet emulated serial port"
+            self._reader = _buffered_telnet_reader(self.ser, serial_port_name, timeout)
         elif isinstance(address_or_serial_obj, (str, None)):
             self.ser = serial.Serial()
             self.ser.port = address_or_serial_obj		# open the specified serial port
@@ -491,6 +803,8 @@ class visa_wrapper_serial(visa_wrapper):
         else:
             raise ValueError("visa_wrapper_serial() called with {}{} instead of expected address string "
                              "or serial.Serial object.".format(type(address_or_serial_obj), address_or_serial_obj))
+        if not hasattr(self, '_reader'):
+            self._reader = _buffered_reader(self.ser, serial_port_name)
         try:
             # self.terminationCharacter = kwargs['terminationCharacter'].encode(str_encoding)
             self.terminationCharacter = kwargs['terminationCharacter']
@@ -505,13 +819,12 @@ class visa_wrapper_serial(visa_wrapper):
         self.resync()
 
     def readline(self):
-        # TODO: speed this up using buffered IO to wrap serial port
-        # readline() of ser doesn't work correctly
-        # https://docs.python.org/2/library/io.html#io.TextIOWrapper
-        # http://pyserial.readthedocs.org/en/latest/shortintro.html#eol
+        # readline() of ser doesn't support a termination character, so lines
+        # are split out of _buffered_reader's bulk reads instead.
         """Return the readline.
 
-        Reads data from the underlying source and returns it.
+        Reads data from the underlying source and returns it, including the
+        termination character.
 
 
         >>> from PyICe.visa_wrappers import visa_wrapper_serial
@@ -526,22 +839,11 @@ class visa_wrapper_serial(visa_wrapper):
         """
         dbgprint(
             "vvv-- visa_wrapper_serial.readline({}) entered".format(self.serial_port_name))
-        # response = bytes()
-        response = str()
-        while True:
-            char = self.ser.read(1)
-            response += char
-            if char == self.terminationCharacter:
-                break
-            elif len(char) == 0:
-                raise visaWrapperException(
-                    "Serial timeout on port {}!".format(
-                        self.ser.port))
-                # print "Serial timeout on port {}!".format(self.ser.port)
+        terminator = (self.terminationCharacter or "\n").encode(str_encoding)
+        response = strify(self._reader.readline(terminator))
         dbgprint("^^^-- visa_wrapper_serial.readline({}) returns "
                  "{}".format(self.serial_port_name, repr(response)))
         return response
-        # return strify(response)
 
     def read(self):
         """Read and return the current channel value.
@@ -634,7 +936,7 @@ class visa_wrapper_serial(visa_wrapper):
         return valtup
 
     def read_values_binary(self, format_str='B',
-                           byte_order='=', terminationCharacter=''):
+                           byte_order='=', terminationCharacter='', as_array=False):
         """Follows Definite Length Arbitrary Block format.
 
         ie ASCII header '#<heder_bytes_following><data_bytes_following><data0>...<dataN>
@@ -670,10 +972,15 @@ class visa_wrapper_serial(visa_wrapper):
         >>> hasattr(visa_wrapper_serial, 'read_values_binary')
         True
 
+        as_array=True decodes the block with numpy.frombuffer instead of struct,
+        which is much faster for long waveforms. format_str must then describe
+        a single numeric element.
+
         Args:
             byte_order: Byte order to use.
             format_str: Format str to use.
             terminationCharacter: Terminationcharacter to use.
+            as_array: Return a numpy array instead of a tuple.
 
         Returns:
             The read values binary result.
@@ -683,25 +990,19 @@ class visa_wrapper_serial(visa_wrapper):
         """
         dbgprint(
             "vvv-- visa_wrapper_serial.read_values_binary({}) entered".format(self.serial_port_name))
-        hash = self.ser.read(1)
-        while hash != '#':
-            if len(hash):
-                print(
-                    'Saw extra character code: {} in read_values_binary header'.format(
-                        ord(hash)))
-            else:  # timeout
-                raise visaWrapperException(
-                    'Timeout in read_values_binary header')
-            hash = self.ser.read(1)
-        header_len = int(self.ser.read(1))
-        data_len = int(self.ser.read(header_len))
-        data = self.ser.read(data_len).encode('latin-1')
-        _term = self.ser.read(len(terminationCharacter))  # noqa: F841
-        format_len = struct.calcsize(format_str)
-        fmt = byte_order + format_str * (data_len // format_len)
+        data = self._reader.read_block()
+        if terminationCharacter:
+            try:
+                self._reader.read_exact(len(terminationCharacter))
+            except visaWrapperException:
+                pass  # A missing trailing terminator doesn't invalidate the block.
+        if as_array:
+            values = numpy.frombuffer(data, dtype=_block_dtype(format_str, byte_order))
+        else:
+            values = _unpack_block(format_str, byte_order, data)
         dbgprint("^^^-- visa_wrapper_serial.read_values_binary({}) "
-                 "returns struct({})".format(self.serial_port_name, repr(fmt)))
-        return struct.unpack(fmt, data)
+                 "returns {} {}{} values".format(self.serial_port_name, len(values), byte_order, format_str))
+        return values
 
     def read_raw(self):
         """Return read raw result.
@@ -769,9 +1070,9 @@ class visa_wrapper_serial(visa_wrapper):
         True
 
         Returns:
-            True if resynchronization succeeded.
+            Whatever was discarded from the input buffer.
         """
-        return self.ser.read(self.ser.inWaiting())
+        return strify(self._reader.drain())
 
     def close(self):
         """Close the connection and release resources.
@@ -904,7 +1205,7 @@ class visa_wrapper_telnet(visa_wrapper_serial):
         """
         port = telnetlib.Telnet(ip_address, port, timeout=timeout)
         self._timeout = timeout
-        visa_wrapper_serial.__init__(self, port)
+        visa_wrapper_serial.__init__(self, port, timeout=timeout)
 
     def resync(self):
         """Return the resync.
@@ -917,35 +1218,16 @@ class visa_wrapper_telnet(visa_wrapper_serial):
         True
 
         Returns:
-            True if resynchronization succeeded.
+            Whatever was discarded from the input buffer.
         """
-        return self.ser.read_very_eager()
-
-    def readline(self):
-        """Return the readline.
-
-        Reads data from the underlying source and returns it.
-
-
-        >>> from PyICe.visa_wrappers import visa_wrapper_telnet
-        >>> hasattr(visa_wrapper_telnet, 'readline')
-        True
-
-        Returns:
-            The value read from the device or channel.
-        """
-        response = self.ser.read_until(
-            self.terminationCharacter, self._timeout)
-        if response[-1] != self.terminationCharacter:
-            print("Telnet timeout on port {}!".format(self.ser.port))
-            # prolly should raise exception here (I am Dave)
-        return response
+        return strify(self._reader.drain())
 
     def __getTimeout(self):
         return self._timeout
 
     def __setTimeout(self, timeout):
         self._timeout = timeout
+        self._reader.timeout = timeout
     timeout = property(__getTimeout, __setTimeout)
 
 
@@ -1477,7 +1759,7 @@ class visa_interface(visa_wrapper):
         return self.visaInterface.ask_for_values(message).rstrip()
 
     def ask_for_values_binary(
-            self, message, format_str='B', byte_order='=', terminationCharacter=''):
+            self, message, format_str='B', byte_order='=', terminationCharacter='', as_array=False):
         """Return ask for values binary result.
 
         Supports the ``visa_interface`` workflow by performing the described operation.
@@ -1492,6 +1774,7 @@ class visa_interface(visa_wrapper):
             format_str: Format str to use.
             message: Human-readable message string.
             terminationCharacter: Terminationcharacter to use.
+            as_array: Return a numpy array instead of a list.
 
         Returns:
             List of numeric values parsed from the instrument response.
@@ -1501,7 +1784,8 @@ class visa_interface(visa_wrapper):
         else:
             is_big_endian = True  # Maybe not quite right... '='?
         return self.visaInterface.query_binary_values(
-            message, datatype=format_str, is_big_endian=is_big_endian)
+            message, datatype=format_str, is_big_endian=is_big_endian,
+            container=numpy.array if as_array else list)
 
     def clear(self):
         """Clear buffered data and status registers.
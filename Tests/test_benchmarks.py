@@ -0,0 +1,337 @@
+"""Throughput benchmarks for hot paths.
+
+These are marked ``slow`` and print their measurements rather than
+asserting on absolute timings, which vary too much between machines.
+Run them with ``pytest -m slow -s Tests/test_benchmarks.py``.
+"""
+import time
+import pytest
+
+
+def _time_per_call(function, repeat):
+    """Return the mean wall time of *function* over *repeat* calls.
+
+    Args:
+        function: Zero-argument callable to time.
+        repeat: Number of calls.
+
+    Returns:
+        Mean seconds per call.
+    """
+    function()  # warm caches
+    t_start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - t_start) / repeat
+
+
+@pytest.mark.slow
+@pytest.mark.threading
+class TestReadChannelListOverhead:
+    """Per-read Python overhead of master.read_channel_list()."""
+
+    CHANNELS_PER_INSTRUMENT = 30
+    INSTRUMENTS = 100
+
+    @pytest.fixture
+    def bench(self, master_instance):
+        """Build a master with many dummy-interface instruments.
+
+        Args:
+            master_instance: Master instance.
+
+        Returns:
+            Tuple of (master, channel list).
+        """
+        from PyICe.lab_core import instrument, delegator, channel
+
+        class dummy_instrument(instrument, delegator):
+            def __init__(self, name):
+                instrument.__init__(self, name)
+                delegator.__init__(self)
+
+        m = master_instance
+        channels = []
+        for i in range(self.INSTRUMENTS):
+            inst = dummy_instrument(f'inst{i}')
+            inst._add_interface(m.get_dummy_interface(name=f'iface{i}'))
+            for j in range(self.CHANNELS_PER_INSTRUMENT):
+                ch = channel(f'inst{i}_ch{j}', read_function=lambda: 0.0)
+                ch.set_delegator(inst)
+                channels.append(inst._add_channel(ch))
+            m.add(inst)
+        return m, channels
+
+    def test_cached_plan_vs_rebuild(self, bench):
+        """Compare reads reusing the cached scan plan with reads that rebuild it.
+
+        Args:
+            bench: Benchmark master and channels.
+        """
+        m, channels = bench
+        cached = _time_per_call(lambda: m.read_channel_list(channels), 20)
+        rebuilt = _time_per_call(
+            lambda: (m.invalidate_scan_plans(), m.read_channel_list(channels)), 20)
+        print(f'\n{len(channels)} channels / {self.INSTRUMENTS} delegators: '
+              f'cached plan {cached * 1e3:.2f} ms/read, '
+              f'rebuilt plan {rebuilt * 1e3:.2f} ms/read')
+        assert len(m.read_channel_list(channels)) == len(channels)
+
+
+@pytest.mark.slow
+class TestChannelNameResolution:
+    """Cost of resolving channel names in a deep channel_group tree."""
+
+    GROUPS = 200
+    CHANNELS_PER_GROUP = 25
+
+    def test_get_channel_and_all_names(self):
+        """Time get_channel() lookups and get_all_channel_names() on a large tree."""
+        from PyICe.lab_core import channel_group, channel
+        root = channel_group('root')
+        for i in range(self.GROUPS):
+            sub = channel_group(f'grp{i}')
+            for j in range(self.CHANNELS_PER_GROUP):
+                sub.add(channel(f'grp{i}_ch{j}'))
+            root.add(sub)
+        names = root.get_all_channel_names()
+        last = names[-1]
+        lookup = _time_per_call(lambda: root.get_channel(last), 1000)
+        listing = _time_per_call(root.get_all_channel_names, 100)
+        print(f'\n{len(names)} channels in {self.GROUPS} groups: '
+              f'get_channel {lookup * 1e6:.2f} us, '
+              f'get_all_channel_names {listing * 1e3:.3f} ms')
+        assert root.get_channel(last).get_name() == last
+
+
+@pytest.mark.slow
+@pytest.mark.database
+class TestLoggerBackendThroughput:
+    """Rows per second stored by logger_backend, one row per INSERT vs batched."""
+
+    ROWS = 2000
+
+    @pytest.mark.parametrize('column_count', [10, 100, 1000])
+    def test_rows_per_second(self, tmp_path, column_count):
+        """Store ROWS rows of *column_count* columns with and without batching.
+
+        Args:
+            tmp_path: Tmp path.
+            column_count: Channels per row.
+        """
+        from PyICe.lab_core import logger_backend
+        columns = {f'ch{i}': 'NUMERIC' for i in range(column_count)}
+        rates = {}
+        for label, max_rows in (('unbatched', 1), ('batched', 200)):
+            backend = logger_backend(database=str(tmp_path / f'{label}.sqlite'))
+            backend.new_table('bench', columns)
+            backend.set_batching(max_rows=max_rows, max_latency=None)
+            t_start = time.perf_counter()
+            for row in range(self.ROWS):
+                data = {'rowid': None, 'datetime': '2026-01-01T00:00:00.000000Z'}
+                data.update((name, row * 0.5) for name in columns)
+                backend.store(data)
+            backend.sync_threads()
+            rates[label] = self.ROWS / (time.perf_counter() - t_start)
+            backend.stop()
+        print(f'\n{column_count} columns: '
+              + ', '.join(f'{label} {rate:,.0f} rows/s' for label, rate in rates.items()))
+        assert rates['batched'] > 0
+
+
+@pytest.mark.slow
+@pytest.mark.database
+class TestSqliteBulkRead:
+    """Row-by-row numpy/pandas conversion vs the columnar chunked reader."""
+
+    ROWS = 100000
+
+    def test_bulk_read(self, tmp_path):
+        """Load a logger-style table both ways and compare wall time.
+
+        Args:
+            tmp_path: Tmp path.
+        """
+        import sqlite3
+        from PyICe.lab_utils.sqlite_data import sqlite_data
+        db_path = str(tmp_path / 'bulk.sqlite')
+        conn = sqlite3.connect(db_path)
+        conn.execute('CREATE TABLE bench ( rowid INTEGER PRIMARY KEY, datetime DATETIME, '
+                     '"vin" NUMERIC, "vout" NUMERIC, "iout" NUMERIC )')
+        conn.executemany('INSERT INTO bench (datetime, vin, vout, iout) VALUES (?, ?, ?, ?)',
+                         ((f'2026-01-01T00:{i // 60000 % 60:02d}:{i // 1000 % 60:02d}.{i % 1000:06d}Z',
+                           i * 0.001, i * 0.002, i * 0.003) for i in range(self.ROWS)))
+        conn.commit()
+        conn.close()
+        db = sqlite_data(table_name='bench', database_file=db_path)
+        timings = {
+            'rows recarray': _time_per_call(db.numpy_recarray, 1),
+            'columnar recarray': _time_per_call(lambda: db.numpy_recarray(columnar=True), 1),
+        }
+        # read_sql_query cannot build a frame from the custom tzinfo, so compare on numbers only.
+        db.query('SELECT vin, vout, iout FROM bench')
+        timings['rows dataframe'] = _time_per_call(db.pandas_dataframe, 1)
+        timings['columnar dataframe'] = _time_per_call(lambda: db.pandas_dataframe(columnar=True), 1)
+        print(f'\n{self.ROWS} rows: '
+              + ', '.join(f'{label} {seconds:.3f} s' for label, seconds in timings.items()))
+        assert len(db.columns()['vin']) == self.ROWS
+
+
+@pytest.mark.slow
+@pytest.mark.database
+class TestSqlitePagination:
+    """OFFSET slicing vs keyset chunks when walking a table page by page."""
+
+    ROWS = 1000000
+    PAGE = 1000
+
+    def test_page_walk(self, tmp_path):
+        """Walk the whole table one page at a time both ways.
+
+        Args:
+            tmp_path: Tmp path.
+        """
+        import sqlite3
+        from PyICe.lab_utils.sqlite_data import sqlite_data
+        db_path = str(tmp_path / 'pages.sqlite')
+        conn = sqlite3.connect(db_path)
+        conn.execute('CREATE TABLE bench ( rowid INTEGER PRIMARY KEY, "vout" REAL )')
+        conn.executemany('INSERT INTO bench (vout) VALUES (?)', ((i * 0.001,) for i in range(self.ROWS)))
+        conn.commit()
+        conn.close()
+        db = sqlite_data(table_name='bench', database_file=db_path)
+
+        def offset_walk():
+            return sum(len(db[start:start + self.PAGE]) for start in range(0, self.ROWS, self.PAGE))
+
+        def keyset_walk():
+            return sum(len(chunk) for chunk in db.chunks(self.PAGE))
+
+        timings = {
+            'len': _time_per_call(lambda: len(db), 5),
+            'offset slices': _time_per_call(offset_walk, 1),
+            'keyset chunks': _time_per_call(keyset_walk, 1),
+        }
+        print(f'\n{self.ROWS} rows: '
+              + ', '.join(f'{label} {seconds:.3f} s' for label, seconds in timings.items()))
+        assert keyset_walk() == self.ROWS
+
+
+@pytest.mark.slow
+class TestSerialReadThroughput:
+    """Byte-at-a-time vs buffered line and binary block reads from SerialTestHarness."""
+
+    LINES = 2000
+    SAMPLES = 100000
+
+    def test_readline(self):
+        """Read the same ASCII lines one byte per read() and through _buffered_reader."""
+        import itertools
+        from PyICe.lab_interfaces import SerialTestHarness
+        from PyICe.visa_wrappers import _buffered_reader
+        line = b'+1.23456789E+00,+2.34567890E-03\n'
+
+        def bytewise():
+            harness = SerialTestHarness(itertools.cycle(line), 4096)
+            for _ in range(self.LINES):
+                response = bytearray()
+                while response[-1:] != b'\n':
+                    response += harness.read(1)  # empty reads here are harness noise, not timeouts
+
+        def buffered():
+            reader = _buffered_reader(SerialTestHarness(itertools.cycle(line), 4096), 'bench', empty_reads=100)
+            for _ in range(self.LINES):
+                reader.readline(b'\n')
+
+        timings = {
+            'bytewise': _time_per_call(bytewise, 1),
+            'buffered': _time_per_call(buffered, 1),
+        }
+        print(f'\n{self.LINES} lines: '
+              + ', '.join(f'{label} {seconds:.3f} s' for label, seconds in timings.items()))
+
+    def test_binary_block(self):
+        """Decode one definite length block with a repeated struct format and with numpy."""
+        import struct
+        import numpy
+        from PyICe.visa_wrappers import _block_dtype, _unpack_block
+        data = struct.pack(f'>{self.SAMPLES}H', *(i % 65536 for i in range(self.SAMPLES)))
+        timings = {
+            'repeated struct format': _time_per_call(lambda: struct.unpack('>' + 'H' * self.SAMPLES, data), 5),
+            'counted struct format': _time_per_call(lambda: _unpack_block('H', '>', data), 5),
+            'numpy.frombuffer': _time_per_call(lambda: numpy.frombuffer(data, dtype=_block_dtype('H', '>')), 5),
+        }
+        print(f'\n{self.SAMPLES} samples: '
+              + ', '.join(f'{label} {seconds * 1e3:.3f} ms' for label, seconds in timings.items()))
+        assert tuple(numpy.frombuffer(data, dtype=_block_dtype('H', '>'))) == _unpack_block('H', '>', data)
+
+
+@pytest.mark.slow
+class TestPecThroughput:
+    """Bit-serial vs look-up table vs batch SMBus PEC over a register list scan."""
+
+    FRAMES = 10000
+
+    def test_pec(self):
+        """Check the PEC of many read-word transactions three ways."""
+        import random
+        from PyICe.twi_interface import twi_interface
+        rng = random.Random(0)
+        frames = [[0xB0, rng.randrange(256), 0xB1, rng.randrange(256), rng.randrange(256)] for _ in range(self.FRAMES)]
+
+        def bitwise_pec(byte_list):
+            crc = 0
+            for byte in byte_list:
+                crc ^= byte
+                for _ in range(8):
+                    crc <<= 1
+                    if crc & 0x100:
+                        crc ^= 0x07
+            return crc & 0xFF
+
+        timings = {
+            'bitwise': _time_per_call(lambda: [bitwise_pec(frame) for frame in frames], 3),
+            'table': _time_per_call(lambda: [twi_interface.pec(frame) for frame in frames], 3),
+            'pec_array': _time_per_call(lambda: twi_interface.pec_array(frames), 3),
+        }
+        print(f'\n{self.FRAMES} frames: '
+              + ', '.join(f'{label} {seconds * 1e3:.2f} ms' for label, seconds in timings.items()))
+        assert twi_interface.pec_array(frames).tolist() == [bitwise_pec(frame) for frame in frames]
+
+
+@pytest.mark.slow
+class TestStreamWindowThroughput:
+    """Packets per second through StreamWindow with copying and memoryview accessors."""
+
+    PACKETS = 20000
+
+    def test_packets_per_second(self):
+        """Parse bobbytalk-framed packets replayed by SerialTestHarness."""
+        import itertools
+        import struct
+        from PyICe.lab_interfaces import SerialTestHarness
+        from PyICe.lab_utils.StreamWindow import StreamWindow
+        payload = bytes(range(64))
+        packet = b'LT' + struct.pack('>HHH', 0x0020, 0xABCD, len(payload)) + payload + b'\x00\x00'
+
+        def parse(views):
+            sw = StreamWindow(SerialTestHarness(itertools.cycle(packet), 4096))
+            peek = sw.peek_view if views else sw.peek
+            read = sw.read_view if views else sw.read
+            for _ in range(self.PACKETS):
+                header = peek(8)
+                while len(header) < 8:
+                    header = peek(8)
+                sop, src, dest, length = struct.unpack_from('>HHHH', header)
+                assert sop == 0x4C54
+                size = 8 + length + 2
+                while len(peek(size)) < size:
+                    pass
+                read(size)
+
+        timings = {
+            'copy': _time_per_call(lambda: parse(False), 1),
+            'views': _time_per_call(lambda: parse(True), 1),
+        }
+        print(f'\n{self.PACKETS} packets: '
+              + ', '.join(f'{label} {self.PACKETS / seconds:.0f} pkt/s' for label, seconds in timings.items()))
@@ -1,5 +1,7 @@
 """Tests for data utils."""
 import math
+import struct
+import warnings
 import numpy
 import pytest
 from PyICe.data_utils.units_conversions import dBV, dBm, Vpp_to_VRMS, VRMS_to_Vpp
@@ -8,6 +10,10 @@ from PyICe.data_utils.EMI_char_levels import (IEC61967_2_uppercase,
                                               IEC61967_2_lowercase)
 from PyICe.data_utils.signal_generator import signal_generator, lfsr_period_generator
 from PyICe.data_utils.spectrum_analyzer import spectrum_analyzer
+from PyICe.data_utils.wave_analysis import waveform, waveform_batch
+from PyICe.data_utils.stdf_utils import stdf_reader
+from PyICe.data_utils.LTspice_waveform_reader import LTspice_wavereader
+from PyICe.data_utils.pattern_generators import TWI_Pattern
 
 
 class TestUnitsConversions:
@@ -336,3 +342,408 @@ class TestSpectrumAnalyzer:
         xf, yf = sa.compute_fft(dc_signal)
         peak_idx = numpy.argmax(yf)
         assert xf[peak_idx] == pytest.approx(0.0, abs=50)
+
+
+class TestWaveformAnalysis:
+    """Tests for the waveform and waveform_batch analyzers."""
+
+    @pytest.fixture
+    def captures(self):
+        """Build a sweep of noisy load steps with ringing of varying size.
+
+        Returns:
+            Result value.
+        """
+        rng = numpy.random.default_rng(0)
+        x = numpy.arange(1000) * 1e-6
+        columns = numpy.arange(1000)
+        ring = rng.uniform(0.05, 0.5, (20, 1)) * numpy.exp(-(columns - 400) / 40.0) * numpy.sin(columns / 5.0)
+        y = numpy.where(columns >= 400, 1.0 + ring, 0.0) + rng.normal(0, 0.002, (20, 1000))
+        return x, y
+
+    def test_pairs_and_columns_agree(self, captures):
+        """Perform test pairs and columns agree operation.
+
+        Args:
+            captures: Captures.
+        """
+        x, y = captures
+        by_columns = waveform((x, y[0]), trigger_sigma=5)
+        by_pairs = waveform(list(zip(x, y[0])), trigger_sigma=5)
+        assert by_pairs.xdata.dtype == numpy.float64
+        assert numpy.array_equal(by_pairs.ydata, by_columns.ydata)
+        assert by_pairs.settling_time(0.98, 1.02) == by_columns.settling_time(0.98, 1.02)
+
+    def test_from_blobs_does_not_copy(self, captures):
+        """Perform test from blobs does not copy operation.
+
+        Args:
+            captures: Captures.
+        """
+        x, y = captures
+        blob = y[0].tobytes()
+        w = waveform.from_blobs(x.tobytes(), blob, trigger_sigma=5)
+        assert numpy.shares_memory(w.ydata, numpy.frombuffer(blob))
+        assert w.rise_time() == pytest.approx(waveform((x, y[0]), trigger_sigma=5).rise_time())
+
+    def test_analysis_does_not_build_figure(self, captures):
+        """Perform test analysis does not build figure operation.
+
+        Args:
+            captures: Captures.
+        """
+        x, y = captures
+        w = waveform((x, y[0]), trigger_sigma=5)
+        w.settling_time(0.98, 1.02)
+        w.settling_time_outside_limit(0.02)
+        assert w._plt is None
+        assert len(w.plt.center) >= 5
+
+    def test_settling_time(self, captures):
+        """Perform test settling time operation.
+
+        Args:
+            captures: Captures.
+        """
+        x, y = captures
+        w = waveform((x, y[0]), trigger_sigma=5)
+        settled = w.settling_time(0.98, 1.02)
+        last_outside = numpy.flatnonzero((y[0] >= 1.02) | (y[0] <= 0.98))[-1]
+        assert w.trigger_index() == 400
+        assert settled == pytest.approx(x[last_outside] - x[400])
+
+    @pytest.mark.parametrize("measurement", [
+        ("settling_time", 0.98, 1.02),
+        ("settling_time_from_max_deviation", 1.02, "pos"),
+        ("settling_time_outside_limit", 0.5),
+        ("rise_time",),
+        ("overshoot",),
+        ("find_first_rising_edge", 1.0),
+    ])
+    def test_batch_matches_waveform(self, captures, measurement):
+        """Perform test batch matches waveform operation.
+
+        Args:
+            captures: Captures.
+            measurement: Measurement.
+        """
+        x, y = captures
+        name, args = measurement[0], measurement[1:]
+        batch = waveform_batch(x, y, trigger_sigma=5)
+        expected = [getattr(batch[i], name)(*args) for i in range(len(batch))]
+        expected = [numpy.nan if value == -1 and name.startswith('settling') else value for value in expected]
+        numpy.testing.assert_allclose(getattr(batch, name)(*args), expected)
+
+    def test_batch_rejects_ragged_captures(self):
+        """Perform test batch rejects ragged captures operation."""
+        with pytest.raises(ValueError):
+            waveform_batch(numpy.arange(10.0), numpy.zeros((3, 12)))
+
+
+def _stdf_record(typ, sub, payload):
+    """Pack one little-endian STDF V4 record.
+
+    Args:
+        typ: Record type.
+        sub: Record sub-type.
+        payload: Packed record fields.
+
+    Returns:
+        Record bytes.
+    """
+    return struct.pack('<HBB', len(payload), typ, sub) + payload
+
+
+def _stdf_part(part_id, tests, soft_bin=1, part_flag=0, x=0, y=0):
+    """Pack the PIR, PTRs and PRR for one part.
+
+    Args:
+        part_id: Part id string.
+        tests: List of (test number, test flag, result) tuples.
+        soft_bin: Soft bin.
+        part_flag: PRR part flag.
+        x: Wafer x coordinate.
+        y: Wafer y coordinate.
+
+    Returns:
+        Record bytes.
+    """
+    records = [_stdf_record(5, 10, struct.pack('<BB', 1, 0))]
+    for testnum, flag, result in tests:
+        records.append(_stdf_record(15, 10, struct.pack('<IBBBBf', testnum, 1, 0, flag, 0, result) + b'\x04TEST'))
+    records.append(_stdf_record(5, 20, struct.pack('<BBBHHHhhI', 1, 0, part_flag, len(tests), soft_bin, soft_bin, x, y, 0)
+                                + struct.pack('<B', len(part_id)) + part_id.encode()))
+    return b''.join(records)
+
+
+class TestStdfReader:
+    """Tests for the columnar stdf_reader."""
+
+    @pytest.fixture
+    def stdf_file(self, tmp_path):
+        """Write a three part lot with one retested part and one skipped test.
+
+        Args:
+            tmp_path: Tmp path.
+
+        Returns:
+            Result value.
+        """
+        lot = b''.join([
+            _stdf_record(0, 10, struct.pack('<BB', 2, 4)),
+            _stdf_record(1, 10, struct.pack('<II', 1600000000, 1600000100)),
+            _stdf_part('1', [(100, 0, 1.5), (200, 0, 2.5)], x=3, y=-4),
+            _stdf_part('2', [(100, 0x80, 9.0)], soft_bin=5, part_flag=8),
+            _stdf_part('3', [(100, 0, 0.25), (200, 0, 0.75)]),
+            _stdf_part('2', [(100, 0, 1.25), (200, 0, 2.0)]),
+            _stdf_record(1, 20, struct.pack('<I', 1600000200)),
+        ])
+        path = tmp_path / 'lot.stdf'
+        path.write_bytes(lot)
+        return str(path)
+
+    def test_columnar_results(self, stdf_file):
+        """Perform test columnar results operation.
+
+        Args:
+            stdf_file: Stdf file.
+        """
+        reader = stdf_reader(stdf_file)
+        assert reader.get_all_part_indices() == ['1', '2', '3']
+        assert reader.testnums.tolist() == [100, 200]
+        assert reader.results.shape == (3, 2)
+        assert reader.get_all_of_testnum(200) == {'1': 2.5, '2': 2.0, '3': 0.75}
+        assert reader.get_testnum_results(100).tolist() == [1.5, 1.25, 0.25]
+        assert reader.get_value(3, 100) == 0.25
+        assert reader.get_all_of_testnum(300) == {}
+        assert (reader.get_xlocation(1), reader.get_ylocation(1)) == (3, -4)
+
+    def test_retest_replaces_part(self, stdf_file):
+        """Perform test retest replaces part operation.
+
+        Args:
+            stdf_file: Stdf file.
+        """
+        reader = stdf_reader(stdf_file)
+        assert reader.part_passed(2)
+        assert reader.test_passed(2, 100)
+        assert reader.get_bin_number(2) == 1
+        assert reader.get_all_passing_parts() == ['1', '2', '3']
+
+    def test_untested_and_failed_tests(self, tmp_path, stdf_file):
+        """Perform test untested and failed tests operation.
+
+        Args:
+            tmp_path: Tmp path.
+            stdf_file: Stdf file.
+        """
+        path = tmp_path / 'fail.stdf'
+        with open(stdf_file, 'rb') as f:
+            lot = f.read()
+        path.write_bytes(lot[:lot.index(_stdf_part('3', [(100, 0, 0.25), (200, 0, 0.75)]))]
+                         + _stdf_record(1, 20, struct.pack('<I', 0)))
+        reader = stdf_reader(str(path))
+        assert reader.test_passed(2, 100) is False
+        assert reader.test_passed(2, 200) is None
+        assert reader.get_value(2, 200) is None
+        assert reader.tested.tolist() == [[True, True], [True, False]]
+        assert reader.passed.tolist() == [[True, True], [False, False]]
+        assert reader.get_all_in_bins_list([5]) == ['2']
+        assert not reader.part_passed(2)
+
+    def test_cache_round_trip(self, tmp_path, stdf_file, mocker):
+        """Perform test cache round trip operation.
+
+        Args:
+            tmp_path: Tmp path.
+            stdf_file: Stdf file.
+            mocker: Mocker.
+        """
+        cache_dir = tmp_path / 'cache'
+        parsed = stdf_reader(stdf_file, cache_dir=str(cache_dir))
+        assert len(list(cache_dir.iterdir())) == 1
+        scan = mocker.patch.object(stdf_reader, 'scan_file')
+        cached = stdf_reader(stdf_file, cache_dir=str(cache_dir))
+        scan.assert_not_called()
+        assert cached.get_all_part_indices() == parsed.get_all_part_indices()
+        assert numpy.array_equal(cached.results, parsed.results)
+        assert cached.get_all_of_testnum(200) == parsed.get_all_of_testnum(200)
+        assert cached.get_setup_time() == parsed.get_setup_time()
+        assert cached.parts == parsed.parts
+
+
+class TestLTspiceWavereader:
+    """Tests for LTspice_wavereader."""
+
+    @pytest.fixture
+    def export_file(self, tmp_path):
+        """Write a small LTspice 'export data as text' file with variable time steps.
+
+        Args:
+            tmp_path: Tmp path.
+
+        Returns:
+            Result value.
+        """
+        path = tmp_path / 'export.txt'
+        lines = ['time\tV(out)\tI(L1)']
+        for i in range(250):
+            t = (i * i) * 1e-9
+            lines.append(f'{t!r}\t{math.sin(t * 1e5)!r}\t{i * 0.1!r}')
+        path.write_text('\n'.join(lines) + '\n\n')
+        return str(path)
+
+    def test_read_file(self, export_file):
+        """Perform test read file operation.
+
+        Args:
+            export_file: Export file.
+        """
+        reader = LTspice_wavereader(export_file)
+        reader.read_file(chunk_rows=64)
+        data = reader.get_results()
+        assert list(data) == ['time', 'V(out)', 'I(L1)']
+        assert len(data['time']) == 250
+        assert data['I(L1)'][10] == 10 * 0.1
+        assert data['time'][-1] == 249 * 249 * 1e-9
+
+    def test_read_file_trailing_blank_chunk(self, export_file):
+        """Perform test read file trailing blank chunk operation.
+
+        Args:
+            export_file: Export file.
+        """
+        reader = LTspice_wavereader(export_file)
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            reader.read_file(chunk_rows=125)
+        assert len(reader.get_results()['time']) == 250
+
+    def test_read_file_strings(self, export_file):
+        """Perform test read file strings operation.
+
+        Args:
+            export_file: Export file.
+        """
+        reader = LTspice_wavereader(export_file)
+        reader.read_file(floats=False)
+        assert reader.data['I(L1)'][1] == '0.1'
+
+    def test_lazy_columns(self, export_file, mocker):
+        """Perform test lazy columns operation.
+
+        Args:
+            export_file: Export file.
+            mocker: Mocker.
+        """
+        reader = LTspice_wavereader(export_file)
+        load = mocker.spy(reader, '_load_array')
+        reader.read_file(lazy=True)
+        load.assert_not_called()
+        assert reader.data['I(L1)'][3] == pytest.approx(0.3)
+        assert reader.data['I(L1)'] is reader.data['I(L1)']
+        load.assert_called_once()
+        assert load.call_args.kwargs['usecols'] == [2]
+
+    def test_cache_sidecar(self, export_file, mocker):
+        """Perform test cache sidecar operation.
+
+        Args:
+            export_file: Export file.
+            mocker: Mocker.
+        """
+        first = LTspice_wavereader(export_file)
+        first.read_file(cache=True)
+        second = LTspice_wavereader(export_file)
+        load = mocker.spy(second, '_load_array')
+        second.read_file(cache=True, lazy=True)
+        load.assert_not_called()
+        assert isinstance(second.data['V(out)'], numpy.memmap)
+        assert numpy.array_equal(second.data['V(out)'], first.data['V(out)'])
+
+    def test_resample_timeseries(self, export_file):
+        """Perform test resample timeseries operation.
+
+        Args:
+            export_file: Export file.
+        """
+        reader = LTspice_wavereader(export_file)
+        reader.read_file()
+        native = {key: numpy.array(value) for key, value in reader.data.items()}
+        reader.resample_timeseries(1e-6)
+        times = reader.data['time']
+        assert numpy.allclose(numpy.diff(times), times[1] - times[0])
+        assert numpy.allclose(reader.data['V(out)'], numpy.interp(times, native['time'], native['V(out)']))
+
+
+class TestTWIPattern:
+    """Tests for TWI_Pattern."""
+
+    @pytest.fixture
+    def pattern(self):
+        """Build a leader, start, one strobed bit and stop, one time step per unit.
+
+        Returns:
+            Result value.
+        """
+        pattern = TWI_Pattern(tstep=1.0, max_record_size=25)
+        pattern.initialize()
+        pattern.add_item(pattern.Leader(pattern, SCL=1, SDA=1, tleader=4))
+        pattern.add_item(pattern.Start(pattern, thd_sta=2))
+        pattern.add_item(pattern.Bit(pattern, value=1, tlow=5, thigh=3, tsu_dat=1, thd_dat=0, strobe=True))
+        pattern.add_item(pattern.Stop(pattern, tsu_sto=2, tbuf=3))
+        return pattern
+
+    def test_records(self, pattern):
+        """Perform test records operation.
+
+        Args:
+            pattern: Pattern.
+        """
+        pattern.finalize()
+        assert pattern.get_SCL().dtype == numpy.uint8
+        assert pattern.get_SCL().tolist() == [1] * 6 + [0] * 5 + [1] * 8
+        assert pattern.get_SDA().tolist() == [1] * 4 + [0] * 6 + [1] * 4 + [0] * 2 + [1] * 3
+        assert pattern.get_STB().tolist() == [0] * 11 + [1] * 3 + [0] * 5
+        assert len(pattern.SCL) == 19
+
+    def test_spikes(self, pattern):
+        """Perform test spikes operation.
+
+        Args:
+            pattern: Pattern.
+        """
+        pattern.add_item(pattern.SDA_Spike(pattern, value=0, tstart=10, twidth=2))
+        pattern.add_item(pattern.SCL_Spike(pattern, value=1, tstart=6, twidth=1))
+        pattern.add_item(pattern.SCL_Spike(pattern, value=0, tstart=17, twidth=5))
+        pattern.finalize()
+        assert pattern.get_SDA().tolist() == [1] * 4 + [0] * 6 + [1, 0, 0, 1] + [0] * 2 + [1] * 3
+        assert pattern.get_SCL().tolist() == [1] * 6 + [0, 1, 0, 0, 0] + [1] * 7 + [0]
+
+    def test_get_all_and_pad_out(self, pattern):
+        """Perform test get all and pad out operation.
+
+        Args:
+            pattern: Pattern.
+        """
+        pattern.add_item(pattern.SDA_Spike(pattern, value=0, tstart=1, twidth=1))
+        pattern.finalize()
+        pattern.pad_out()
+        (scl, sda, stb) = (pattern.get_SCL(), pattern.get_SDA(), pattern.get_STB())
+        assert len(scl) == len(sda) == len(stb) == 25
+        assert scl[-6:].tolist() == sda[-6:].tolist() == [1] * 6
+        combined = pattern.get_ALL(SCL_channel=1, SDA_channel=2, STB_channel=3)
+        assert combined.dtype == numpy.uint8
+        assert numpy.array_equal(combined, scl + 2 * sda + 4 * stb)
+        assert numpy.array_equal(pattern.get_ALL(SCL_channel=3, SDA_channel=1, STB_channel=2),
+                                 4 * scl + sda + 2 * stb)
+
+    def test_record_too_long(self, pattern):
+        """Perform test record too long operation.
+
+        Args:
+            pattern: Pattern.
+        """
+        pattern.max_record_size = 10
+        with pytest.raises(AssertionError, match='exceeds max record size'):
+            pattern.finalize()
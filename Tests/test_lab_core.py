@@ -1,9 +1,9 @@
 """Tests for lab core."""
-import queue
 import pytest
 from unittest.mock import patch
 from PyICe.lab_core import channel, delegator, ChannelNameException, \
-    ChannelAccessException, ChannelValueException, ChannelException
+    ChannelAccessException, ChannelValueException, ChannelException, \
+    ChannelReadException
 from PyICe.lab_core import integer_channel, channel_group, results_ord_dict
 
 
@@ -597,6 +597,81 @@ class TestIntegerReadChannel:
         assert result is not None
         assert 'int_write_channel' in result
 
+    def test_xypoints_format(self, int_write_chan):
+        """Perform test xypoints format operation.
+
+        Args:
+            int_write_chan: Int write chan.
+        """
+        import numpy
+        int_write_chan.add_format('pwl', xypoints=[(20, 1.0), (0, 0.0), (10, 0.2)])
+        fmt = int_write_chan._formats['pwl']['format_function']
+        assert fmt(5) == pytest.approx(0.1)
+        assert isinstance(fmt(0), float)
+        assert fmt(numpy.arange(0, 31, 5)) == pytest.approx([0.0, 0.1, 0.2, 0.6, 1.0, 1.4, 1.8])
+        assert int_write_chan.unformat(0.6, 'pwl', use_presets=False) == 15
+
+    @pytest.mark.parametrize('format, use_presets', [
+        ('pwl', False), ('pwl', True), ('hex', True), ('signed dec', False), (None, True)])
+    def test_format_array_matches_format(self, int_write_chan, format, use_presets):
+        """Perform test format array matches format operation.
+
+        Args:
+            int_write_chan: Int write chan.
+            format: Format name string.
+            use_presets: If True, apply saved preset configurations.
+        """
+        import numpy
+        int_write_chan.add_format('pwl', signed=True, xypoints=[(-16, -1.0), (0, 0.0), (15, 3.0)])
+        int_write_chan.add_preset('LOW', 1)
+        int_write_chan.add_preset('HIGH', 30)
+        codes = numpy.arange(32)
+        expected = [int_write_chan.format(int(c), format, use_presets) for c in codes]
+        result = list(int_write_chan.format_array(codes, format, use_presets))
+        assert len(result) == len(expected)
+        for got, want in zip(result, expected):
+            assert got == (pytest.approx(want) if isinstance(want, float) else want)
+
+    def test_format_array_sparse_presets(self):
+        """Perform test format array sparse presets operation."""
+        import numpy
+        chan = integer_channel('wide', size=32)
+        chan.add_preset('ZERO', 0)
+        chan.add_preset('ALL_ONES', 0xFFFFFFFF)
+        chan.add_preset('ENABLED', True)
+        result = chan.format_array(numpy.array([0, 1, 5, 0xFFFFFFFF, 0xFFFFFFFE]), None, use_presets=True)
+        assert list(result) == ['ZERO', 1, 5, 'ALL_ONES', 0xFFFFFFFE]
+
+    def test_format_array_dense_presets(self):
+        """Perform test format array dense presets operation."""
+        chan = integer_channel('narrow', size=8)
+        chan.add_preset('ZERO', 0)
+        chan.add_preset('FOUR', 4)
+        assert list(chan.format_array([0, 1, 4, 255, None], None, use_presets=True)) == [
+            'ZERO', 1, 'FOUR', 255, None]
+
+    def test_format_array_64_bit(self):
+        """Perform test format array 64 bit operation."""
+        chan = integer_channel('r', size=64)
+        assert list(chan.format_array([1, 2], 'signed dec', False)) == [
+            chan.format(code, 'signed dec', False) for code in (1, 2)]
+        chan.add_format('signed', signed=True, xypoints=[(-10, -10.0), (10, 10.0)])
+        chan.add_preset('ALL_ONES', 2 ** 64 - 1)
+        codes = [1, 2 ** 64 - 2, 2 ** 63]
+        assert list(chan.format_array(codes, 'signed', False)) == [
+            pytest.approx(chan.format(code, 'signed', False)) for code in codes]
+        assert list(chan.format_array([2 ** 64 - 1, 2 ** 64 - 2], None, True)) == [
+            'ALL_ONES', 2 ** 64 - 2]
+
+    def test_format_array_cache_invalidated(self):
+        """Perform test format array cache invalidated operation."""
+        chan = integer_channel('scaled', size=8)
+        chan.add_format('volts', signed=False, xypoints=[(0, 0.0), (255, 1.0)])
+        assert chan.format_array([255], 'volts', False)[0] == pytest.approx(1.0)
+        assert set(chan.get_formats()) == set(chan._formats)
+        chan.add_format('volts', signed=False, xypoints=[(0, 0.0), (255, 2.0)])
+        assert chan.format_array([255], 'volts', False)[0] == pytest.approx(2.0)
+
     def test_unformat_string(self, int_write_chan):
         """Perform test unformat string operation.
 
@@ -1182,13 +1257,12 @@ class TestChannelGroup:
         group.start_threads(2)
         assert group._threaded is True
         assert group._threads == 2
-        assert hasattr(group, '_read_queue')
-        assert hasattr(group, '_read_results_queue')
+        assert group._read_executor is not None
         with pytest.raises(Exception, match='Threads already started'):
             group.start_threads(1)
-        group._threaded = False
-        for _ in range(2):
-            group._read_queue.put([])
+        group.stop_threads()
+        assert group._threaded is False
+        assert group._read_executor is None
 
     def test_threaded_read_function(self, thread_group):
         """Perform test threaded read function operation.
@@ -1199,11 +1273,10 @@ class TestChannelGroup:
         group, channels = thread_group
         group.start_threads(1)
         readable = [c for c in channels if c.get_name() == 'chan0']
-        group._read_queue.put(readable)
-        result = group._read_results_queue.get(timeout=2)
+        result = group._submit_work_unit(readable).result(timeout=2)
         assert result['chan0'] == 'Reading'
-        group._threaded = False
-        group._read_queue.put([])
+        assert group.get_read_stats()['chan0']['count'] == 1
+        group.stop_threads()
 
     def test_get_threaded_results(self, group):
         """Perform test get threaded results operation.
@@ -1211,19 +1284,18 @@ class TestChannelGroup:
         Args:
             group: Group.
         """
-        group._read_results_queue = queue.Queue()
-        r1 = results_ord_dict()
-        r1['ch_a'] = 1
-        r2 = results_ord_dict()
-        r2['ch_b'] = 2
-        group._read_results_queue.put(r1)
-        group._read_results_queue.put(r2)
-        results = group.get_threaded_results(2)
+        import concurrent.futures
+        ch_a, ch_b, ch_c = (channel(name, read_function=read_function)
+                            for name in ('ch_a', 'ch_b', 'ch_c'))
+        f1, f2, f3 = (concurrent.futures.Future() for _ in range(3))
+        f1.set_result(results_ord_dict(ch_a=1))
+        f2.set_result(results_ord_dict(ch_b=2))
+        f3.set_exception(IOError('read error'))
+        results = group.get_threaded_results({f1: [ch_a], f2: [ch_b], f3: [ch_c]})
         assert results['ch_a'] == 1
         assert results['ch_b'] == 2
-        group._read_results_queue.put(Exception('read error'))
-        with pytest.raises(Exception):
-            group.get_threaded_results(1)
+        assert isinstance(results['ch_c'], ChannelReadException)
+        assert isinstance(results['ch_c'].original_exception, IOError)
 
     def test_read_all_channels(self, thread_group):
         """Perform test read all channels operation.
@@ -1511,3 +1583,634 @@ class TestChannelGroup:
         soup = BeautifulSoup(html, 'html5lib')
         assert soup.find('select', {'name': 'presets'}) is None
         assert soup.find('select', {'name': 'attributes'}) is None
+
+
+class TestScanPlan:
+    """Tests for scan_plan caching and invalidation."""
+
+    def test_plan_reused_between_reads(self, thread_group):
+        """Perform test plan reused between reads operation.
+
+        Args:
+            thread_group: Thread group.
+        """
+        group, (c0, c1, c2, c3, c4) = thread_group
+        plan = group.get_scan_plan([c0, c1, c3])
+        group.read_channel_list([c0, c1, c3])
+        assert group.get_scan_plan([c0, c1, c3]) is plan
+
+    def test_plan_partitions_threadable(self, thread_group):
+        """Perform test plan partitions threadable operation.
+
+        Args:
+            thread_group: Thread group.
+        """
+        group, (c0, c1, c2, c3, c4) = thread_group
+        plan = group.get_scan_plan([c0, c1, c2, c3])
+        assert plan.threadable_channels == (c0, c3)
+        non_threaded = [ch for _, chs in plan.non_threadable_groups
+                        for ch in chs]
+        assert non_threaded == [c1, c2]
+        assert plan.self_delegation_channels == ()
+
+    def test_plan_groups_by_delegator(self):
+        """Perform test plan groups by delegator operation."""
+        group = channel_group('grp')
+        parent = delegator()
+        chans = [channel(name=f'ch{i}', read_function=read_function)
+                 for i in range(4)]
+        for ch in chans[:3]:
+            ch.set_delegator(parent)
+            group.add(ch)
+        group.add(chans[3])
+        plan = group.get_scan_plan(chans)
+        assert [(d, [c.get_name() for c in chs])
+                for d, chs in plan.delegator_groups] == [
+            (parent, ['ch0', 'ch1', 'ch2']), (chans[3], ['ch3'])]
+
+    @pytest.mark.parametrize('mutation', [
+        'add_channel', 'remove_channel', 'set_delegator',
+        'set_allow_threading', 'add_interface'])
+    def test_plan_invalidated(self, thread_group, mutation):
+        """Perform test plan invalidated operation.
+
+        Args:
+            thread_group: Thread group.
+            mutation: Topology change to apply.
+        """
+        group, (c0, c1, c2, c3, c4) = thread_group
+        plan = group.get_scan_plan([c0, c3])
+        if mutation == 'add_channel':
+            group.add(channel(name='late', read_function=read_function))
+        elif mutation == 'remove_channel':
+            group.remove_channel(c4)
+        elif mutation == 'set_delegator':
+            c3.set_delegator(delegator())
+        elif mutation == 'set_allow_threading':
+            c0.set_allow_threading(False)
+        elif mutation == 'add_interface':
+            c0.add_interface('iface')
+        assert not plan.is_current()
+        new_plan = group.get_scan_plan([c0, c3])
+        assert new_plan is not plan
+        if mutation == 'set_allow_threading':
+            assert new_plan.threadable_channels == (c3,)
+
+    def test_resolving_reads_keep_plans(self, thread_group):
+        """Perform test resolving reads keep plans operation.
+
+        Args:
+            thread_group: Thread group.
+        """
+        from PyICe.lab_core import get_topology_generation
+        group, (c0, c1, c2, c3, c4) = thread_group
+        plan = group.get_scan_plan([c0, c3])
+        group.get_all_channels_dict()
+        channels_cache = group._all_channels_cache
+        generation = get_topology_generation()
+        group.read_channels(['chan0', 'chan3'])
+        group.read_all_channels(exclusions=['chan1'])
+        assert get_topology_generation() == generation
+        assert group.get_scan_plan([c0, c3]) is plan
+        group.get_all_channels_dict()
+        assert group._all_channels_cache is channels_cache
+
+    def test_plan_invalidated_by_com_node_change(self, thread_group):
+        """Perform test plan invalidated by com node change operation.
+
+        Args:
+            thread_group: Thread group.
+        """
+        from PyICe.lab_interfaces import communication_node
+        group, (c0, c1, c2, c3, c4) = thread_group
+        plan = group.get_scan_plan([c0])
+        communication_node().set_com_node_thread_safe(True)
+        assert group.get_scan_plan([c0]) is not plan
+
+    def test_plan_cache_bounded(self, group):
+        """Perform test plan cache bounded operation.
+
+        Args:
+            group: Group.
+        """
+        chans = [channel(name=f'ch{i}', read_function=read_function)
+                 for i in range(channel_group._scan_plan_cache_size + 4)]
+        for ch in chans:
+            group.get_scan_plan([ch])
+        assert len(group._scan_plans) == channel_group._scan_plan_cache_size
+
+    def test_copy_does_not_share_plans(self, thread_group):
+        """Perform test copy does not share plans operation.
+
+        Args:
+            thread_group: Thread group.
+        """
+        group, (c0, c1, c2, c3, c4) = thread_group
+        group.get_scan_plan([c0])
+        assert len(group.copy()._scan_plans) == 0
+
+
+class TestNameIndex:
+    """Name resolution through the cached channel index."""
+
+    @pytest.fixture
+    def tree(self):
+        """Root group with two nested instruments-like sub groups.
+
+        Returns:
+            tuple: ``(root, mid, leaf)`` channel groups.
+        """
+        root, mid, leaf = channel_group('root'), channel_group('mid'), channel_group('leaf')
+        root.add(channel(name='r0', read_function=read_function))
+        mid.add(channel(name='m0', read_function=read_function))
+        leaf.add(channel(name='l0', read_function=read_function))
+        mid.add(leaf)
+        root.add(mid)
+        return root, mid, leaf
+
+    def test_resolves_descendants(self, tree):
+        """Perform test resolves descendants operation.
+
+        Args:
+            tree: Tree.
+        """
+        root, mid, leaf = tree
+        assert root.get_channel('l0') is leaf.get_channel('l0')
+        assert set(root._name_index) == {'r0', 'm0', 'l0'}
+
+    def test_late_addition_propagates(self, tree):
+        """Perform test late addition propagates operation.
+
+        Args:
+            tree: Tree.
+        """
+        root, mid, leaf = tree
+        ch = leaf.add(channel(name='l1', read_function=read_function))
+        assert root.get_channel('l1') is ch
+        assert root.get_all_channel_names()[-1] == 'l1'
+
+    def test_removal_propagates(self, tree):
+        """Perform test removal propagates operation.
+
+        Args:
+            tree: Tree.
+        """
+        root, mid, leaf = tree
+        leaf.remove_channel_by_name('l0')
+        assert 'l0' not in root._name_index
+        with pytest.raises(ChannelAccessException):
+            root.get_channel('l0')
+
+    def test_remove_sub_group(self, tree):
+        """Perform test remove sub group operation.
+
+        Args:
+            tree: Tree.
+        """
+        root, mid, leaf = tree
+        root.remove_sub_channel_group(mid)
+        assert set(root._name_index) == {'r0'}
+        assert root not in mid._parent_groups
+        mid.add(channel(name='m1', read_function=read_function))
+        assert 'm1' not in root._name_index
+
+    def test_remove_all_unindexes_parents(self, tree):
+        """Perform test remove all unindexes parents operation.
+
+        Args:
+            tree: Tree.
+        """
+        root, mid, leaf = tree
+        mid.remove_all_channels_and_sub_groups()
+        assert set(root._name_index) == {'r0'}
+
+    def test_redefinition_replaces_entry(self, tree):
+        """Perform test redefinition replaces entry operation.
+
+        Args:
+            tree: Tree.
+        """
+        root, mid, leaf = tree
+        replacement = channel(name='l0', read_function=read_function)
+        leaf.add(replacement)
+        assert root.get_channel('l0') is replacement
+
+    def test_shadowed_name_uses_first_sub_group(self, tree):
+        """Perform test shadowed name uses first sub group operation.
+
+        Args:
+            tree: Tree.
+        """
+        root, mid, leaf = tree
+        other = channel_group('other')
+        root.add(other)
+        late = other.add(channel(name='m0', read_function=read_function))
+        original = mid.get_channel('m0')
+        assert root.get_channel('m0') is original
+        mid.remove_channel(original)
+        assert root.get_channel('m0') is late
+
+    def test_name_conflicts_still_detected(self, tree):
+        """Perform test name conflicts still detected operation.
+
+        Args:
+            tree: Tree.
+        """
+        root, mid, leaf = tree
+        with pytest.raises(Exception, match='Name Conflict'):
+            root.add(channel(name='l0', read_function=read_function))
+        clash = channel_group('clash')
+        clash.add(channel(name='m0', read_function=read_function))
+        with pytest.raises(Exception, match='conflict'):
+            root.add(clash)
+
+    def test_category_filter_follows_set_category(self, tree):
+        """Perform test category filter follows set category operation.
+
+        Args:
+            tree: Tree.
+        """
+        root, mid, leaf = tree
+        assert root.get_all_channel_names(categories=['power']) == []
+        leaf.get_channel('l0').set_category('power')
+        mid.get_channel('m0').set_category('power')
+        assert root.get_all_channel_names(categories=['power']) == ['m0', 'l0']
+        assert root.get_all_channel_names(categories=['power', None]) == ['r0', 'm0', 'l0']
+
+    def test_returned_dict_is_private_copy(self, tree):
+        """Perform test returned dict is private copy operation.
+
+        Args:
+            tree: Tree.
+        """
+        root, mid, leaf = tree
+        channels = root.get_all_channels_dict()
+        del channels['r0']
+        assert 'r0' in root.get_all_channels_dict()
+
+    def test_copy_has_independent_index(self, tree):
+        """Perform test copy has independent index operation.
+
+        Args:
+            tree: Tree.
+        """
+        root, mid, leaf = tree
+        duplicate = root.copy()
+        duplicate.add(channel(name='d0', read_function=read_function))
+        assert 'd0' not in root._name_index
+        ch = leaf.add(channel(name='l1', read_function=read_function))
+        assert duplicate.get_channel('l1') is ch
+
+
+@pytest.mark.threading
+class TestReadExecutor:
+    """Future-based threaded reads on a master."""
+
+    def _add_instrument(self, master, name, read_function):
+        """Add an instrument on its own dummy interface.
+
+        Args:
+            master: Master instance.
+            name: Instrument name.
+            read_function: Read function of its single channel.
+
+        Returns:
+            The instrument's channel.
+        """
+        from PyICe.lab_core import instrument
+        inst = instrument(name)
+        inst._add_interface(master.get_dummy_interface(name=f'{name}_bus'))
+        ch = inst._add_channel(channel(f'{name}_ch', read_function=read_function))
+        master.add(inst)
+        return ch
+
+    def test_work_units_read_on_pool(self, master_instance):
+        """Perform test work units read on pool operation.
+
+        Args:
+            master_instance: Master instance.
+        """
+        import threading
+        seen = {}
+
+        def record(name):
+            seen[name] = threading.current_thread().name
+            return name
+        a = self._add_instrument(master_instance, 'inst_a', lambda: record('a'))
+        b = self._add_instrument(master_instance, 'inst_b', lambda: record('b'))
+        results = master_instance.read_channel_list([a, b])
+        assert results['inst_a_ch'] == 'a' and results['inst_b_ch'] == 'b'
+        assert all(thread_name.endswith(tuple('0123456789')) and '_read' in thread_name
+                   for thread_name in seen.values())
+        stats = master_instance.get_read_stats()
+        assert stats['inst_a_ch']['count'] == 1
+        assert stats['inst_b_ch']['count'] == 1
+        master_instance.reset_read_stats()
+        assert len(master_instance.get_read_stats()) == 0
+
+    def test_concurrent_scans_do_not_mix(self, master_instance):
+        """Perform test concurrent scans do not mix operation.
+
+        Args:
+            master_instance: Master instance.
+        """
+        import threading
+        import time
+        chans = [self._add_instrument(master_instance, f'inst{i}',
+                                      lambda i=i: time.sleep(0.001) or i)
+                 for i in range(6)]
+        lists = (chans[:3], chans[3:])
+        errors = []
+
+        def scan(channel_list):
+            expected = {ch.get_name() for ch in channel_list}
+            for _ in range(30):
+                results = master_instance.read_channel_list(channel_list)
+                if set(results) != expected:
+                    errors.append(set(results) ^ expected)
+        threads = [threading.Thread(target=scan, args=(cl,)) for cl in lists]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert not errors
+
+    def test_timeout_keeps_other_groups(self, group):
+        """Perform test timeout keeps other groups operation.
+
+        Args:
+            group: Group.
+        """
+        import threading
+        release = threading.Event()
+        slow = channel('slow', read_function=lambda: release.wait(5))
+        fast = channel('fast', read_function=read_function)
+        group.start_threads(2)
+        group.set_read_timeout(0.05)
+        try:
+            futures = {group._submit_work_unit([slow]): [slow],
+                       group._submit_work_unit([fast]): [fast]}
+            results = group.get_threaded_results(futures)
+        finally:
+            release.set()
+            group.stop_threads()
+        assert results['fast'] == 'Reading'
+        assert str(results['slow']) == 'READ_TIMEOUT'
+        assert group.get_read_stats()['slow']['timeouts'] == 1
+
+    def test_timeout_counts_from_unit_start(self, group):
+        """Perform test timeout counts from unit start operation.
+
+        Args:
+            group: Group.
+        """
+        import time
+        chans = [channel(f'queued{i}', read_function=lambda i=i: time.sleep(0.1) or i)
+                 for i in range(3)]
+        group.start_threads(1)
+        group.set_read_timeout(0.25)
+        try:
+            futures = {group._submit_work_unit([ch]): [ch] for ch in chans}
+            results = group.get_threaded_results(futures)
+        finally:
+            group.stop_threads()
+        assert [results[ch.get_name()] for ch in chans] == [0, 1, 2]
+
+    def test_timed_out_worker_replaced(self, group):
+        """Perform test timed out worker replaced operation.
+
+        Args:
+            group: Group.
+        """
+        import threading
+        release = threading.Event()
+        slow = channel('slow', read_function=lambda: release.wait(5))
+        queued = channel('queued', read_function=read_function)
+        group.start_threads(1)
+        group.set_read_timeout(0.05)
+        try:
+            futures = {group._submit_work_unit([slow]): [slow],
+                       group._submit_work_unit([queued]): [queued]}
+            results = group.get_threaded_results(futures)
+        finally:
+            release.set()
+            group.stop_threads()
+        assert str(results['slow']) == 'READ_TIMEOUT'
+        assert results['queued'] == 'Reading'
+
+    def test_hung_read_does_not_block_exit(self):
+        """Perform test hung read does not block exit operation."""
+        import subprocess
+        import sys
+        script = (
+            "import time\n"
+            "from PyICe.lab_core import channel, channel_group\n"
+            "g = channel_group('g')\n"
+            "ch = channel('hung', read_function=lambda: time.sleep(60))\n"
+            "g.start_threads(1)\n"
+            "g.set_read_timeout(0.05)\n"
+            "print(g.get_threaded_results({g._submit_work_unit([ch]): [ch]})['hung'])\n"
+            "g.stop_threads()\n")
+        done = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, timeout=30)
+        assert done.returncode == 0, done.stderr
+        assert done.stdout.splitlines()[-1] == 'READ_TIMEOUT'
+
+    def test_copy_does_not_stop_pool(self, group):
+        """Perform test copy does not stop pool operation.
+
+        Args:
+            group: Group.
+        """
+        ch = channel('x', read_function=read_function)
+        group.start_threads(1)
+        try:
+            group.copy().stop_threads()
+            assert group._submit_work_unit([ch]).result(timeout=5)['x'] == 'Reading'
+        finally:
+            group.stop_threads()
+
+    def test_cancel_pending_work_unit(self, group):
+        """Perform test cancel pending work unit operation.
+
+        Args:
+            group: Group.
+        """
+        import threading
+        release = threading.Event()
+        blocker = channel('blocker', read_function=lambda: release.wait(5))
+        queued = channel('queued', read_function=read_function)
+        group.start_threads(1)
+        try:
+            futures = {group._submit_work_unit([blocker]): [blocker],
+                       group._submit_work_unit([queued]): [queued]}
+            assert group.cancel_threaded_reads() == 1
+            release.set()
+            results = group.get_threaded_results(futures)
+        finally:
+            group.stop_threads()
+        assert results['blocker'] is True
+        assert str(results['queued']) == 'READ_CANCELLED'
+
+    def test_partial_results_are_per_thread(self, master_instance):
+        """Perform test partial results are per thread operation.
+
+        Args:
+            master_instance: Master instance.
+        """
+        import threading
+        master_instance._partial_delegation_results['x'] = 1
+        seen = []
+        t = threading.Thread(target=lambda: seen.append(
+            dict(master_instance._partial_delegation_results)))
+        t.start()
+        t.join()
+        assert seen == [{}]
+        assert master_instance._partial_delegation_results['x'] == 1
+
+
+class TestBatchedWrites:
+    """Tests for delegator-batched channel_group.write_channels."""
+
+    def test_runs_grouped_by_delegator(self):
+        """Perform test runs grouped by delegator operation."""
+        calls = []
+
+        class recording_delegator(delegator):
+            def write_delegated_channel_list(self, channel_value_list):
+                calls.append((self, [(ch.get_name(), v) for ch, v in channel_value_list]))
+                return delegator.write_delegated_channel_list(self, channel_value_list)
+
+        group = channel_group('grp')
+        d1 = recording_delegator()
+        d2 = recording_delegator()
+        for name, d in [('a', d1), ('b', d1), ('c', d2)]:
+            ch = channel(name=name, write_function=write_function)
+            ch.set_delegator(d)
+            group.add(ch)
+        result = group.write_channels([('a', 1), ('b', 2), ('c', 3), ('a', 4)])
+        assert result == [1, 2, 3, 4]
+        assert calls == [(d1, [('a', 1), ('b', 2)]),
+                         (d2, [('c', 3)]),
+                         (d1, [('a', 4)])]
+        assert group.read_channel('a') == 4
+
+    def test_master_write_callbacks_per_channel(self, master_instance):
+        """Perform test master write callbacks per channel operation.
+
+        Args:
+            master_instance: Master instance.
+        """
+        master_instance.add_channel_dummy('x')
+        master_instance.add_channel_dummy('y')
+        seen = []
+        master_instance.add_write_callback(seen.append)
+        assert master_instance.write_channels([('x', 1), ('y', 2)]) == [1, 2]
+        assert seen == [{'x': 1}, {'y': 2}]
+
+    def test_limit_error_propagates(self):
+        """Perform test limit error propagates operation."""
+        group = channel_group('grp')
+        ch = group.add(channel(name='lim', write_function=write_function))
+        ch.set_max_write_limit(5)
+        with pytest.raises(ChannelValueException):
+            group.write_channels([('lim', 1), ('lim', 10)])
+        assert ch.read() == 1
+
+
+class TestScpiWriteConcatenation:
+    """Tests for scpi_instrument write concatenation."""
+
+    @pytest.fixture()
+    def scpi_inst(self):
+        """Return an SCPI instrument that delegates its own channels.
+
+        Returns:
+            Tuple of instrument and the list of messages written.
+        """
+        from PyICe.lab_core import scpi_instrument
+
+        class fake_interface(object):
+            def __init__(self):
+                self.messages = []
+
+            def write(self, message):
+                self.messages.append(message)
+
+            def ask(self, message):
+                self.messages.append(message)
+                return '0'
+
+            def lock(self):
+                pass
+
+            def unlock(self):
+                pass
+
+        class batching_instrument(scpi_instrument, delegator):
+            def __init__(self):
+                scpi_instrument.__init__(self, 'batching')
+                delegator.__init__(self)
+                self._interfaces.append(fake_interface())
+
+            def add_channel(self, name, command):
+                ch = channel(name, write_function=lambda v: self.get_interface().write(f'{command} {v}'))
+                ch.set_delegator(self)
+                return self._add_channel(ch)
+
+        inst = batching_instrument()
+        inst.add_channel('volt', 'SOUR:VOLT')
+        inst.add_channel('curr', 'SOUR:CURR')
+        inst.add_channel('outp', 'OUTP')
+        return inst, inst._interfaces[0].messages
+
+    def test_disabled_by_default(self, scpi_inst):
+        """Perform test disabled by default operation.
+
+        Args:
+            scpi_inst: Scpi inst.
+        """
+        inst, messages = scpi_inst
+        inst.write_channels([('volt', 1), ('curr', 2)])
+        assert messages == ['SOUR:VOLT 1', 'SOUR:CURR 2']
+
+    def test_commands_joined(self, scpi_inst):
+        """Perform test commands joined operation.
+
+        Args:
+            scpi_inst: Scpi inst.
+        """
+        inst, messages = scpi_inst
+        inst.set_write_concatenation()
+        assert inst.write_channels([('volt', 1), ('curr', 2), ('outp', 'ON')]) == [1, 2, 'ON']
+        assert messages == ['SOUR:VOLT 1;:SOUR:CURR 2;:OUTP ON']
+        inst.write_channel('volt', 3)
+        assert messages[-1] == 'SOUR:VOLT 3'
+
+    def test_max_length_and_write_delay(self, scpi_inst):
+        """Perform test max length and write delay operation.
+
+        Args:
+            scpi_inst: Scpi inst.
+        """
+        inst, messages = scpi_inst
+        inst.set_write_concatenation(max_length=25)
+        inst.write_channels([('volt', 1), ('curr', 2), ('outp', 'ON')])
+        assert messages == ['SOUR:VOLT 1;:SOUR:CURR 2', 'OUTP ON']
+        del messages[:]
+        inst.get_channel('curr').set_write_delay(0.001)
+        inst.write_channels([('volt', 1), ('curr', 2), ('outp', 'ON')])
+        assert messages == ['SOUR:VOLT 1', 'SOUR:CURR 2', 'OUTP ON']
+
+    def test_ask_flushes_queue(self, scpi_inst):
+        """Perform test ask flushes queue operation.
+
+        Args:
+            scpi_inst: Scpi inst.
+        """
+        inst, messages = scpi_inst
+        inst.set_write_concatenation()
+        ch = channel('query', write_function=lambda v: inst.get_interface().ask('SYST:ERR?'))
+        ch.set_delegator(inst)
+        inst._add_channel(ch)
+        inst.write_channels([('volt', 1), ('query', 0), ('curr', 2)])
+        assert messages == ['SOUR:VOLT 1', 'SYST:ERR?', 'SOUR:CURR 2']
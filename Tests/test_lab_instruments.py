@@ -4,6 +4,7 @@ This file demonstrates the pattern for testing instrument drivers without
 hardware. I2C drivers use the i2c_dummy interface which stores register
 data in a plain Python dict. VISA/SCPI instruments use unittest.mock.
 """
+import numpy
 import pytest
 from unittest.mock import MagicMock
 from PyICe.lab_core import instrument
@@ -22,6 +23,11 @@ from PyICe.lab_instruments.BR24H64 import BR24H64
 from PyICe.lab_instruments.smu import scpi_smu, keithley_2400, keithley_2600
 from PyICe.lab_instruments.hameg_4040 import hameg_4040
 from PyICe.lab_instruments.rigol_DG800 import rigol_DG800
+from PyICe.lab_instruments.agilent_8110a import Agilent_8110a
+from PyICe.lab_instruments.keysight_u2300a import u2331a_datalogger, u2300aBufferOverflowError
+from PyICe.lab_instruments.agilent_3034a import agilent_3034a
+from PyICe.lab_instruments.a3497x_instruments import agilent_3497xa_chassis, agilent_3497xa_20ch
+from PyICe.lab_instruments.daq970a_instruments import agilent_a970a_chassis, agilent_a970a_20ch
 from PyICe.lab_interfaces import interface_visa
 
 
@@ -1435,6 +1441,63 @@ class TestRigolDG800:
         assert ch.get_min_write_limit() == 30e-9
 
 
+class TestAgilent8110a:
+    """Tests for Agilent 8110a pattern channels."""
+
+    @pytest.fixture
+    def patgen(self, master_instance):
+        """Return patgen result.
+
+        Args:
+            master_instance: Master instance.
+
+        Returns:
+            Result value.
+        """
+        mock_iface = MagicMock()
+        mock_iface.__class__ = interface_visa
+        inst = Agilent_8110a.__new__(Agilent_8110a)
+        instrument.__init__(inst, 'hp8110a_test')
+        inst._base_name = 'HP8110A'
+        inst._debug_comms = False
+        inst.add_interface_visa(mock_iface)
+        master_instance.add(inst)
+        return inst, mock_iface
+
+    def test_channels_pattern_from_array(self, patgen):
+        """Perform test channels pattern from array operation.
+
+        Args:
+            patgen: Patgen.
+        """
+        inst, mock = patgen
+        inst.add_channels_pattern('patterns').write(numpy.array([0, 7, 3, 5, 1], dtype=numpy.uint8))
+        mock.write.assert_any_call(':DIG:STIM:PATT:DATA #15' + '07351')
+
+    def test_channel_pattern_csv_and_array_agree(self, patgen):
+        """Perform test channel pattern csv and array agree operation.
+
+        Args:
+            patgen: Patgen.
+        """
+        inst, mock = patgen
+        pattern = inst.add_channel_pattern('pattern1', 1)
+        pattern.write('1,0,0,1')
+        pattern.write(numpy.array([1, 0, 0, 1], dtype=numpy.uint8))
+        writes = [c.args[0] for c in mock.write.call_args_list if 'PATT' in c.args[0]]
+        assert writes == [':DIG:STIM:PATT:DATA1 #141001'] * 2
+
+    def test_channel_pattern_rejects_bad_values(self, patgen):
+        """Perform test channel pattern rejects bad values operation.
+
+        Args:
+            patgen: Patgen.
+        """
+        inst, _ = patgen
+        with pytest.raises(Exception, match='Values other than 1 or 0'):
+            inst.add_channel_pattern('pattern1', 1).write(numpy.array([0, 2], dtype=numpy.uint8))
+
+
 class TestKeithley2400:
     """Tests for Keithley2400."""
 
@@ -1614,6 +1677,502 @@ class TestKeithley2600:
         assert any('smua.source.limiti = 0.1' in c for c in calls)
 
 
+class TestU2300aStreaming:
+    """Tests for the U2300A datalogger streaming acquire/decode stages."""
+
+    @pytest.fixture
+    def daq(self):
+        """U2331A datalogger built without hardware, scanning 101 and 102.
+
+        Returns:
+            Result value.
+        """
+        from PyICe.lab_core import channel
+        import numpy
+        inst = u2331a_datalogger.__new__(u2331a_datalogger)
+        inst._waveform_channel_types = ['ain_single_ended_bipolar']
+        chans = [channel('t'), channel('a'), channel('b')]
+        chans[0].set_attribute('u2300a_type', 'ain_time')
+        for ch, address, sig_range in ((chans[1], 101, 10.), (chans[2], 102, 1.)):
+            ch.set_attribute('u2300a_type', 'ain_single_ended_bipolar')
+            ch.set_attribute('internal_address', address)
+            ch.set_attribute('polarity', 'bipolar')
+            ch.set_attribute('sig_range', sig_range)
+        inst.get_all_channels_list = lambda: chans
+        inst._last_scan_internal_addresses = [102, 101]
+        inst._sample_rate = 1000.
+        inst._stream_setup()
+        inst._stream_start = numpy.datetime64('2024-01-01T00:00:00', 'us')
+        inst._chans = chans
+        return inst
+
+    def test_decode_matches_scale_fn(self, daq):
+        """Perform test decode matches scale fn operation.
+
+        Args:
+            daq: Daq.
+        """
+        import struct
+        readings = [-32768, 32752, 16, -16, 0, 2048]
+        chunk = daq._stream_decode(struct.pack('<6h', *readings))
+        scale_a = daq._scale_fn(daq._chans[1])
+        scale_b = daq._scale_fn(daq._chans[2])
+        assert list(chunk['b']) == pytest.approx([scale_b(x) for x in readings[0::2]])
+        assert list(chunk['a']) == pytest.approx([scale_a(x) for x in readings[1::2]])
+        assert list(chunk['t']) == pytest.approx([0, 0.001, 0.002])
+        assert list(chunk['datetime']) == ['2024-01-01T00:00:00.000000Z',
+                                           '2024-01-01T00:00:00.001000Z',
+                                           '2024-01-01T00:00:00.002000Z']
+
+    def test_decode_carries_partial_scan(self, daq):
+        """Perform test decode carries partial scan operation.
+
+        Args:
+            daq: Daq.
+        """
+        import struct
+        raw = struct.pack('<4h', 16, 32, 48, 64)
+        assert daq._stream_decode(raw[:2]) is None
+        first = daq._stream_decode(raw[2:6])
+        second = daq._stream_decode(raw[6:])
+        assert len(first['a']) == 1 and len(second['a']) == 1
+        assert list(second['t']) == pytest.approx([0.001])
+
+    def test_decode_realigns_after_drop(self, daq):
+        """Perform test decode realigns after drop operation.
+
+        Args:
+            daq: Daq.
+        """
+        from PyICe.lab_instruments.keysight_u2300a import _stream_block
+        import struct
+        raw = struct.pack('<12h', *range(0, 192, 16))
+        assert len(daq._stream_decode(_stream_block(raw[:6], 0))['a']) == 1
+        # raw[6:10] was dropped; raw[10:] starts mid-scan, at point 2 plus 2 bytes
+        chunk = daq._stream_decode(_stream_block(raw[10:18], 10))
+        assert list(chunk['t']) == pytest.approx([0.003])
+        assert list(chunk['a']) == pytest.approx([daq._scale_fn(daq._chans[1])(112)])
+        assert list(chunk['datetime']) == ['2024-01-01T00:00:00.003000Z']
+        chunk = daq._stream_decode(_stream_block(raw[18:], 18))
+        assert list(chunk['t']) == pytest.approx([0.004, 0.005])
+
+    def test_acquire_status(self, daq):
+        """Perform test acquire status operation.
+
+        Args:
+            daq: Daq.
+        """
+        iface = MagicMock()
+        daq.get_interface = lambda: iface
+        iface.ask.return_value = 'FRAG'
+        assert daq._stream_acquire() is None
+        iface.ask.return_value = 'DATA'
+        iface.read_raw.return_value = b'#800000004' + b'\x01\x02\x03\x04\n'
+        assert daq._stream_acquire() == b'\x01\x02\x03\x04'
+        assert daq._stream_acquire().offset == 4
+        iface.write.assert_called_with('WAVeform:DATA?')
+        iface.ask.return_value = 'OVER'
+        with pytest.raises(u2300aBufferOverflowError):
+            daq._stream_acquire()
+
+    def test_store_writes_rows(self, daq):
+        """Perform test store writes rows operation.
+
+        Args:
+            daq: Daq.
+        """
+        import numpy
+        daq.logger = MagicMock()
+        daq._stream_store({'a': numpy.array([1.0, 2.0]), 'datetime': numpy.array(['x', 'y'])})
+        daq.logger.log_many.assert_called_once_with(
+            [{'a': 1.0, 'datetime': 'x'}, {'a': 2.0, 'datetime': 'y'}])
+
+
+class _fake_scope_interface(object):
+    """Minimal scope VISA stand-in recording every query.
+
+    Args:
+        data_format: :WAVeform:FORMat? response.
+        byte_order: :WAVeform:BYTeorder? response.
+        unsigned: :WAVeform:UNSigned? response.
+    """
+
+    def __init__(self, data_format='WORD', byte_order='MSBF', unsigned='0'):
+        """Initialize _fake_scope_interface.
+
+        Args:
+            data_format: Data format.
+            byte_order: Byte order.
+            unsigned: Unsigned.
+        """
+        self.responses = {':WAVeform:FORMat?': data_format,
+                          ':WAVeform:BYTeorder?': byte_order,
+                          ':WAVeform:UNSigned?': unsigned}
+        self.codes = {'CHANnel1': [0, 1, -2, 300], 'CHANnel2': [5, 6, 7, 8]}
+        self.source = None
+        self.log = []
+
+    def write(self, command):
+        """Record a write.
+
+        Args:
+            command: Command.
+        """
+        self.log.append(command)
+        for part in command.split(';'):
+            if part.startswith(':WAVeform:SOURce '):
+                self.source = part.split(' ', 1)[1]
+
+    def ask(self, command):
+        """Answer a query.
+
+        Args:
+            command: Command.
+
+        Returns:
+            Response string.
+        """
+        self.log.append(command)
+        if command == ':WAVeform:PREamble?':
+            # scale differs by source so mixed-up preambles are caught
+            yinc = '0.5' if self.source == 'CHANnel1' else '2'
+            return f'0,0,4,1,1e-9,0,0,{yinc},1.0,10'
+        return self.responses[command]
+
+    def read_raw(self):
+        """Return the binary block for the current source.
+
+        Returns:
+            Raw IEEE block.
+        """
+        import struct
+        fmt = {'WORD': 'h', 'BYTE': 'b'}[self.responses[':WAVeform:FORMat?']]
+        order = '>' if self.responses[':WAVeform:BYTeorder?'] == 'MSBF' else '<'
+        codes = self.codes[self.source]
+        if self.responses[':WAVeform:UNSigned?'] == '1':
+            fmt = fmt.upper()
+            codes = [c & (0xFFFF if fmt == 'H' else 0xFF) for c in codes]
+        payload = struct.pack(f'{order}{len(codes)}{fmt}', *codes)
+        return f'#8{len(payload):08d}'.encode() + payload + b'\n'
+
+
+class TestOscilloscopeWaveforms:
+    """Tests for oscilloscope waveform decode, caching and multi-source fetch."""
+
+    @staticmethod
+    def _scope(iface):
+        """Build an agilent_3034a around *iface* without hardware.
+
+        Args:
+            iface: Fake interface.
+
+        Returns:
+            Result value.
+        """
+        scope = agilent_3034a.__new__(agilent_3034a)
+        scope.get_interface = lambda num=0: iface
+        return scope
+
+    @staticmethod
+    def _expected(codes, yinc):
+        """Scale *codes* like the fake preamble.
+
+        Args:
+            codes: Codes.
+            yinc: Y increment.
+
+        Returns:
+            Expected values.
+        """
+        return [(c - 10) * yinc + 1.0 for c in codes]
+
+    @pytest.mark.parametrize('data_format, byte_order, unsigned', [
+        ('WORD', 'MSBF', '0'), ('WORD', 'LSBF', '0'), ('BYTE', 'LSBF', '0'), ('WORD', 'LSBF', '1')])
+    def test_decode_matches_reference(self, data_format, byte_order, unsigned):
+        """Perform test decode matches reference operation.
+
+        Args:
+            data_format: Data format.
+            byte_order: Byte order.
+            unsigned: Unsigned.
+        """
+        iface = _fake_scope_interface(data_format, byte_order, unsigned)
+        iface.codes['CHANnel1'] = [0, 1, -2, 100]
+        scope = self._scope(iface)
+        codes = iface.codes['CHANnel1']
+        if unsigned == '1':
+            codes = [c & 0xFFFF for c in codes]
+        data = scope.fetch_waveform_data('CHANnel1')
+        assert list(data) == pytest.approx(self._expected(codes, 0.5))
+
+    def test_settings_cached_until_invalidated(self):
+        """Perform test settings cached until invalidated operation."""
+        iface = _fake_scope_interface()
+        scope = self._scope(iface)
+        scope.fetch_waveform_data('CHANnel1')
+        scope.fetch_waveform_data('CHANnel1')
+        assert iface.log.count(':WAVeform:FORMat?') == 1
+        assert iface.log.count(':WAVeform:PREamble?') == 1
+        assert iface.log.count(':WAVeform:SOURce CHANnel1') == 1
+        scope.invalidate_waveform_cache()
+        scope.fetch_waveform_data('CHANnel1')
+        assert iface.log.count(':WAVeform:FORMat?') == 2
+        assert iface.log.count(':WAVeform:PREamble?') == 2
+
+    def test_setup_channel_write_invalidates(self, mocker):
+        """Perform test setup channel write invalidates operation.
+
+        Args:
+            mocker: Mocker.
+        """
+        from PyICe.lab_core import channel, scpi_instrument
+        mocker.patch.object(scpi_instrument, '_add_channel', autospec=True,
+                            side_effect=lambda self, ch: ch)
+        iface = _fake_scope_interface()
+        scope = self._scope(iface)
+        setup = scope._add_channel(channel('vdiv', write_function=lambda value: None))
+        scope._add_channel(channel('wave', read_function=lambda: None))
+        scope.fetch_waveform_data('CHANnel1')
+        assert scope._waveform_format is not None
+        setup.write(2)
+        assert scope._waveform_format is None
+        scope.fetch_waveform_data('CHANnel1')
+        assert iface.log.count(':WAVeform:PREamble?') == 2
+
+    def test_fetch_waveforms_pipelines_sources(self):
+        """Perform test fetch waveforms pipelines sources operation."""
+        iface = _fake_scope_interface()
+        scope = self._scope(iface)
+        results = scope.fetch_waveforms(['CHANnel1', 'CHANnel2'])
+        assert list(results) == ['CHANnel1', 'CHANnel2']
+        assert list(results['CHANnel1']) == pytest.approx(self._expected(iface.codes['CHANnel1'], 0.5))
+        assert list(results['CHANnel2']) == pytest.approx(self._expected(iface.codes['CHANnel2'], 2.0))
+        iface.log.clear()
+        scope.fetch_waveforms(['CHANnel1', 'CHANnel2'])
+        assert iface.log == [':WAVeform:SOURce CHANnel1;:WAVeform:DATA?',
+                             ':WAVeform:SOURce CHANnel2;:WAVeform:DATA?']
+
+    def test_fetch_waveforms_decodes_after_next_query(self, mocker):
+        """Perform test fetch waveforms decodes after next query operation.
+
+        Args:
+            mocker: Mocker.
+        """
+        iface = _fake_scope_interface()
+        scope = self._scope(iface)
+        scope.fetch_waveforms(['CHANnel1', 'CHANnel2'])
+        decode = scope._decode_waveform_data
+        mocker.patch.object(scope, '_decode_waveform_data',
+                            side_effect=lambda raw, source: iface.log.append(f'decode {source}') or decode(raw, source))
+        read_raw = iface.read_raw
+        mocker.patch.object(iface, 'read_raw', side_effect=lambda: iface.log.append('read') or read_raw())
+        iface.log.clear()
+        scope.fetch_waveforms(['CHANnel1', 'CHANnel2'])
+        assert iface.log == [':WAVeform:SOURce CHANnel1;:WAVeform:DATA?', 'read',
+                             ':WAVeform:SOURce CHANnel2;:WAVeform:DATA?', 'decode CHANnel1', 'read',
+                             'decode CHANnel2']
+
+    def test_delegated_read_applies_channel_read(self, mocker):
+        """Perform test delegated read applies channel read operation.
+
+        Args:
+            mocker: Mocker.
+        """
+        from PyICe.lab_core import channel
+        iface = _fake_scope_interface()
+        scope = self._scope(iface)
+        scope.force_trigger = False
+        mocker.patch.object(scope, 'scope_stopped', return_value=True)
+        mocker.patch.object(scope, '_read_scope_time_info')
+        wave = channel('wave', read_function=lambda: None)
+        wave.set_attribute('waveform_source', 'CHANnel1')
+        read = mocker.spy(wave, 'read_without_delegator')
+        results = scope.read_delegated_channel_list([wave])
+        assert list(results['wave']) == pytest.approx(self._expected(iface.codes['CHANnel1'], 0.5))
+        assert read.call_args.kwargs['force_data'] is True
+        assert read.call_args.kwargs['data'] is results['wave']
+
+    def test_unmanaged_source_queries_preamble(self):
+        """Perform test unmanaged source queries preamble operation."""
+        iface = _fake_scope_interface()
+        scope = self._scope(iface)
+        scope.fetch_waveform_data('CHANnel1')
+        iface.write(':WAVeform:SOURce CHANnel2')
+        data = scope.fetch_waveform_data()
+        assert list(data) == pytest.approx(self._expected(iface.codes['CHANnel2'], 2.0))
+
+
+class _fake_mainframe_interface(interface_visa):
+    """34970A/DAQ970A stand-in that keeps a scan list like the real mainframe.
+
+    CONFigure replaces the scan list with the configured channel, as on the
+    instrument.  Each reading is the internal address divided by 100.
+
+    Args:
+        plugin_type: SYSTem:CTYPe? model field.
+    """
+
+    def __init__(self, plugin_type='34901A'):
+        """Initialize _fake_mainframe_interface.
+
+        Args:
+            plugin_type: Plugin type.
+        """
+        interface_visa.__init__(self, 'fake_mainframe')
+        self.plugin_type = plugin_type
+        self.scan = []
+        self.log = []
+
+    def _command(self, command):
+        """Apply one command or answer one query.
+
+        Args:
+            command: Single SCPI command.
+
+        Returns:
+            Response string, or None for commands.
+        """
+        command = command.lstrip(':')
+        if command.startswith('ROUTe:SCAN ') or command.startswith('CONFigure:'):
+            addresses = command.split('(@')[1].rstrip(')')
+            self.scan = sorted(int(address) for address in addresses.split(','))
+        elif command == 'ROUTe:SCAN?':
+            return '(@' + ','.join(str(address) for address in self.scan) + ')'
+        elif command == 'READ?':
+            return ','.join(f'{address / 100:+.8E}' for address in self.scan)
+        elif command.startswith('SYSTem:CTYPe?'):
+            return f'AGILENT TECHNOLOGIES,{self.plugin_type},0,1.0'
+        elif 'RELay:CYCLes?' in command:
+            return ','.join(['0'] * 20)
+        return None
+
+    def write(self, command):
+        """Record and apply a message.
+
+        Args:
+            command: Command.
+        """
+        self.log.append(command)
+        for part in command.split(';'):
+            self._command(part)
+
+    def ask(self, command):
+        """Record a message and answer its queries.
+
+        Args:
+            command: Command.
+
+        Returns:
+            Response string.
+        """
+        self.log.append(command)
+        responses = [self._command(part) for part in command.split(';')]
+        return ';'.join(response for response in responses if response is not None)
+
+
+@pytest.mark.parametrize('chassis_class, mux_class, plugin_type', [
+    (agilent_3497xa_chassis, agilent_3497xa_20ch, '34901A'),
+    (agilent_a970a_chassis, agilent_a970a_20ch, 'DAQM901A')])
+class TestMainframeScanList:
+    """Tests for 34970A/DAQ970A scan list caching."""
+
+    @staticmethod
+    def _bench(master_instance, chassis_class, mux_class, plugin_type):
+        """Build a chassis with one configured mux.
+
+        Args:
+            master_instance: Master instance.
+            chassis_class: Chassis class.
+            mux_class: Mux class.
+            plugin_type: Plugin type.
+
+        Returns:
+            Result value.
+        """
+        iface = _fake_mainframe_interface(plugin_type)
+        chassis = chassis_class(iface)
+        mux = mux_class(iface, bay=1)
+        mux.add_channel_dc_voltage('vin', 1)
+        mux.add_channel_dc_voltage('vout', 2)
+        chassis.add(mux)
+        master_instance.add(chassis)
+        return iface, chassis, mux
+
+    def test_unchanged_scan_is_one_round_trip(self, master_instance, chassis_class, mux_class, plugin_type):
+        """Perform test unchanged scan is one round trip operation.
+
+        Args:
+            master_instance: Master instance.
+            chassis_class: Chassis class.
+            mux_class: Mux class.
+            plugin_type: Plugin type.
+        """
+        iface, _, _ = self._bench(master_instance, chassis_class, mux_class, plugin_type)
+        results = master_instance.read_channels(['vin', 'vout'])
+        assert results['vin'] == pytest.approx(1.01)
+        assert results['vout'] == pytest.approx(1.02)
+        assert any('ROUTe:SCAN (@101,102);:ROUTe:SCAN?' in message for message in iface.log)
+        iface.log.clear()
+        results = master_instance.read_channels(['vin', 'vout'])
+        assert iface.log == ['READ?']
+        assert results['vout'] == pytest.approx(1.02)
+
+    def test_reconfiguration_reprograms_scan(self, master_instance, chassis_class, mux_class, plugin_type):
+        """Perform test reconfiguration reprograms scan operation.
+
+        Args:
+            master_instance: Master instance.
+            chassis_class: Chassis class.
+            mux_class: Mux class.
+            plugin_type: Plugin type.
+        """
+        iface, chassis, mux = self._bench(master_instance, chassis_class, mux_class, plugin_type)
+        master_instance.read_channels(['vin', 'vout'])
+        generation = chassis.get_config_generation()
+        mux._config_dc_voltage(mux['vout'], 1, 'AUTO', True, None, True)
+        assert chassis.get_config_generation() > generation
+        assert iface.scan == [102]
+        results = master_instance.read_channels(['vin', 'vout'])
+        assert iface.scan == [101, 102]
+        assert results['vin'] == pytest.approx(1.01)
+
+    def test_channel_set_change_reprograms_scan(self, master_instance, chassis_class, mux_class, plugin_type):
+        """Perform test channel set change reprograms scan operation.
+
+        Args:
+            master_instance: Master instance.
+            chassis_class: Chassis class.
+            mux_class: Mux class.
+            plugin_type: Plugin type.
+        """
+        iface, chassis, _ = self._bench(master_instance, chassis_class, mux_class, plugin_type)
+        master_instance.read_channels(['vin', 'vout'])
+        iface.log.clear()
+        chassis.read_delegated_channel_list([chassis['vin']])
+        assert iface.scan == [101]
+        assert iface.log[-1].startswith('ROUTe:MONitor (@101)')
+        iface.log.clear()
+        assert chassis.read_delegated_channel_list([chassis['vin']])['vin'] == pytest.approx(1.01)
+        assert iface.log == ['READ?']
+
+    def test_stale_scan_list_recovers(self, master_instance, chassis_class, mux_class, plugin_type):
+        """Perform test stale scan list recovers operation.
+
+        Args:
+            master_instance: Master instance.
+            chassis_class: Chassis class.
+            mux_class: Mux class.
+            plugin_type: Plugin type.
+        """
+        iface, _, _ = self._bench(master_instance, chassis_class, mux_class, plugin_type)
+        master_instance.read_channels(['vin', 'vout'])
+        # scan list changed from the front panel
+        iface.scan = [101]
+        results = master_instance.read_channels(['vin', 'vout'])
+        assert iface.scan == [101, 102]
+        assert results['vout'] == pytest.approx(1.02)
+
+
 class TestHtx9011ThreadConsolidation:
     """Verify that add_channel_isense_remapper registers meter interfaces on the htx9011,
     preventing concurrent SCPI access via thread consolidation."""
@@ -1767,15 +2326,13 @@ class TestThreadResolution:
         """
         from PyICe.lab_core import results_ord_dict
         work_units = []
-        original_put = master._read_queue.put
 
-        def capture_put(ch_list):
+        def capture_submit(ch_list):
             work_units.append(set(ch.get_name() for ch in ch_list))
+            return len(work_units)
 
-        master._read_queue.put = capture_put
-        old_get_results = master.get_threaded_results
-        master.get_threaded_results = lambda n: results_ord_dict()
-        old_non_threaded = master._read_channels_non_threaded
+        master._submit_work_unit = capture_submit
+        master.get_threaded_results = lambda futures: results_ord_dict()
         remainder_channels = []
         master._read_channels_non_threaded = lambda cl: (
             remainder_channels.extend(cl) or results_ord_dict())
@@ -1783,9 +2340,9 @@ class TestThreadResolution:
         try:
             master._read_channels_threaded(channel_list)
         finally:
-            master._read_queue.put = original_put
-            master.get_threaded_results = old_get_results
-            master._read_channels_non_threaded = old_non_threaded
+            del master._submit_work_unit
+            del master.get_threaded_results
+            del master._read_channels_non_threaded
 
         remainder = set(ch.get_name() for ch in remainder_channels)
         return work_units, remainder
@@ -8,6 +8,8 @@ from PyICe.lab_utils.bounded import bounded
 from PyICe.lab_utils.isclose import isclose
 from PyICe.lab_utils.parse_list import parse_list
 from PyICe.lab_utils.ordered_pair import ordered_pair
+from PyICe.lab_utils.StreamWindow import StreamWindow
+from PyICe.lab_utils.stream_pipeline import stream_pipeline
 
 
 class TestSwapEndian:
@@ -441,3 +443,203 @@ class TestOrderedPair:
         assert sample.interpolated_y_value(1.5) == pytest.approx(15.0)
         assert sample.interpolated_y_value(0) == pytest.approx(0.0)
         assert sample.interpolated_y_value(4) == pytest.approx(40.0)
+
+
+class TestStreamWindow:
+    """Tests for Stream Window wrap-around behaviour."""
+
+    def test_random_operations_match_reference(self):
+        """Perform test random operations match reference operation."""
+        import io
+        import random
+        rng = random.Random(1)
+        data = bytes(rng.choice(b'LTxy') for _ in range(5000))
+        sw = StreamWindow(io.BytesIO(data), buffer_size=13)
+        consumed = 0
+        buffered = 0
+        while consumed < len(data):
+            op = rng.randrange(5)
+            num = rng.randint(1, 15)
+            if op == 0:
+                assert sw.peek(num) == data[consumed:consumed + min(num, 13)]
+                buffered = max(buffered, min(consumed + min(num, 13), len(data)) - consumed)
+            elif op == 1:
+                assert bytes(sw.peek_view(num)) == data[consumed:consumed + min(num, 13)]
+                buffered = max(buffered, min(consumed + min(num, 13), len(data)) - consumed)
+            elif op == 2:
+                expected = data[consumed:consumed + num]
+                assert sw.read(num) == expected
+                consumed += len(expected)
+                buffered = max(buffered - len(expected), 0)
+            elif op == 3:
+                expected = data[consumed:consumed + min(num, 13)]
+                assert bytes(sw.read_view(num)) == expected
+                consumed += len(expected)
+                buffered = max(buffered, len(expected)) - len(expected)
+            else:
+                window = data[consumed:consumed + buffered]
+                assert len(sw) == buffered
+                for sub in (b'LT', b'L', b'TxL'):
+                    assert sw.find(sub) == window.find(sub)
+                    assert sw.find(sub, 2, -1) == window.find(sub, 2, -1)
+                assert sw[:] == window
+                if window:
+                    assert sw[-1] == window[-1]
+                    assert sw[::2] == window[::2]
+
+    def test_index_past_end(self):
+        """Perform test index past end operation."""
+        import io
+        sw = StreamWindow(io.BytesIO(b'ab'), buffer_size=4)
+        sw.peek(2)
+        with pytest.raises(IndexError):
+            sw[2]
+
+
+class TestStreamPipeline:
+    """Tests for the acquire/decode/store stream pipeline."""
+
+    @staticmethod
+    def _source(blocks, error=None):
+        """Return an acquire callable yielding *blocks*, then raising.
+
+        Args:
+            blocks: Raw blocks to return in order.
+            error: Exception to raise once exhausted, or StopIteration if None.
+
+        Returns:
+            Acquire callable.
+        """
+        pending = list(blocks)
+
+        def acquire():
+            """Return next block.
+
+            Returns:
+                Next block.
+            """
+            if pending:
+                return pending.pop(0)
+            raise error if error is not None else StopIteration
+        return acquire
+
+    def test_blocks_stored_in_order(self):
+        """Perform test blocks stored in order operation."""
+        stored = []
+        p = stream_pipeline(self._source(range(100)), lambda x: x * 2, stored.append, queue_depth=2)
+        p.start()
+        assert p.wait(timeout=10)
+        p.stop()
+        assert stored == [x * 2 for x in range(100)]
+        metrics = p.get_metrics()
+        assert metrics['decode']['items'] == 100
+        assert metrics['store']['items'] == 100
+        assert metrics['raw_queue']['high_water'] <= 2
+
+    def test_acquire_error_drains_then_raises(self):
+        """Perform test acquire error drains then raises operation."""
+        stored = []
+        finished = []
+        p = stream_pipeline(self._source([1, 2, 3], error=OverflowError('too slow')),
+                            lambda x: x, stored.append, finish=lambda: finished.append(True))
+        p.start()
+        assert p.wait(timeout=10)
+        with pytest.raises(OverflowError):
+            p.stop()
+        assert stored == [1, 2, 3]
+        assert finished == [True]
+
+    def test_stop_runs_finish_then_drains(self):
+        """Perform test stop runs finish then drains operation."""
+        import threading
+        halted = threading.Event()
+        remaining = [b'x', b'y']
+
+        def acquire():
+            """Return a block only once the source is halted.
+
+            Returns:
+                Next block or None.
+            """
+            if halted.is_set() and remaining:
+                return remaining.pop(0)
+            return None
+        stored = []
+        p = stream_pipeline(acquire, bytes, stored.append, finish=halted.set).start()
+        assert not p.wait(timeout=0.05)
+        p.stop()
+        assert stored == [b'x', b'y']
+        assert not p.is_running()
+
+    def test_store_error_aborts(self):
+        """Perform test store error aborts operation."""
+        def store(chunk):
+            """Fail on every chunk.
+
+            Args:
+                chunk: Chunk.
+            """
+            raise ValueError('disk full')
+        p = stream_pipeline(lambda: b'data', bytes, store, queue_depth=1, poll_interval=0)
+        p.start()
+        assert p.wait(timeout=10)
+        with pytest.raises(ValueError):
+            p.stop(timeout=10)
+        assert not any(t.is_alive() for t in p._threads)
+
+    def test_drop_policy_counts_overflow(self):
+        """Perform test drop policy counts overflow operation."""
+        import threading
+        release = threading.Event()
+
+        def decode(raw):
+            """Block until released.
+
+            Args:
+                raw: Raw block.
+
+            Returns:
+                The block.
+            """
+            release.wait(10)
+            return raw
+        stored = []
+        p = stream_pipeline(self._source(range(20)), decode, stored.append,
+                            queue_depth=2, overflow='drop')
+        p.start()
+        while p._metrics['acquire']['items'] < 20:
+            pass
+        release.set()
+        p.stop()
+        dropped = p.get_metrics()['raw_queue']['dropped']
+        assert dropped > 0
+        assert len(stored) == 20 - dropped
+
+    def test_abort_discards_queued(self):
+        """Perform test abort discards queued operation."""
+        import threading
+        import time
+        release = threading.Event()
+        stored = []
+
+        def store(chunk):
+            """Store a chunk, then block until released.
+
+            Args:
+                chunk: Chunk.
+            """
+            stored.append(chunk)
+            release.wait(10)
+        p = stream_pipeline(self._source(range(10)), lambda x: x, store).start()
+        while p._metrics['decode']['items'] < 10:
+            time.sleep(0.001)
+        threading.Timer(0.1, release.set).start()
+        p.stop(drain=False, timeout=10)
+        assert stored == [0]
+        metrics = p.get_metrics()
+        assert metrics['raw_queue']['discarded'] + metrics['chunk_queue']['discarded'] == 9
+
+    def test_bad_overflow_policy(self):
+        """Perform test bad overflow policy operation."""
+        with pytest.raises(ValueError):
+            stream_pipeline(None, None, None, overflow='spill')
@@ -257,6 +257,32 @@ class TestInterpolator:
         interp = interpolator([[0, 0], [1, 1]])
         assert interp(0.5) == 0.5
 
+    def test_array_matches_scalar(self, multi_point):
+        """Perform test array matches scalar operation.
+
+        Args:
+            multi_point: Multi point.
+        """
+        import numpy
+        xs = numpy.linspace(-2, 5, 57)
+        result = multi_point(xs)
+        assert isinstance(result, numpy.ndarray)
+        assert result == pytest.approx([multi_point(float(x)) for x in xs])
+        assert multi_point([0, 1, 3]).tolist() == [0.0, 10.0, 30.0]
+
+    def test_inverse_array(self):
+        """Perform test inverse array operation."""
+        interp = interpolator([[0, 100], [10, 0], [5, 40]])
+        assert interp.get_x_val([100, 40, 20, -10]) == pytest.approx([0, 5, 7.5, 11.25])
+        assert interp.get_x_val(20) == pytest.approx(7.5)
+
+    def test_add_points_unsorted(self):
+        """Perform test add points unsorted operation."""
+        interp = interpolator()
+        interp.add_points([[10, 100], [0, 0], [5, 40]])
+        assert interp(2.5) == 20.0
+        assert interp(7.5) == 70.0
+
 
 class TestFloatRange:
     """Tests for Float Range."""
@@ -2,7 +2,7 @@
 import os
 import sqlite3
 import pytest
-from PyICe.lab_core import logger, master, PartialReadException, ChannelReadException
+from PyICe.lab_core import logger, master, PartialReadException, ChannelReadException, get_topology_generation
 
 
 @pytest.fixture
@@ -274,6 +274,139 @@ class TestLoggerLogging:
         assert len(received) == 1
 
 
+@pytest.mark.database
+class TestLoggerLogFast:
+    """Tests for compiled scans and Logger.log_fast."""
+
+    def test_log_fast_matches_log(self, simple_logger):
+        """Perform test log fast matches log operation.
+
+        Args:
+            simple_logger: Simple logger.
+        """
+        simple_logger.new_table('fast_test')
+        slow = simple_logger.log()
+        fast = simple_logger.log_fast()
+        assert list(fast.keys()) == list(slow.keys())
+        assert fast['voltage'] == slow['voltage']
+        assert fast['datetime'].endswith('Z')
+        simple_logger.flush()
+        conn = sqlite3.connect(simple_logger.get_database())
+        rows = conn.execute("SELECT voltage, current FROM fast_test").fetchall()
+        conn.close()
+        assert rows == [(3.3, 0.001), (3.3, 0.001)]
+
+    def test_compiled_exclusions(self, simple_logger):
+        """Perform test compiled exclusions operation.
+
+        Args:
+            simple_logger: Simple logger.
+        """
+        simple_logger.new_table('fast_excl')
+        scan = simple_logger.compile_scan(exclusions=['voltage'])
+        assert scan.column_names == ('current', 'rowid', 'datetime')
+        data = simple_logger.log_fast()
+        assert 'voltage' not in data
+        assert 'current' in data
+
+    def test_bad_exclusion(self, simple_logger):
+        """Perform test bad exclusion operation.
+
+        Args:
+            simple_logger: Simple logger.
+        """
+        simple_logger.master.add_channel_dummy('unlogged')
+        with pytest.raises(Exception, match='not a member of scan_list'):
+            simple_logger.compile_scan(exclusions=[simple_logger.master['unlogged']])
+
+    def test_scan_does_not_rebuild_channel_tree(self, simple_logger, mocker):
+        """Perform test scan does not rebuild channel tree operation.
+
+        Args:
+            simple_logger: Simple logger.
+            mocker: Mocker.
+        """
+        simple_logger.new_table('fast_tree')
+        simple_logger.compile_scan()
+        spy = mocker.spy(simple_logger, 'get_all_channels_dict')
+        for _ in range(3):
+            simple_logger.log_fast()
+        assert spy.call_count == 0
+
+    def test_recompiles_after_topology_change(self, simple_logger):
+        """Perform test recompiles after topology change operation.
+
+        Args:
+            simple_logger: Simple logger.
+        """
+        scan = simple_logger.compile_scan(exclusions=['voltage'])
+        simple_logger.add_channel_dummy('extra').write(7)
+        assert not scan.is_current()
+        simple_logger.new_table('fast_topo')
+        data = simple_logger.log_fast()
+        assert data['extra'] == 7
+        assert 'voltage' not in data
+        simple_logger['extra'].set_read_access(False)
+        assert 'extra' not in simple_logger.log_fast()
+
+    def test_survives_reads_and_exclusions(self, simple_logger, mocker):
+        """Perform test survives reads and exclusions operation.
+
+        Args:
+            simple_logger: Simple logger.
+            mocker: Mocker.
+        """
+        simple_logger.new_table('fast_reads')
+        scan = simple_logger.compile_scan(exclusions=['voltage'])
+        generation = get_topology_generation()
+        simple_logger.master.read_channels(['voltage', 'current'])
+        simple_logger.read_all_channels(exclusions=['current'])
+        simple_logger.log(exclusions=['current'])
+        assert get_topology_generation() == generation
+        assert scan.is_current()
+        compile_spy = mocker.spy(simple_logger, 'compile_scan')
+        simple_logger.log_fast()
+        assert compile_spy.call_count == 0
+
+    def test_recompiles_after_callback_change(self, simple_logger):
+        """Perform test recompiles after callback change operation.
+
+        Args:
+            simple_logger: Simple logger.
+        """
+        simple_logger.new_table('fast_cb')
+        scan = simple_logger.compile_scan()
+        received = []
+        simple_logger.add_log_callback(received.append)
+        assert not scan.is_current()
+        data = simple_logger.log_fast(scan)
+        assert received == [data]
+        received[0]['voltage'] = None
+        assert simple_logger._previously_logged_data['voltage'] == 3.3
+
+    def test_log_fast_stores_partial_row(self, tmp_path):
+        """Perform test log fast stores partial row operation.
+
+        Args:
+            tmp_path: Tmp path.
+        """
+        m = master()
+        m.add_channel_dummy('good_ch').write(42.0)
+        m.add_channel_virtual('bad_ch', read_function=lambda: 1 / 0)
+        db_path = str(tmp_path / "partial_fast.sqlite")
+        lg = logger(m, database=db_path, use_threads=False)
+        lg.new_table('test_partial', replace_table=True)
+        with pytest.raises(PartialReadException):
+            lg.log_fast()
+        lg.stop()
+        m.stop_threads()
+        conn = sqlite3.connect(db_path)
+        row = conn.execute("SELECT good_ch, datetime FROM test_partial").fetchone()
+        conn.close()
+        assert row[0] == 42.0
+        assert 'T' in row[1]
+
+
 @pytest.mark.database
 class TestLoggerDataChannels:
     """Tests for Logger Data Channels."""
@@ -422,3 +555,357 @@ class TestLoggerPartialRead:
         assert isinstance(failure, ChannelFailure)
         assert failure.exception_type == 'RuntimeError'
         assert failure.message == 'comm failure'
+
+
+@pytest.fixture
+def threaded_logger(tmp_path):
+    """Threaded logger with two dummy channels and a table ready for logging.
+
+    Args:
+        tmp_path: Tmp path.
+
+    Yields:
+        Next value.
+    """
+    m = master()
+    m.add_channel_dummy('voltage')
+    m['voltage'].write(3.3)
+    m.add_channel_dummy('current')
+    m['current'].write(0.001)
+    lg = logger(m, database=str(tmp_path / "batch.sqlite"), use_threads=True)
+    lg.new_table('batch_test', replace_table=True)
+    yield lg
+    lg.stop()
+    m.stop_threads()
+
+
+def _committed_rows(lg, table='batch_test'):
+    """Read rows through a separate connection, so only committed data is seen.
+
+    Args:
+        lg: Logger.
+        table: Table name.
+
+    Returns:
+        List of (rowid, voltage) tuples.
+    """
+    conn = sqlite3.connect(lg._database)
+    try:
+        return conn.execute(f'SELECT rowid, voltage FROM {table} ORDER BY rowid').fetchall()
+    finally:
+        conn.close()
+
+
+@pytest.mark.database
+@pytest.mark.threading
+class TestLoggerBatching:
+    """Write-behind batching in the logger backend."""
+
+    def test_batched_rows_written_in_order(self, threaded_logger):
+        """Perform test batched rows written in order operation.
+
+        Args:
+            threaded_logger: Threaded logger.
+        """
+        threaded_logger.set_batching(max_rows=3, max_latency=None)
+        for i in range(7):
+            threaded_logger.write('voltage', i)
+            threaded_logger.log()
+        threaded_logger.flush()
+        assert _committed_rows(threaded_logger) == [(i + 1, i) for i in range(7)]
+        assert threaded_logger._previously_logged_data['rowid'] == 7
+
+    def test_latency_flush_commits(self, threaded_logger):
+        """Perform test latency flush commits operation.
+
+        Args:
+            threaded_logger: Threaded logger.
+        """
+        import time
+        threaded_logger.set_batching(max_rows=1000, max_latency=0.05)
+        threaded_logger.log()
+        threaded_logger.log()
+        deadline = time.monotonic() + 5
+        while len(_committed_rows(threaded_logger)) < 2 and time.monotonic() < deadline:
+            time.sleep(0.02)
+        assert len(_committed_rows(threaded_logger)) == 2
+
+    def test_table_switch_flushes_pending_rows(self, threaded_logger):
+        """Perform test table switch flushes pending rows operation.
+
+        Args:
+            threaded_logger: Threaded logger.
+        """
+        threaded_logger.set_batching(max_rows=1000, max_latency=60)
+        threaded_logger.log()
+        threaded_logger.log()
+        threaded_logger.new_table('second_table', replace_table=True)
+        threaded_logger.log()
+        threaded_logger.flush()
+        assert len(_committed_rows(threaded_logger)) == 2
+        assert len(_committed_rows(threaded_logger, 'second_table')) == 1
+
+    def test_invalid_settings_rejected(self, threaded_logger):
+        """Perform test invalid settings rejected operation.
+
+        Args:
+            threaded_logger: Threaded logger.
+        """
+        with pytest.raises(ValueError):
+            threaded_logger.set_batching(max_rows=0)
+        with pytest.raises(ValueError):
+            threaded_logger.set_batching(durability='sometimes')
+
+    def test_idle_durability(self, threaded_logger):
+        """Perform test idle durability operation.
+
+        Args:
+            threaded_logger: Threaded logger.
+        """
+        threaded_logger.set_batching(max_rows=2, max_latency=None, durability='idle')
+        for _ in range(5):
+            threaded_logger.log()
+        threaded_logger.flush()
+        assert len(_committed_rows(threaded_logger)) == 5
+
+
+@pytest.mark.database
+class TestLoggerWideRows:
+    """Rows wider than the SQLite bound-variable limit."""
+
+    def test_wide_row_split_insert(self, simple_logger):
+        """Perform test wide row split insert operation.
+
+        Args:
+            simple_logger: Simple logger.
+        """
+        simple_logger.new_table('wide', replace_table=True)
+        backend = simple_logger._backend
+        backend._max_variables = 2
+        simple_logger.log()
+        simple_logger.log()
+        rows = simple_logger.query('SELECT rowid, voltage, current FROM wide').fetchall()
+        assert [tuple(row) for row in rows] == [(1, 3.3, 0.001), (2, 3.3, 0.001)]
+
+
+@pytest.mark.database
+@pytest.mark.threading
+class TestStorageQueuePolicy:
+    """Bounded storage queue policies while the database thread is stalled."""
+
+    @staticmethod
+    def _stall(lg):
+        """Block the database thread until the returned event is set.
+
+        Args:
+            lg: Logger.
+
+        Returns:
+            threading.Event releasing the database thread.
+        """
+        import threading
+        release = threading.Event()
+        started = threading.Event()
+        lg._backend.storage_queue.put(lambda: started.set() or release.wait(10))
+        started.wait(5)
+        return release
+
+    def _log_values(self, lg, values):
+        """Log one row per value of the voltage channel.
+
+        Args:
+            lg: Logger.
+            values: Voltages to log.
+        """
+        for value in values:
+            lg.write('voltage', value)
+            lg.log()
+
+    def test_drop_oldest(self, threaded_logger):
+        """Perform test drop oldest operation.
+
+        Args:
+            threaded_logger: Threaded logger.
+        """
+        threaded_logger.set_queue_policy(max_rows=2, policy='drop_oldest')
+        release = self._stall(threaded_logger)
+        self._log_values(threaded_logger, range(5))
+        release.set()
+        threaded_logger.flush()
+        assert [v for _, v in _committed_rows(threaded_logger)] == [3, 4]
+        assert threaded_logger.get_storage_metrics()['rows_dropped'] == 3
+
+    def test_spill_keeps_order(self, threaded_logger, tmp_path):
+        """Perform test spill keeps order operation.
+
+        Args:
+            threaded_logger: Threaded logger.
+            tmp_path: Tmp path.
+        """
+        threaded_logger.set_queue_policy(max_rows=1, policy='spill', journal_dir=str(tmp_path))
+        release = self._stall(threaded_logger)
+        self._log_values(threaded_logger, range(4))
+        metrics = threaded_logger.get_storage_metrics()
+        assert metrics['rows_in_memory'] == 1
+        assert metrics['rows_in_journal'] == 3
+        release.set()
+        threaded_logger.flush()
+        assert [v for _, v in _committed_rows(threaded_logger)] == [0, 1, 2, 3]
+        metrics = threaded_logger.get_storage_metrics()
+        assert metrics['rows_spilled'] == 3
+        assert metrics['rows_in_journal'] == 0
+
+    def test_block_waits_for_room(self, threaded_logger):
+        """Perform test block waits for room operation.
+
+        Args:
+            threaded_logger: Threaded logger.
+        """
+        import threading
+        threaded_logger.set_queue_policy(max_rows=1, policy='block')
+        release = self._stall(threaded_logger)
+        self._log_values(threaded_logger, [0])
+        writer = threading.Thread(target=self._log_values, args=(threaded_logger, [1]))
+        writer.start()
+        writer.join(0.2)
+        assert writer.is_alive()
+        release.set()
+        writer.join(5)
+        assert not writer.is_alive()
+        threaded_logger.flush()
+        assert [v for _, v in _committed_rows(threaded_logger)] == [0, 1]
+
+    def test_metrics_after_logging(self, threaded_logger):
+        """Perform test metrics after logging operation.
+
+        Args:
+            threaded_logger: Threaded logger.
+        """
+        threaded_logger.set_batching(max_rows=2, max_latency=None)
+        for _ in range(4):
+            threaded_logger.log()
+        threaded_logger.flush()
+        metrics = threaded_logger.get_storage_metrics()
+        assert metrics['rows_enqueued'] == 4
+        assert metrics['rows_committed'] == 4
+        assert metrics['commits'] >= 2
+        assert metrics['latency_p50'] <= metrics['latency_max']
+        assert metrics['queue_policy'] == 'block'
+
+    def test_invalid_policy_rejected(self, threaded_logger):
+        """Perform test invalid policy rejected operation.
+
+        Args:
+            threaded_logger: Threaded logger.
+        """
+        with pytest.raises(ValueError):
+            threaded_logger.set_queue_policy(policy='newest')
+        with pytest.raises(ValueError):
+            threaded_logger.set_queue_policy(max_rows=-1)
+
+
+def _index_names(db_path, table):
+    """List the explicitly created indexes on *table*.
+
+    Args:
+        db_path: Database file.
+        table: Table name.
+
+    Returns:
+        Sorted list of index names.
+    """
+    conn = sqlite3.connect(db_path)
+    try:
+        return sorted(row[1] for row in conn.execute(f'PRAGMA index_list({table})')
+                      if row[3] == 'c')
+    finally:
+        conn.close()
+
+
+@pytest.mark.database
+class TestLoggerIndexes:
+    """Index keys declared on the logger and built after collection."""
+
+    def test_no_indexes_while_logging(self, simple_logger):
+        """Perform test no indexes while logging operation.
+
+        Args:
+            simple_logger: Simple logger.
+        """
+        simple_logger.new_table('idx_test', replace_table=True)
+        simple_logger.log()
+        assert _index_names(simple_logger._database, 'idx_test') == []
+
+    def test_built_on_stop(self, simple_logger):
+        """Perform test built on stop operation.
+
+        Args:
+            simple_logger: Simple logger.
+        """
+        simple_logger['voltage'].set_attribute('index_key', True)
+        simple_logger.add_index('voltage', 'current')
+        simple_logger.new_table('idx_test', replace_table=True)
+        simple_logger.log()
+        simple_logger.stop()
+        assert _index_names(simple_logger._database, 'idx_test') == [
+            'idx_test_datetime_idx', 'idx_test_voltage_current_idx', 'idx_test_voltage_idx']
+
+    def test_built_on_table_switch(self, simple_logger):
+        """Perform test built on table switch operation.
+
+        Args:
+            simple_logger: Simple logger.
+        """
+        simple_logger['current'].set_category('sweep')
+        simple_logger.set_index_categories('sweep')
+        simple_logger.new_table('first', replace_table=True)
+        simple_logger.log()
+        simple_logger.new_table('second', replace_table=True)
+        assert _index_names(simple_logger._database, 'first') == [
+            'first_current_idx', 'first_datetime_idx']
+        assert _index_names(simple_logger._database, 'second') == []
+
+    def test_missing_column_skipped(self, simple_logger):
+        """Perform test missing column skipped operation.
+
+        Args:
+            simple_logger: Simple logger.
+        """
+        simple_logger.remove_index('datetime')
+        simple_logger.add_index('not_a_column')
+        simple_logger.add_index('voltage')
+        simple_logger.new_table('idx_test', replace_table=True)
+        simple_logger.build_indexes()
+        assert _index_names(simple_logger._database, 'idx_test') == ['idx_test_voltage_idx']
+
+    def test_explain_reports_full_scan(self, simple_logger):
+        """Perform test explain reports full scan operation.
+
+        Args:
+            simple_logger: Simple logger.
+        """
+        from PyICe.lab_utils.sqlite_data import sqlite_data
+        simple_logger.add_index('voltage')
+        simple_logger.new_table('idx_test', replace_table=True)
+        for value in range(200):
+            # enough distinct rows that the analyzed planner prefers the index
+            simple_logger['voltage'].write(value)
+            simple_logger.log()
+        db = sqlite_data(table_name='idx_test', database_file=simple_logger._database)
+        db.query('SELECT * FROM idx_test WHERE voltage = ?', 3)
+        assert any(step.full_scan for step in db.explain())
+        simple_logger.build_indexes()
+        assert not any(step.full_scan for step in db.explain())
+        assert not any(step.full_scan for step in db.explain(
+            "SELECT * FROM idx_test WHERE datetime > ?", '2026-01-01'))
+        db.conn.close()
+
+    def test_threaded_build(self, threaded_logger):
+        """Perform test threaded build operation.
+
+        Args:
+            threaded_logger: Threaded logger.
+        """
+        threaded_logger.log()
+        threaded_logger.stop()
+        assert _index_names(threaded_logger._database, 'batch_test') == ['batch_test_datetime_idx']
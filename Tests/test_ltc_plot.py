@@ -1,8 +1,10 @@
 """Comprehensive tests for PyICe.LTC_plot module."""
 import csv
+import os
 import re
 import numpy as np
 import pytest
+from PyICe import LTC_plot
 from PyICe.LTC_plot import (
     plot,
     scope_plot,
@@ -25,6 +27,8 @@ from PyICe.LTC_plot import (
     DELTA,
     DEGC,
     DEG,
+    DECIMATE_ABOVE,
+    DECIMATION_DPI,
 )
 
 
@@ -198,7 +202,7 @@ class TestAddTrace:
         expected_keys = {
             "axis", "data", "color", "marker", "markersize",
             "linestyle", "linewidth", "legend", "stepped_style",
-            "vxline", "hxline",
+            "vxline", "hxline", "decimate",
         }
         assert set(trace.keys()) == expected_keys
 
@@ -1030,6 +1034,186 @@ class TestPlotCreateCsv:
         assert csv_path.exists()
 
 
+class TestTraceDecimation:
+    """Tests for render-time decimation of long traces."""
+
+    @staticmethod
+    def _long_trace(n=DECIMATE_ABOVE * 5):
+        """Build a noisy ramp with one spike in each direction."""
+        x = np.linspace(-10, 10, n)
+        y = 40 + np.sin(x * 50) + np.random.default_rng(1).normal(0, 0.1, n)
+        y[n // 3] = 95
+        y[2 * n // 3] = 5
+        return x, y
+
+    @staticmethod
+    def _rendered_lines(plt):
+        """Render plt on a page and return its matplotlib lines."""
+        page = Page(plot_count=1)
+        page.add_plot(plt)
+        return page.Figure.axes[0].get_lines()
+
+    def test_long_trace_decimated_with_extremes(self, basic_plot):
+        """Verify a long trace is drawn with fewer points and the same extremes."""
+        x, y = self._long_trace()
+        basic_plot.add_trace(axis=1, data=np.column_stack((x, y)), color=LT_RED_1)
+        (line,) = self._rendered_lines(basic_plot)
+        columns = int(11.0 / 6.0 * DECIMATION_DPI)
+        assert len(line.get_xdata()) <= 4 * (columns + 2)
+        assert line.get_ydata().max() == 95
+        assert line.get_ydata().min() == 5
+        assert line.get_xdata()[0] == x[0]
+        assert line.get_xdata()[-1] == x[-1]
+
+    def test_decimated_trace_covers_same_columns(self, basic_plot):
+        """Verify each plot column keeps its full vertical extent."""
+        x, y = self._long_trace()
+        basic_plot.add_trace(axis=1, data=list(zip(x, y)), color=LT_RED_1)
+        (line,) = self._rendered_lines(basic_plot)
+        columns = int(11.0 / 6.0 * DECIMATION_DPI)
+        full = np.floor((x + 10) / 20 * columns)
+        kept = np.floor((line.get_xdata() + 10) / 20 * columns)
+        for column in (0, columns // 3, columns // 2):
+            assert line.get_ydata()[kept == column].max() == y[full == column].max()
+            assert line.get_ydata()[kept == column].min() == y[full == column].min()
+
+    def test_decimate_false_draws_every_point(self, basic_plot):
+        """Verify decimate=False keeps the full trace."""
+        x, y = self._long_trace()
+        basic_plot.add_trace(axis=1, data=np.column_stack((x, y)), color=LT_RED_1, decimate=False)
+        (line,) = self._rendered_lines(basic_plot)
+        assert len(line.get_xdata()) == len(x)
+
+    def test_short_markers_and_unsorted_traces_untouched(self, basic_plot):
+        """Verify short, marker and non-monotonic traces are not decimated."""
+        x, y = self._long_trace()
+        basic_plot.add_trace(axis=1, data=np.column_stack((x[:1000], y[:1000])), color=LT_RED_1)
+        basic_plot.add_trace(axis=1, data=np.column_stack((x, y)), color=LT_RED_1, marker='.')
+        basic_plot.add_trace(axis=1, data=np.column_stack((x[::-1], y)), color=LT_RED_1)
+        lines = self._rendered_lines(basic_plot)
+        assert [len(line.get_xdata()) for line in lines] == [1000, len(x), len(x)]
+
+    def test_csv_keeps_full_resolution(self, basic_plot, tmp_path):
+        """Verify create_csv exports every point of a decimated trace."""
+        x, y = self._long_trace()
+        basic_plot.add_trace(axis=1, data=np.column_stack((x, y)), color=LT_RED_1, legend="Long")
+        self._rendered_lines(basic_plot)
+        basic_plot.create_csv(file_basename="long", filepath=str(tmp_path))
+        with open(tmp_path / "csv" / "long.csv", 'r') as f:
+            assert sum(1 for _ in f) == len(x) + 1
+
+    def test_scope_plot_passes_decimate(self, scope):
+        """Verify scope_plot.add_trace forwards the decimate flag."""
+        scope.add_trace(data=[(0, 0), (1, 1)], color=LT_RED_1, decimate=False)
+        assert scope.y1_axis_params["trace_data"][0]["decimate"] is False
+
+
+class TestRenderCache:
+    """Tests for the on-disk cache of rendered Pages."""
+
+    @pytest.fixture
+    def cache_dir(self, tmp_path, monkeypatch):
+        """Turn the render cache on in a temporary directory."""
+        cache_dir = tmp_path / "render_cache"
+        monkeypatch.setattr(LTC_plot, "RENDER_CACHE_DIR", str(cache_dir))
+        return cache_dir
+
+    @staticmethod
+    def _page(ymax=1, note=None):
+        """Build a one-plot page whose content depends on the arguments."""
+        plt = plot(
+            plot_title="Cached", plot_name="C01", xaxis_label="X", yaxis_label="Y",
+            xlims=(0, 1), ylims=(0, 10), xminor=0, xdivs=5, yminor=0, ydivs=5,
+            logx=False, logy=False,
+        )
+        plt.add_trace(axis=1, data=np.array([[0, 0], [1, ymax]]), color=LT_RED_1, legend="trace")
+        if note is not None:
+            plt.add_note(note, location=(0.5, 5))
+        page = Page(plot_count=1)
+        page.add_plot(plt)
+        return page
+
+    @staticmethod
+    def _count_renders(page):
+        """Count the SVG renders done by page."""
+        calls = []
+        render = page._render_svg
+        page._render_svg = lambda: calls.append(1) or render()
+        return calls
+
+    def test_identical_page_served_from_cache(self, cache_dir):
+        """Verify an identical page is not rendered again."""
+        first = self._page().create_svg()
+        page = self._page()
+        renders = self._count_renders(page)
+        assert page.create_svg() == first
+        assert renders == []
+        assert len(list(cache_dir.glob("*.svg"))) == 1
+
+    def test_changed_data_or_notes_miss(self, cache_dir):
+        """Verify trace data and notes are part of the cache key."""
+        self._page().create_svg()
+        self._page(ymax=2).create_svg()
+        self._page(note="new").create_svg()
+        assert len(list(cache_dir.glob("*.svg"))) == 3
+
+    def test_comments_added_after_cache(self, cache_dir):
+        """Verify SVG comments are applied to cached output."""
+        self._page().create_svg()
+        page = self._page()
+        page.add_comment("run 2")
+        assert b"<!-- run 2 -->" in page.create_svg()
+        (cached,) = cache_dir.glob("*.svg")
+        assert b"run 2" not in cached.read_bytes()
+
+    def test_pdf_cached(self, cache_dir, tmp_path):
+        """Verify create_pdf writes the cached PDF on a hit."""
+        self._page().create_pdf("first", filepath=str(tmp_path))
+        page = self._page()
+        page.Figure.savefig = None
+        page.create_pdf("second", filepath=str(tmp_path))
+        first = (tmp_path / "plots" / "first.pdf").read_bytes()
+        assert (tmp_path / "plots" / "second.pdf").read_bytes() == first
+        assert first.startswith(b"%PDF")
+
+    def test_least_recently_used_evicted(self, cache_dir, monkeypatch):
+        """Verify eviction removes the least recently used file first."""
+        self._page(ymax=1).create_svg()
+        size = next(cache_dir.glob("*.svg")).stat().st_size
+        monkeypatch.setattr(LTC_plot, "RENDER_CACHE_MAX_BYTES", int(size * 2.5))
+        self._page(ymax=2).create_svg()
+        for path in cache_dir.glob("*.svg"):
+            os.utime(path, ns=(0, 0))
+        page = self._page(ymax=1)
+        page.create_svg()
+        self._page(ymax=3).create_svg()
+        assert len(list(cache_dir.glob("*.svg"))) == 2
+        page = self._page(ymax=1)
+        renders = self._count_renders(page)
+        page.create_svg()
+        assert renders == []
+
+    def test_unhashable_plot_not_cached(self, cache_dir):
+        """Verify plots holding arbitrary objects bypass the cache."""
+        page = Page(plot_count=1)
+        plt = plot(
+            plot_title="Odd", plot_name="O01", xaxis_label="X", yaxis_label="Y",
+            xlims=(0, 1), ylims=(0, 10), xminor=0, xdivs=5, yminor=0, ydivs=5,
+            logx=False, logy=False,
+        )
+        plt.owner = object()
+        page.add_plot(plt)
+        page.create_svg()
+        assert not cache_dir.exists()
+
+    def test_cache_off_by_default(self, basic_plot):
+        """Verify no page is hashed while RENDER_CACHE_DIR is None."""
+        assert LTC_plot.RENDER_CACHE_DIR is None
+        page = Page(plot_count=1)
+        page.add_plot(basic_plot)
+        assert page._render_cache_file("svg") is None
+
+
 class TestMultipagePdf:
     """Tests for Multipage_pdf class."""
 
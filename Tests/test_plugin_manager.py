@@ -0,0 +1,115 @@
+"""Tests for Plugin_Manager.plot serial and parallel plotting."""
+import sqlite3
+import pytest
+from PyICe import LTC_plot
+from PyICe.plugins.master_test_template import Master_Test_Template
+from PyICe.plugins.plugin_manager import Plugin_Manager
+
+
+class _plotting_test(Master_Test_Template):
+    """Test whose plot() draws the vout column of its table."""
+
+    def __init__(self):
+        """Initialize _plotting_test."""
+        self.project_folder_name = 'test_project'
+        self.title = 'vout'
+
+    def plot(self):
+        """Plot vout against vin.
+
+        Returns:
+            Result value.
+        """
+        db = self.get_database()
+        db.query(f'SELECT vin, vout FROM {self.get_table_name()}')
+        plt = LTC_plot.plot(plot_title=self.title, plot_name=self.get_name(),
+                            xaxis_label='VIN (V)', yaxis_label='VOUT (V)',
+                            xlims=None, ylims=None, xminor=0, xdivs=5, yminor=0, ydivs=5,
+                            logx=False, logy=False)
+        plt.add_trace(axis=1, data=db.to_list(), color=LTC_plot.LT_RED_1, legend='vout')
+        self.linked_plots[self.title] = [plt]
+        return plt
+
+
+class _crashing_test(_plotting_test):
+    """Test whose plot() raises."""
+
+    def plot(self):
+        """Raise.
+
+        Raises:
+            ValueError: Always.
+        """
+        raise ValueError('no data for you')
+
+
+@pytest.fixture
+def plot_pm(tmp_path):
+    """Plugin_Manager with two plotting tests and a crashing one between them.
+
+    Args:
+        tmp_path: Tmp path.
+
+    Returns:
+        Result value.
+    """
+    database = str(tmp_path / 'data_log.sqlite')
+    conn = sqlite3.connect(database)
+    conn.execute('CREATE TABLE results (vin REAL, vout REAL)')
+    conn.executemany('INSERT INTO results VALUES (?, ?)', [(v, 2.0 * v) for v in range(10)])
+    conn.commit()
+    conn.close()
+    pm = Plugin_Manager(settings={'plugins': [], 'project_path': '.', 'verbose': False})
+    for test_class in (_plotting_test, _crashing_test, _plotting_test):
+        pm.add_test(test_class)
+    pm.tests[2].title = 'vout_again'
+    return pm, database
+
+
+class TestPluginManagerPlot:
+    """Tests for Plugin_Manager.plot."""
+
+    def test_parallel_matches_serial(self, plot_pm):
+        """Perform test parallel matches serial operation.
+
+        Args:
+            plot_pm: Plot pm.
+        """
+        pm, database = plot_pm
+        pm.plot(database=database, table_name='results')
+        serial_plots = pm._plots
+        serial_linked = pm._linked_plots
+        assert len(serial_plots) == 2
+        pm.plot(database=database, table_name='results', processes=2)
+        assert len(pm._plots) == 2
+        assert list(pm._linked_plots) == list(serial_linked) == ['vout', 'vout_again']
+        assert [len(svg) for svg in pm._plots] == pytest.approx(
+            [len(svg) for svg in serial_plots], rel=0.01)
+        assert pm.tests[0].plot_list == [pm._plots[0]]
+
+    def test_parallel_crash_is_isolated(self, plot_pm, capsys):
+        """Perform test parallel crash is isolated operation.
+
+        Args:
+            plot_pm: Plot pm.
+            capsys: Capsys.
+        """
+        pm, database = plot_pm
+        pm.plot(database=database, table_name='results', processes=2)
+        out = capsys.readouterr().out
+        assert 'crashed.' in out
+        assert 'no data for you' in out
+        assert len(pm._plots) == 2
+
+    def test_parallel_worker_database_is_read_only(self, plot_pm):
+        """Perform test parallel worker database is read only operation.
+
+        Args:
+            plot_pm: Plot pm.
+        """
+        from PyICe.lab_utils.sqlite_data import sqlite_data
+        _, database = plot_pm
+        db = sqlite_data(database_file=database, table_name='results', read_only=True)
+        assert len(db.to_list()) == 10
+        with pytest.raises(sqlite3.OperationalError):
+            db.conn.execute('DELETE FROM results')
@@ -298,3 +298,293 @@ class TestSqliteData:
         arr = db.numpy_recarray(force_float_dtype=True)
         assert len(arr) == 5
         assert arr.voltage[0] == pytest.approx(3.3)  # pylint: disable=no-member; 'voltage' is a named field on the numpy recarray created from the database query columns
+
+    def test_length_with_parameters(self, populated_db):
+        """Perform test length with parameters operation.
+
+        Args:
+            populated_db: Populated db.
+        """
+        db = sqlite_data(table_name='measurements',
+                         database_file=populated_db)
+        db.query("SELECT * FROM measurements WHERE status = ?;", 'ok')
+        assert len(db) == 3
+
+    def test_negative_index(self, populated_db):
+        """Perform test negative index operation.
+
+        Args:
+            populated_db: Populated db.
+        """
+        db = sqlite_data(table_name='measurements',
+                         database_file=populated_db)
+        assert db[-1]['voltage'] == 2.9
+        assert db[-5]['voltage'] == 3.3
+        with pytest.raises(IndexError):
+            db[-6]
+        with pytest.raises(IndexError):
+            db[5]
+
+    def test_slice_steps(self, populated_db):
+        """Perform test slice steps operation.
+
+        Args:
+            populated_db: Populated db.
+        """
+        db = sqlite_data(table_name='measurements',
+                         database_file=populated_db)
+        voltages = [3.3, 3.2, 3.1, 3.0, 2.9]
+        for key in (slice(None, None, 2), slice(1, None, 3), slice(-3, None),
+                    slice(None, -2), slice(None, None, -1), slice(4, 0, -2),
+                    slice(-1, -4, -1), slice(3, 1), slice(10, 20)):
+            assert [row['voltage'] for row in db[key]] == voltages[key]
+        with pytest.raises(ValueError):
+            db[::0]
+
+    def test_chunks(self, populated_db):
+        """Perform test chunks operation.
+
+        Args:
+            populated_db: Populated db.
+        """
+        db = sqlite_data(table_name='measurements',
+                         database_file=populated_db)
+        chunks = list(db.chunks(chunk_size=2))
+        assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+        assert [row['rowid'] for chunk in chunks for row in chunk] == [1, 2, 3, 4, 5]
+
+    def test_chunks_by_column(self, populated_db):
+        """Perform test chunks by column operation.
+
+        Args:
+            populated_db: Populated db.
+        """
+        db = sqlite_data(table_name='measurements',
+                         database_file=populated_db)
+        db.query("SELECT rowid, status, voltage FROM measurements WHERE current > ?", 0.001)
+        rows = [row for chunk in db.chunks(chunk_size=1, key_column='voltage') for row in chunk]
+        assert [row['voltage'] for row in rows] == [2.9, 3.0, 3.1, 3.2]
+        rows = [row for chunk in db.chunks(chunk_size=2, key_column=('status', 'rowid'))
+                for row in chunk]
+        assert [row['rowid'] for row in rows] == [5, 2, 4, 3]
+
+    def test_chunks_implicit_rowid(self, tmp_path):
+        """Perform test chunks implicit rowid operation.
+
+        Args:
+            tmp_path: Tmp path.
+        """
+        db_path = str(tmp_path / "plain.sqlite")
+        conn = sqlite3.connect(db_path)
+        conn.execute("CREATE TABLE t (value REAL)")
+        conn.executemany("INSERT INTO t (value) VALUES (?)", [(i,) for i in range(25)])
+        conn.commit()
+        conn.close()
+        db = sqlite_data(table_name='t', database_file=db_path)
+        chunks = list(db.chunks(chunk_size=10))
+        assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+        assert [row['value'] for chunk in chunks for row in chunk] == list(range(25))
+
+    def test_chunks_unknown_key(self, populated_db):
+        """Perform test chunks unknown key operation.
+
+        Args:
+            populated_db: Populated db.
+        """
+        db = sqlite_data(table_name='measurements',
+                         database_file=populated_db)
+        with pytest.raises(ValueError):
+            list(db.chunks(chunk_size=2, key_column='voltgae'))
+        db.query("SELECT status, voltage FROM measurements")
+        with pytest.raises(ValueError):
+            list(db.chunks(chunk_size=2))
+
+    def test_keyset_positions(self, tmp_path, mocker):
+        """Perform test keyset positions operation.
+
+        Args:
+            tmp_path: Tmp path.
+            mocker: Mocker.
+        """
+        db_path = str(tmp_path / "gaps.sqlite")
+        conn = sqlite3.connect(db_path)
+        conn.execute("CREATE TABLE t (value REAL)")
+        conn.executemany("INSERT INTO t (value) VALUES (?)", [(i,) for i in range(30)])
+        conn.execute("DELETE FROM t WHERE value % 4 = 1")
+        conn.commit()
+        conn.close()
+        values = [float(i) for i in range(30) if i % 4 != 1]
+        db = sqlite_data(table_name='t', database_file=db_path)
+        mocker.patch.object(sqlite_data, '_keyset_page_size', 4)
+        count = mocker.spy(sqlite_data, '__len__')
+        assert db[-1]['value'] == values[-1]
+        assert [row['value'] for row in db[3::5]] == values[3::5]
+        assert count.call_count == 0
+        for key in (slice(None, None, -3), slice(-2, 2, -4), slice(-7, None, 2)):
+            assert [row['value'] for row in db[key]] == values[key]
+        db.query("SELECT value FROM t ORDER BY value DESC")
+        assert db[0]['value'] == values[-1]
+        assert [row['value'] for row in db[::7]] == values[::-1][::7]
+
+
+@pytest.mark.database
+class TestSqliteColumns:
+    """Tests for the columnar bulk-read path of Sqlite Data."""
+
+    ROWS = 25
+
+    @pytest.fixture
+    def logger_db(self, tmp_path):
+        """Create a database laid out the way lab_core.logger writes it.
+
+        Args:
+            tmp_path: Tmp path.
+
+        Returns:
+            Path to the database file.
+        """
+        from PyICe.lab_core import logger_backend
+        db_path = str(tmp_path / "columns.sqlite")
+        conn = sqlite3.connect(db_path)
+        conn.execute('CREATE TABLE log ( rowid INTEGER PRIMARY KEY, datetime DATETIME, '
+                     '"vbat" NUMERIC, "trace" PyICeBLOB, "state" TEXT, "mixed" NUMERIC )')
+        rows = []
+        for i in range(self.ROWS):
+            rows.append((
+                f'2026-03-01T12:00:{i:02d}.{i:06d}Z',
+                None if i == 7 else 3.3 - i * 0.01,
+                bytes(logger_backend.db_clean(np.arange(i, dtype='<i4'))),
+                f'state{i % 3}',
+                str([i, i + 1]) if i % 5 == 0 else i,
+            ))
+        conn.executemany('INSERT INTO log (datetime, vbat, trace, state, mixed) '
+                         'VALUES (?, ?, ?, ?, ?)', rows)
+        conn.commit()
+        conn.close()
+        return db_path
+
+    def test_column_dtypes(self, logger_db):
+        """Perform test column dtypes operation.
+
+        Args:
+            logger_db: Logger db.
+        """
+        cols = sqlite_data(table_name='log', database_file=logger_db).columns(chunk_size=4)
+        assert list(cols) == ['rowid', 'datetime', 'vbat', 'trace', 'state', 'mixed']
+        assert all(len(col) == self.ROWS for col in cols.values())
+        assert cols['rowid'].dtype == np.int64
+        assert cols['datetime'].dtype == np.dtype('datetime64[us]')
+        assert cols['vbat'].dtype == np.float64
+        assert cols['trace'].dtype == object
+        assert cols['state'].dtype == object
+
+    def test_matches_row_access(self, logger_db):
+        """Perform test matches row access operation.
+
+        Args:
+            logger_db: Logger db.
+        """
+        db = sqlite_data(table_name='log', database_file=logger_db)
+        cols = db.columns(chunk_size=4)
+        for i, row in enumerate(db):
+            assert cols['rowid'][i] == row['rowid']
+            assert cols['datetime'][i] == np.datetime64(row['datetime'].replace(tzinfo=None), 'us')
+            if row['vbat'] is None:
+                assert np.isnan(cols['vbat'][i])
+            else:
+                # Row access round-trips REAL through text; columns keep the stored double.
+                assert cols['vbat'][i] == pytest.approx(row['vbat'])
+            np.testing.assert_array_equal(cols['trace'][i], row['trace'])
+            assert cols['trace'][i].dtype == np.dtype('<i4')
+            assert cols['state'][i] == row['state']
+            assert cols['mixed'][i] == row['mixed']
+
+    def test_column_subset_and_parameters(self, logger_db):
+        """Perform test column subset and parameters operation.
+
+        Args:
+            logger_db: Logger db.
+        """
+        db = sqlite_data(table_name='log', database_file=logger_db)
+        db.query("SELECT rowid, vbat * 2 AS double, datetime, trace FROM log WHERE rowid > ?", 20)
+        cols = db.columns(column_names=['double', 'datetime', 'trace'])
+        assert list(cols) == ['double', 'datetime', 'trace']
+        assert len(cols['double']) == self.ROWS - 20
+        # Declared types are unknown for parameterized queries; inferred from data.
+        assert cols['datetime'].dtype == np.dtype('datetime64[us]')
+        np.testing.assert_array_equal(cols['trace'][0], np.arange(20, dtype='<i4'))
+
+    def test_null_then_numbers(self, tmp_path):
+        """Perform test null then numbers operation.
+
+        Args:
+            tmp_path: Tmp path.
+        """
+        db_path = str(tmp_path / "nulls.sqlite")
+        conn = sqlite3.connect(db_path)
+        conn.execute('CREATE TABLE t (a NUMERIC, b NUMERIC)')
+        conn.executemany('INSERT INTO t VALUES (?, ?)',
+                         [(None, 1), (None, 2), (3, 2.5), (4, None)])
+        conn.commit()
+        conn.close()
+        cols = sqlite_data(table_name='t', database_file=db_path).columns(chunk_size=2)
+        np.testing.assert_array_equal(cols['a'], [np.nan, np.nan, 3.0, 4.0])
+        np.testing.assert_array_equal(cols['b'], [1.0, 2.0, 2.5, np.nan])
+
+    def test_iteration_is_one_query(self, logger_db):
+        """Perform test iteration is one query operation.
+
+        Args:
+            logger_db: Logger db.
+        """
+        import sqlite3 as _sqlite3
+        db = sqlite_data(table_name='log', database_file=logger_db)
+        assert isinstance(iter(db), _sqlite3.Cursor)
+        assert [row['rowid'] for row in db] == [row['rowid'] for row in db[:]] == list(range(1, self.ROWS + 1))
+
+    def test_formatted_columns(self, tmp_path):
+        """Perform test formatted columns operation.
+
+        Args:
+            tmp_path: Tmp path.
+        """
+        from PyICe.lab_core import integer_channel
+        db_path = str(tmp_path / "codes.sqlite")
+        conn = sqlite3.connect(db_path)
+        conn.execute('CREATE TABLE t (code INTEGER, other INTEGER)')
+        conn.executemany('INSERT INTO t VALUES (?, ?)', [(0, 1), (128, 2), (None, 3), (255, 4)])
+        conn.commit()
+        conn.close()
+        ch = integer_channel('code', size=8)
+        ch.add_format('volts', xypoints=[(0, 0.0), (255, 5.1)])
+        ch.add_preset('FULL', 255)
+        cols = sqlite_data(table_name='t', database_file=db_path).columns(
+            formats={'code': (ch, 'volts', True), 'other': lambda col: col * 10})
+        assert list(cols['code']) == [0.0, pytest.approx(2.56), None, 'FULL']
+        assert list(cols['other']) == [10, 20, 30, 40]
+
+    def test_empty_result(self, logger_db):
+        """Perform test empty result operation.
+
+        Args:
+            logger_db: Logger db.
+        """
+        db = sqlite_data(table_name='log', database_file=logger_db)
+        db.query("SELECT vbat FROM log WHERE rowid < 0")
+        assert len(db.columns()['vbat']) == 0
+
+    def test_columnar_recarray_and_dataframe(self, logger_db):
+        """Perform test columnar recarray and dataframe operation.
+
+        Args:
+            logger_db: Logger db.
+        """
+        db = sqlite_data(table_name='log', database_file=logger_db)
+        db.query("SELECT rowid, vbat FROM log")
+        arr = db.numpy_recarray(force_float_dtype=True, columnar=True)
+        assert arr.rowid.dtype == np.float64  # pylint: disable=no-member; recarray field
+        assert arr.vbat[0] == pytest.approx(3.3)  # pylint: disable=no-member; recarray field
+        db.query("SELECT datetime, vbat FROM log")
+        df = db.pandas_dataframe(columnar=True)
+        assert len(df) == self.ROWS
+        assert str(df['datetime'].dtype).startswith('datetime64')
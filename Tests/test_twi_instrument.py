@@ -82,3 +82,101 @@ class TestTwiInstrument:
         chan = twi_inst.get_channel('alert')
         result = chan.read()
         assert type(result) is int  # bad practice to return random numbers
+
+
+class TestTwiBatchedWrites:
+    """Tests for twi_instrument.write_delegated_channel_list."""
+
+    @pytest.fixture()
+    def bitfields(self, twi_inter):
+        """Return an instrument with three bitfields in two registers.
+
+        Args:
+            twi_inter: Twi inter.
+
+        Returns:
+            Tuple of instrument and interface.
+        """
+        inst = twi_instrument(twi_inter)
+        for name, cc, size, offset in [('lo', 0x10, 4, 0), ('hi', 0x10, 4, 4),
+                                       ('other', 0x20, 8, 0)]:
+            inst.add_register(name=name, addr7=0x70, command_code=cc, size=size,
+                              offset=offset, word_size=8, is_readable=True,
+                              is_writable=True)
+        return inst, twi_inter
+
+    def test_shared_command_code_merged(self, bitfields, mocker):
+        """Perform test shared command code merged operation.
+
+        Args:
+            bitfields: Bitfields.
+            mocker: Mocker.
+        """
+        inst, iface = bitfields
+        iface.write_register(0x70, 0x10, 0x00, 8, False)
+        read = mocker.spy(iface, 'read_register')
+        write = mocker.spy(iface, 'write_register')
+        write_list = mocker.spy(iface, 'write_register_list')
+        assert inst.write_channels([('lo', 0x3), ('hi', 0xA), ('other', 0x55)]) == [3, 10, 0x55]
+        assert read.call_count == 0
+        assert write.call_count == 0
+        write_list.assert_called_once_with(addr7=0x70, cc_data_list=[(0x10, 0xA3), (0x20, 0x55)],
+                                           data_size=8, use_pec=False)
+        assert iface.read_register(0x70, 0x10, 8, False) == 0xA3
+
+    def test_partial_register_read_once(self, bitfields, mocker):
+        """Perform test partial register read once operation.
+
+        Args:
+            bitfields: Bitfields.
+            mocker: Mocker.
+        """
+        inst, iface = bitfields
+        iface.write_register(0x70, 0x10, 0xF0, 8, False)
+        read = mocker.spy(iface, 'read_register')
+        inst.write_channels([('lo', 0x5)])
+        assert read.call_count == 1
+        assert iface.read_register(0x70, 0x10, 8, False) == 0xF5
+
+    def test_repeated_bitfield_not_collapsed(self, bitfields, mocker):
+        """Perform test repeated bitfield not collapsed operation.
+
+        Args:
+            bitfields: Bitfields.
+            mocker: Mocker.
+        """
+        inst, iface = bitfields
+        iface.write_register(0x70, 0x10, 0x00, 8, False)
+        write_list = mocker.spy(iface, 'write_register_list')
+        inst.write_channels([('lo', 1), ('hi', 2), ('lo', 0)])
+        assert [call.kwargs['cc_data_list'] for call in write_list.call_args_list] == [
+            [(0x10, 0x21)], [(0x10, 0x20)]]
+
+    def test_program_order_preserved(self, bitfields, mocker):
+        """Perform test program order preserved operation.
+
+        Args:
+            bitfields: Bitfields.
+            mocker: Mocker.
+        """
+        inst, iface = bitfields
+        iface.write_register(0x70, 0x10, 0x00, 8, False)
+        write_list = mocker.spy(iface, 'write_register_list')
+        inst.write_channels([('lo', 0x3), ('other', 0x55), ('hi', 0xA)])
+        bus_order = [command_code for call in write_list.call_args_list
+                     for (command_code, _) in call.kwargs['cc_data_list']]
+        assert bus_order == [0x10, 0x20, 0x10]
+        assert iface.read_register(0x70, 0x10, 8, False) == 0xA3
+
+    def test_read_flushes_pending_writes(self, bitfields):
+        """Perform test read flushes pending writes operation.
+
+        Args:
+            bitfields: Bitfields.
+        """
+        inst, iface = bitfields
+        seen = []
+        inst.get_channel('lo').add_write_callback(
+            lambda ch, value: seen.append(inst.read_channel('lo')))
+        inst.write_channels([('lo', 7)])
+        assert seen == [7]
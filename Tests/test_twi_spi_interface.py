@@ -1,7 +1,8 @@
 """Tests for twi spi interface."""
 import pytest
 from collections import OrderedDict
-from PyICe.twi_interface import twi_interface, i2c_dummy
+from PyICe.twi_interface import twi_interface, i2c_dummy, i2cPECError
+from PyICe.lab_interfaces import interface_twi_scpi
 from PyICe.spi_interface import shift_register
 
 
@@ -41,6 +42,84 @@ class TestTwiInterfaceUtilities:
         assert isinstance(result, int)
         assert 0 <= result <= 0xFF
 
+    def test_pec_table_matches_bitwise(self):
+        """Perform test pec table matches bitwise operation."""
+        def bitwise_pec(byte_list):
+            crc = 0
+            for byte in byte_list:
+                crc ^= byte
+                for _ in range(8):
+                    crc <<= 1
+                    if crc & 0x100:
+                        crc ^= 0x07
+            return crc & 0xFF
+        for byte_list in ([], [0x00], [0xFF], [0xA0, 0x00, 0x12], list(range(256)), [0x90, 0x01, 0x91, 0xAB, 0xCD]):
+            assert twi_interface.pec(byte_list) == bitwise_pec(byte_list)
+
+    def test_pec_array_matches_pec(self):
+        """Perform test pec array matches pec operation."""
+        frames = [[0xB0, cc, 0xB1, cc ^ 0x5A, 0xFF - cc] for cc in range(256)]
+        assert twi_interface.pec_array(frames).tolist() == [twi_interface.pec(frame) for frame in frames]
+
+    def test_pec_array_residue(self):
+        """Perform test pec array residue operation."""
+        frames = [[0xB0, cc, 0xB1, cc] for cc in range(16)]
+        checked = [frame + [twi_interface.pec(frame)] for frame in frames]
+        assert not twi_interface.pec_array(checked).any()
+
+    def test_pec_array_shape(self):
+        """Perform test pec array shape operation."""
+        with pytest.raises(ValueError):
+            twi_interface.pec_array([0xB0, 0x01])
+
+
+class TestI2CScpiListRead:
+    """Tests for i2c_scpi register list reads with PEC."""
+
+    class _fake_interface:
+        def __init__(self, response):
+            self.response = response
+
+        def write(self, message):
+            pass
+
+        def close(self):
+            pass
+
+        def ask_for_values_binary(self, message, format_str, byte_order, terminationCharacter):
+            return self.response
+
+    @staticmethod
+    def _byte_response(addr7, registers, corrupt=None):
+        """Build an i2c_scpi byte list read response with PEC.
+
+        Args:
+            addr7: Addr7.
+            registers: Registers.
+            corrupt: Command code whose PEC is corrupted.
+
+        Returns:
+            Tuple of response bytes.
+        """
+        response = [0, 0]
+        for cc, value in sorted(registers.items()):
+            pec = twi_interface.pec([addr7 << 1, cc, addr7 << 1 | 1, value])
+            response += [value, pec ^ 0x01 if cc == corrupt else pec]
+        return tuple(response)
+
+    def test_byte_list_pec(self):
+        """Perform test byte list pec operation."""
+        registers = {cc: (cc * 7) & 0xFF for cc in range(0, 64, 3)}
+        bus = interface_twi_scpi(self._fake_interface(self._byte_response(0x48, registers)), timeout=1)
+        assert bus.read_register_list(0x48, list(registers), data_size=8, use_pec=True) == registers
+
+    def test_byte_list_pec_failure(self):
+        """Perform test byte list pec failure operation."""
+        registers = {cc: (cc * 7) & 0xFF for cc in range(0, 64, 3)}
+        bus = interface_twi_scpi(self._fake_interface(self._byte_response(0x48, registers, corrupt=0x21)), timeout=1)
+        with pytest.raises(i2cPECError, match='command code: 33'):
+            bus.read_register_list(0x48, list(registers), data_size=8, use_pec=True)
+
 
 class TestI2CDummy:
     """Tests for I2 C Dummy."""
@@ -0,0 +1,157 @@
+"""Tests for the buffered serial reader behind visa_wrapper_serial."""
+import struct
+import pytest
+import numpy
+import serial
+from PyICe.lab_interfaces import SerialTestHarness, interface_visa_serial
+from PyICe.visa_wrappers import (_buffered_reader, _block_dtype, _unpack_block,
+                                 visaWrapperException)
+
+
+def _harness_reader(data, max_bytes_returned_per_read=None):
+    """Return a _buffered_reader over a SerialTestHarness replaying data.
+
+    The harness returns short and empty reads at random, so many consecutive
+    empty reads are needed before the stream is considered exhausted.
+
+    Args:
+        data: Bytes to replay.
+        max_bytes_returned_per_read: Harness read size limit.
+
+    Returns:
+        _buffered_reader instance.
+    """
+    harness = SerialTestHarness(iter(data), max_bytes_returned_per_read)
+    return _buffered_reader(harness, 'TEST_PORT', empty_reads=100)
+
+
+class TestBufferedReader:
+    """Tests for _buffered_reader against SerialTestHarness."""
+
+    def test_readline_splits_lines(self):
+        """Lines are split on the terminator and keep it."""
+        lines = [b'line %d\n' % i for i in range(200)]
+        reader = _harness_reader(b''.join(lines), max_bytes_returned_per_read=37)
+        assert [bytes(reader.readline(b'\n')) for _ in lines] == lines
+
+    def test_readline_multibyte_terminator(self):
+        """A terminator split across reads is still found."""
+        reader = _harness_reader(b'abc\r\ndef\r\n', max_bytes_returned_per_read=1)
+        assert reader.readline(b'\r\n') == b'abc\r\n'
+        assert reader.readline(b'\r\n') == b'def\r\n'
+
+    def test_readline_timeout(self):
+        """An unterminated line raises and is discarded."""
+        reader = _harness_reader(b'no terminator')
+        with pytest.raises(visaWrapperException):
+            reader.readline(b'\n')
+        assert reader.buffer == b''
+
+    def test_read_block(self):
+        """The block payload is returned and following bytes stay buffered."""
+        payload = bytes(range(256)) * 4
+        reader = _harness_reader(b'xx#41024' + payload + b'\nnext\n', max_bytes_returned_per_read=100)
+        assert reader.read_block() == payload
+        assert reader.readline(b'\n') == b'\n'
+        assert reader.readline(b'\n') == b'next\n'
+
+    def test_read_block_indefinite_length(self):
+        """Indefinite length blocks are rejected."""
+        reader = _harness_reader(b'#0abc\n')
+        with pytest.raises(visaWrapperException):
+            reader.read_block()
+
+    def test_read_exact_timeout(self):
+        """A short stream raises instead of returning a partial block."""
+        reader = _harness_reader(b'#210abc')
+        with pytest.raises(visaWrapperException):
+            reader.read_block()
+
+
+class TestBlockDecoding:
+    """Tests for binary block format helpers."""
+
+    def test_unpack_single_format(self):
+        """Single-character formats unpack with a counted struct."""
+        data = struct.pack('>3h', -1, 2, 300)
+        assert _unpack_block('h', '>', data) == (-1, 2, 300)
+
+    def test_unpack_mixed_format(self):
+        """Multi-field formats unpack record by record."""
+        data = struct.pack('>HBHB', 513, 7, 1, 255)
+        assert _unpack_block('HB', '>', data) == (513, 7, 1, 255)
+
+    def test_dtype_matches_struct(self):
+        """numpy and struct decode a block identically."""
+        data = struct.pack('<4f', 1.5, -2.0, 3.25, 0.0)
+        values = numpy.frombuffer(data, dtype=_block_dtype('f', '<'))
+        assert tuple(values) == _unpack_block('f', '<', data)
+
+    def test_dtype_rejects_mixed_format(self):
+        """Formats with several fields have no single dtype."""
+        with pytest.raises(ValueError):
+            _block_dtype('HB', '>')
+
+
+class TestVisaWrapperSerial:
+    """Tests for visa_wrapper_serial reads over a loopback port."""
+
+    @pytest.fixture
+    def loopback(self):
+        """Return a loopback port and a visa wrapper reading from it.
+
+        Returns:
+            Tuple of (port, wrapper).
+        """
+        port = serial.serial_for_url('loop://', timeout=0.05)
+        yield port, interface_visa_serial(port)
+        port.close()
+
+    def test_readline_and_read(self, loopback):
+        """Perform test readline and read operation.
+
+        Args:
+            loopback: Fixture.
+        """
+        port, wrapper = loopback
+        port.write(b'hello\nworld\n')
+        assert wrapper.readline() == 'hello\n'
+        assert wrapper.read() == 'world'
+
+    def test_readline_timeout(self, loopback):
+        """Perform test readline timeout operation.
+
+        Args:
+            loopback: Fixture.
+        """
+        port, wrapper = loopback
+        port.write(b'partial')
+        with pytest.raises(visaWrapperException):
+            wrapper.readline()
+
+    def test_read_values_binary(self, loopback):
+        """Perform test read values binary operation.
+
+        Args:
+            loopback: Fixture.
+        """
+        port, wrapper = loopback
+        payload = struct.pack('>4H', 1, 2, 3, 65535)
+        port.write(b'#18' + payload + b'\n' + b'#18' + payload + b'\n')
+        assert wrapper.read_values_binary('H', '>', '\n') == (1, 2, 3, 65535)
+        values = wrapper.read_values_binary('H', '>', '\n', as_array=True)
+        assert values.dtype == numpy.dtype('>u2')
+        assert values.tolist() == [1, 2, 3, 65535]
+
+    def test_resync_drains_buffer(self, loopback):
+        """Perform test resync drains buffer operation.
+
+        Args:
+            loopback: Fixture.
+        """
+        port, wrapper = loopback
+        port.write(b'one\nstale')
+        assert wrapper.readline() == 'one\n'
+        assert wrapper.resync() == 'stale'
+        port.write(b'fresh\n')
+        assert wrapper.readline() == 'fresh\n'